@@ -47,7 +47,6 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import UnknownFlow
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, device_registry as dr
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.loader import async_get_integration
@@ -101,6 +100,7 @@ from .const import (
     STARTUP_MESSAGE,
 )
 from .coordinator import AlexaMediaCoordinator
+from .event_router import async_get_event_router
 from .exceptions import TimeoutException
 from .helpers import (
     _catch_login_errors,
@@ -113,6 +113,7 @@ from .helpers import (
 )
 from .metrics import AlexaMetrics, get_metrics
 from .notify import async_unload_entry as notify_async_unload_entry
+from .poll_scheduler import async_get_poll_scheduler
 from .runtime_data import AlexaRuntimeData
 from .services import AlexaMediaServices
 
@@ -270,6 +271,17 @@ def _push_healthy(account: dict) -> bool:
     return True
 
 
+def _update_poll_interval(account: dict) -> None:
+    """Set the coordinator polling interval from push health.
+
+    This is the only place the interval changes: the slow heartbeat while
+    push is healthy, the configured scan interval otherwise.
+    """
+    coordinator = account.get("coordinator")
+    if isinstance(coordinator, AlexaMediaCoordinator):
+        coordinator.set_push_healthy(_push_healthy(account))
+
+
 def _network_allowed(login_obj) -> bool:
     if login_obj.close_requested:
         return False
@@ -524,10 +536,8 @@ def _store_and_dispatch_last_called(
             "%s: last_called changed",
             hide_email(email),
         )
-        async_dispatcher_send(
-            hass,
-            f"{DOMAIN}_{hide_email(email)}"[0:32],
-            {"last_called_change": payload},
+        async_get_event_router(hass, email).async_route(
+            {"last_called_change": payload}
         )
 
 
@@ -918,27 +928,41 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
         if metrics:
             cached_devices = metrics.api_cache.get(f"{cache_key_prefix}_devices")
 
+        # While push is healthy, bluetooth and preferences are only re-fetched
+        # once their last result is too old; push events keep them current.
+        poll_scheduler = async_get_poll_scheduler(hass, email)
+        poll_scheduler.push_healthy = not first_run and _push_healthy(account)
+        tasks = [
+            poll_scheduler.async_poll(
+                "get_bluetooth", lambda: AlexaAPI.get_bluetooth(login_obj)
+            ),
+            poll_scheduler.async_poll(
+                "get_device_preferences",
+                lambda: AlexaAPI.get_device_preferences(login_obj),
+            ),
+            poll_scheduler.async_call(
+                "get_dnd_state", AlexaAPI.get_dnd_state(login_obj)
+            ),
+        ]
         if cached_devices and not new_devices:
             _LOGGER.debug("%s: Using cached devices data", hide_email(email))
             # NOTE: DataCache returns direct references. We intentionally enrich device dicts
             # in-place each refresh cycle (bluetooth_state/locale/dnd/etc.).
             devices = cached_devices
             _used_cached_devices = True
-            # Still need fresh bluetooth, preferences, and DND
-            tasks = [
-                AlexaAPI.get_bluetooth(login_obj),
-                AlexaAPI.get_device_preferences(login_obj),
-                AlexaAPI.get_dnd_state(login_obj),
-            ]
         else:
-            tasks = [
-                AlexaAPI.get_devices(login_obj),
-                AlexaAPI.get_bluetooth(login_obj),
-                AlexaAPI.get_device_preferences(login_obj),
-                AlexaAPI.get_dnd_state(login_obj),
-            ]
+            tasks.insert(
+                0,
+                poll_scheduler.async_call(
+                    "get_devices", AlexaAPI.get_devices(login_obj)
+                ),
+            )
         if new_devices:
-            tasks.append(AlexaAPI.get_authentication(login_obj))
+            tasks.append(
+                poll_scheduler.async_call(
+                    "get_authentication", AlexaAPI.get_authentication(login_obj)
+                )
+            )
 
         entities_to_monitor = set()
 
@@ -991,10 +1015,19 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 entities_to_monitor.add(smart_switch.alexa_entity_id)
 
         if entities_to_monitor:
-            tasks.append(get_entity_data(login_obj, list(entities_to_monitor)))
+            tasks.append(
+                poll_scheduler.async_call(
+                    "get_entity_data",
+                    get_entity_data(login_obj, list(entities_to_monitor)),
+                )
+            )
 
         if should_get_network:
-            tasks.append(AlexaAPI.get_network_details(login_obj))
+            tasks.append(
+                poll_scheduler.async_call(
+                    "get_network_details", AlexaAPI.get_network_details(login_obj)
+                )
+            )
 
         optional_task_results = []
         try:
@@ -1395,6 +1428,9 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                     )
                 hass.data[DATA_ALEXAMEDIA]["accounts"][email]["first_run"] = False
 
+        # Back off to the heartbeat only while push is actually delivering.
+        _update_poll_interval(account)
+
         return entity_state
 
     @_catch_login_errors
@@ -1479,10 +1515,8 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
             dt.as_local(account_dict["notifications"]["process_timestamp"]),
         )
         # Notify sensors that the notifications snapshot has been refreshed
-        async_dispatcher_send(
-            hass,
-            f"{DOMAIN}_{hide_email(email)}"[0:32],
-            {"notifications_refreshed": True},
+        async_get_event_router(hass, email).async_route(
+            {"notifications_refreshed": True}
         )
         return True
 
@@ -2063,7 +2097,10 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
     @_catch_login_errors
     async def update_bluetooth_state(login_obj, device_serial):
         """Update the bluetooth state on ws bluetooth event."""
-        bluetooth = await AlexaAPI.get_bluetooth(login_obj)
+        # Also refreshes the result the coordinator reuses while push is healthy.
+        bluetooth = await async_get_poll_scheduler(hass, email).async_call(
+            "get_bluetooth", AlexaAPI.get_bluetooth(login_obj)
+        )
         device = hass.data[DATA_ALEXAMEDIA]["accounts"][email]["devices"][
             "media_player"
         ][device_serial]
@@ -2211,10 +2248,8 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
             return
 
         if dnd is not None and "doNotDisturbDeviceStatusList" in dnd:
-            async_dispatcher_send(
-                hass,
-                f"{DOMAIN}_{hide_email(email)}"[0:32],
-                {"dnd_update": dnd["doNotDisturbDeviceStatusList"]},
+            async_get_event_router(hass, email).async_route(
+                {"dnd_update": dnd["doNotDisturbDeviceStatusList"]}
             )
             return
 
@@ -2575,17 +2610,13 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                         _LOGGER.debug(
                             "Updating media_player: %s", hide_serial(json_payload)
                         )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"player_state": json_payload},
+                        async_get_event_router(hass, email).async_route(
+                            {"player_state": json_payload}
                         )
                     elif command == "NotifyNowPlayingUpdated":
                         _LOGGER.debug("Send NowPlaying: %s", hide_serial(json_payload))
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"now_playing": json_payload},
+                        async_get_event_router(hass, email).async_route(
+                            {"now_playing": json_payload}
                         )
 
                 elif command == "PUSH_VOLUME_CHANGE":
@@ -2608,10 +2639,8 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                             "Updating media_player volume: %s",
                             hide_serial(json_payload),
                         )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"player_state": json_payload},
+                        async_get_event_router(hass, email).async_route(
+                            {"player_state": json_payload}
                         )
 
                 elif command == "PUSH_DOPPLER_CONNECTION_CHANGE":
@@ -2621,10 +2650,8 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                             "Updating media_player availability %s",
                             hide_serial(json_payload),
                         )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"player_state": json_payload},
+                        async_get_event_router(hass, email).async_route(
+                            {"player_state": json_payload}
                         )
 
                 elif command == "PUSH_EQUALIZER_STATE_CHANGE":
@@ -2650,10 +2677,8 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                             "Updating media_player equalizer state %s",
                             hide_serial(json_payload),
                         )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"player_state": json_payload},
+                        async_get_event_router(hass, email).async_route(
+                            {"player_state": json_payload}
                         )
 
                 elif command == "PUSH_BLUETOOTH_STATE_CHANGE":
@@ -2693,10 +2718,8 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                             "bluetooth_state %s", hide_serial(bluetooth_state)
                         )
                         if bluetooth_state:
-                            async_dispatcher_send(
-                                hass,
-                                f"{DOMAIN}_{hide_email(email)}"[0:32],
-                                {"bluetooth_change": bluetooth_state},
+                            async_get_event_router(hass, email).async_route(
+                                {"bluetooth_change": bluetooth_state}
                             )
 
                 elif command == "PUSH_MEDIA_QUEUE_CHANGE":
@@ -2706,10 +2729,8 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                             "Updating media_player queue %s",
                             hide_serial(json_payload),
                         )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"queue_state": json_payload},
+                        async_get_event_router(hass, email).async_route(
+                            {"queue_state": json_payload}
                         )
 
                 elif command == "PUSH_NOTIFICATION_CHANGE":
@@ -2727,10 +2748,8 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                             "Updating mediaplayer notifications: %s",
                             hide_serial(json_payload),
                         )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"notification_update": json_payload},
+                        async_get_event_router(hass, email).async_route(
+                            {"notification_update": json_payload}
                         )
 
                 elif command in [
@@ -2892,9 +2911,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
             )
         coordinator = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get("coordinator")
         if coordinator:
-            coordinator.update_interval = timedelta(
-                seconds=scan_interval * 10 if http2_enabled else scan_interval
-            )
+            _update_poll_interval(hass.data[DATA_ALEXAMEDIA]["accounts"][email])
             _LOGGER.debug(
                 "HTTP2push: %s, Polling interval: %s",
                 http2_enabled,
@@ -2981,20 +2998,14 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
 
         hass.data[DATA_ALEXAMEDIA]["accounts"][email]["coordinator"] = coordinator
         # Set correct interval now that http2 status is known
-        coordinator.set_http2_status(bool(http2_enabled))
+        _update_poll_interval(hass.data[DATA_ALEXAMEDIA]["accounts"][email])
 
         # Also store in runtime_data for type-safe access
         if runtime_data:
             runtime_data.coordinator = coordinator
     else:
         _LOGGER.debug("%s: setup_alexa: Reusing coordinator", hide_email(email))
-        # Use the optimized set_http2_status method if available
-        if isinstance(coordinator, AlexaMediaCoordinator):
-            coordinator.set_http2_status(bool(http2_enabled))
-        else:
-            coordinator.update_interval = timedelta(
-                seconds=scan_interval * 10 if http2_enabled else scan_interval
-            )
+        _update_poll_interval(hass.data[DATA_ALEXAMEDIA]["accounts"][email])
     # Fetch initial data
     _LOGGER.debug("%s: setup_alexa: Starting coordinator refresh", hide_email(email))
     _t = time.monotonic()
@@ -3101,6 +3112,9 @@ async def async_unload_entry(hass, entry) -> bool:
     await close_connections(hass, email)
     for listener in hass.data[DATA_ALEXAMEDIA]["accounts"][email][DATA_LISTENER]:
         listener()
+    poll_scheduler = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get("poll_scheduler")
+    if poll_scheduler:
+        poll_scheduler.async_cancel()
     hass.data[DATA_ALEXAMEDIA]["accounts"].pop(email)
     # Clean up config flows in progress
     flows_to_remove = []
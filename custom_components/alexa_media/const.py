@@ -105,6 +105,14 @@ HTTP2_ERROR_THRESHOLD = 5
 LAST_PUSH_INACTIVITY_SECONDS = 600.0
 LAST_PING_MAX_AGE_SECONDS = 900.0
 
+# Adaptive polling: while push is healthy these endpoints are only re-fetched
+# once their last result is older than this many seconds.
+PUSH_HEALTHY_ENDPOINT_MAX_AGE = {
+    "get_bluetooth": 1800.0,
+    "get_device_preferences": 3600.0,
+}
+REFRESH_COALESCE_WINDOW = 0.5  # merge per-device refresh requests (seconds)
+
 RECURRING_PATTERN = {
     None: "Never Repeat",
     "P1D": "Every day",
@@ -53,11 +53,9 @@ class AlexaMediaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.runtime_data = runtime_data
         self._scan_interval = scan_interval or SCAN_INTERVAL.total_seconds()
 
-        # Calculate update interval based on HTTP2 status
-        http2_enabled = runtime_data.http2 is not None if runtime_data else False
-        update_interval = timedelta(
-            seconds=self._scan_interval * 10 if http2_enabled else self._scan_interval
-        )
+        # Start at the scan interval; set_push_healthy() backs it off once
+        # push is known to be healthy.
+        update_interval = timedelta(seconds=self._scan_interval)
 
         # Initialize debouncer for request coalescing
         # This prevents multiple rapid refresh requests from hammering the API
@@ -82,18 +80,18 @@ class AlexaMediaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             request_refresh_debouncer=debouncer,
         )
 
-    def set_http2_status(self, enabled: bool) -> None:
-        """Update polling interval based on HTTP2 connection status.
+    def set_push_healthy(self, healthy: bool) -> None:
+        """Update polling interval based on HTTP2 push health.
 
-        When HTTP2 is enabled, we can poll less frequently since we get push updates.
+        While push is healthy, we can poll less frequently since we get push updates.
         """
         new_interval = timedelta(
-            seconds=self._scan_interval * 10 if enabled else self._scan_interval
+            seconds=self._scan_interval * 10 if healthy else self._scan_interval
         )
         if self.update_interval != new_interval:
             self.update_interval = new_interval
             _LOGGER.debug(
-                "Updated polling interval: %s (HTTP2: %s)",
+                "Updated polling interval: %s (push healthy: %s)",
                 new_interval,
-                enabled,
+                healthy,
             )
@@ -383,6 +383,17 @@ async def async_get_config_entry_diagnostics(
 
     coordinator_summaries = [_summarize_coordinator(c) for c in coordinators]
 
+    event_router = None
+    poll_scheduler = None
+    if isinstance(domain_data, Mapping):
+        account = (domain_data.get("accounts") or {}).get(
+            config_entry.data.get("email")
+        )
+        if isinstance(account, Mapping) and account.get("event_router"):
+            event_router = account["event_router"].get_stats()
+        if isinstance(account, Mapping) and account.get("poll_scheduler"):
+            poll_scheduler = account["poll_scheduler"].get_stats()
+
     data: dict = {
         "entry": {
             "entry_id": config_entry.entry_id,
@@ -401,6 +412,8 @@ async def async_get_config_entry_diagnostics(
             # AMP-specific summaries (useful when coordinator_count == 0)
             "amp_entry_runtime_summary": _summarize_amp_entry_runtime(entry_runtime),
             "amp_domain_summary": _summarize_amp_domain(domain_data, config_entry),
+            "event_router": event_router,
+            "poll_scheduler": poll_scheduler,
         },
     }
 
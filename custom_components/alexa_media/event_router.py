@@ -0,0 +1,151 @@
+"""Per-account push event router for Alexa Media Player.
+
+SPDX-License-Identifier: Apache-2.0
+
+Push events used to be sent on one account-wide dispatcher signal that every
+media player, switch and sensor of the account listened to, so each event was
+handled (and mostly discarded) by every entity. The router extracts the target
+device serial once and only calls the entities of that device. Events that
+concern the whole account go to the broadcast channel.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable
+
+from alexapy import hide_serial
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+
+from .const import DATA_ALEXAMEDIA
+from .helpers import safe_get
+
+_LOGGER = logging.getLogger(__name__)
+
+# Events every subscriber of the broadcast channel needs to see. Media players
+# track last_called and now_playing across devices, sensors rebuild from the
+# account wide notification snapshot.
+BROADCAST_EVENTS = frozenset(
+    {"last_called_change", "now_playing", "notifications_refreshed", "push_activity"}
+)
+
+
+def event_serial(event_type: str, payload: Any) -> str | None:
+    """Return the serial of the device a targeted event concerns."""
+    if not isinstance(payload, dict):
+        return None
+    if event_type == "bluetooth_change":
+        return payload.get("deviceSerialNumber")
+    return safe_get(payload, ["dopplerId", "deviceSerialNumber"])
+
+
+class AlexaEventRouter:
+    """Route push events of one account to the entities they concern."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize router."""
+        self.hass = hass
+        # Subscribers per device serial; None is the broadcast channel.
+        self._targets: dict[str | None, list[HassJob]] = {}
+        self._routed = 0
+        self._broadcast = 0
+        self._dropped = 0
+        self._deliveries = 0
+
+    @callback
+    def async_subscribe(
+        self,
+        target: Callable[[dict], Any],
+        serial: str | None = None,
+        broadcast: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to the events of a device and/or the broadcast channel.
+
+        Args:
+            target: Event handler, called with the event dict
+            serial: Device serial to receive targeted events for
+            broadcast: Also receive account-wide events
+
+        Returns:
+            Callable that removes the subscription
+        """
+        job = HassJob(target)
+        channels = ([serial] if serial else []) + ([None] if broadcast else [])
+        for channel in channels:
+            self._targets.setdefault(channel, []).append(job)
+
+        @callback
+        def _async_unsubscribe() -> None:
+            for channel in channels:
+                jobs = self._targets.get(channel)
+                if jobs and job in jobs:
+                    jobs.remove(job)
+                    if not jobs:
+                        del self._targets[channel]
+
+        return _async_unsubscribe
+
+    @callback
+    def async_route(self, event: dict) -> None:
+        """Send an event to its device's subscribers or to the broadcast channel.
+
+        Args:
+            event: Single key dict of event type to payload
+        """
+        event_type, payload = next(iter(event.items()))
+        if event_type in BROADCAST_EVENTS:
+            self._broadcast += 1
+            self._async_deliver(None, event)
+        elif event_type == "dnd_update":
+            # One account wide status list; hand every device its own entry.
+            for status in payload or []:
+                self._async_route_serial(
+                    status.get("deviceSerialNumber"), {event_type: [status]}
+                )
+        else:
+            self._async_route_serial(event_serial(event_type, payload), event)
+
+    @callback
+    def _async_route_serial(self, serial: str | None, event: dict) -> None:
+        if serial and self._async_deliver(serial, event):
+            self._routed += 1
+        else:
+            self._dropped += 1
+            _LOGGER.debug(
+                "No subscriber for %s event of %s",
+                next(iter(event)),
+                hide_serial(serial),
+            )
+
+    @callback
+    def _async_deliver(self, channel: str | None, event: dict) -> bool:
+        jobs = self._targets.get(channel)
+        if not jobs:
+            return False
+        for job in tuple(jobs):
+            self._deliveries += 1
+            try:
+                self.hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling %s event", next(iter(event)))
+        return True
+
+    def get_stats(self) -> dict[str, int]:
+        """Get routing statistics."""
+        return {
+            "routed": self._routed,
+            "broadcast": self._broadcast,
+            "dropped": self._dropped,
+            "deliveries": self._deliveries,
+            "devices": sum(1 for channel in self._targets if channel is not None),
+            "broadcast_subscribers": len(self._targets.get(None, [])),
+        }
+
+
+def async_get_event_router(hass: HomeAssistant, email: str) -> AlexaEventRouter:
+    """Get (or create) the event router of an account."""
+    account = hass.data[DATA_ALEXAMEDIA]["accounts"][email]
+    router = account.get("event_router")
+    if router is None:
+        router = account["event_router"] = AlexaEventRouter(hass)
+    return router
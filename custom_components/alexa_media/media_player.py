@@ -32,10 +32,6 @@ from homeassistant.const import CONF_EMAIL, CONF_NAME, CONF_PASSWORD, STATE_UNAV
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.discovery import async_load_platform
-from homeassistant.helpers.dispatcher import (
-    async_dispatcher_connect,
-    async_dispatcher_send,
-)
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util import slugify
 
@@ -60,8 +56,10 @@ from .const import (
     STREAMING_ERROR_MESSAGE,
     UPLOAD_PATH,
 )
+from .event_router import async_get_event_router
 from .exceptions import TimeoutException
 from .helpers import _catch_login_errors, add_devices, is_http2_enabled, safe_get
+from .poll_scheduler import async_get_poll_scheduler
 
 SUPPORT_ALEXA = (
     MediaPlayerEntityFeature.PAUSE
@@ -309,10 +307,10 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         """Perform tasks after loading."""
         # Register event handler on bus
         await self.refresh(self._device)
-        self._listener = async_dispatcher_connect(
-            self.hass,
-            f"{ALEXA_DOMAIN}_{hide_email(self._login.email)}"[0:32],
-            self._handle_event,
+        self._listener = async_get_event_router(
+            self.hass, self._login.email
+        ).async_subscribe(
+            self._handle_event, serial=self.device_serial_number, broadcast=True
         )
         # Register to coordinator:
         email = self._login.email
@@ -735,10 +733,8 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
                         "Updating player info by parent (http2): %s",
                         hide_serial(json_payload),
                     )
-                    async_dispatcher_send(
-                        self.hass,
-                        f"{ALEXA_DOMAIN}_{hide_email(self._login.email)}"[0:32],
-                        {"parent_state": json_payload},
+                    async_get_event_router(self.hass, self._login.email).async_route(
+                        {"parent_state": json_payload}
                     )
 
         if "queue_state" in event:
@@ -815,7 +811,9 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
 
     @util.Throttle(MIN_TIME_BETWEEN_SCANS, MIN_TIME_BETWEEN_FORCED_SCANS)
     async def _api_get_state(self):
-        return await self.alexa_api.get_state()
+        return await async_get_poll_scheduler(self.hass, self._login.email).async_call(
+            "get_state", self.alexa_api.get_state()
+        )
 
     @_catch_login_errors
     async def refresh(self, device=None, skip_api: bool = False, no_throttle=False):
@@ -958,10 +956,8 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
                                 "Updating player info by parent (API Call): %s",
                                 hide_serial(json_payload),
                             )
-                            async_dispatcher_send(
-                                self.hass,
-                                f"{ALEXA_DOMAIN}_{hide_email(self._login.email)}"[0:32],
-                                {"parent_state": json_payload},
+                            async_get_event_router(self.hass, self._login.email).async_route(
+                                {"parent_state": json_payload}
                             )
 
             if _transport := self._session.get("transport"):
@@ -1238,6 +1234,8 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         play states. An initial version included an update_devices call on
         every update. However, this quickly floods the network for every new
         device added. This should only call refresh() to call the AlexaAPI.
+        Refreshes requested for the account's devices within
+        REFRESH_COALESCE_WINDOW are merged into one batch.
         """
         try:
             if not self.enabled:
@@ -1280,7 +1278,10 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
             else None
         )
 
-        await self.refresh(device, no_throttle=True)
+        await async_get_poll_scheduler(self.hass, email).async_request_refresh(
+            self.device_serial_number,
+            lambda: self.refresh(device, no_throttle=True),
+        )
 
         # Safely access 'http2' setting
         push_enabled = is_http2_enabled(self.hass, self._login.email)
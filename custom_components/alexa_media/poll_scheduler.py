@@ -0,0 +1,205 @@
+"""Per-account REST polling scheduler for Alexa Media Player.
+
+SPDX-License-Identifier: Apache-2.0
+
+While the HTTP2 push channel is healthy most state arrives by push, so the
+coordinator backs off to a slow heartbeat and slow changing endpoints are
+answered from their last result until it is older than
+PUSH_HEALTHY_ENDPOINT_MAX_AGE. Per-device refreshes requested within
+REFRESH_COALESCE_WINDOW are merged and run as one batch for the account.
+Every call is counted and timed for diagnostics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+import logging
+import time
+from typing import Any, Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DATA_ALEXAMEDIA,
+    PUSH_HEALTHY_ENDPOINT_MAX_AGE,
+    REFRESH_COALESCE_WINDOW,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _EndpointStats:
+    __slots__ = ("calls", "errors", "skipped", "total", "max", "last")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.skipped = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+
+class AlexaPollScheduler:
+    """Decide which REST endpoints are due and coalesce device refreshes."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize scheduler."""
+        self.hass = hass
+        self.push_healthy = False
+        self._endpoints: dict[str, _EndpointStats] = {}
+        # Last result of the endpoints that may be skipped, with its monotonic time
+        self._results: dict[str, tuple[float, Any]] = {}
+        self._pending_refreshes: dict[str, tuple[Callable, asyncio.Future]] = {}
+        self._refresh_unsub: CALLBACK_TYPE | None = None
+        self._refresh_requests = 0
+        self._refresh_coalesced = 0
+        self._refresh_batches = 0
+
+    def _stats(self, endpoint: str) -> _EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats()
+        return stats
+
+    def is_due(self, endpoint: str) -> bool:
+        """Return whether an endpoint has to be fetched on this poll."""
+        max_age = PUSH_HEALTHY_ENDPOINT_MAX_AGE.get(endpoint)
+        if not self.push_healthy or max_age is None:
+            return True
+        last = self._results.get(endpoint)
+        return last is None or time.monotonic() - last[0] >= max_age
+
+    async def async_call(self, endpoint: str, request: Awaitable[Any]) -> Any:
+        """Await an API request, recording its latency.
+
+        Args:
+            endpoint: Name the call is reported under
+            request: Awaitable doing the API call
+
+        Returns:
+            The result of the request
+        """
+        stats = self._stats(endpoint)
+        start = time.monotonic()
+        try:
+            result = await request
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed = time.monotonic() - start
+            stats.calls += 1
+            stats.total += elapsed
+            stats.last = elapsed
+            stats.max = max(stats.max, elapsed)
+        if endpoint in PUSH_HEALTHY_ENDPOINT_MAX_AGE and result is not None:
+            self._results[endpoint] = (time.monotonic(), result)
+        return result
+
+    async def async_poll(
+        self, endpoint: str, request: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Fetch an endpoint if it is due, else return its last result.
+
+        Args:
+            endpoint: Name the call is reported under
+            request: Callable returning the awaitable API call
+
+        Returns:
+            The fresh or the last result of the endpoint
+        """
+        if self.is_due(endpoint):
+            return await self.async_call(endpoint, request())
+        self._stats(endpoint).skipped += 1
+        return self._results[endpoint][1]
+
+    async def async_request_refresh(
+        self, key: str, refresh: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Refresh a device together with all refreshes requested in the window.
+
+        Requests for a device that already has a refresh waiting join it.
+
+        Args:
+            key: Device serial
+            refresh: Callable returning the device refresh awaitable
+        """
+        self._refresh_requests += 1
+        pending = self._pending_refreshes.get(key)
+        if pending is not None:
+            self._refresh_coalesced += 1
+            future = pending[1]
+        else:
+            future = self.hass.loop.create_future()
+            self._pending_refreshes[key] = (refresh, future)
+            if self._refresh_unsub is None:
+                self._refresh_unsub = async_call_later(
+                    self.hass, REFRESH_COALESCE_WINDOW, self._async_run_refreshes
+                )
+        await asyncio.shield(future)
+
+    async def _async_run_refreshes(self, _now=None) -> None:
+        self._refresh_unsub = None
+        pending, self._pending_refreshes = self._pending_refreshes, {}
+        if not pending:
+            return
+        self._refresh_batches += 1
+        _LOGGER.debug("Refreshing %s devices in one batch", len(pending))
+        results = await asyncio.gather(
+            *(refresh() for refresh, _ in pending.values()), return_exceptions=True
+        )
+        for (_, future), result in zip(pending.values(), results):
+            if future.done():
+                continue
+            if isinstance(result, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(None)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop refreshes that have not started yet."""
+        if self._refresh_unsub is not None:
+            self._refresh_unsub()
+            self._refresh_unsub = None
+        for _, future in self._pending_refreshes.values():
+            future.cancel()
+        self._pending_refreshes.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get polling statistics."""
+        return {
+            "push_healthy": self.push_healthy,
+            "endpoints": {
+                endpoint: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "skipped": stats.skipped,
+                    "avg_ms": (
+                        round(stats.total / stats.calls * 1000, 1)
+                        if stats.calls
+                        else 0
+                    ),
+                    "max_ms": round(stats.max * 1000, 1),
+                    "last_ms": round(stats.last * 1000, 1),
+                }
+                for endpoint, stats in sorted(self._endpoints.items())
+            },
+            "refresh_requests": self._refresh_requests,
+            "refresh_coalesced": self._refresh_coalesced,
+            "refresh_batches": self._refresh_batches,
+        }
+
+
+def async_get_poll_scheduler(hass: HomeAssistant, email: str) -> AlexaPollScheduler:
+    """Get (or create) the poll scheduler of an account."""
+    account = hass.data[DATA_ALEXAMEDIA]["accounts"][email]
+    scheduler = account.get("poll_scheduler")
+    if scheduler is None:
+        scheduler = account["poll_scheduler"] = AlexaPollScheduler(hass)
+    return scheduler
@@ -20,7 +20,6 @@ from homeassistant.const import UnitOfTemperature, __version__ as HA_VERSION
 from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryNotReady, NoEntitySpecifiedError
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt
@@ -50,6 +49,7 @@ from .const import (
     RECURRING_PATTERN,
     RECURRING_PATTERN_ISO_SET,
 )
+from .event_router import async_get_event_router
 from .helpers import add_devices, alarm_just_dismissed, is_http2_enabled, safe_get
 
 _LOGGER = logging.getLogger(__name__)
@@ -964,10 +964,12 @@ class AlexaMediaNotificationSensor(SensorEntity):
             pass
         self._process_raw_notifications()
         # Register event handler on bus
-        self._listener = async_dispatcher_connect(
-            self.hass,
-            f"{ALEXA_DOMAIN}_{hide_email(self._account)}"[0:32],
+        self._listener = async_get_event_router(
+            self.hass, self._account
+        ).async_subscribe(
             self._handle_event,
+            serial=self._client.device_serial_number,
+            broadcast=True,
         )
         await self.async_update()
 
@@ -12,7 +12,6 @@ import logging
 
 from alexapy import AlexaAPI
 from homeassistant.exceptions import ConfigEntryNotReady, NoEntitySpecifiedError
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -28,6 +27,7 @@ from . import (
 from .alexa_entity import parse_power_from_coordinator
 from .alexa_media import AlexaMedia
 from .const import CONF_EXTENDED_ENTITY_DISCOVERY
+from .event_router import async_get_event_router
 from .helpers import _catch_login_errors, add_devices, safe_get
 
 try:
@@ -196,10 +196,8 @@ class AlexaMediaSwitch(SwitchDevice, AlexaMedia):
         except AttributeError:
             pass
         # Register event handler on bus
-        self._listener = async_dispatcher_connect(
-            self.hass,
-            f"{ALEXA_DOMAIN}_{hide_email(self.email)}"[0:32],
-            self._handle_event,
+        self._listener = async_get_event_router(self.hass, self.email).async_subscribe(
+            self._handle_event, serial=self._client.device_serial_number
         )
 
     async def async_will_remove_from_hass(self):
@@ -80,6 +80,7 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
             
         self._updatedDevice = False
         self._shutdown = False
+        self._changed_models = None
         self.data = self.get_model()
         self._eventloop = asyncio.get_running_loop()
         # Pass LOGGERFORHA logger into HA as otherwise it generates a debug output line every single time we tell it we have an update
@@ -134,7 +135,10 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
             self._update_data()
 
         elif event == "event_printer_data_update":
-            self._update_data()
+            # Skip the entity fan-out for reports that didn't change anything.
+            changed_models = self.get_model().pop_changed_models()
+            if changed_models is None or len(changed_models) != 0:
+                self._update_data(changed_models)
 
             # Check is usage hours change and persist to config entry if it did.
             if self.latest_usage_hours != self.get_model().info.usage_hours:
@@ -150,7 +154,7 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
 
         elif event == "event_printer_chamber_image_update":
             if self.get_option_enabled(Options.IMAGECAMERA):
-                self._update_data()
+                self._update_data({"chamber_image"})
 
         elif event == "event_printer_cover_image_update":
             self._update_data()
@@ -160,6 +164,7 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
 
         elif event == "event_print_error":
             self._update_print_error()
+            self._update_data()
 
         # event_print_started
         # event_print_finished
@@ -722,14 +727,29 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
         device = self.get_model()
         return device
     
-    def _update_data(self):
+    def _update_data(self, changed_models: set | None = None):
         device = self.get_model()
+        self._changed_models = changed_models
         try:
             self.async_set_updated_data(device)
         except Exception as e:
             LOGGER.error("An exception occurred calling async_set_updated_data():")
             LOGGER.error(f"Exception type: {type(e)}")
             LOGGER.error(f"Exception data: {e}")
+        finally:
+            self._changed_models = None
+
+    def models_changed(self, models: frozenset | None) -> bool:
+        """Return whether the update being dispatched touches any of the given pybambu sub-models.
+
+        None for the update means everything may have changed. None for the models means any printer data,
+        which excludes chamber image frames that only concern the entities that declare them.
+        """
+        if self._changed_models is None:
+            return True
+        if models is None:
+            return not self._changed_models <= {"chamber_image"}
+        return not self._changed_models.isdisjoint(models)
 
     def _update_printer_error(self):
         dev_reg = device_registry.async_get(self._hass)
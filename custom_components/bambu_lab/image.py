@@ -91,6 +91,9 @@ class CoverImage(ImageEntity, BambuLabEntity):
     
 class ChamberImage(ImageEntity, BambuLabEntity):
     """Representation of an image entity."""
+
+    _model_dependencies = frozenset({"chamber_image"})
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -1,4 +1,5 @@
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -6,7 +7,20 @@ from .const import DOMAIN, LOGGER, BRAND
 from .coordinator import BambuDataUpdateCoordinator
 
 
-class BambuLabEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
+class BambuCoordinatorEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
+    """Defines a coordinator entity that only refreshes when its data changed."""
+
+    # pybambu Device sub-models the entity reads. None refreshes on every update.
+    _model_dependencies: frozenset[str] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self.coordinator.models_changed(self._model_dependencies):
+            super()._handle_coordinator_update()
+
+
+class BambuLabEntity(BambuCoordinatorEntity):
     """Defines a base Bambu entity."""
 
     _attr_has_entity_name = True
@@ -17,10 +31,12 @@ class BambuLabEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
         return self.coordinator.get_printer_device()
 
 
-class AMSEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
+class AMSEntity(BambuCoordinatorEntity):
     """Defines a base AMS entity."""
 
     _attr_has_entity_name = True
+    # The active tray follows the extruder and the external spools.
+    _model_dependencies = frozenset({"ams", "extruder", "external_spool", "home_flag", "info"})
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -28,10 +44,11 @@ class AMSEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
         return self.coordinator.get_ams_device(self.index)
 
 
-class VirtualTrayEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
+class VirtualTrayEntity(BambuCoordinatorEntity):
     """Defines an External Spool entity."""
 
     _attr_has_entity_name = True
+    _model_dependencies = frozenset({"external_spool", "ams", "extruder", "home_flag", "info"})
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -39,10 +56,11 @@ class VirtualTrayEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
         return self.coordinator.get_virtual_tray_device(self.suffix)
 
 
-class HotendRackEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
+class HotendRackEntity(BambuCoordinatorEntity):
     """Defines a base Hotend Rack entity."""
 
     _attr_has_entity_name = True
+    _model_dependencies = frozenset({"hotend_rack"})
 
     @property
     def device_info(self) -> DeviceInfo:
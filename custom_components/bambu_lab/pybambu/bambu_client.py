@@ -8,6 +8,7 @@ import math
 import os
 import queue
 import re
+import select
 import socket
 import ssl
 import struct
@@ -110,12 +111,11 @@ class ChamberImageThread(threading.Thread):
             auth_data += struct.pack("<x")
 
         ctx = self._client.local_tls_context
+        MAX_PAYLOAD_SIZE = 16 * 1024 * 1024
 
         jpeg_start = bytearray([0xff, 0xd8, 0xff, 0xe0])
         jpeg_end = bytearray([0xff, 0xd9])
 
-        read_chunk_size = 4096 # 4096 is the max we'll get even if we increase this.
-
         # Payload format for each image is:
         # 16 byte header:
         #   Bytes 0:3   = little endian payload size for the jpeg image (does not include this header).
@@ -129,6 +129,11 @@ class ChamberImageThread(threading.Thread):
         # Bytes payload_size-2:payload_size = jpeg_end magic bytes
         #
         # Further attempts to receive data will get SSLWantReadError until a new image is ready (1-2 seconds later)
+        #
+        # The header and each image are read straight into preallocated buffers. A completed image buffer is handed
+        # to the client, which returns the buffer of the previous image to receive the next one into.
+        header = bytearray(16)
+        img = bytearray()
         while connect_attempts < MAX_CONNECT_ATTEMPTS and not self._stop_event.is_set():
             connect_attempts += 1
             try:
@@ -136,8 +141,6 @@ class ChamberImageThread(threading.Thread):
                     try:
                         sslSock = ctx.wrap_socket(sock, server_hostname=hostname)
                         sslSock.write(auth_data)
-                        img = None
-                        payload_size = 0
 
                         status = sslSock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
                         LOGGER.debug(f"SOCKET STATUS: {status}")
@@ -151,52 +154,42 @@ class ChamberImageThread(threading.Thread):
                         continue
 
                     sslSock.setblocking(False)
+                    received_image = False
                     while not self._stop_event.is_set():
-                        try:
-                            dr = sslSock.recv(read_chunk_size)
-                        except ssl.SSLWantReadError:
-                            if self._stop_event.wait(1):
-                                break
-                            continue
-
-                        if img is not None and len(dr) > 0:
-                            img += dr
-                            if len(img) > payload_size:
-                                # We got more data than we expected.
-                                LOGGER.error(f"Unexpected image payload received: {len(img)} > {payload_size}")
-                                # Reset buffer
-                                img = None
-                            elif len(img) == payload_size:
-                                # We should have the full image now.
-                                if img[:4] != jpeg_start:
-                                    LOGGER.error("JPEG start magic bytes missing.")
-                                elif img[-2:] != jpeg_end:
-                                    LOGGER.error("JPEG end magic bytes missing.")
-                                else:
-                                    # Content is as expected. Send it.
-                                    self._client.on_jpeg_received(img)
-
-                                # Reset buffer
-                                img = None
-                            # else:
-                            # Otherwise we need to continue looping without reseting the buffer to receive the remaining data
-                            # and without delaying.
-
-                        elif len(dr) == 16:
-                            # We got the header bytes. Get the expected payload size from it and create the image buffer bytearray.
-                            # Reset connect_attempts now we know the connect was successful.
-                            connect_attempts = 0
-                            img = bytearray()
-                            payload_size = int.from_bytes(dr[0:3], byteorder='little')
-
-                        elif len(dr) == 0:
+                        with memoryview(header) as view:
+                            received = self._recv_into(sslSock, view)
+                        if received == 0 and not received_image:
                             # This occurs if the wrong access code was provided.
                             LOGGER.error("Chamber image connection rejected by the printer. Check provided access code and IP address.")
+                        if received != len(header):
+                            if self._stop_event.is_set():
+                                break
                             raise RuntimeError("Received no data unexpectedly.")
 
+                        # We got the header bytes. Reset connect_attempts now we know the connect was successful.
+                        connect_attempts = 0
+                        payload_size = int.from_bytes(header[0:4], byteorder='little')
+                        if payload_size < len(jpeg_start) + len(jpeg_end) or payload_size > MAX_PAYLOAD_SIZE:
+                            LOGGER.error(f"Unexpected image payload size received: {payload_size}")
+                            raise RuntimeError(f"Unexpected image payload size received: {payload_size}")
+
+                        if len(img) < payload_size:
+                            img = bytearray(payload_size)
+                        with memoryview(img) as view:
+                            received = self._recv_into(sslSock, view[:payload_size])
+                        if received != payload_size:
+                            if self._stop_event.is_set():
+                                break
+                            raise RuntimeError("Received no data unexpectedly.")
+                        received_image = True
+
+                        if img[:4] != jpeg_start:
+                            LOGGER.error("JPEG start magic bytes missing.")
+                        elif img[payload_size - 2:payload_size] != jpeg_end:
+                            LOGGER.error("JPEG end magic bytes missing.")
                         else:
-                            LOGGER.error(f"UNEXPECTED DATA RECEIVED: {len(dr)}")
-                            raise RuntimeError(f"Unexpected data chunk size received: {len(dr)}")
+                            # Content is as expected. Send it and receive the next image into the buffer we get back.
+                            img = self._client.on_jpeg_received(img, payload_size)
 
             except OSError as e:
                 if e.errno == 113:
@@ -215,6 +208,25 @@ class ChamberImageThread(threading.Thread):
 
         LOGGER.debug("Chamber image thread exited.")
 
+    def _recv_into(self, sslSock, view) -> int:
+        """Fill view from the socket. Returns fewer bytes than requested if the connection closed or we were stopped."""
+        received = 0
+        while received < len(view):
+            try:
+                count = sslSock.recv_into(view[received:])
+            except ssl.SSLWantReadError:
+                # Wait for the socket to become readable instead of polling. Decrypted data may already be buffered
+                # by the SSL layer without the socket being readable. Wake up every second to check for stop().
+                if sslSock.pending() == 0:
+                    select.select([sslSock], [], [], 1)
+                if self._stop_event.is_set():
+                    break
+                continue
+            if count == 0:
+                break
+            received += count
+        return received
+
 
 class MqttThread(threading.Thread):
     def __init__(self, client):
@@ -578,8 +590,8 @@ class BambuClient:
         self._device.info.set_online(False)
         self.publish(START_PUSH)
 
-    def on_jpeg_received(self, bytes):
-        self._device.chamber_image.set_image(bytes)
+    def on_jpeg_received(self, bytes, size = None) -> bytearray:
+        return self._device.chamber_image.set_image(bytes, size)
 
     def on_message(self, client, userdata, message):
         """Return the payload when received"""
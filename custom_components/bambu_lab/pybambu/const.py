@@ -214,6 +214,11 @@ AMS_DRYING_MODELS = [
     "AMS HT"
 ]
 
+# Chamber image frames are published on every frame while someone fetched the image within the viewer timeout,
+# otherwise only once per idle interval. The latest frame is always kept for on-demand reads.
+CHAMBER_IMAGE_IDLE_INTERVAL = 10
+CHAMBER_IMAGE_VIEWER_TIMEOUT = 5
+
 AMS_MODELS = [
     "AMS",
     "AMS Lite",
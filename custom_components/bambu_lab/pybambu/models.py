@@ -12,6 +12,7 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from dateutil import parser, tz
+from io import BytesIO
 from pathlib import Path
 from zipfile import ZipFile
 from typing import List, Union
@@ -52,6 +53,8 @@ from .const import (
     GCODE_STATE_OPTIONS,
     PRINT_TYPE_OPTIONS,
     AIRDUCT_MODES,
+    CHAMBER_IMAGE_IDLE_INTERVAL,
+    CHAMBER_IMAGE_VIEWER_TIMEOUT,
     TempEnum, Print_Fun_Values,
 )
 from .commands import (
@@ -96,28 +99,52 @@ class Device:
         self.cover_image = CoverImage(client = client)
         self.pick_image = PickImage(client = client)
         self.print_fun = PrintFun(client = client)
+        self._changed_models = None
+        self._changed_models_lock = threading.Lock()
+
+        # Sub-models in update order with the top level print report keys they read. A report only
+        # runs the sub-models whose keys it carries; None runs on every report (fan overrides expire
+        # on a timer).
+        self._print_dispatch = (
+            ("info", self.info, frozenset({"net", "upgrade_state", "device", "nozzle_diameter", "nozzle_type",
+                                           "home_flag", "stat", "wifi_signal", "hw_switch_state"})),
+            ("upgrade", self.upgrade, frozenset({"upgrade_state"})),
+            ("print_job", self.print_job, frozenset({"mc_percent", "gcode_state", "gcode_file", "print_type",
+                                                     "subtask_name", "layer_num", "total_layer_num", "ams_mapping",
+                                                     "s_obj", "mc_remaining_time", "gcode_file_prepare_percent",
+                                                     "print_error"})),
+            ("lights", self.lights, frozenset({"lights_report"})),
+            ("fans", self.fans, None),
+            ("speed", self.speed, frozenset({"spd_lvl", "spd_mag"})),
+            ("stage", self.stage, frozenset({"print_type", "stage", "stg_cur"})),
+            ("extruder", self.extruder, frozenset({"device"})), # Must be before the AMS and external spools and temperature
+            ("temperature", self.temperature, frozenset({"device", "bed_temper", "bed_target_temper", "chamber_temper",
+                                                         "nozzle_temper", "nozzle_target_temper"})),
+            ("ams", self.ams, frozenset({"ams", "device"})),
+            ("external_spool", self.external_spool[0], frozenset({"vir_slot", "vt_tray"})),
+            ("external_spool", self.external_spool[1], frozenset({"vir_slot", "vt_tray"})),
+            ("hms", self.hms, frozenset({"hms"})),
+            ("print_error", self.print_error, frozenset({"print_error"})),
+            ("camera", self.camera, frozenset({"ipcam"})),
+            ("home_flag", self.home_flag, frozenset({"home_flag"})),
+            ("print_fun", self.print_fun, frozenset({"fun"})),
+            ("extruder_tool", self.extruder_tool, frozenset({"device"})),
+            ("hotend_rack", self.hotend_rack, frozenset({"device"})),
+        )
 
     def print_update(self, data) -> bool:
-        send_event = False
-        send_event = send_event | self.info.print_update(data = data)
-        send_event = send_event | self.upgrade.print_update(data = data)
-        send_event = send_event | self.print_job.print_update(data = data)
-        send_event = send_event | self.lights.print_update(data = data)
-        send_event = send_event | self.fans.print_update(data = data)
-        send_event = send_event | self.speed.print_update(data = data)
-        send_event = send_event | self.stage.print_update(data = data)
-        send_event = send_event | self.extruder.print_update(data = data) # Must be before the AMS and external spools and temperature
-        send_event = send_event | self.temperature.print_update(data = data)
-        send_event = send_event | self.ams.print_update(data = data)
-        send_event = send_event | self.external_spool[0].print_update(data = data)
-        send_event = send_event | self.external_spool[1].print_update(data = data)
-        send_event = send_event | self.hms.print_update(data = data)
-        send_event = send_event | self.print_error.print_update(data = data)
-        send_event = send_event | self.camera.print_update(data = data)
-        send_event = send_event | self.home_flag.print_update(data = data)
-        send_event = send_event | self.print_fun.print_update(data = data)
-        send_event = send_event | self.extruder_tool.print_update(data = data)
-        send_event = send_event | self.hotend_rack.print_update(data = data)
+        keys = data.keys()
+        changed = set()
+        for name, model, model_keys in self._print_dispatch:
+            if model_keys is None or not model_keys.isdisjoint(keys):
+                if model.print_update(data = data):
+                    changed.add(name)
+
+        with self._changed_models_lock:
+            if self._changed_models is None:
+                self._changed_models = changed
+            else:
+                self._changed_models |= changed
 
         if data.get("command") == "push_status":
             if data.get("msg", 0) == 0:
@@ -129,6 +156,17 @@ class Device:
                     self._client.callback("event_printer_ready")
 
         self._client.callback("event_printer_data_update")
+        return len(changed) != 0
+
+    def pop_changed_models(self) -> set | None:
+        """Return the names of the sub-models changed by print reports since the last call.
+
+        None means no print report was applied since then, so the caller can't tell what changed.
+        """
+        with self._changed_models_lock:
+            changed = self._changed_models
+            self._changed_models = None
+        return changed
 
     @property
     def has_full_printer_data(self):
@@ -1063,6 +1101,9 @@ class PrintJob:
             if not self._client.ftp_enabled:
                 # We can update task data from the cloud immediately. But ftp has to wait.
                 self._update_task_data()
+            elif not self._client._test_mode:
+                # But a reprint of a model we already have cached can be loaded right away.
+                self._download_task_data_from_printer(cache_only=True)
 
         old_gcode_file_prepare_percent = self._gcode_file_prepare_percent
         self._gcode_file_prepare_percent = int(data.get("gcode_file_prepare_percent", str(self._gcode_file_prepare_percent)))
@@ -1188,7 +1229,11 @@ class PrintJob:
     #
     # The legacy caching approach just put them in a matching path in the local cache for
     # the printer. If we encounter that, we move the files to the new size-based subdirectory.
-    def _attempt_ftp_download_of_file(self, ftp, file_path, progress_callback=None):
+    #
+    # Next to each cached file we keep a <name>.metadata.json with the printer's name, size and modification time
+    # of the file (if the printer reports it) and, once parsed, the metadata extracted from it. A changed
+    # modification time invalidates the cached file.
+    def _attempt_ftp_download_of_file(self, ftp, file_path, progress_callback=None, cache_only=False):
         if 'Metadata' in file_path:
             # This is a ram drive on the X1 and is not accessible via FTP
             return None
@@ -1198,7 +1243,8 @@ class PrintJob:
         try:
             LOGGER.debug(f"Looking for '{file_path}'")
             size = int(ftp.size(file_path))
-            LOGGER.debug(f"File exists. Size: {size} bytes.")
+            mtime = self._ftp_mtime(ftp, file_path)
+            LOGGER.debug(f"File exists. Size: {size} bytes. Modified: {mtime}")
 
             relative_path = Path(file_path.lstrip('/'))
             subdir = relative_path.parent
@@ -1216,8 +1262,10 @@ class PrintJob:
             cache_file_path.parent.mkdir(parents=True, exist_ok=True)
 
             # First check the new cache file path:
-            if cache_file_path.exists() and cache_file_path.stat().st_size == size:
+            if cache_file_path.exists() and cache_file_path.stat().st_size == size and \
+                self._cached_model_matches(str(cache_file_path), mtime):
                 LOGGER.debug(f"File already in cache: {cache_file_path}")
+                self._remember_model_source(str(cache_file_path), file_path, size, mtime)
                 # Update last edited time to refresh its cache lifetime and print order in history.
                 os.utime(cache_file_path, None)
                 return str(cache_file_path)
@@ -1243,10 +1291,14 @@ class PrintJob:
                         except Exception as e:
                             LOGGER.debug(f"Failed moving {src} -> {dst}: {e}")
 
+                self._remember_model_source(str(cache_file_path), file_path, size, mtime)
                 # Update last edited time to refresh it's cache lifetime and print order in history.
                 os.utime(cache_file_path, None)
                 return str(cache_file_path)
 
+            if cache_only:
+                return None
+
             # Download to cache with progress tracking
             total_downloaded = 0
             start_time = time.time()
@@ -1289,6 +1341,8 @@ class PrintJob:
             download_speed = size / download_time if download_time > 0 else 0
             
             LOGGER.debug(f"Successfully downloaded '{file_path}' to cache. Time: {download_time:.0f}s, Speed: {download_speed/1024:.0f} KB/s")
+            # Replaces any metadata extracted from a previous file of the same name and size.
+            self._write_model_metadata(str(cache_file_path), {'name': file_path, 'size': size, 'mtime': mtime})
             return str(cache_file_path)
                     
         except ftplib.error_perm as e:
@@ -1300,16 +1354,65 @@ class PrintJob:
             pass
         return None
 
+    def _ftp_mtime(self, ftp, file_path) -> Union[str, None]:
+        # Not every printer firmware supports MDTM. Without it the cache is keyed by name and size only.
+        try:
+            return ftp.voidcmd(f"MDTM {file_path}").split()[-1]
+        except Exception:
+            return None
+
+    MODEL_METADATA_VERSION = 1
+
+    def _model_metadata_path(self, model_file_path: str) -> str:
+        return os.path.splitext(model_file_path)[0] + '.metadata.json'
+
+    def _read_model_metadata(self, model_file_path: str) -> Union[dict, None]:
+        try:
+            with open(self._model_metadata_path(model_file_path), 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('version') != self.MODEL_METADATA_VERSION:
+            return None
+        return data
+
+    def _write_model_metadata(self, model_file_path: str, data: dict):
+        data['version'] = self.MODEL_METADATA_VERSION
+        path = self._model_metadata_path(model_file_path)
+        try:
+            with open(f"{path}.tmp", 'w') as f:
+                json.dump(data, f)
+            os.replace(f"{path}.tmp", path)
+        except OSError as e:
+            LOGGER.debug(f"Failed to write model metadata cache '{path}': {e}")
+
+    def _remember_model_source(self, model_file_path: str, name: str, size: int, mtime):
+        # Files cached before the sidecar existed (or by firmware without MDTM) adopt the printer's values on
+        # their next cache hit, so a later re-upload under the same name and size is detected by its mtime.
+        cached = self._read_model_metadata(model_file_path) or {}
+        source = {'name': name, 'size': size, 'mtime': mtime}
+        missing = {key: value for key, value in source.items() if cached.get(key) is None and value is not None}
+        if missing:
+            cached.update(missing)
+            self._write_model_metadata(model_file_path, cached)
+
+    def _cached_model_matches(self, model_file_path: str, mtime) -> bool:
+        # The cached file is only stale if both the printer and the cache know the modification time and it differs.
+        if mtime is None:
+            return True
+        cached = self._read_model_metadata(model_file_path)
+        return cached is None or cached.get('mtime') in (None, mtime)
+
     ftp_search_paths = ['/cache/', '/']
-    def _attempt_ftp_download_of_file_from_search_path(self, ftp, filename):
+    def _attempt_ftp_download_of_file_from_search_path(self, ftp, filename, cache_only=False):
         for path in self.ftp_search_paths:
             file_path = f"{path}{filename.lstrip('/')}"
-            result = self._attempt_ftp_download_of_file(ftp, file_path)
+            result = self._attempt_ftp_download_of_file(ftp, file_path, cache_only=cache_only)
             if result is not None:
                 return result
         return None
 
-    def _attempt_ftp_download(self, ftp) -> Union[str, None]:
+    def _attempt_ftp_download(self, ftp, cache_only=False) -> Union[str, None]:
 
         filenames_to_try = []
 
@@ -1332,11 +1435,11 @@ class PrintJob:
 
         # Try each candidate filename in order
         for filename in filenames_to_try:
-            model_file = self._attempt_ftp_download_of_file_from_search_path(ftp, filename=filename)
+            model_file = self._attempt_ftp_download_of_file_from_search_path(ftp, filename=filename, cache_only=cache_only)
             if model_file is not None:
                 return model_file
 
-        if self._subtask_name == "":
+        if self._subtask_name == "" and not cache_only:
             # Fall back to find the latest file by timestamp but only if we don't have a subtask name set - printer must have been rebooted.
             LOGGER.debug("Falling back to searching for latest 3mf file.")
             model_path = self._find_latest_file(ftp, self.ftp_search_paths, ['.3mf'])
@@ -1440,7 +1543,7 @@ class PrintJob:
         self._prune_old_files(directory=cache_file_path,
                               extensions=['.3mf'],
                               keep=self._client._print_cache_count,
-                              extra_extensions=['.jpg', '.png', '.slice_info.config', '.gcode'])
+                              extra_extensions=['.jpg', '.png', '.slice_info.config', '.gcode', '.pick.png', '.metadata.json'])
 
     async def async_prune_timelapse_files(self):
         loop = asyncio.get_event_loop()
@@ -1592,13 +1695,13 @@ class PrintJob:
         if self._client.ftp_enabled:
             self._download_task_data_from_printer()
 
-    def _download_task_data_from_printer(self):
+    def _download_task_data_from_printer(self, cache_only=False):
         if self._ftpThread is None:
             # Only start a new thread if there
             LOGGER.debug("Starting FTP thread.")
-            self._ftpThread = threading.Thread(target=self._async_download_task_data_from_printer)
+            self._ftpThread = threading.Thread(target=self._async_download_task_data_from_printer, args=(cache_only,))
             self._ftpThread.start()
-        else:
+        elif not cache_only:
             LOGGER.debug("FTP thread already running.")
             self._ftpRunAgain = True
 
@@ -1613,7 +1716,7 @@ class PrintJob:
         self._client._device.pick_image.set_image(None)
         self._printable_objects = {}
 
-    def _async_download_task_data_from_printer(self):
+    def _async_download_task_data_from_printer(self, cache_only=False):
         current_thread = threading.current_thread()
         current_thread.setName(f"{self._client._device.info.device_type}-FTP-{threading.get_native_id()}")
         LOGGER.debug(f"FTP thread starting.")
@@ -1622,9 +1725,10 @@ class PrintJob:
             while True:
                 self._ftpRunAgain = False
                 start_time = datetime.now()
-                self._async_download_task_data_from_printer_worker()
+                self._async_download_task_data_from_printer_worker(cache_only)
                 if not self._ftpRunAgain:
                     break
+                cache_only = False
                 end_time = datetime.now()
                 LOGGER.debug("FTP thread re-running. Elapsed time = {(end_time-start_time).seconds}s")
         except Exception as e:
@@ -1634,10 +1738,18 @@ class PrintJob:
         LOGGER.info(f"FTP thread exiting. Elapsed time = {(end_time-start_time).seconds}s")
         self._ftpThread = None
 
-    def _async_download_task_data_from_printer_worker(self):
+    def _async_download_task_data_from_printer_worker(self, cache_only=False):
         # Open the FTP connection
         ftp = self._client.ftp_connection()
 
+        if cache_only:
+            model_file_path = self._attempt_ftp_download(ftp, cache_only=True)
+            ftp.quit()
+            if model_file_path is None:
+                LOGGER.debug("Model file is not cached yet.")
+                return False
+            return self._load_model_data(model_file_path, cache_only=True)
+
         for i in range(1,13):
             model_file_path = self._attempt_ftp_download(ftp)
             if model_file_path is not None:
@@ -1660,164 +1772,227 @@ class PrintJob:
             LOGGER.debug("No model file found.")
             return
 
+        return self._load_model_data(model_file_path)
+
+    def _load_model_data(self, model_file_path: str, cache_only=False) -> bool:
         result = False
         
         try:
             LOGGER.debug(f"File size is {os.path.getsize(model_file_path)} bytes")
 
-            model_dir = os.path.dirname(model_file_path)
+            cached = self._read_model_metadata(model_file_path) or {}
+            metadata = cached.get('metadata')
+            images = self._read_cached_model_images(model_file_path, metadata) if metadata is not None else None
+            if images is not None:
+                LOGGER.debug("Using cached model metadata.")
+            elif cache_only:
+                LOGGER.debug("Model metadata is not cached yet.")
+                return False
+            else:
+                metadata, images = self._extract_model_metadata(model_file_path)
+                cached['metadata'] = metadata
+                self._write_model_metadata(model_file_path, cached)
 
-            # Open the 3mf zip archive
-            with ZipFile(model_file_path) as archive:
-                # Extract the slicer XML config and parse the plate tree
-                plate = ElementTree.fromstring(archive.read('Metadata/slice_info.config')).find('plate')
-                
-                # Iterate through each config element and extract the data
-                # Example contents:
-                # {'key': 'index', 'value': '2'}
-                # {'key': 'printer_model_id', 'value': 'C12'}
-                # {'key': 'nozzle_diameters', 'value': '0.4'}
-                # {'key': 'timelapse_type', 'value': '0'}
-                # {'key': 'prediction', 'value': '5935'}
-                # {'key': 'weight', 'value': '20.91'}
-                # {'key': 'outside', 'value': 'false'}
-                # {'key': 'support_used', 'value': 'false'}
-                # {'key': 'label_object_enabled', 'value': 'true'}
-                # {'identify_id': '123', 'name': 'ModelObjectOne.stl', 'skipped': 'false'}
-                # {'identify_id': '394', 'name': 'ModelObjectTwo.stl', 'skipped': 'false'}
-                # {'id': '1', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#000000', 'used_m': '5.45', 'used_g': '17.32'}
-                # {'id': '2', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#8D8C8F', 'used_m': '0.84', 'used_g': '2.66'}
-                # {'id': '3', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#FFFFFF', 'used_m': '0.29', 'used_g': '0.93'}
-                
-                # Start a total print length count to be compiled from each filament
-                print_length = 0
-                plate_number = None
-                _printable_objects = {}
-                filament_count = len(self.ams_mapping)
-                plate_filament_count = len(plate.findall('filament'))
-
-                # Reset filament data
-                self._ams_print_weights = [0.0] * 136 # TODO: Convert to a dict in the future?
-                self._ams_print_lengths = [0.0] * 136 # TODO: Convert to a dict in the future?
-
-                for metadata in plate:
-                    if (metadata.get('key') == 'index'):
-                        # Index is the plate number being printed
-                        plate_number = metadata.get('value')
-                        LOGGER.debug(f"Plate: {plate_number}")
-                        
-                        # Now we have the plate number, extract the cover image from the archive
-                        self._client._device.cover_image.set_image(archive.read(f"Metadata/plate_{plate_number}.png"))
-                        LOGGER.debug(f"Cover image: Metadata/plate_{plate_number}.png")
+            self._apply_model_metadata(metadata, images)
 
-                        # Save the cover image to the cache
-                        try:
-                            # Save the cover image directly to the cache
-                            cover_filename = os.path.splitext(os.path.basename(model_file_path))[0] + '.png'
-                            cover_path = os.path.join(model_dir, cover_filename)
-                            with archive.open(f"Metadata/plate_{plate_number}.png") as cover_entry, open(cover_path, "wb") as target_path:
-                                shutil.copyfileobj(cover_entry, target_path)
-                            LOGGER.debug(f"Cover image saved to: {cover_path}")
-                        except Exception as e:
-                            LOGGER.error(f"Failed to save cover image: {e}")
+            self._client.callback("event_printer_data_update")
+            result = True
+        except Exception as e:
+            LOGGER.error(f"Unexpected error parsing model data: {e}")
+        
+        self.prune_print_history_files()
 
-                        try:
-                            # Save the gcode file to the cache
-                            gcode_filename = os.path.splitext(os.path.basename(model_file_path))[0] + '.gcode'
-                            gcode_path = os.path.join(model_dir, gcode_filename)
-                            with archive.open(f"Metadata/plate_{plate_number}.gcode") as gcode_entry, open(gcode_path, "wb") as target_path:
-                                shutil.copyfileobj(gcode_entry, target_path)
-                                self.gcode_file_downloaded = gcode_filename
-                        except Exception as e:
-                            self.gcode_file_downloaded = "ERROR"
-                            LOGGER.error(f"Error while extracting gcode zip entry to target path. {repr(e)}")
-                        
-                        # And extract the plate type from the plate json.
-                        self.print_bed_type = json.loads(archive.read(f"Metadata/plate_{plate_number}.json")).get('bed_type')
-                    elif (metadata.get('key') == 'weight'):
-                        LOGGER.debug(f"Weight: {metadata.get('value')}")
-                        self.print_weight = metadata.get('value')
-                    elif (metadata.get('key') == 'prediction'):
-                        # Estimated print length in seconds
-                        LOGGER.debug(f"Print time: {metadata.get('value')}s")
-                    elif (metadata.tag == 'object'):
-                        # Get the list of printable objects present on the plate before slicing.
-                        # This includes hidden objects which need to be filtered out later.
-                        if metadata.get('skipped') == f"false":
-                            _printable_objects[metadata.get('identify_id')] = metadata.get('name')
-                    elif (metadata.tag == 'filament'):
-                        try:
-                            # Filament used for the current print job. The plate info contains filaments
-                            # identified in the order they appear in the slicer. These IDs must be
-                            # mapped to the AMS tray mappings provided by MQTT print.ams_mapping
-
-                            # Zero-index the filament ID
-                            filament_index = int(metadata.get('id')) - 1
-                            log_label = f"External spool"
-                            
-                            # Filament count should be greater than the zero-indexed filament ID
-                            if filament_count > filament_index:
-                                ams_index = self.ams_mapping[filament_index]
-                                if ams_index < 16: # BUG - This will not yet handle AMS HT devices
-                                    # We add the filament as you can map multiple slicer filaments to the same physical filament.
-                                    self._ams_print_weights[ams_index] += float(metadata.get('used_g'))
-                                    self._ams_print_lengths[ams_index] += float(metadata.get('used_m'))
-                                    log_label = f"AMS Tray {ams_index + 1}"
-                                else:
-                                    LOGGER.debug(f"ams_mapping: {self.ams_mapping}")
-                            elif plate_filament_count > 0:
-                                # Multi filament print but the AMS mapping is unknown
-                                # The data is only sent in the mqtt payload once and isn't part of the 'full' data so the integration must be
-                                # live and listening to capture it.
-                                LOGGER.debug(f"filament_index: {filament_index}")
-                                log_label = f"AMS Tray unknown"
-                            else:
-                                LOGGER.debug(f"plate_filament_count: {plate_filament_count}")
-
-                            LOGGER.debug(f"{log_label}: {metadata.get('used_m')}m | {metadata.get('used_g')}g")
-
-                            # Increase the total print length
-                            print_length += float(metadata.get('used_m'))
-                        except Exception as e:
-                            LOGGER.error(f"Failed to parse filament data: {e}")
-                
-                self.print_length = print_length
+        return result
 
-                if plate_number is not None:
-                    try:
-                        image = archive.read(f"Metadata/pick_{plate_number}.png")
-                        self._client._device.pick_image.set_image(image)
-                        # Process the pick image for objects
-                        pick_image = Image.open(archive.open(f"Metadata/pick_{plate_number}.png"))
-                        identify_ids = self._identify_objects_in_pick_image(image=pick_image)
-                        
-                        # Filter the printable objects from slice_info.config, removing
-                        # any that weren't detected in the pick image
-                        self._printable_objects = {k: _printable_objects[k] for k in identify_ids if k in _printable_objects}
-                    except:
-                        LOGGER.debug(f"Unable to load 'Metadata/pick_{plate_number}.png' from archive")
+    def _extract_model_metadata(self, model_file_path: str):
+        # Reads the plate data from the 3mf and extracts the cover image, pick image, gcode and slicer config next to it.
+        # Only the members of the sliced plate are read and each of them only once.
+        base_path = os.path.splitext(model_file_path)[0]
+        metadata = {
+            'plate': None,
+            'weight': None,
+            'bed_type': None,
+            'gcode_file': None,
+            'objects': {},
+            'filaments': [],
+            'pick_ids': None,
+        }
+        images = {}
+
+        # Open the 3mf zip archive
+        with ZipFile(model_file_path) as archive:
+            # Extract the slicer XML config and parse the plate tree
+            slice_info_bytes = archive.read('Metadata/slice_info.config')
+            plate = ElementTree.fromstring(slice_info_bytes).find('plate')
+
+            # Iterate through each config element and extract the data
+            # Example contents:
+            # {'key': 'index', 'value': '2'}
+            # {'key': 'printer_model_id', 'value': 'C12'}
+            # {'key': 'nozzle_diameters', 'value': '0.4'}
+            # {'key': 'timelapse_type', 'value': '0'}
+            # {'key': 'prediction', 'value': '5935'}
+            # {'key': 'weight', 'value': '20.91'}
+            # {'key': 'outside', 'value': 'false'}
+            # {'key': 'support_used', 'value': 'false'}
+            # {'key': 'label_object_enabled', 'value': 'true'}
+            # {'identify_id': '123', 'name': 'ModelObjectOne.stl', 'skipped': 'false'}
+            # {'identify_id': '394', 'name': 'ModelObjectTwo.stl', 'skipped': 'false'}
+            # {'id': '1', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#000000', 'used_m': '5.45', 'used_g': '17.32'}
+            # {'id': '2', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#8D8C8F', 'used_m': '0.84', 'used_g': '2.66'}
+            # {'id': '3', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#FFFFFF', 'used_m': '0.29', 'used_g': '0.93'}
+            for entry in plate:
+                if (entry.get('key') == 'index'):
+                    # Index is the plate number being printed
+                    metadata['plate'] = entry.get('value')
+                    LOGGER.debug(f"Plate: {metadata['plate']}")
+                elif (entry.get('key') == 'weight'):
+                    LOGGER.debug(f"Weight: {entry.get('value')}")
+                    metadata['weight'] = entry.get('value')
+                elif (entry.get('key') == 'prediction'):
+                    # Estimated print length in seconds
+                    LOGGER.debug(f"Print time: {entry.get('value')}s")
+                elif (entry.tag == 'object'):
+                    # Get the list of printable objects present on the plate before slicing.
+                    # This includes hidden objects which need to be filtered out later.
+                    if entry.get('skipped') == f"false":
+                        metadata['objects'][entry.get('identify_id')] = entry.get('name')
+                elif (entry.tag == 'filament'):
+                    metadata['filaments'].append({
+                        'id': entry.get('id'),
+                        'used_g': entry.get('used_g'),
+                        'used_m': entry.get('used_m'),
+                    })
 
-                # Save the slice_info.config file only if file cache is enabled
+            plate_number = metadata['plate']
+            if plate_number is not None:
+                # Now we have the plate number, extract the cover image from the archive
+                images['cover'] = archive.read(f"Metadata/plate_{plate_number}.png")
+                LOGGER.debug(f"Cover image: Metadata/plate_{plate_number}.png")
+
+                # Save the cover image to the cache
                 try:
-                    slice_info_bytes = archive.read('Metadata/slice_info.config')
-                    # Save the slice_info.config in the same directory as the model file
-                    slice_info_filename = os.path.splitext(os.path.basename(model_file_path))[0] + '.slice_info.config'
-                    slice_info_path = os.path.join(model_dir, slice_info_filename)
-                    with open(slice_info_path, "wb") as f:
-                        f.write(slice_info_bytes)
+                    cover_path = f"{base_path}.png"
+                    with open(cover_path, "wb") as target_path:
+                        target_path.write(images['cover'])
+                    LOGGER.debug(f"Cover image saved to: {cover_path}")
                 except Exception as e:
-                    LOGGER.error(f"Failed to save slice_info.config: {e}")
+                    LOGGER.error(f"Failed to save cover image: {e}")
 
-            archive.close()
+                try:
+                    # Save the gcode file to the cache
+                    gcode_path = f"{base_path}.gcode"
+                    with archive.open(f"Metadata/plate_{plate_number}.gcode") as gcode_entry, open(f"{gcode_path}.tmp", "wb") as target_path:
+                        shutil.copyfileobj(gcode_entry, target_path)
+                    os.replace(f"{gcode_path}.tmp", gcode_path)
+                    metadata['gcode_file'] = os.path.basename(gcode_path)
+                except Exception as e:
+                    metadata['gcode_file'] = "ERROR"
+                    LOGGER.error(f"Error while extracting gcode zip entry to target path. {repr(e)}")
 
-            self._client.callback("event_printer_data_update")
-            result = True
+                # And extract the plate type from the plate json.
+                metadata['bed_type'] = json.loads(archive.read(f"Metadata/plate_{plate_number}.json")).get('bed_type')
+
+                try:
+                    images['pick'] = archive.read(f"Metadata/pick_{plate_number}.png")
+                    # Process the pick image for objects
+                    metadata['pick_ids'] = sorted(self._identify_objects_in_pick_image(image=Image.open(BytesIO(images['pick']))))
+                    with open(f"{base_path}.pick.png", "wb") as f:
+                        f.write(images['pick'])
+                except:
+                    images.pop('pick', None)
+                    metadata['pick_ids'] = None
+                    LOGGER.debug(f"Unable to load 'Metadata/pick_{plate_number}.png' from archive")
+
+        # Save the slice_info.config in the same directory as the model file
+        try:
+            with open(f"{base_path}.slice_info.config", "wb") as f:
+                f.write(slice_info_bytes)
         except Exception as e:
-            LOGGER.error(f"Unexpected error parsing model data: {e}")
+            LOGGER.error(f"Failed to save slice_info.config: {e}")
+
+        return metadata, images
+
+    def _read_cached_model_images(self, model_file_path: str, metadata: dict) -> Union[dict, None]:
+        # Returns None if any file extracted from the 3mf is gone and it needs to be extracted again.
+        if metadata.get('plate') is None:
+            return {}
+        base_path = os.path.splitext(model_file_path)[0]
+        images = {}
+        try:
+            with open(f"{base_path}.png", "rb") as f:
+                images['cover'] = f.read()
+            if metadata.get('pick_ids') is not None:
+                with open(f"{base_path}.pick.png", "rb") as f:
+                    images['pick'] = f.read()
+            gcode_file = metadata.get('gcode_file')
+            if gcode_file not in (None, "ERROR") and not os.path.exists(os.path.join(os.path.dirname(model_file_path), gcode_file)):
+                return None
+        except OSError:
+            return None
+        return images
+
+    def _apply_model_metadata(self, metadata: dict, images: dict):
+        if metadata['plate'] is not None:
+            self._client._device.cover_image.set_image(images['cover'])
+            self.gcode_file_downloaded = metadata['gcode_file']
+            self.print_bed_type = metadata['bed_type']
+        if metadata['weight'] is not None:
+            self.print_weight = metadata['weight']
+
+        # Start a total print length count to be compiled from each filament
+        print_length = 0
+        filament_count = len(self.ams_mapping)
+        plate_filament_count = len(metadata['filaments'])
+
+        # Reset filament data
+        self._ams_print_weights = [0.0] * 136 # TODO: Convert to a dict in the future?
+        self._ams_print_lengths = [0.0] * 136 # TODO: Convert to a dict in the future?
+
+        for filament in metadata['filaments']:
+            try:
+                # Filament used for the current print job. The plate info contains filaments
+                # identified in the order they appear in the slicer. These IDs must be
+                # mapped to the AMS tray mappings provided by MQTT print.ams_mapping
+
+                # Zero-index the filament ID
+                filament_index = int(filament['id']) - 1
+                log_label = f"External spool"
+                
+                # Filament count should be greater than the zero-indexed filament ID
+                if filament_count > filament_index:
+                    ams_index = self.ams_mapping[filament_index]
+                    if ams_index < 16: # BUG - This will not yet handle AMS HT devices
+                        # We add the filament as you can map multiple slicer filaments to the same physical filament.
+                        self._ams_print_weights[ams_index] += float(filament['used_g'])
+                        self._ams_print_lengths[ams_index] += float(filament['used_m'])
+                        log_label = f"AMS Tray {ams_index + 1}"
+                    else:
+                        LOGGER.debug(f"ams_mapping: {self.ams_mapping}")
+                elif plate_filament_count > 0:
+                    # Multi filament print but the AMS mapping is unknown
+                    # The data is only sent in the mqtt payload once and isn't part of the 'full' data so the integration must be
+                    # live and listening to capture it.
+                    LOGGER.debug(f"filament_index: {filament_index}")
+                    log_label = f"AMS Tray unknown"
+                else:
+                    LOGGER.debug(f"plate_filament_count: {plate_filament_count}")
+
+                LOGGER.debug(f"{log_label}: {filament['used_m']}m | {filament['used_g']}g")
+
+                # Increase the total print length
+                print_length += float(filament['used_m'])
+            except Exception as e:
+                LOGGER.error(f"Failed to parse filament data: {e}")
         
-        self.prune_print_history_files()
+        self.print_length = print_length
 
-        return result
+        if metadata['plate'] is not None and metadata['pick_ids'] is not None:
+            self._client._device.pick_image.set_image(images['pick'])
+            # Filter the printable objects from slice_info.config, removing
+            # any that weren't detected in the pick image
+            objects = metadata['objects']
+            self._printable_objects = {k: objects[k] for k in metadata['pick_ids'] if k in objects}
 
     # The task list is of the following form with a 'hits' array with typical 20 entries.
     #
@@ -1935,24 +2110,19 @@ class PrintJob:
         # Open the pick image so we can detect objects present
         image_width, image_height = image.size
         
-        seen_colors = set()
         seen_identify_ids = set()
 
-        # Loop through every pixel and label the first occurrence of each unique color
-        pixels = image.load()
-        for y in range(image_height):
-            for x in range(image_width):
-                current_color = pixels[x, y]
-                r, g, b, a = current_color
-
-                # Skip this pixel if it's transparent or already identified
-                if a == 0 or current_color in seen_colors:
-                    continue
-
-                # Convert the colour to the decimal representation of its hex value
-                identify_id = int(f"0x{b:02X}{g:02X}{r:02X}", 16)
-                seen_colors.add(current_color)
-                seen_identify_ids.add(str(identify_id))
+        # Let PIL count the unique colors rather than walking every pixel in python
+        for _, current_color in image.convert("RGBA").getcolors(maxcolors=image_width * image_height):
+            r, g, b, a = current_color
+
+            # Skip this color if it's transparent
+            if a == 0:
+                continue
+
+            # Convert the colour to the decimal representation of its hex value
+            identify_id = int(f"0x{b:02X}{g:02X}{r:02X}", 16)
+            seen_identify_ids.add(str(identify_id))
         
         object_count = len(seen_identify_ids)
         LOGGER.debug(f"Finished proccessing pick image, found {object_count} object{'s'[:object_count^1]}")
@@ -2313,6 +2483,9 @@ class Info:
                 if entry.get("modeId") in AIRDUCT_MODES
             ]
 
+        # "hw_switch_state": 1,
+        self.extruder_filament_state = bool(data.get("hw_switch_state", self.extruder_filament_state))
+
         # Compute if there's a delta before we check the wifi_signal value.
         changed = (old_data != f"{self.__dict__}")
 
@@ -2326,9 +2499,6 @@ class Info:
                 # It's been long enough. We can send this one.
                 self.wifi_sent = datetime.now()
                 changed = True
-        
-        # "hw_switch_state": 1,
-        self.extruder_filament_state = bool(data.get("hw_switch_state", self.extruder_filament_state))
 
         return changed
 
@@ -3307,15 +3477,37 @@ class ChamberImage:
     def __init__(self, client):
         self._client = client
         self._bytes = bytearray()
+        self._size = 0
+        self._lock = threading.Lock()
         self._image_last_updated = None
-
-    def set_image(self, bytes):
-        self._bytes = bytes
-        self._image_last_updated = datetime.now()
-        self._client.callback("event_printer_chamber_image_update")
+        self._last_published = None
+        self._last_viewed = None
+
+    def set_image(self, bytes, size = None) -> bytearray:
+        """Take ownership of a frame buffer holding size bytes of jpeg and return the previous buffer for reuse."""
+        with self._lock:
+            previous = self._bytes
+            self._bytes = bytes
+            self._size = len(bytes) if size is None else size
+            self._image_last_updated = datetime.now()
+
+        # Only publish at the rate the viewers fetch images. When no one is looking, just keep the latest frame.
+        now = time.monotonic()
+        if self._last_published is None:
+            publish = True
+        elif self._last_viewed is not None and now - self._last_viewed < CHAMBER_IMAGE_VIEWER_TIMEOUT:
+            publish = True
+        else:
+            publish = now - self._last_published >= CHAMBER_IMAGE_IDLE_INTERVAL
+        if publish:
+            self._last_published = now
+            self._client.callback("event_printer_chamber_image_update")
+        return previous
 
     def get_image(self) -> bytearray:
-        return self._bytes.copy()
+        self._last_viewed = time.monotonic()
+        with self._lock:
+            return self._bytes[:self._size]
     
     def get_last_update_time(self) -> datetime:
         return self._image_last_updated
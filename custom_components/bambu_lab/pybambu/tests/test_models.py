@@ -1,15 +1,19 @@
 import logging
 import unittest
-from unittest.mock import call, MagicMock
+from unittest.mock import call, patch, MagicMock
 from datetime import datetime
 import sys
 import os
 import json
+import tempfile
+from io import BytesIO
+from zipfile import ZipFile
+from PIL import Image
 
 # Add the parent directory to the Python path to find pybambu
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from pybambu.models import PrintJob, Info, AMSList, Extruder, HMSList, PrintError, Temperature
+from pybambu.models import ChamberImage, Device, PrintJob, Info, AMSList, Extruder, HMSList, PrintError, Temperature
 from pybambu.const import Printers
 
 class TestPrintJob(unittest.TestCase):
@@ -576,6 +580,221 @@ class TestH2D(unittest.TestCase):
 
 
 
+class TestDevicePrintUpdate(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.device = Device(self.client)
+        self.client._device = self.device
+        # Load test data from P1P.json
+        with open(os.path.join(os.path.dirname(__file__), 'P1P.json'), 'r') as f:
+            self.test_data = json.load(f)
+
+    def test_push_all_reports_changed_models(self):
+        result = self.device.print_update(self.test_data['push_all'])
+
+        self.assertTrue(result)
+        changed = self.device.pop_changed_models()
+        self.assertIn("print_job", changed)
+        self.assertIn("temperature", changed)
+        self.assertIn("ams", changed)
+        self.assertNotIn("speed", changed)  # spd_lvl matches the default profile
+        self.client.callback.assert_any_call("event_printer_data_update")
+
+    def test_report_only_runs_models_for_its_keys(self):
+        self.device.temperature.print_update = MagicMock(return_value=False)
+        self.device.ams.print_update = MagicMock(return_value=False)
+
+        self.device.print_update({"spd_lvl": 3})
+        self.device.temperature.print_update.assert_not_called()
+        self.device.ams.print_update.assert_not_called()
+        self.assertEqual(self.device.pop_changed_models(), {"speed"})
+
+        self.device.print_update({"bed_temper": 55})
+        self.device.temperature.print_update.assert_called_once()
+        self.device.ams.print_update.assert_not_called()
+
+    def test_unchanged_report(self):
+        self.device.print_update({"spd_lvl": 3})
+        self.device.pop_changed_models()
+
+        result = self.device.print_update({"spd_lvl": 3})
+        self.assertFalse(result)
+        self.assertEqual(self.device.pop_changed_models(), set())
+
+    def test_hw_switch_state_only_report_changes_info(self):
+        self.device.print_update({"hw_switch_state": 1})
+        self.device.pop_changed_models()
+
+        result = self.device.print_update({"hw_switch_state": 0})
+        self.assertTrue(result)
+        self.assertEqual(self.device.pop_changed_models(), {"info"})
+        self.assertFalse(self.device.info.extruder_filament_state)
+
+    def test_changed_models_accumulate_until_popped(self):
+        self.assertIsNone(self.device.pop_changed_models())
+
+        self.device.print_update({"spd_lvl": 3})
+        self.device.print_update({"lights_report": [{"node": "chamber_light", "mode": "on"}]})
+        self.assertEqual(self.device.pop_changed_models(), {"speed", "lights"})
+        self.assertIsNone(self.device.pop_changed_models())
+
+class TestChamberImage(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.chamber_image = ChamberImage(self.client)
+
+    def test_set_image_swaps_buffers(self):
+        first = bytearray(b"\xff\xd8\xff\xe0first\xff\xd9....")
+        second = bytearray(b"\xff\xd8\xff\xe0second\xff\xd9")
+
+        previous = self.chamber_image.set_image(first, 11)
+        self.assertEqual(previous, bytearray())
+        self.assertEqual(self.chamber_image.get_image(), first[:11])
+
+        previous = self.chamber_image.set_image(second)
+        self.assertIs(previous, first)
+        self.assertEqual(self.chamber_image.get_image(), second)
+        self.assertIsNotNone(self.chamber_image.get_last_update_time())
+
+    @patch("pybambu.models.time.monotonic")
+    def test_publish_rate_follows_viewers(self, monotonic):
+        monotonic.return_value = 1000.0
+        self.chamber_image.set_image(bytearray(b"1"))
+        self.assertEqual(self.client.callback.call_count, 1)
+
+        # Nobody is looking: frames are kept but only published once per idle interval.
+        monotonic.return_value = 1001.0
+        self.chamber_image.set_image(bytearray(b"2"))
+        self.assertEqual(self.client.callback.call_count, 1)
+        self.assertEqual(self.chamber_image.get_image(), bytearray(b"2"))
+
+        # The fetch above marks a viewer: every frame is published now.
+        monotonic.return_value = 1002.0
+        self.chamber_image.set_image(bytearray(b"3"))
+        self.assertEqual(self.client.callback.call_count, 2)
+
+        # The viewer went away.
+        monotonic.return_value = 1008.0
+        self.chamber_image.set_image(bytearray(b"4"))
+        self.assertEqual(self.client.callback.call_count, 2)
+        monotonic.return_value = 1012.0
+        self.chamber_image.set_image(bytearray(b"5"))
+        self.assertEqual(self.client.callback.call_count, 3)
+        self.client.callback.assert_called_with("event_printer_chamber_image_update")
+
+class TestModelMetadataCache(unittest.TestCase):
+    SLICE_INFO = """<?xml version="1.0" encoding="UTF-8"?>
+<config>
+  <plate>
+    <metadata key="index" value="1"/>
+    <metadata key="prediction" value="5935"/>
+    <metadata key="weight" value="20.91"/>
+    <object identify_id="123" name="One.stl" skipped="false" />
+    <object identify_id="394" name="Two.stl" skipped="false" />
+    <object identify_id="500" name="Hidden.stl" skipped="false" />
+    <filament id="1" tray_info_idx="GFA01" type="PLA" color="#000000" used_m="5.45" used_g="17.32" />
+    <filament id="2" tray_info_idx="GFA01" type="PLA" color="#FFFFFF" used_m="0.84" used_g="2.66" />
+  </plate>
+</config>
+"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.print_job = PrintJob(self.client)
+        self.print_job.ams_mapping = [2, 0]
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.model_file_path = os.path.join(self.temp_dir.name, "1234-model.gcode.3mf")
+
+        # Pick image colours are the little-endian identify_id of each object.
+        pick = Image.new("RGBA", (4, 4), (0, 0, 0, 0))
+        pick.putpixel((0, 0), (123, 0, 0, 255))
+        pick.putpixel((3, 3), (138, 1, 0, 255))
+        pick_bytes = BytesIO()
+        pick.save(pick_bytes, format="PNG")
+
+        with ZipFile(self.model_file_path, "w") as archive:
+            archive.writestr("Metadata/slice_info.config", self.SLICE_INFO)
+            archive.writestr("Metadata/plate_1.png", b"cover")
+            archive.writestr("Metadata/plate_1.gcode", b"G28\n")
+            archive.writestr("Metadata/plate_1.json", json.dumps({"bed_type": "textured_plate"}))
+            archive.writestr("Metadata/pick_1.png", pick_bytes.getvalue())
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def assert_model_data(self):
+        self.assertEqual(self.print_job.print_weight, "20.91")
+        self.assertEqual(self.print_job.print_bed_type, "textured_plate")
+        self.assertEqual(self.print_job.gcode_file_downloaded, "1234-model.gcode.gcode")
+        self.assertAlmostEqual(self.print_job.print_length, 6.29)
+        self.assertAlmostEqual(self.print_job._ams_print_weights[2], 17.32)
+        self.assertAlmostEqual(self.print_job._ams_print_weights[0], 2.66)
+        self.assertEqual(self.print_job._printable_objects, {"123": "One.stl", "394": "Two.stl"})
+        self.client._device.cover_image.set_image.assert_called_with(b"cover")
+
+    def test_extracts_and_caches_metadata(self):
+        self.assertTrue(self.print_job._load_model_data(self.model_file_path))
+        self.assert_model_data()
+
+        base_path = os.path.join(self.temp_dir.name, "1234-model.gcode")
+        for extension in [".png", ".pick.png", ".gcode", ".slice_info.config", ".metadata.json"]:
+            self.assertTrue(os.path.exists(base_path + extension), extension)
+        cached = self.print_job._read_model_metadata(self.model_file_path)
+        self.assertEqual(cached["metadata"]["pick_ids"], ["123", "394"])
+
+    def test_cached_metadata_skips_the_archive(self):
+        self.assertTrue(self.print_job._load_model_data(self.model_file_path))
+
+        print_job = PrintJob(self.client)
+        print_job.ams_mapping = [2, 0]
+        self.print_job = print_job
+        with patch.object(PrintJob, "_extract_model_metadata") as extract:
+            self.assertTrue(print_job._load_model_data(self.model_file_path, cache_only=True))
+            extract.assert_not_called()
+        self.assert_model_data()
+
+    def test_cache_only_needs_extracted_metadata(self):
+        self.assertFalse(self.print_job._load_model_data(self.model_file_path, cache_only=True))
+        self.assertFalse(os.path.exists(self.print_job._model_metadata_path(self.model_file_path)))
+
+    def test_missing_extracted_file_is_extracted_again(self):
+        self.print_job._load_model_data(self.model_file_path)
+        os.remove(os.path.join(self.temp_dir.name, "1234-model.gcode.pick.png"))
+
+        self.assertTrue(self.print_job._load_model_data(self.model_file_path))
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, "1234-model.gcode.pick.png")))
+
+    def test_cached_model_matches_mtime(self):
+        self.print_job._write_model_metadata(self.model_file_path, {"name": "/cache/model.gcode.3mf", "size": 1, "mtime": "20250101120000"})
+
+        self.assertTrue(self.print_job._cached_model_matches(self.model_file_path, "20250101120000"))
+        self.assertTrue(self.print_job._cached_model_matches(self.model_file_path, None))
+        self.assertFalse(self.print_job._cached_model_matches(self.model_file_path, "20250102120000"))
+        self.assertTrue(self.print_job._cached_model_matches(os.path.join(self.temp_dir.name, "other.3mf"), "20250102120000"))
+
+    def test_cache_hit_adopts_printer_mtime(self):
+        self.client.cache_path = self.temp_dir.name
+        size = os.path.getsize(self.model_file_path)
+        cache_dir = os.path.join(self.temp_dir.name, "prints", "cache")
+        os.makedirs(cache_dir)
+        cached_path = os.path.join(cache_dir, f"{size}-model.gcode.3mf")
+        os.replace(self.model_file_path, cached_path)
+        # Cached and parsed before the printer's modification time was recorded.
+        self.assertTrue(self.print_job._load_model_data(cached_path))
+        self.assertIsNone(self.print_job._read_model_metadata(cached_path).get("mtime"))
+
+        ftp = MagicMock()
+        ftp.size.return_value = size
+        ftp.voidcmd.return_value = "213 20250101120000"
+        self.assertEqual(self.print_job._attempt_ftp_download_of_file(ftp, "/cache/model.gcode.3mf"), cached_path)
+        ftp.retrbinary.assert_not_called()
+        cached = self.print_job._read_model_metadata(cached_path)
+        self.assertEqual(cached["mtime"], "20250101120000")
+        self.assertEqual(cached["size"], size)
+        self.assertIn("metadata", cached)
+
+        # A re-upload with the same name and size is now detected.
+        self.assertFalse(self.print_job._cached_model_matches(cached_path, "20250102120000"))
 
 if __name__ == '__main__':
     unittest.main()
@@ -54,6 +54,7 @@ from .dreame.const import (
     ATTR_RECOVERY_MAP_FILE,
     ATTR_WIFI_MAP_PICTURE,
     ATTR_COLOR_SCHEME,
+    ATTR_RENDER_STATS,
 )
 from .dreame.map import (
     DreameVacuumMapRenderer,
@@ -935,6 +936,8 @@ class DreameVacuumCameraEntity(DreameVacuumEntity, Camera):
             token = self.access_tokens[-1]
             if self.map_index == 0:
                 attributes[ATTR_COLOR_SCHEME] = self._color_scheme
+                if self._renderer.render_stats:
+                    attributes[ATTR_RENDER_STATS] = self._renderer.render_stats
 
                 def get_key(index, history):
                     return f"{index}: {time.strftime('%m/%d %H:%M', time.localtime(history.date.timestamp()))} - {'Second ' if history.second_cleaning else ''}{STATUS_CODE_TO_NAME.get(history.status, STATE_UNKNOWN).replace('_', ' ').title()} {'(Completed)' if history.completed else '(Interrupted)'}"
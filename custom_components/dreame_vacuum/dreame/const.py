@@ -524,6 +524,7 @@ ATTR_SHORTCUT_TASK: Final = "shortcut_task"
 ATTR_FIRMWARE_VERSION: Final = "firmware_version"
 ATTR_AP: Final = "ap"
 ATTR_COLOR_SCHEME: Final = "color_scheme"
+ATTR_RENDER_STATS: Final = "render_stats"
 ATTR_CAPABILITIES: Final = "capabilities"
 
 MAP_PARAMETER_NAME: Final = "name"
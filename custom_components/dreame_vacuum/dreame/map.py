@@ -145,6 +145,15 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Object layers that follow the robot state; everything else is drawn from the (mostly static) map data.
+DYNAMIC_RENDERER_LAYERS = (
+    MapRendererLayer.CHARGER,
+    MapRendererLayer.ROBOT,
+    MapRendererLayer.ROUTER,
+    MapRendererLayer.OBSTACLES,
+    MapRendererLayer.CRUISE_POINTS,
+)
+
 
 class DreameMapVacuumMapManager:
     def __init__(self, _protocol: DreameVacuumProtocol) -> None:
@@ -2695,6 +2704,39 @@ class DreameVacuumMapDecoder:
     def _read_int_16(data: bytes, offset: int = 0) -> int:
         return int.from_bytes(data[offset : offset + 2], byteorder="big", signed=True)
 
+    @staticmethod
+    def _pixel_grid(data: bytes, width: int, height: int) -> tuple[np.ndarray, bool]:
+        """Map pixels as a (height, width) uint8 grid in stored (row-major) order.
+
+        Bytes missing from a short buffer read as 0, which every pixel classifier
+        treats as "outside"; the returned flag tells the caller the buffer was short.
+        """
+        size = max(width, 0) * max(height, 0)
+        count = min(len(data), size)
+        grid = np.zeros(size, dtype=np.uint8)
+        if count > 0:
+            grid[:count] = np.frombuffer(data, dtype=np.uint8, count=count)
+        return grid.reshape(max(height, 0), max(width, 0)), count < size
+
+    @staticmethod
+    def _classify_wifi_pixels(map_data: MapData, pixels: np.ndarray) -> None:
+        """Fill pixel_type of a W (wifi heat) frame from its low nibbles.
+
+        A nibble that is not a MapPixelType value stops classification at that
+        pixel (row-major), as the per-pixel MapPixelType() lookup always did.
+        """
+        values = (pixels & 15).ravel()
+        nonzero = values > 0
+        valid = np.isin(values, [member.value for member in MapPixelType])
+        invalid = np.flatnonzero(nonzero & ~valid)
+        stop = int(invalid[0]) if invalid.size else values.size
+        if invalid.size or nonzero[:stop].any():
+            map_data.empty_map = False
+        keep = np.zeros(values.size, dtype=bool)
+        keep[:stop] = nonzero[:stop]
+        keep = keep.reshape(pixels.shape)
+        map_data.pixel_type.T[keep] = (pixels & 15)[keep]
+
     @staticmethod
     def _read_int_16_le(data: bytes, offset: int = 0) -> int:
         return int.from_bytes(data[offset : offset + 2], byteorder="little", signed=True)
@@ -3104,96 +3146,79 @@ class DreameVacuumMapDecoder:
                             if map_data.data[(width * y) + x] > 0:
                                 map_data.empty_map = False
                                 break
+                pixels, truncated = DreameVacuumMapDecoder._pixel_grid(map_data.data, width, height)
 
                 np.seterr(over="ignore")
                 map_data.pixel_type = np.full((width, height), MapPixelType.OUTSIDE.value, dtype=np.uint8)
+                # pixel_type is indexed [x, y]; its transpose is a (height, width)
+                # view that lines up with the row-major pixel grid.
+                pixel_type = map_data.pixel_type.T
                 if not map_data.empty_map:
                     map_data.empty_map = True
                     if map_data.frame_type == MapFrameType.W.value:
-                        try:
-                            for y in range(height):
-                                for x in range(width):
-                                    pixel = map_data.data[(width * y) + x] & 15
-                                    if pixel > 0:
-                                        map_data.empty_map = False
-                                        map_data.pixel_type[x, y] = MapPixelType(pixel)
-                        except:
-                            pass
+                        DreameVacuumMapDecoder._classify_wifi_pixels(map_data, pixels)
                     elif map_data.frame_type == MapFrameType.I.value:
                         if map_data.frame_map:
-                            for y in range(height):
-                                for x in range(width):
-                                    pixel = map_data.data[(width * y) + x]
-                                    if pixel > 0:
-                                        if pixel & 0x03 == 3:
-                                            carpet_pixels.append((x, y))
-                                        map_data.empty_map = False
-                                        segment_id = pixel >> 2
-                                        if 0 < segment_id < 64:
-                                            if segment_id == 63:
-                                                map_data.pixel_type[x, y] = MapPixelType.WALL.value
-                                            elif segment_id == 62:
-                                                map_data.pixel_type[x, y] = MapPixelType.FLOOR.value
-                                            elif segment_id == 61:
-                                                map_data.pixel_type[x, y] = MapPixelType.UNKNOWN.value
-                                            else:
-                                                map_data.pixel_type[x, y] = segment_id
-                                        else:
-                                            segment_id = pixel & 0x3F
-                                            if segment_id == 1 or segment_id == 3:
-                                                map_data.pixel_type[x, y] = MapPixelType.NEW_SEGMENT.value
-                                            elif segment_id == 2:
-                                                map_data.pixel_type[x, y] = MapPixelType.WALL.value
+                            nonzero = pixels > 0
+                            carpet = nonzero & ((pixels & 0x03) == 3)
+                            map_data.empty_map = not nonzero.any()
+                            segment_id = pixels >> 2
+                            in_segment = nonzero & (segment_id > 0)
+                            values = np.where(
+                                segment_id == 63,
+                                MapPixelType.WALL.value,
+                                np.where(
+                                    segment_id == 62,
+                                    MapPixelType.FLOOR.value,
+                                    np.where(segment_id == 61, MapPixelType.UNKNOWN.value, segment_id),
+                                ),
+                            )
+                            pixel_type[in_segment] = values[in_segment]
+                            low = nonzero & (segment_id == 0)
+                            pixel_type[low & ((pixels == 1) | (pixels == 3))] = MapPixelType.NEW_SEGMENT.value
+                            pixel_type[low & (pixels == 2)] = MapPixelType.WALL.value
                         elif map_data.saved_map_status == 1 or map_data.saved_map_status == 0:
-                            for y in range(height):
-                                for x in range(width):
-                                    pixel = map_data.data[(width * y) + x]
-                                    if pixel > 0:
-                                        if pixel & 0x03 == 3:
-                                            carpet_pixels.append((x, y))
-                                        segment_id = pixel & 0x3F
-                                        # as implemented on the app
-                                        if segment_id == 1 or segment_id == 3:
-                                            map_data.empty_map = False
-                                            map_data.pixel_type[x, y] = MapPixelType.NEW_SEGMENT.value
-                                        elif segment_id == 2:
-                                            map_data.empty_map = False
-                                            map_data.pixel_type[x, y] = MapPixelType.WALL.value
+                            carpet = (pixels & 0x03) == 3
+                            segment_id = pixels & 0x3F
+                            # as implemented on the app
+                            new_segment = (segment_id == 1) | (segment_id == 3)
+                            wall = segment_id == 2
+                            map_data.empty_map = not (new_segment.any() or wall.any())
+                            pixel_type[new_segment] = MapPixelType.NEW_SEGMENT.value
+                            pixel_type[wall] = MapPixelType.WALL.value
                         elif (
                             vslam_map and not map_data.saved_map and not map_data.recovery_map
                         ) or map_data.saved_map_status == 2:
-                            for y in range(height):
-                                for x in range(width):
-                                    pixel = map_data.data[(width * y) + x]
-                                    if pixel & 0x03 == 3:
-                                        carpet_pixels.append((x, y))
-                                    segment_id = pixel & 0x3F
-                                    if segment_id > 0:
-                                        map_data.empty_map = False
-                                        if segment_id == 2:
-                                            map_data.pixel_type[x, y] = MapPixelType.WALL.value
-                                        else:
-                                            map_data.pixel_type[x, y] = MapPixelType.NEW_SEGMENT.value
+                            carpet = (pixels & 0x03) == 3
+                            segment_id = pixels & 0x3F
+                            in_segment = segment_id > 0
+                            map_data.empty_map = not in_segment.any()
+                            pixel_type[in_segment] = MapPixelType.NEW_SEGMENT.value
+                            pixel_type[segment_id == 2] = MapPixelType.WALL.value
                         else:
-                            for y in range(height):
-                                for x in range(width):
-                                    pixel = map_data.data[(width * y) + x]
-                                    if pixel > 0:
-                                        if (pixel & 0x40) == 64:
-                                            carpet_pixels.append((x, y))
-                                        map_data.empty_map = False
-                                        segment_id = pixel & 0x3F
-                                        if pixel >> 7:
-                                            map_data.pixel_type[x, y] = (
-                                                MapPixelType.HIDDEN_WALL.value
-                                                if map_data.hidden_segments
-                                                and segment_id
-                                                and segment_id in map_data.hidden_segments
-                                                else MapPixelType.WALL.value
-                                            )
-                                        else:
-                                            if segment_id > 0:
-                                                map_data.pixel_type[x, y] = segment_id
+                            nonzero = pixels > 0
+                            carpet = nonzero & ((pixels & 0x40) == 64)
+                            map_data.empty_map = not nonzero.any()
+                            segment_id = pixels & 0x3F
+                            wall = (pixels >> 7).astype(bool)
+                            pixel_type[wall] = MapPixelType.WALL.value
+                            if map_data.hidden_segments:
+                                hidden_ids = [
+                                    i for i in range(1, 64) if i in map_data.hidden_segments
+                                ]
+                                if hidden_ids:
+                                    pixel_type[wall & np.isin(segment_id, hidden_ids)] = (
+                                        MapPixelType.HIDDEN_WALL.value
+                                    )
+                            in_segment = ~wall & (segment_id > 0)
+                            pixel_type[in_segment] = segment_id[in_segment]
+
+                        ys, xs = np.nonzero(carpet)
+                        carpet_pixels = list(zip(xs.tolist(), ys.tolist()))
+                        if truncated:
+                            # The per-pixel decoder ran off the end of a short
+                            # buffer here; keep failing the frame the same way.
+                            raise IndexError("map data shorter than width * height")
 
                         if carpet_pixels:
                             map_data.carpet_pixels = carpet_pixels
@@ -3968,40 +3993,68 @@ class DreameVacuumMapDecoder:
             top_offset = int((current_dimensions.top - top) / current_dimensions.grid_size)
 
             # Copy old image to buffer
-            for y in range(current_dimensions.height):
-                for x in range(current_dimensions.width):
-                    data[(width * (top_offset + y)) + left_offset + x] = current_map_data.data[
-                        (current_dimensions.width * y) + x
-                    ]
-                    pixel_type[left_offset + x, top_offset + y] = current_map_data.pixel_type[x, y]
+            grid = data.reshape(height, width)
+            cur_width = current_dimensions.width
+            cur_height = current_dimensions.height
+            if (
+                left_offset + cur_width <= width
+                and top_offset + cur_height <= height
+                and len(current_map_data.data) >= cur_width * cur_height
+                and current_map_data.pixel_type.shape[0] >= cur_width
+                and current_map_data.pixel_type.shape[1] >= cur_height
+            ):
+                grid[top_offset : top_offset + cur_height, left_offset : left_offset + cur_width] = np.frombuffer(
+                    current_map_data.data, dtype=np.uint8, count=cur_width * cur_height
+                ).reshape(cur_height, cur_width)
+                pixel_type[left_offset : left_offset + cur_width, top_offset : top_offset + cur_height] = (
+                    current_map_data.pixel_type[:cur_width, :cur_height]
+                )
+            else:
+                # Grid mismatch between frames: keep the exact per-pixel copy.
+                for y in range(cur_height):
+                    for x in range(cur_width):
+                        data[(width * (top_offset + y)) + left_offset + x] = current_map_data.data[
+                            (cur_width * y) + x
+                        ]
+                        pixel_type[left_offset + x, top_offset + y] = current_map_data.pixel_type[x, y]
 
             # Calculate new image offset
             left_offset = int((new_dimensions.left - left) / grid_size)
             top_offset = int((new_dimensions.top - top) / grid_size)
 
-            # Copy new image to buffer at calculated offset
-            for y in range(new_dimensions.height):
-                for x in range(new_dimensions.width):
-                    current_index = (new_dimensions.width * y) + x
-                    if map_data.data[current_index]:
-                        new_index = (width * (top_offset + y)) + left_offset + x
-                        # Add current buffer value to new buffer value for finding the new pixel value
-                        data[new_index] = data[new_index] + map_data.data[current_index]
-                        # Calculate the new pixel type from updated buffer value
-                        pixel_type[left_offset + x, top_offset + y], carpet = DreameVacuumMapDecoder._get_pixel_type(
-                            current_map_data,
-                            int(data[new_index]),
-                            vslam_map,
-                        )
-                        if carpet and current_map_data.carpet_pixels is None:
-                            current_map_data.carpet_pixels = []
-
-                        if current_map_data.carpet_pixels is not None:
-                            coord = (left_offset + x, top_offset + y)
-                            if not carpet and coord in current_map_data.carpet_pixels:
-                                current_map_data.carpet_pixels.remove(coord)
-                            elif carpet and coord not in current_map_data.carpet_pixels:
-                                current_map_data.carpet_pixels.append(coord)
+            # Copy new image to buffer at calculated offset. A P frame is a diff,
+            # so only its non-zero pixels (in stored order) need work.
+            new_pixels, truncated = DreameVacuumMapDecoder._pixel_grid(
+                map_data.data, new_dimensions.width, new_dimensions.height
+            )
+            carpet_lookup = (
+                set(current_map_data.carpet_pixels) if current_map_data.carpet_pixels is not None else None
+            )
+            for current_index in np.flatnonzero(new_pixels).tolist():
+                y, x = divmod(current_index, new_dimensions.width)
+                new_index = (width * (top_offset + y)) + left_offset + x
+                # Add current buffer value to new buffer value for finding the new pixel value
+                data[new_index] = data[new_index] + map_data.data[current_index]
+                # Calculate the new pixel type from updated buffer value
+                pixel_type[left_offset + x, top_offset + y], carpet = DreameVacuumMapDecoder._get_pixel_type(
+                    current_map_data,
+                    int(data[new_index]),
+                    vslam_map,
+                )
+                if carpet and current_map_data.carpet_pixels is None:
+                    current_map_data.carpet_pixels = []
+                    carpet_lookup = set()
+
+                if current_map_data.carpet_pixels is not None:
+                    coord = (left_offset + x, top_offset + y)
+                    if not carpet and coord in carpet_lookup:
+                        current_map_data.carpet_pixels.remove(coord)
+                        carpet_lookup.discard(coord)
+                    elif carpet and coord not in carpet_lookup:
+                        current_map_data.carpet_pixels.append(coord)
+                        carpet_lookup.add(coord)
+            if truncated:
+                raise IndexError("P frame data shorter than width * height")
 
             # Update size and buffer
             current_map_data.data = bytes(data)
@@ -4078,14 +4131,28 @@ class DreameVacuumMapDecoder:
                 DreameVacuumMapDecoder.HEADER_SIZE : DreameVacuumMapDecoder.HEADER_SIZE + width * height
             ]
 
-            for y in range(height):
-                for x in range(width):
-                    value = data[int(y * width + x)] & 0x03
-                    if value > 0:
-                        xx = int(((left + (x * grid_size)) - map_data.dimensions.left) / map_data.dimensions.grid_size)
-                        yy = int(((top + (y * grid_size)) - map_data.dimensions.top) / map_data.dimensions.grid_size)
-                        if cleaning_map.check_point(xx, yy, True):
-                            cleaning_map.pixel_type[xx, yy] = 249 - value
+            pixels, truncated = DreameVacuumMapDecoder._pixel_grid(data, width, height)
+            if truncated:
+                raise IndexError("cleaning map data shorter than width * height")
+            ys, xs = np.nonzero(pixels & 0x03)
+            if xs.size:
+                values = (pixels[ys, xs] & 0x03).astype(np.int64)
+                dims = map_data.dimensions
+                xx = np.trunc(((left + (xs * grid_size)) - dims.left) / dims.grid_size).astype(np.int64)
+                yy = np.trunc(((top + (ys * grid_size)) - dims.top) / dims.grid_size).astype(np.int64)
+                # check_point(absolute=True): inside the map and not outside/wall.
+                # Painting only ever writes 246-248, so checking against the
+                # unpainted map gives the same answer as the sequential loop.
+                inside = (xx >= 0) & (xx < dims.width) & (yy >= 0) & (yy < dims.height)
+                xx, yy, values = xx[inside], yy[inside], values[inside]
+                current = cleaning_map.pixel_type[xx, yy]
+                paint = (current > 0) & (current != 255)
+                xx, yy, values = xx[paint], yy[paint], values[paint]
+                # Several source pixels can land on one target; the last one wins.
+                flat = (xx * cleaning_map.pixel_type.shape[1] + yy)[::-1]
+                _, last = np.unique(flat, return_index=True)
+                last = len(flat) - 1 - last
+                cleaning_map.pixel_type[xx[last], yy[last]] = 249 - values[last]
 
         cleaning_map.has_dirty_area = bool(MapPixelType.DIRTY_AREA.value in cleaning_map.pixel_type)
         cleaning_map.has_cleaned_area = bool(MapPixelType.CLEAN_AREA.value in cleaning_map.pixel_type)
@@ -4095,23 +4162,27 @@ class DreameVacuumMapDecoder:
     @staticmethod
     def get_segments(map_data: MapData, vslam_map: bool) -> dict[str, Any]:
         segments = {}
-        for y in range(map_data.dimensions.height):
-            for x in range(map_data.dimensions.width):
-                segment_id = int(map_data.pixel_type[x, y])
-                if segment_id > 0 and segment_id < 64:
-                    if segment_id not in segments:
-                        segments[segment_id] = Segment(segment_id, x, y, x, y)
-                        continue
-
-                    if x < segments[segment_id].x0:
-                        segments[segment_id].x0 = x
-                    elif x > segments[segment_id].x1:
-                        segments[segment_id].x1 = x
-
-                    if y < segments[segment_id].y0:
-                        segments[segment_id].y0 = y
-                    elif y > segments[segment_id].y1:
-                        segments[segment_id].y1 = y
+        # Bounding box of every segment id (1-63), in order of first appearance
+        # scanning rows top to bottom.
+        width = map_data.dimensions.width
+        height = map_data.dimensions.height
+        rows = map_data.pixel_type[:width, :height].T
+        flat = np.flatnonzero((rows > 0) & (rows < 64))
+        if flat.size:
+            ids = rows.ravel()[flat]
+            ys, xs = np.divmod(flat, width)
+            found, first = np.unique(ids, return_index=True)
+            for segment_id in found[np.argsort(first)].tolist():
+                member = ids == segment_id
+                seg_xs = xs[member]
+                seg_ys = ys[member]
+                segments[segment_id] = Segment(
+                    segment_id,
+                    int(seg_xs.min()),
+                    int(seg_ys[0]),
+                    int(seg_xs.max()),
+                    int(seg_ys[-1]),
+                )
 
         if segments:
             for k, v in segments.items():
@@ -5072,6 +5143,9 @@ class DreameVacuumMapRenderer:
         self._square: bool = square
         self._cache: bool = cache
         self._has_mask: bool = False
+        self._layer_changes: list[MapRendererLayer] = []
+        self._dynamic_layer_boxes: dict[MapRendererLayer, tuple[int, int, int, int]] = {}
+        self._render_stats: dict[str, Any] = {}
         self._calibration_points: dict[str, int] = None
         self._default_calibration_points: dict[str, int] = [
             {
@@ -6144,6 +6218,7 @@ class DreameVacuumMapRenderer:
 
         self.render_complete = False
         now = time.time()
+        self._layer_changes = []
 
         if map_data.saved_map:
             robot_status = 0
@@ -6168,6 +6243,7 @@ class DreameVacuumMapRenderer:
                     and self._image
                 ):
                     self.render_complete = True
+                    self._set_render_stats(map_data, now, skipped=True)
                     _LOGGER.info("Skip render frame, map data not changed")
                     return self._to_buffer(self._image)
 
@@ -6296,6 +6372,7 @@ class DreameVacuumMapRenderer:
                 else ((0, 0, 0, 0) if map_data.wifi_map else self.color_scheme.outside)
             )
 
+            image_start = time.time()
             if (
                 not self._cache
                 or self._map_data is None
@@ -6316,6 +6393,7 @@ class DreameVacuumMapRenderer:
                     )
                 )
             ):
+                self._layer_changes.append(MapRendererLayer.IMAGE)
                 area_colors = {}
                 # as implemented on the app
                 if map_data.cleaning_map:
@@ -6410,24 +6488,31 @@ class DreameVacuumMapRenderer:
                 max_x = 0
                 max_y = 0
 
-                for y in range(map_data.dimensions.height):
-                    for x in range(map_data.dimensions.width):
-                        px_type = int(map_data.pixel_type[x, map_data.dimensions.height - y - 1])
-
-                        if px_type != 0:
-                            pixels[y, x] = area_colors.get(px_type, area_colors[253])
-
-                            max_x = max(x, max_x)
-                            min_x = min(x, min_x)
-                            max_y = max(y, max_y)
-                            min_y = min(y, min_y)
+                # Image rows run bottom to top: pixel [y, x] is pixel_type[x, height - y - 1].
+                px_types = map_data.pixel_type[: map_data.dimensions.width, : map_data.dimensions.height][:, ::-1].T
+                filled = px_types != 0
+                if filled.any():
+                    color_table = np.empty((256, 4), dtype=np.uint8)
+                    color_table[:] = area_colors[253]
+                    for k, v in area_colors.items():
+                        if 0 <= k < 256:
+                            color_table[k] = v
+                    pixels[filled] = color_table[px_types[filled]]
+
+                    rows = np.flatnonzero(filled.any(axis=1))
+                    columns = np.flatnonzero(filled.any(axis=0))
+                    min_x = min(int(columns[0]), min_x)
+                    max_x = max(int(columns[-1]), max_x)
+                    min_y = min(int(rows[0]), min_y)
+                    max_y = max(int(rows[-1]), max_y)
 
-                            if self._has_mask and px_type != 255:
-                                mask[y, x] = mask_color
+                    if self._has_mask:
+                        mask[filled & (px_types != 255)] = mask_color
 
-                            if segment_mask is not None:
-                                if px_type in map_data.neglected_segments:
-                                    segment_mask[y, x] = self.color_scheme.neglected_segment
+                    if segment_mask is not None:
+                        segment_mask[filled & np.isin(px_types, list(map_data.neglected_segments))] = (
+                            self.color_scheme.neglected_segment
+                        )
 
                 if render_material or render_carpet:
                     floor_scale = 2
@@ -6563,11 +6648,13 @@ class DreameVacuumMapRenderer:
                     )
             else:
                 map_data.dimensions.crop = self._map_data.dimensions.crop
+            image_time = time.time() - image_start
 
             self._calibration_points = self._calculate_calibration_points(map_data)
 
             image = cached_layers[MapRendererLayer.IMAGE]
 
+            path_start = time.time()
             if not map_data.saved_map and map_data.path and self.config.path:
                 if (
                     not self._cache
@@ -6589,12 +6676,16 @@ class DreameVacuumMapRenderer:
                         object_scale,
                     )
                     cached_layers[MapRendererLayer.PATH].thumbnail(image.size, Image.Resampling.BOX, reducing_gap=1.5)
+                    self._layer_changes.append(MapRendererLayer.PATH)
                     _LOGGER.debug("Render PATH")
                 image = Image.alpha_composite(image, cached_layers[MapRendererLayer.PATH])
             elif self._cache and cached_layers.get(MapRendererLayer.PATH):
                 del cached_layers[MapRendererLayer.PATH]
+            path_time = time.time() - path_start
 
+            objects_start = time.time()
             image = self.render_objects(cached_layers, map_data, robot_status, station_status, image, object_scale)
+            objects_time = time.time() - objects_start
 
             if segment_mask is not None:
                 image = Image.alpha_composite(
@@ -6825,6 +6916,7 @@ class DreameVacuumMapRenderer:
                     text_draw.text((line_x, line_y), lines[i], fill=text_color, font=text_font)
                     line_y = line_y + line_sizes[i][1]
 
+            self._set_render_stats(map_data, now, image_time, path_time, objects_time)
             _LOGGER.info(
                 "Render frame: %s:%s took: %.2f",
                 map_data.map_id,
@@ -6843,6 +6935,25 @@ class DreameVacuumMapRenderer:
         self.render_complete = True
         return self._to_buffer(self._image if self._cache else image)
 
+    def _set_render_stats(
+        self,
+        map_data: MapData,
+        started: float,
+        image_time: float = 0,
+        path_time: float = 0,
+        objects_time: float = 0,
+        skipped: bool = False,
+    ) -> None:
+        self._render_stats = {
+            "frame_id": map_data.frame_id,
+            "skipped": skipped,
+            "total_ms": round((time.time() - started) * 1000, 1),
+            "image_ms": round(image_time * 1000, 1),
+            "path_ms": round(path_time * 1000, 1),
+            "objects_ms": round(objects_time * 1000, 1),
+            "redrawn_layers": [layer.name.lower() for layer in self._layer_changes],
+        }
+
     def render_objects(self, cached_layers, map_data, robot_status, station_status, map_image, scale):
         layer_size = (int(map_image.size[0] * scale), int(map_image.size[1] * scale))
         line_width = 3 if map_data.dimensions.scale > 2 else 1
@@ -7574,24 +7685,92 @@ class DreameVacuumMapRenderer:
             changes.append(layer)
             del cached_layers[layer]
 
+        self._layer_changes.extend(changes)
         if changes or not self._cache:
-            cached_layers[MapRendererLayer.OBJECTS] = Image.new(
-                "RGBA",
-                [layer_size[0], layer_size[1]],
-                (255, 255, 255, 0),
+            # Layers are composited in the order they are rendered above and every dynamic layer comes after
+            # all static ones, so the static prefix is kept as its own composite and only rebuilt when one of
+            # its layers changes. A robot or obstacle update then only composites the dynamic layers on top.
+            static_changed = (
+                not self._cache
+                or not cached_layers.get(MapRendererLayer.STATIC_OBJECTS)
+                or cached_layers[MapRendererLayer.STATIC_OBJECTS].size != layer_size
+                or any(l not in DYNAMIC_RENDERER_LAYERS for l in changes)
             )
-            for l in layers:
-                if cached_layers.get(l):
+            if static_changed:
+                cached_layers[MapRendererLayer.STATIC_OBJECTS] = Image.new(
+                    "RGBA",
+                    [layer_size[0], layer_size[1]],
+                    (255, 255, 255, 0),
+                )
+                for l in layers:
+                    if l not in DYNAMIC_RENDERER_LAYERS and cached_layers.get(l):
+                        if l in changes:
+                            _LOGGER.debug("Render %s", l.name)
+                        cached_layers[MapRendererLayer.STATIC_OBJECTS] = Image.alpha_composite(
+                            cached_layers[MapRendererLayer.STATIC_OBJECTS], cached_layers[l]
+                        )
+
+            dynamic_layers = [l for l in layers if l in DYNAMIC_RENDERER_LAYERS and cached_layers.get(l)]
+            dynamic_boxes = {l: cached_layers[l].getbbox() for l in dynamic_layers}
+            if (
+                not static_changed
+                and cached_layers.get(MapRendererLayer.OBJECTS)
+                and cached_layers[MapRendererLayer.OBJECTS].size == map_image.size
+                and layer_size == (map_image.size[0] * 2, map_image.size[1] * 2)
+            ):
+                # Only dynamic layers changed: recomposite and downscale just the area they covered before and
+                # cover now. The 2:1 box downscale is pixel local, so this matches a full recomposite exactly.
+                dirty = None
+                for l in changes:
+                    for box in (self._dynamic_layer_boxes.get(l), dynamic_boxes.get(l)):
+                        if box:
+                            dirty = (
+                                box
+                                if dirty is None
+                                else (
+                                    min(dirty[0], box[0]),
+                                    min(dirty[1], box[1]),
+                                    max(dirty[2], box[2]),
+                                    max(dirty[3], box[3]),
+                                )
+                            )
+                if dirty:
+                    dirty = (
+                        dirty[0] - dirty[0] % 2,
+                        dirty[1] - dirty[1] % 2,
+                        min(layer_size[0], dirty[2] + dirty[2] % 2),
+                        min(layer_size[1], dirty[3] + dirty[3] % 2),
+                    )
+                    region = cached_layers[MapRendererLayer.STATIC_OBJECTS].crop(dirty)
+                    for l in dynamic_layers:
+                        if l in changes:
+                            _LOGGER.debug("Render %s", l.name)
+                        region = Image.alpha_composite(region, cached_layers[l].crop(dirty))
+                    cached_layers[MapRendererLayer.OBJECTS].paste(
+                        region.resize(
+                            (int((dirty[2] - dirty[0]) / 2), int((dirty[3] - dirty[1]) / 2)),
+                            Image.Resampling.BOX,
+                        ),
+                        (int(dirty[0] / 2), int(dirty[1] / 2)),
+                    )
+            else:
+                cached_layers[MapRendererLayer.OBJECTS] = cached_layers[MapRendererLayer.STATIC_OBJECTS]
+                for l in dynamic_layers:
                     if l in changes:
                         _LOGGER.debug("Render %s", l.name)
                     cached_layers[MapRendererLayer.OBJECTS] = Image.alpha_composite(
                         cached_layers[MapRendererLayer.OBJECTS], cached_layers[l]
                     )
 
-            if layer_size != map_image.size:
-                cached_layers[MapRendererLayer.OBJECTS].thumbnail(
-                    map_image.size, Image.Resampling.BOX, reducing_gap=1.5
-                )
+                if cached_layers[MapRendererLayer.OBJECTS] is cached_layers[MapRendererLayer.STATIC_OBJECTS]:
+                    # thumbnail() below resizes in place
+                    cached_layers[MapRendererLayer.OBJECTS] = cached_layers[MapRendererLayer.OBJECTS].copy()
+
+                if layer_size != map_image.size:
+                    cached_layers[MapRendererLayer.OBJECTS].thumbnail(
+                        map_image.size, Image.Resampling.BOX, reducing_gap=1.5
+                    )
+            self._dynamic_layer_boxes = dynamic_boxes
         else:
             if not cached_layers.get(MapRendererLayer.OBJECTS):
                 return map_image
@@ -9481,6 +9660,10 @@ class DreameVacuumMapRenderer:
     def calibration_points(self) -> dict[str, int]:
         return self._calibration_points
 
+    @property
+    def render_stats(self) -> dict[str, Any]:
+        return self._render_stats
+
     @property
     def default_map_image(self) -> bytes:
         if self._default_map_image is None:
@@ -9653,111 +9836,42 @@ class DreameVacuumMapOptimizer:
                         if startX >= 0:
                             isEmpty = True
 
-    def _denoise(self, data, width, height):
-        tmpMapInfo = data.copy()
-        ssize = 20
-        for i in range(width):
-            startY = -1
-            for j in range(height):
-                index = j * width + i
-                if data[index] != 0:
-                    if startY < 0:
-                        startY = j
-                    continue
-
-                if startY != -1 and (j - startY) <= ssize:
-                    isBorder = False
-                    if i == 0 or i == (width - 1) or (j - startY) <= 2:
-                        isBorder = True
-
-                    if not isBorder:
-                        _i = i - 1
-                        isBorder = True
-                        for k in range(startY, j):
-                            if tmpMapInfo[k * width + _i] == 1:
-                                isBorder = False
-                                break
-
-                    if not isBorder:
-                        _i = i + 1
-                        isBorder = True
-                        for k in range(startY, j):
-                            if tmpMapInfo[k * width + _i] == 1:
-                                isBorder = False
-                                break
-
-                    if isBorder:
-                        for k in range(startY, j):
-                            data[k * width + i] = 0
-
-                startY = -1
-
-        for j in range(height):
-            startX = -1
-            for i in range(width):
-                index = j * width + i
-                if data[index] != 0:
-                    if startX < 0:
-                        startX = i
-                    continue
-
-                if startX != -1 and (i - startX) <= ssize:
-                    isBorder = False
-                    if j == 0 or j == (height - 1) or (i - startX) <= 2:
-                        isBorder = True
-
-                    if not isBorder:
-                        _j = j - 1
-                        isBorder = True
-                        for k in range(startX, i):
-                            if tmpMapInfo[_j * width + k] == 1:
-                                isBorder = False
-                                break
-
-                    if not isBorder:
-                        _j = j + 1
-                        isBorder = True
-                        for k in range(startX, i):
-                            if tmpMapInfo[_j * width + k] == 1:
-                                isBorder = False
-                                break
-
-                    if isBorder:
-                        for k in range(startX, i):
-                            data[j * width + k] = 0
-
-                startX = -1
-
-        ssize = 2
-        for i in range(width):
-            startY = -1
-            for j in range(height):
-                index = j * width + i
-                if data[index] != 0:
-                    if startY < 0:
-                        startY = j
-                    continue
-
-                if startY != -1 and (j - startY) <= ssize:
-                    for k in range(startY, j):
-                        data[k * width + i] = 0
-
-                startY = -1
-
-        for j in range(height):
-            startX = -1
-            for i in range(width):
-                index = j * width + i
-                if data[index] != 0:
-                    if startX < 0:
-                        startX = i
-                    continue
+    @staticmethod
+    def _short_runs(lines, max_length):
+        """Runs of non zero cells along every line of a 2D grid that are ended by a zero cell and are at most
+        max_length cells long, as (line, start, end) index arrays with end being the ending zero cell."""
+        edges = np.diff(np.pad(lines != 0, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+        line, start = np.nonzero(edges == 1)
+        end = np.nonzero(edges == -1)[1]
+        keep = (end < lines.shape[1]) & (end - start <= max_length)
+        return line[keep], start[keep], end[keep]
 
-                if startX != -1 and (i - startX) <= ssize:
-                    for k in range(startX, i):
-                        data[j * width + k] = 0
+    @staticmethod
+    def _clear_runs(lines, line, start, end):
+        marks = np.zeros((lines.shape[0], lines.shape[1] + 1), dtype=np.int32)
+        np.add.at(marks, (line, start), 1)
+        np.add.at(marks, (line, end), -1)
+        lines[marks.cumsum(axis=1)[:, :-1] > 0] = 0
 
-                startX = -1
+    def _denoise(self, data, width, height):
+        # Every pass reads the runs of its own lines and the neighbours of the unmodified map only, so the lines do
+        # not depend on each other and are processed at once.
+        grid = np.array(data).reshape(height, width)
+        original = grid == 1
+        for lines, neighbours in ((grid.T, original.T), (grid, original)):
+            line, start, end = self._short_runs(lines, 20)
+            border = (line == 0) | (line == lines.shape[0] - 1) | (end - start <= 2)
+            ones = np.zeros((neighbours.shape[0], neighbours.shape[1] + 1), dtype=np.int32)
+            ones[:, 1:] = neighbours.cumsum(axis=1)
+            inner = ~border
+            for side in (line[inner] - 1, line[inner] + 1):
+                border[inner] |= ones[side, end[inner]] == ones[side, start[inner]]
+            self._clear_runs(lines, line[border], start[border], end[border])
+
+        for lines in (grid.T, grid):
+            self._clear_runs(lines, *self._short_runs(lines, 2))
+
+        data[:] = grid.ravel().tolist()
 
     def _update_border_value(self, data, width, height, stroke):
         for j in range(height):
@@ -10777,70 +10891,121 @@ class DreameVacuumMapOptimizer:
             si = int((saved_map_data.dimensions.left - left) / saved_map_data.dimensions.grid_size)
             sj = int((saved_map_data.dimensions.top - top) / saved_map_data.dimensions.grid_size)
 
-            sim = si + saved_map_data.dimensions.width
-            sjm = sj + saved_map_data.dimensions.height
-
             ni = int((map_data.dimensions.left - left) / map_data.dimensions.grid_size)
             nj = int((map_data.dimensions.top - top) / map_data.dimensions.grid_size)
 
-            nim = ni + map_data.dimensions.width
-            njm = nj + map_data.dimensions.height
-
-            pixel_type = np.zeros((width, height), np.uint8)
             data = map_data.optimized_pixel_type if map_data.optimized_pixel_type is not None else map_data.pixel_type
+            saved_values = self._place_cells(
+                saved_map_data.pixel_type[: saved_map_data.dimensions.width, : saved_map_data.dimensions.height],
+                si,
+                sj,
+                width,
+                height,
+            )
+            clean_values = self._place_cells(
+                data[: map_data.dimensions.width, : map_data.dimensions.height], ni, nj, width, height
+            )
 
-            for j in range(height):
-                for i in range(width):
-                    if j >= sj and i >= si and j < sjm and i < sim:
-                        saved_value = int(saved_map_data.pixel_type[(i - si), (j - sj)])
-                    else:
-                        saved_value = 0
-
-                    if j >= nj and i >= ni and j < njm and i < nim:
-                        clean_value = int(data[(i - ni), (j - nj)])
-                    else:
-                        clean_value = 0
-
-                    if saved_value != 0:
-                        if saved_value != 255:
-                            pixel_type[i, j] = saved_value
-                        else:
-                            if clean_value != 0 and clean_value != 255:
-                                pixel_type[i, j] = 254
-                            else:
-                                pixel_type[i, j] = 255
-                    elif clean_value != 0:
-                        if clean_value == 255:
-                            pixel_type[i, j] = 255
-                        else:
-                            pixel_type[i, j] = 254
+            pixel_type = np.where(
+                saved_values != 0,
+                np.where(
+                    saved_values != 255,
+                    saved_values,
+                    np.where((clean_values != 0) & (clean_values != 255), 254, 255),
+                ),
+                np.where(clean_values == 0, 0, np.where(clean_values == 255, 255, 254)),
+            ).astype(np.uint8)
 
             if original_data is not None:
-                for j in range(height):
-                    for i in range(width):
-                        if j >= nj and i >= ni and j < njm and i < nim:
-                            if (
-                                original_data[(j - nj) * map_data.dimensions.width + (i - ni)] == 2
-                                and pixel_type[i, j] != 0
-                            ):
-                                dis = 3
-                                hasBorder = False
-                                for _j in range(j - dis, j + dis + 1):
-                                    for _i in range(i - dis, i + dis):
-                                        if _j < 0 or _i < 0 or _j >= height or _i >= width:
-                                            continue
-                                        if hasBorder:
-                                            break
-                                        if pixel_type[_i, _j] == 255:
-                                            hasBorder = True
-                                            break
-
-                                if not hasBorder:
-                                    pixel_type[i, j] = 251
+                original_values = self._place_cells(
+                    np.array(original_data, dtype=np.uint8)
+                    .reshape(map_data.dimensions.height, map_data.dimensions.width)
+                    .T,
+                    ni,
+                    nj,
+                    width,
+                    height,
+                )
+                # Obstacle cells of the original map without a wall within [-3, +2] x [-3, +3] cells
+                dis = 3
+                border = self._window_sum(pixel_type == 255, dis, dis - 1, dis, dis)
+                pixel_type[(original_values == 2) & (pixel_type != 0) & (border == 0)] = 251
 
             map_data.optimized_pixel_type = pixel_type
             map_data.optimized_dimensions = MapImageDimensions(top, left, height, width, map_data.dimensions.grid_size)
 
+    @staticmethod
+    def _place_cells(values, offset_x, offset_y, width, height):
+        """Copy a [x, y] cell grid into a zero (width, height) grid at the given offset, clipping at the edges."""
+        result = np.zeros((width, height), dtype=values.dtype)
+        x0 = max(offset_x, 0)
+        y0 = max(offset_y, 0)
+        x1 = min(offset_x + values.shape[0], width)
+        y1 = min(offset_y + values.shape[1], height)
+        if x1 > x0 and y1 > y0:
+            result[x0:x1, y0:y1] = values[x0 - offset_x : x1 - offset_x, y0 - offset_y : y1 - offset_y]
+        return result
+
+    @staticmethod
+    def _window_sum(mask, left, right, top, bottom):
+        """Count of set cells of a [x, y] mask in the window [x - left, x + right] x [y - top, y + bottom] of every
+        cell, clipped at the map edges."""
+        width, height = mask.shape
+        table = np.zeros((width + 1, height + 1), dtype=np.int64)
+        table[1:, 1:] = mask.cumsum(axis=0).cumsum(axis=1)
+        x0 = np.clip(np.arange(width) - left, 0, width)
+        x1 = np.clip(np.arange(width) + right + 1, 0, width)
+        y0 = np.clip(np.arange(height) - top, 0, height)
+        y1 = np.clip(np.arange(height) + bottom + 1, 0, height)
+        return (
+            table[x1[:, None], y1[None, :]]
+            - table[x0[:, None], y1[None, :]]
+            - table[x1[:, None], y0[None, :]]
+            + table[x0[:, None], y0[None, :]]
+        )
+
+    def _smooth_wifi_map(self, pixel_type, optimized_pixel_type, width, height):
+        """Replace every non wall wifi cell with the most common signal level around it, looking in a 7x7 window and
+        widening it up to 11x11 until a signal cell is found. On a tie the level that reaches the top count first in
+        row order wins, as the app does."""
+        values = pixel_type[:width, :height].astype(np.int64)
+        targets = values > 2
+        if not targets.any():
+            return
+
+        levels = [
+            MapPixelType.WIFI_POOR.value,
+            MapPixelType.WIFI_LOW.value,
+            MapPixelType.WIFI_HIGH.value,
+            MapPixelType.WIFI_EXCELLENT.value,
+        ]
+        xs, ys = np.nonzero(targets)
+        for delta in range(3, 6):
+            if not xs.size:
+                break
+
+            counts = np.stack(
+                [self._window_sum(values == level, delta, delta, delta, delta)[xs, ys] for level in levels]
+            )
+            best = counts.max(axis=0)
+            found = best > 0
+            winner = counts.argmax(axis=0)
+            for k in np.flatnonzero(found & ((counts == best).sum(axis=0) > 1)).tolist():
+                x = int(xs[k])
+                y = int(ys[k])
+                window = values[max(x - delta, 0) : x + delta + 1, max(y - delta, 0) : y + delta + 1].T.ravel()
+                first = None
+                for index, level in enumerate(levels):
+                    if counts[index, k] == best[k]:
+                        position = int(np.flatnonzero(window == level)[best[k] - 1])
+                        if first is None or position < first:
+                            first = position
+                            winner[k] = index
+
+            optimized_pixel_type[xs[found], ys[found]] = np.array(levels, dtype=np.uint8)[winner[found]]
+            xs = xs[~found]
+            ys = ys[~found]
+
     def optimize(self, map_data, saved_map_data=None, js_optimizer=True):
         if map_data.saved_map:
             return map_data
@@ -10849,33 +11014,12 @@ class DreameVacuumMapOptimizer:
             map_data.optimized_pixel_type = np.copy(map_data.pixel_type)
             map_data.optimized_dimensions = map_data.dimensions
             if not map_data.empty_map:
-                for y in range(map_data.dimensions.height):
-                    for x in range(map_data.dimensions.width):
-                        if int(map_data.pixel_type[x, y]) > 2:
-                            max_count = 0
-                            max_px = -1
-                            value_count = [0, 0, 0, 0]
-                            for delta in range(3, 6):
-                                for n in range(y - delta, y + delta + 1):
-                                    for m in range(x - delta, x + delta + 1):
-                                        if (
-                                            n < 0
-                                            or n >= map_data.dimensions.height
-                                            or m < 0
-                                            or m >= map_data.dimensions.width
-                                        ):
-                                            continue
-
-                                        px = int(map_data.pixel_type[m, n]) - 11
-                                        if px >= 0:
-                                            value_count[px] = value_count[px] + 1
-                                            if value_count[px] > max_count:
-                                                max_count = value_count[px]
-                                                max_px = px
-
-                                if max_px >= 0:
-                                    map_data.optimized_pixel_type[x, y] = MapPixelType(max_px + 11)
-                                    break
+                self._smooth_wifi_map(
+                    map_data.pixel_type,
+                    map_data.optimized_pixel_type,
+                    map_data.dimensions.width,
+                    map_data.dimensions.height,
+                )
             return map_data
 
         try:
@@ -10950,17 +11094,15 @@ class DreameVacuumMapOptimizer:
             else:
                 width = map_data.dimensions.width
                 height = map_data.dimensions.height
-                clean_data = np.zeros((width * height), np.uint8).tolist()
 
-                data_map = {255: 2, 253: 1, 250: 3}
-                pointNum = 0
-                for j in range(height):
-                    for i in range(width):
-                        index = j * width + i
-                        clean_data[index] = int(map_data.pixel_type[i, j])
-                        if clean_data[index]:
-                            pointNum = pointNum + 1
-                            clean_data[index] = data_map.get(clean_data[index], 0)
+                # Flat row-major cell list: 255 (wall) -> 2, 253 (new segment) -> 1, 250 (hidden wall) -> 3
+                values = map_data.pixel_type[:width, :height].T.ravel()
+                pointNum = int(np.count_nonzero(values))
+                clean_values = np.zeros(values.shape, np.uint8)
+                clean_values[values == 255] = 2
+                clean_values[values == 253] = 1
+                clean_values[values == 250] = 3
+                clean_data = clean_values.tolist()
 
                 original_data = clean_data.copy()
                 pixel_type = np.zeros((width, height), np.uint8)
@@ -11019,14 +11161,11 @@ class DreameVacuumMapOptimizer:
                     else:
                         self._clean_small_obstacle(clean_data, width, height, 3)
 
-                    currentPointNum = 0
-                    data_map = {7: 255, 2: 255, 3: (0 if saved_map_data else 250)}
-                    for j in range(height):
-                        for i in range(width):
-                            clean_value = clean_data[j * width + i]
-                            if clean_value != 0:
-                                currentPointNum = currentPointNum + 1
-                                pixel_type[i, j] = data_map.get(clean_value, 253)
+                    clean_values = np.array(clean_data, dtype=np.int64).reshape(height, width).T
+                    currentPointNum = int(np.count_nonzero(clean_values))
+                    pixel_type[clean_values != 0] = 253
+                    pixel_type[(clean_values == 7) | (clean_values == 2)] = 255
+                    pixel_type[clean_values == 3] = 0 if saved_map_data else 250
 
                     if not ((currentPointNum * 100) / pointNum) < 50 and pointNum > 2000:
                         map_data.optimized_pixel_type = pixel_type
@@ -4016,6 +4016,7 @@ class MapRendererLayer(IntEnum):
     OBSTACLE = 19
     CRUISE_POINTS = 20
     CRUISE_POINT = 21
+    STATIC_OBJECTS = 22
 
 
 @dataclass
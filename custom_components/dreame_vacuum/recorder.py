@@ -59,6 +59,7 @@ from .dreame.const import (
     ATTR_FLOOR_DIRECTION_CLEANING_AVAILABLE,
     ATTR_CAPABILITIES,
     ATTR_COLOR_SCHEME,
+    ATTR_RENDER_STATS,
     ATTR_SHORTCUT_TASK,
 )
 
@@ -88,6 +89,7 @@ CAMERA_UNRECORDED_ATTRIBUTES = {
     ATTR_UPDATED,
     ATTR_FRAME_ID,
     ATTR_COLOR_SCHEME,
+    ATTR_RENDER_STATS,
 }
 
 VACUUM_UNRECORDED_ATTRIBUTES = {
@@ -0,0 +1,3 @@
+"""
+Test package for the dreame_vacuum integration
+"""
@@ -0,0 +1,133 @@
+import base64
+import json
+import os
+import struct
+import unittest
+import zlib
+
+import numpy as np
+
+try:
+    from custom_components.dreame_vacuum.dreame.map import DreameVacuumMapDecoder
+except ImportError as err:  # Home Assistant and the device libraries are imported at package level
+    raise unittest.SkipTest(f"requires the dreame_vacuum dependencies: {err}")
+
+FRAMES = os.path.join(os.path.dirname(__file__), "map_frames.json")
+
+SEGMENT_FIELDS = ("x0", "y0", "x1", "y1", "x", "y", "name", "unique_id", "type", "index", "neighbors")
+
+
+def encode_frame(frame_type, width, height, pixels, data_json=None, map_id=1, frame_id=1, left=0, top=0, grid_size=50):
+    """Map frame string as the device sends it: header, row-major pixels and JSON, zlib and url safe base64."""
+    header = struct.pack(
+        "<hhb" + "h" * 11,
+        map_id,
+        frame_id,
+        frame_type,
+        100, 200, 0,  # robot position
+        -100, 50, 90,  # charger position
+        grid_size,
+        width,
+        height,
+        left,
+        top,
+    )
+    raw = header + bytes(pixels) + (json.dumps(data_json).encode() if data_json is not None else b"")
+    return base64.urlsafe_b64encode(zlib.compress(raw)).decode()
+
+
+def _grid(values):
+    return base64.b64encode(zlib.compress(np.ascontiguousarray(values.T).tobytes())).decode()
+
+
+def summarize(map_data):
+    """Decoder output that the vectorized decoder must reproduce, in JSON form."""
+    if map_data is None:
+        return None
+    summary = {
+        "frame_id": map_data.frame_id,
+        "empty_map": map_data.empty_map,
+        "dimensions": None,
+        "pixel_type": None,
+        "combined_pixel_type": None,
+        "carpet_pixels": None,
+        "segments": None,
+        "cleaning_pixel_type": None,
+    }
+    if map_data.dimensions is not None:
+        d = map_data.dimensions
+        summary["dimensions"] = [d.top, d.left, d.height, d.width, d.grid_size]
+    if map_data.pixel_type is not None:
+        summary["pixel_type"] = [list(map_data.pixel_type.shape), _grid(map_data.pixel_type)]
+    if map_data.combined_pixel_type is not None:
+        summary["combined_pixel_type"] = [
+            list(map_data.combined_pixel_type.shape),
+            _grid(map_data.combined_pixel_type),
+        ]
+    if map_data.carpet_pixels is not None:
+        summary["carpet_pixels"] = [[int(x), int(y)] for x, y in map_data.carpet_pixels]
+    if map_data.segments is not None:
+        summary["segments"] = [
+            [int(k)] + [getattr(v, field) for field in SEGMENT_FIELDS] for k, v in map_data.segments.items()
+        ]
+    cleaning = map_data.cleaning_map_data
+    if cleaning is not None and cleaning.pixel_type is not None:
+        summary["cleaning_pixel_type"] = [list(cleaning.pixel_type.shape), _grid(cleaning.pixel_type)]
+    return json.loads(json.dumps(summary))
+
+
+def decode_sequence(frames, vslam_map):
+    """Decode an I or W frame followed by the P frames that update it, summarizing the map after each frame.
+
+    A frame the decoder gives up on is summarized by the exception it raises.
+    """
+    try:
+        map_data = DreameVacuumMapDecoder.decode_map(frames[0], vslam_map)[0]
+    except Exception as err:  # pylint: disable=broad-except
+        return [{"error": type(err).__name__}]
+    summaries = [summarize(map_data)]
+    for frame in frames[1:]:
+        partial = DreameVacuumMapDecoder.decode_map_partial(frame)
+        map_data = DreameVacuumMapDecoder.decode_p_map_data_from_partial(partial, map_data, vslam_map)
+        summaries.append(summarize(map_data))
+    return summaries
+
+
+def _pixels(encoded):
+    shape, data = encoded
+    return np.frombuffer(zlib.decompress(base64.b64decode(data)), dtype=np.uint8).reshape(shape[1], shape[0]).T
+
+
+class TestMapDecoderGolden(unittest.TestCase):
+    """Stored I/W/P frames decode to the output recorded from the per-pixel decoder."""
+
+    @classmethod
+    def setUpClass(cls):
+        with open(FRAMES, encoding="utf-8") as f:
+            cls.cases = json.load(f)["cases"]
+
+    def assertSameSummary(self, result, expected):
+        if expected is None or "error" in expected:
+            self.assertEqual(result, expected)
+            return
+        for key in ("pixel_type", "combined_pixel_type", "cleaning_pixel_type"):
+            if expected[key] is None:
+                self.assertIsNone(result[key], key)
+            else:
+                np.testing.assert_array_equal(_pixels(result[key]), _pixels(expected[key]), key)
+        for key in expected:
+            if not key.endswith("pixel_type"):
+                self.assertEqual(result[key], expected[key], key)
+
+    def test_frames(self):
+        for case in self.cases:
+            with self.subTest(case=case["name"]):
+                summaries = decode_sequence(case["frames"], case["vslam_map"])
+                self.assertEqual(len(summaries), len(case["expected"]))
+                for index, (result, expected) in enumerate(zip(summaries, case["expected"])):
+                    with self.subTest(frame=index):
+                        self.assertSameSummary(result, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
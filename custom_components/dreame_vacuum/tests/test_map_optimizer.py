@@ -0,0 +1,357 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+try:
+    from custom_components.dreame_vacuum.dreame.map import DreameVacuumMapOptimizer
+    from custom_components.dreame_vacuum.dreame.types import MapImageDimensions, MapPixelType
+except ImportError as err:  # Home Assistant and the device libraries are imported at package level
+    raise unittest.SkipTest(f"requires the dreame_vacuum dependencies: {err}")
+
+
+class LoopMapOptimizer(DreameVacuumMapOptimizer):
+    """The optimizer with the per-cell loops the array passes replaced, kept as the parity reference."""
+
+    def _smooth_wifi_map(self, pixel_type, optimized_pixel_type, width, height):
+        for y in range(height):
+            for x in range(width):
+                if int(pixel_type[x, y]) > 2:
+                    max_count = 0
+                    max_px = -1
+                    value_count = [0, 0, 0, 0]
+                    for delta in range(3, 6):
+                        for n in range(y - delta, y + delta + 1):
+                            for m in range(x - delta, x + delta + 1):
+                                if n < 0 or n >= height or m < 0 or m >= width:
+                                    continue
+
+                                px = int(pixel_type[m, n]) - 11
+                                if px >= 0:
+                                    value_count[px] = value_count[px] + 1
+                                    if value_count[px] > max_count:
+                                        max_count = value_count[px]
+                                        max_px = px
+
+                        if max_px >= 0:
+                            optimized_pixel_type[x, y] = MapPixelType(max_px + 11)
+                            break
+
+    def _denoise(self, data, width, height):
+        tmpMapInfo = data.copy()
+        ssize = 20
+        for i in range(width):
+            startY = -1
+            for j in range(height):
+                index = j * width + i
+                if data[index] != 0:
+                    if startY < 0:
+                        startY = j
+                    continue
+
+                if startY != -1 and (j - startY) <= ssize:
+                    isBorder = False
+                    if i == 0 or i == (width - 1) or (j - startY) <= 2:
+                        isBorder = True
+
+                    if not isBorder:
+                        _i = i - 1
+                        isBorder = True
+                        for k in range(startY, j):
+                            if tmpMapInfo[k * width + _i] == 1:
+                                isBorder = False
+                                break
+
+                    if not isBorder:
+                        _i = i + 1
+                        isBorder = True
+                        for k in range(startY, j):
+                            if tmpMapInfo[k * width + _i] == 1:
+                                isBorder = False
+                                break
+
+                    if isBorder:
+                        for k in range(startY, j):
+                            data[k * width + i] = 0
+
+                startY = -1
+
+        for j in range(height):
+            startX = -1
+            for i in range(width):
+                index = j * width + i
+                if data[index] != 0:
+                    if startX < 0:
+                        startX = i
+                    continue
+
+                if startX != -1 and (i - startX) <= ssize:
+                    isBorder = False
+                    if j == 0 or j == (height - 1) or (i - startX) <= 2:
+                        isBorder = True
+
+                    if not isBorder:
+                        _j = j - 1
+                        isBorder = True
+                        for k in range(startX, i):
+                            if tmpMapInfo[_j * width + k] == 1:
+                                isBorder = False
+                                break
+
+                    if not isBorder:
+                        _j = j + 1
+                        isBorder = True
+                        for k in range(startX, i):
+                            if tmpMapInfo[_j * width + k] == 1:
+                                isBorder = False
+                                break
+
+                    if isBorder:
+                        for k in range(startX, i):
+                            data[j * width + k] = 0
+
+                startX = -1
+
+        ssize = 2
+        for i in range(width):
+            startY = -1
+            for j in range(height):
+                index = j * width + i
+                if data[index] != 0:
+                    if startY < 0:
+                        startY = j
+                    continue
+
+                if startY != -1 and (j - startY) <= ssize:
+                    for k in range(startY, j):
+                        data[k * width + i] = 0
+
+                startY = -1
+
+        for j in range(height):
+            startX = -1
+            for i in range(width):
+                index = j * width + i
+                if data[index] != 0:
+                    if startX < 0:
+                        startX = i
+                    continue
+
+                if startX != -1 and (i - startX) <= ssize:
+                    for k in range(startX, i):
+                        data[j * width + k] = 0
+
+                startX = -1
+
+    def _merge_saved_map_data(self, map_data, saved_map_data, original_data=None):
+        if saved_map_data:
+            maxX = map_data.dimensions.left + (map_data.dimensions.width * map_data.dimensions.grid_size)
+            maxY = map_data.dimensions.top + (map_data.dimensions.height * map_data.dimensions.grid_size)
+
+            if maxX < saved_map_data.dimensions.left + (
+                saved_map_data.dimensions.width * saved_map_data.dimensions.grid_size
+            ):
+                maxX = saved_map_data.dimensions.left + (
+                    saved_map_data.dimensions.width * saved_map_data.dimensions.grid_size
+                )
+
+            if maxY < saved_map_data.dimensions.top + (
+                saved_map_data.dimensions.height * saved_map_data.dimensions.grid_size
+            ):
+                maxY = saved_map_data.dimensions.top + (
+                    saved_map_data.dimensions.height * saved_map_data.dimensions.grid_size
+                )
+
+            left = map_data.dimensions.left
+            top = map_data.dimensions.top
+
+            if saved_map_data.dimensions.left < left:
+                left = saved_map_data.dimensions.left
+
+            if saved_map_data.dimensions.top < top:
+                top = saved_map_data.dimensions.top
+
+            width = int((maxX - left) / saved_map_data.dimensions.grid_size)
+            height = int((maxY - top) / saved_map_data.dimensions.grid_size)
+
+            si = int((saved_map_data.dimensions.left - left) / saved_map_data.dimensions.grid_size)
+            sj = int((saved_map_data.dimensions.top - top) / saved_map_data.dimensions.grid_size)
+
+            sim = si + saved_map_data.dimensions.width
+            sjm = sj + saved_map_data.dimensions.height
+
+            ni = int((map_data.dimensions.left - left) / map_data.dimensions.grid_size)
+            nj = int((map_data.dimensions.top - top) / map_data.dimensions.grid_size)
+
+            nim = ni + map_data.dimensions.width
+            njm = nj + map_data.dimensions.height
+
+            pixel_type = np.zeros((width, height), np.uint8)
+            data = map_data.optimized_pixel_type if map_data.optimized_pixel_type is not None else map_data.pixel_type
+
+            for j in range(height):
+                for i in range(width):
+                    if j >= sj and i >= si and j < sjm and i < sim:
+                        saved_value = int(saved_map_data.pixel_type[(i - si), (j - sj)])
+                    else:
+                        saved_value = 0
+
+                    if j >= nj and i >= ni and j < njm and i < nim:
+                        clean_value = int(data[(i - ni), (j - nj)])
+                    else:
+                        clean_value = 0
+
+                    if saved_value != 0:
+                        if saved_value != 255:
+                            pixel_type[i, j] = saved_value
+                        else:
+                            if clean_value != 0 and clean_value != 255:
+                                pixel_type[i, j] = 254
+                            else:
+                                pixel_type[i, j] = 255
+                    elif clean_value != 0:
+                        if clean_value == 255:
+                            pixel_type[i, j] = 255
+                        else:
+                            pixel_type[i, j] = 254
+
+            if original_data is not None:
+                for j in range(height):
+                    for i in range(width):
+                        if j >= nj and i >= ni and j < njm and i < nim:
+                            if (
+                                original_data[(j - nj) * map_data.dimensions.width + (i - ni)] == 2
+                                and pixel_type[i, j] != 0
+                            ):
+                                dis = 3
+                                hasBorder = False
+                                for _j in range(j - dis, j + dis + 1):
+                                    for _i in range(i - dis, i + dis):
+                                        if _j < 0 or _i < 0 or _j >= height or _i >= width:
+                                            continue
+                                        if hasBorder:
+                                            break
+                                        if pixel_type[_i, _j] == 255:
+                                            hasBorder = True
+                                            break
+
+                                if not hasBorder:
+                                    pixel_type[i, j] = 251
+
+            map_data.optimized_pixel_type = pixel_type
+            map_data.optimized_dimensions = MapImageDimensions(top, left, height, width, map_data.dimensions.grid_size)
+
+
+def _room_map(rng, width, height):
+    """[x, y] pixel grid with walled rooms, noise, gaps and stray wall cells."""
+    pixel_type = np.zeros((width, height), np.uint8)
+    for _ in range(int(rng.integers(2, 6))):
+        x0 = int(rng.integers(0, width - 10))
+        y0 = int(rng.integers(0, height - 10))
+        x1 = int(rng.integers(x0 + 8, min(width, x0 + 60)))
+        y1 = int(rng.integers(y0 + 8, min(height, y0 + 60)))
+        pixel_type[x0:x1, y0:y1] = 253
+        pixel_type[x0:x1, [y0, y1 - 1]] = 255
+        pixel_type[[x0, x1 - 1], y0:y1] = 255
+    noise = rng.random((width, height))
+    pixel_type[noise < 0.03] = 0
+    pixel_type[(noise > 0.97) & (pixel_type == 0)] = 253
+    pixel_type[noise > 0.995] = 255
+    pixel_type[(noise > 0.5) & (noise < 0.505)] = 250
+    return pixel_type
+
+
+def _map_data(pixel_type, left, top, grid_size=50, **kwargs):
+    width, height = pixel_type.shape
+    values = {
+        "map_id": 1,
+        "frame_id": 1,
+        "saved_map": False,
+        "wifi_map": False,
+        "empty_map": False,
+        "charger_position": None,
+        "optimized_pixel_type": None,
+        "optimized_dimensions": None,
+        "optimized_charger_position": None,
+        **kwargs,
+    }
+    return SimpleNamespace(
+        pixel_type=pixel_type, dimensions=MapImageDimensions(top, left, height, width, grid_size), **values
+    )
+
+
+class TestMapOptimizerParity(unittest.TestCase):
+    """The array passes of DreameVacuumMapOptimizer produce the same cells as the per-cell loops."""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(42)
+        self.optimizer = DreameVacuumMapOptimizer()
+        self.reference = LoopMapOptimizer()
+
+    def assertSameMap(self, result, expected):
+        np.testing.assert_array_equal(result.optimized_pixel_type, expected.optimized_pixel_type)
+        if expected.optimized_dimensions is None:
+            self.assertIsNone(result.optimized_dimensions)
+            return
+        for key in ("top", "left", "width", "height"):
+            self.assertEqual(
+                getattr(result.optimized_dimensions, key), getattr(expected.optimized_dimensions, key)
+            )
+
+    def test_denoise(self):
+        for case in range(25):
+            width = int(self.rng.integers(3, 70))
+            height = int(self.rng.integers(3, 70))
+            data = self.rng.choice([0, 0, 1, 1, 1, 2, 3], size=width * height).tolist()
+            expected = list(data)
+            self.reference._denoise(expected, width, height)
+            with self.subTest(case=case):
+                self.optimizer._denoise(data, width, height)
+                self.assertEqual(data, expected)
+
+    def test_wifi_map(self):
+        levels = [0, 0, 1, 2, 11, 12, 13, 14]
+        for case in range(15):
+            width = int(self.rng.integers(5, 60))
+            height = int(self.rng.integers(5, 60))
+            pixel_type = self.rng.choice(levels, size=(width, height)).astype(np.uint8)
+            # Sparse maps leave cells without a signal cell in reach of the widest window.
+            pixel_type[self.rng.random((width, height)) < case / 15] = 0
+            result = _map_data(pixel_type.copy(), 0, 0, wifi_map=True)
+            expected = _map_data(pixel_type.copy(), 0, 0, wifi_map=True)
+            with self.subTest(case=case):
+                self.optimizer.optimize(result)
+                self.reference.optimize(expected)
+                self.assertSameMap(result, expected)
+
+    def test_merge_saved_map(self):
+        for case in range(30):
+            saved = _map_data(
+                _room_map(self.rng, int(self.rng.integers(20, 70)), int(self.rng.integers(20, 70))),
+                int(self.rng.integers(-10, 10)) * 50,
+                int(self.rng.integers(-10, 10)) * 50,
+            )
+            saved.pixel_type[self.rng.random(saved.pixel_type.shape) < 0.05] = 7
+            current = _room_map(self.rng, int(self.rng.integers(20, 70)), int(self.rng.integers(20, 70)))
+            original = self.rng.choice([0, 1, 2], size=current.size).tolist() if case % 2 else None
+            result = _map_data(current.copy(), int(self.rng.integers(-10, 10)) * 50, 0)
+            expected = _map_data(current.copy(), result.dimensions.left, 0)
+            with self.subTest(case=case):
+                self.optimizer._merge_saved_map_data(result, saved, original)
+                self.reference._merge_saved_map_data(expected, saved, original)
+                self.assertSameMap(result, expected)
+
+    def test_python_pipeline(self):
+        for case in range(6):
+            pixel_type = _room_map(self.rng, 90, 80)
+            saved = _map_data(_room_map(self.rng, 70, 70), -500, 250) if case % 2 else None
+            result = _map_data(pixel_type.copy(), 0, 0)
+            expected = _map_data(pixel_type.copy(), 0, 0)
+            with self.subTest(case=case):
+                self.optimizer.optimize(result, saved, js_optimizer=False)
+                self.reference.optimize(expected, saved, js_optimizer=False)
+                self.assertSameMap(result, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -286,6 +286,202 @@ def compute_dtw_lite(
         _LOGGER.debug("compute_dtw_lite vectorized path failed; using scalar fallback", exc_info=True)
         return _dtw_lite_scalar(xf, yf, n, m, w)
 
+
+# How often (in anti-diagonals) the batched kernel checks its early-abandon bound.
+# Checking is a reduction over every active row, so doing it on every diagonal
+# costs more than it saves for the 200-point matching grid.
+_DTW_ABANDON_CHECK_EVERY = 8
+
+
+def compute_dtw_lite_batch(
+    x: np.ndarray,
+    ys: np.ndarray,
+    band_width_ratio: float = 0.1,
+    derivative: bool = False,
+    abandon_above: np.ndarray | None = None,
+) -> np.ndarray:
+    """DTW distance of one (or one-per-row) query against many equal-length candidates.
+
+    ``ys`` is a ``(k, m)`` stack of candidate curves (already on a common grid,
+    e.g. ``MATCH_DTW_RESAMPLE_N``); ``x`` is either a single ``(n,)`` query shared
+    by every row or a ``(k, n)`` stack with one query per row. Returns a ``(k,)``
+    array of distances, each identical to :func:`compute_dtw_lite` for that pair
+    (same Sakoe-Chiba band, same ``local + min(up, left, diag)`` recurrence).
+
+    The per-pair kernel loops over rows in Python, which is the right call for a
+    single n=200 pair but repeats the whole interpreter overhead per candidate.
+    Here the band is filled one anti-diagonal at a time: every cell on diagonal
+    ``i + j == d`` depends only on diagonals ``d-1`` and ``d-2``, and the in-band
+    cells of a diagonal form one contiguous ``i`` range, so each step is a handful
+    of slice operations over ``(k, cells)`` - ~n+m NumPy calls for the whole
+    batch instead of ~n*w Python iterations per candidate.
+
+    ``abandon_above`` (optional, ``(k,)``) enables early abandoning: every warping
+    path crosses at least one of any two consecutive anti-diagonals and all local
+    costs are non-negative, so ``min`` over the last two diagonals is a lower bound
+    on the final distance. Rows whose bound exceeds their threshold are dropped
+    from the fill and reported as ``inf``.
+    """
+    ys = np.atleast_2d(np.asarray(ys, dtype=float))
+    k, m = ys.shape
+    xs = np.asarray(x, dtype=float)
+    if derivative:
+        if xs.shape[-1] > 1:
+            xs = np.gradient(xs, axis=-1)
+        if m > 1:
+            ys = np.gradient(ys, axis=1)
+    n = xs.shape[-1]
+    out = np.full(k, np.inf)
+    if k == 0 or n == 0 or m == 0:
+        return out
+    per_row_x = xs.ndim == 2
+    if per_row_x and xs.shape[0] != k:
+        raise ValueError("x must be 1-D or have one row per candidate")
+
+    w = max(1, int(min(n, m) * band_width_ratio))
+
+    # Row band bounds exactly as compute_dtw_lite computes them (1-based i, j).
+    centers = (np.arange(1, n + 1, dtype=float) * (m / n)).astype(np.intp)
+    lo = np.maximum(1, centers - w)
+    hi = np.minimum(m, centers + w + 1)
+    # Cell (i, d-i) is in band iff lo_i + i <= d <= hi_i + i. Both sides are
+    # strictly increasing in i, so the in-band cells of diagonal d are the
+    # contiguous range [first i with hi_i+i >= d, last i with lo_i+i <= d].
+    rows = np.arange(1, n + 1)
+    lo_d = lo + rows
+    hi_d = hi + rows
+    diags = np.arange(n + m + 1)
+    i_first = np.searchsorted(hi_d, diags, side="left") + 1
+    i_last = np.searchsorted(lo_d, diags, side="right")
+
+    # Reversed candidates turn y[j-1] (j = d-i, i ascending) into a forward slice.
+    yr = np.ascontiguousarray(ys[:, ::-1])
+    xq = xs if per_row_x else xs[np.newaxis, :]
+
+    active = np.arange(k)
+    thresholds = None
+    if abandon_above is not None:
+        thresholds = np.asarray(abandon_above, dtype=float).reshape(k)
+
+    # Rolling diagonals indexed by i (0..n); cells off the diagonal stay inf.
+    prev2 = np.full((k, n + 1), np.inf)
+    prev1 = np.full((k, n + 1), np.inf)
+    curr = np.full((k, n + 1), np.inf)
+    prev2[:, 0] = 0.0  # diagonal 0 holds only C[0, 0]; diagonal 1 is all boundary
+
+    for d in range(2, n + m + 1):
+        a = int(i_first[d])
+        b = int(i_last[d])
+        curr.fill(np.inf)
+        if a <= b:
+            local = np.abs(xq[:, a - 1 : b] - yr[:, m - d + a : m - d + b + 1])
+            best = np.minimum(
+                np.minimum(prev1[:, a - 1 : b], prev1[:, a : b + 1]),
+                prev2[:, a - 1 : b],
+            )
+            curr[:, a : b + 1] = local + best
+        prev2, prev1, curr = prev1, curr, prev2
+
+        if thresholds is not None and d % _DTW_ABANDON_CHECK_EVERY == 0 and d < n + m:
+            bound = np.minimum(prev1.min(axis=1), prev2.min(axis=1))
+            keep = bound <= thresholds
+            if not keep.all():
+                if not keep.any():
+                    return out
+                active = active[keep]
+                thresholds = thresholds[keep]
+                yr = yr[keep]
+                if per_row_x:
+                    xq = xq[keep]
+                prev2 = prev2[keep]
+                prev1 = prev1[keep]
+                curr = curr[keep]
+
+    out[active] = prev1[:, n]
+    return out
+
+
+def compute_dtw_lite_many(
+    x: np.ndarray,
+    ys: np.ndarray,
+    band_width_ratio: float = 0.1,
+    derivative: bool = False,
+    abandon_above: np.ndarray | None = None,
+) -> np.ndarray:
+    """:func:`compute_dtw_lite_batch` with a per-pair fallback.
+
+    Mirrors ``compute_dtw_lite``/``compute_dtw_path``: an unexpected error in the
+    batched fill degrades to the per-pair kernel (exact, never abandons) rather
+    than escaping the unguarded Stage-3 refinement in compute_matches_worker.
+    """
+    try:
+        return compute_dtw_lite_batch(
+            x, ys, band_width_ratio=band_width_ratio, derivative=derivative,
+            abandon_above=abandon_above,
+        )
+    except Exception:  # pylint: disable=broad-exception-caught
+        _LOGGER.debug("compute_dtw_lite_batch failed; using per-pair fallback", exc_info=True)
+        ys2 = np.atleast_2d(np.asarray(ys, dtype=float))
+        xs = np.asarray(x, dtype=float)
+        return np.array([
+            compute_dtw_lite(
+                xs[r] if xs.ndim == 2 else xs, ys2[r],
+                band_width_ratio=band_width_ratio, derivative=derivative,
+            )
+            for r in range(ys2.shape[0])
+        ], dtype=float)
+
+
+def lb_kim(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """LB_Kim (first/last point) lower bound on the banded DTW distance.
+
+    Every warping path starts at ``(0, 0)`` and ends at ``(n-1, m-1)``, so the
+    sum of those two local costs can never exceed the DTW distance. O(1) per
+    row, which makes it the first stage of the pruning cascade.
+    """
+    xs = np.atleast_2d(xs)
+    ys = np.atleast_2d(ys)
+    first = np.abs(xs[:, 0] - ys[:, 0])
+    if xs.shape[1] < 2 and ys.shape[1] < 2:
+        return first
+    return first + np.abs(xs[:, -1] - ys[:, -1])
+
+
+def keogh_envelope(
+    ys: np.ndarray, n: int, band_width_ratio: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Upper/lower Sakoe-Chiba envelopes of each candidate row for an ``n``-point query.
+
+    ``upper[r, i]`` / ``lower[r, i]`` bound every ``ys[r, j]`` that row ``i`` of
+    :func:`compute_dtw_lite`'s band can reach. Windows are taken at the band's
+    widest width from each row's first column, so near the ends they may cover
+    a few extra cells; a wider envelope only loosens the bound, never breaks it.
+    """
+    ys = np.atleast_2d(np.asarray(ys, dtype=float))
+    m = ys.shape[1]
+    w = max(1, int(min(n, m) * band_width_ratio))
+    centers = (np.arange(1, n + 1, dtype=float) * (m / n)).astype(np.intp)
+    lo = np.maximum(1, centers - w) - 1
+    hi = np.minimum(m, centers + w + 1) - 1
+    width = int((hi - lo).max()) + 1
+    pad = ((0, 0), (0, width))
+    hi_view = np.lib.stride_tricks.sliding_window_view(
+        np.pad(ys, pad, constant_values=-np.inf), width, axis=1
+    )
+    lo_view = np.lib.stride_tricks.sliding_window_view(
+        np.pad(ys, pad, constant_values=np.inf), width, axis=1
+    )
+    return hi_view[:, lo, :].max(axis=-1), lo_view[:, lo, :].min(axis=-1)
+
+
+def lb_keogh(xs: np.ndarray, upper: np.ndarray, lower: np.ndarray) -> np.ndarray:
+    """LB_Keogh lower bound: each query point pays at least its L1 distance to
+    the candidate's band envelope, since some in-band cell of every row lies on
+    the warping path."""
+    xs = np.atleast_2d(xs)
+    return (np.maximum(xs - upper, 0.0) + np.maximum(lower - xs, 0.0)).sum(axis=1)
+
+
 def _resample_to(arr: np.ndarray, n: int) -> np.ndarray:
     """Linearly resample a 1-D array to exactly ``n`` points over its index span.
 
@@ -317,18 +513,216 @@ def _dtw_component_score(
     a = curr_resampled if curr_resampled is not None else _resample_to(curr_arr, MATCH_DTW_RESAMPLE_N)
     b = _resample_to(sample_arr, MATCH_DTW_RESAMPLE_N)
     dtw_dist = compute_dtw_lite(a, b, band_width_ratio=band, derivative=derivative)
+    return _dtw_dist_to_score(dtw_dist, current_peak, scale)
+
+
+def _dtw_dist_to_score(dtw_dist: Any, current_peak: float, scale: float) -> Any:
+    """Map a resampled-grid DTW distance (scalar or array) to a [0,1] similarity,
+    relative to the current peak (behaviour-neutral at MATCH_MAE_REF_PEAK)."""
     norm_dist = dtw_dist / MATCH_DTW_RESAMPLE_N
     scaled = norm_dist * MATCH_MAE_REF_PEAK / max(current_peak, MATCH_MAE_PEAK_FLOOR)
     return scale / (scale + scaled)
 
 
+def _dtw_score_to_dist(min_score: np.ndarray, current_peak: float, scale: float) -> np.ndarray:
+    """Inverse of :func:`_dtw_dist_to_score`: the distance above which a component
+    score falls below ``min_score``. ``inf`` (never abandon) when no score bound
+    applies, negative (abandon at once) when the bound is unreachable (> 1)."""
+    factor = MATCH_MAE_REF_PEAK / (MATCH_DTW_RESAMPLE_N * max(current_peak, MATCH_MAE_PEAK_FLOOR))
+    out = np.full(min_score.shape, np.inf)
+    positive = min_score > 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dist = (scale / min_score - scale) / factor
+    out[positive] = dist[positive]
+    out[min_score > 1.0] = -1.0
+    return out
+
+
+# Relative slack on early-abandon bounds so float rounding in the score mapping
+# can never abandon a candidate that would have tied the leader.
+_ABANDON_SLACK = 1e-9
+
+
+class _Stage3Scorer:
+    """Batched Stage-3 DTW similarity for "scaled" / "ddtw" / "ensemble" modes.
+
+    Holds the resampled current trace once and scores a ``(k, N)`` stack of
+    resampled candidates through :func:`compute_dtw_lite_many`. In ensemble mode
+    the L1 and derivative rows are filled in the same batch (one query row per
+    candidate row). Scores match :func:`_dtw_component_score` exactly.
+    """
+
+    def __init__(
+        self,
+        curr_resampled: np.ndarray,
+        mode: str,
+        band: float,
+        current_peak: float,
+        l1_scale: float,
+        ddtw_scale: float,
+        ensemble_w: float,
+    ) -> None:
+        self._curr = curr_resampled
+        self._curr_deriv = np.gradient(curr_resampled) if len(curr_resampled) > 1 else curr_resampled
+        self._mode = mode
+        self._band = band
+        self._peak = current_peak
+        self._l1_scale = l1_scale
+        self._ddtw_scale = ddtw_scale
+        self._w = ensemble_w
+        # Per-call work accounting surfaced in the match debug payload.
+        self.stats: dict[str, int] = {
+            "candidates": 0,
+            "evaluated": 0,
+            "pruned_lb_kim": 0,
+            "pruned_lb_keogh": 0,
+            "abandoned": 0,
+        }
+
+    def scores(
+        self, samples: np.ndarray, min_dtw_score: np.ndarray | None = None
+    ) -> np.ndarray:
+        """DTW scores for each sample row; ``nan`` where a row was pruned or
+        abandoned because its score provably stays below ``min_dtw_score``.
+
+        With ``min_dtw_score`` the rows first go through a lower-bound cascade
+        (LB_Kim, then LB_Keogh) so provably-losing candidates never reach the
+        DTW fill; survivors are filled with early abandoning.
+        """
+        k = samples.shape[0]
+        if k == 0:
+            return np.empty(0)
+        self.stats["candidates"] += k
+        if self._mode == "ensemble":
+            w = self._w
+            # Ensemble rows: [L1 of every candidate; derivative of every candidate].
+            xs = np.vstack((np.tile(self._curr, (k, 1)), np.tile(self._curr_deriv, (k, 1))))
+            ys = np.vstack((samples, np.gradient(samples, axis=1) if samples.shape[1] > 1 else samples))
+            abandon = None
+            if min_dtw_score is not None:
+                # dtw = w*s_l1 + (1-w)*s_dd with both components <= 1, so each
+                # component alone bounds the blend.
+                t = min_dtw_score - _ABANDON_SLACK
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    t_l1 = (t - (1.0 - w)) / w if w > 0 else np.full(k, -np.inf)
+                    t_dd = (t - w) / (1.0 - w) if w < 1 else np.full(k, -np.inf)
+                abandon = np.concatenate((
+                    self._slack(_dtw_score_to_dist(t_l1, self._peak, self._l1_scale)),
+                    self._slack(_dtw_score_to_dist(t_dd, self._peak, self._ddtw_scale)),
+                ))
+            dists = self._distances(xs, ys, abandon, rows_per_candidate=2)
+            s_l1 = _dtw_dist_to_score(dists[:k], self._peak, self._l1_scale)
+            s_dd = _dtw_dist_to_score(dists[k:], self._peak, self._ddtw_scale)
+            out = w * s_l1 + (1.0 - w) * s_dd
+            if abandon is not None:
+                out[np.isinf(dists[:k]) | np.isinf(dists[k:])] = np.nan
+            return out
+
+        # "scaled" (default) or "ddtw": resample both onto one grid so the
+        # band and normalisation are consistent, then express the distance
+        # relative to the current peak (behaviour-neutral at
+        # MATCH_MAE_REF_PEAK), mirroring the Stage-2 MAE treatment.
+        use_deriv = self._mode == "ddtw"
+        scale = self._ddtw_scale if use_deriv else self._l1_scale
+        query = self._curr_deriv if use_deriv else self._curr
+        ys = (np.gradient(samples, axis=1) if samples.shape[1] > 1 else samples) if use_deriv else samples
+        abandon = None
+        if min_dtw_score is not None:
+            abandon = self._slack(_dtw_score_to_dist(min_dtw_score - _ABANDON_SLACK, self._peak, scale))
+        dists = self._distances(np.tile(query, (k, 1)), ys, abandon, rows_per_candidate=1)
+        out = _dtw_dist_to_score(dists, self._peak, scale)
+        if abandon is not None:
+            out[np.isinf(dists)] = np.nan
+        return out
+
+    def _distances(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        abandon: np.ndarray | None,
+        rows_per_candidate: int,
+    ) -> np.ndarray:
+        """DTW distance per row; ``inf`` for rows pruned/abandoned against
+        ``abandon``. Rows ``r``, ``r+k``, ... belong to the same candidate, so a
+        candidate is dropped as soon as any of its rows is."""
+        n_rows = ys.shape[0]
+        k = n_rows // rows_per_candidate
+        out = np.full(n_rows, np.inf)
+        if abandon is None:
+            dists = compute_dtw_lite_many(xs, ys, band_width_ratio=self._band)
+            self.stats["evaluated"] += k
+            return dists
+
+        def _alive(row_mask: np.ndarray) -> np.ndarray:
+            return row_mask.reshape(rows_per_candidate, k).all(axis=0)
+
+        alive = _alive(lb_kim(xs, ys) <= abandon)
+        self.stats["pruned_lb_kim"] += int(k - alive.sum())
+        if alive.any():
+            rows = np.tile(alive, rows_per_candidate)
+            upper, lower = keogh_envelope(ys[rows], xs.shape[1], self._band)
+            keogh_ok = np.zeros(n_rows, dtype=bool)
+            keogh_ok[rows] = lb_keogh(xs[rows], upper, lower) <= abandon[rows]
+            survivors = _alive(keogh_ok)
+            self.stats["pruned_lb_keogh"] += int(alive.sum() - survivors.sum())
+            alive = survivors
+        if alive.any():
+            rows = np.tile(alive, rows_per_candidate)
+            out[rows] = compute_dtw_lite_many(
+                xs[rows], ys[rows], band_width_ratio=self._band, abandon_above=abandon[rows]
+            )
+            finished = _alive(np.isfinite(out))
+            self.stats["evaluated"] += int(finished.sum())
+            self.stats["abandoned"] += int(alive.sum() - finished.sum())
+        return out
+
+    @staticmethod
+    def _slack(dist: np.ndarray) -> np.ndarray:
+        return np.where(dist >= 0.0, dist * (1.0 + _ABANDON_SLACK) + _ABANDON_SLACK, dist)
+
+
+def _stage4_weights(dur_weight: float, en_weight: float) -> tuple[float, float, float]:
+    """Sanitized (duration, energy, shape) weights for the Stage-4 final blend.
+
+    Keeps the blended score a convex combination in [0, 1]: clamp negatives to
+    0 and, if duration+energy exceed 1.0, scale them down proportionally (shape
+    then contributes 0) rather than letting shape_w go negative or the total
+    exceed 1. Non-finite configured weights (NaN/inf) are dropped so every
+    candidate score stays finite.
+    """
+    dur_w = max(0.0, dur_weight) if np.isfinite(dur_weight) else 0.0
+    en_w = max(0.0, en_weight) if np.isfinite(en_weight) else 0.0
+    de_sum = dur_w + en_w
+    if de_sum > 1.0:
+        dur_w, en_w = dur_w / de_sum, en_w / de_sum
+    shape_w = max(0.0, 1.0 - dur_w - en_w)
+    return dur_w, en_w, shape_w
+
+
 def compute_matches_worker(
     current_power: list[float],
     current_duration: float,
     snapshots: list[dict[str, Any]],
-    config: dict[str, Any]
+    config: dict[str, Any],
+    stats: dict[str, int] | None = None,
 ) -> list[dict[str, Any]]:
-    """Worker function to compute matches against snapshots."""
+    """Worker function to compute matches against snapshots.
+
+    ``stats`` (optional) is filled with the Stage-3 work accounting: how many
+    candidates were refined, fully evaluated, pruned by LB_Kim / LB_Keogh or
+    abandoned mid-fill.
+
+    Pruning is opt-in and only ever drops candidates from below the part of
+    the ranking the caller reads:
+
+    * ``dtw_exact_top_k``: the first ``k`` candidates are scored exactly and
+      any other candidate whose final score provably stays below the lowest of
+      them is dropped, so the top-``k`` ranking is exact. With
+      ``dtw_keep_shape_score`` a candidate is only dropped if its pre-Stage-4
+      shape score also provably stays below that value.
+    * ``dtw_early_abandon``: the same with ``k = 1`` (callers that only consume
+      the winner, e.g. the matching tuner).
+    """
     candidates: list[dict[str, Any]] = []
 
     min_duration_ratio = config.get("min_duration_ratio", DEFAULT_PROFILE_MATCH_MIN_DURATION_RATIO)
@@ -373,6 +767,23 @@ def compute_matches_worker(
 
     candidates.sort(key=lambda x: x["score"], reverse=True)
 
+    # Stage-4 weights are needed up front when Stage 3 abandons early (the
+    # abandon bound is on the FINAL score), so sanitize them once here.
+    dur_w, en_w, shape_w = _stage4_weights(dur_weight, en_weight)
+    stage4_on = (dur_w > 0 or en_w > 0) and bool(candidates) and current_duration > 0
+    integrated = config.get("energy_mode", "mean") == "integrated"
+    cur_mean = float(np.mean(curr_arr)) if stage4_on else 0.0
+    cur_energy = cur_mean * current_duration if integrated else cur_mean
+
+    def _stage4_term(cand: dict[str, Any]) -> tuple[float, float]:
+        prof_dur = float(cand.get("profile_duration") or 0.0)
+        dur_ag = _agreement(current_duration, prof_dur, dur_scale)
+        sample = cand.get("sample") or []
+        cand_mean = float(np.mean(sample)) if sample else 0.0
+        cand_energy = cand_mean * prof_dur if integrated else cand_mean
+        en_ag = _agreement(cur_energy, cand_energy, en_scale)
+        return dur_ag, en_ag
+
     # Stage 3: DTW Refinement on the top N candidates
     if dtw_bandwidth > 0.0 and len(candidates) > 0:
         # top-N, blend and the distance scales are config-overridable so the
@@ -385,41 +796,87 @@ def compute_matches_worker(
         l1_scale = float(config.get("dtw_l1_scale", MATCH_DTW_DIST_SCALE))
         ddtw_scale = float(config.get("dtw_ddtw_scale", MATCH_DDTW_DIST_SCALE))
         ensemble_w = float(config.get("dtw_ensemble_w", MATCH_DTW_ENSEMBLE_W))
-        # Resample the current trace once — it's the same for every candidate.
-        curr_resampled = _resample_to(curr_arr, MATCH_DTW_RESAMPLE_N)
 
-        for cand in to_refine:
-            sample_arr = np.array(cand["sample"])
-
-            if dtw_mode == "legacy":
-                # Original behaviour: raw sequences, distance / len(current),
-                # fixed absolute-watt scale (not peak-relative).
+        if dtw_mode == "legacy":
+            # Original behaviour: raw sequences, distance / len(current),
+            # fixed absolute-watt scale (not peak-relative). Lengths differ per
+            # candidate, so this mode stays on the per-pair kernel.
+            for cand in to_refine:
+                sample_arr = np.array(cand["sample"])
                 dtw_dist = compute_dtw_lite(curr_arr, sample_arr, band_width_ratio=dtw_bandwidth)
                 n_points = len(curr_arr)
                 norm_dist = (dtw_dist / n_points) if n_points > 0 else 999.0
                 dtw_score = 1.0 / (1.0 + norm_dist / MATCH_DTW_DIST_SCALE)
-            elif dtw_mode == "ensemble":
-                # Blend the level-based (L1) and shape-based (derivative) DTW
-                # scores; they are complementary signals.
-                s_l1 = _dtw_component_score(curr_arr, sample_arr, current_peak, dtw_bandwidth, False, l1_scale, curr_resampled=curr_resampled)
-                s_dd = _dtw_component_score(curr_arr, sample_arr, current_peak, dtw_bandwidth, True, ddtw_scale, curr_resampled=curr_resampled)
-                dtw_score = ensemble_w * s_l1 + (1.0 - ensemble_w) * s_dd
-                norm_dist = 0.0  # composite; per-component distance not meaningful
-            else:
-                # "scaled" (default) or "ddtw": resample both onto one grid so the
-                # band and normalisation are consistent, then express the distance
-                # relative to the current peak (behaviour-neutral at
-                # MATCH_MAE_REF_PEAK), mirroring the Stage-2 MAE treatment.
-                use_deriv = dtw_mode == "ddtw"
-                scale = ddtw_scale if use_deriv else l1_scale
-                dtw_score = _dtw_component_score(
-                    curr_arr, sample_arr, current_peak, dtw_bandwidth, use_deriv, scale, curr_resampled=curr_resampled
+                cand["original_score"] = float(cand["score"])
+                cand["score"] = float(blend * cand["score"] + (1.0 - blend) * dtw_score)
+                cand["dtw_dist"] = float(norm_dist)
+            if stats is not None:
+                stats["candidates"] = stats["evaluated"] = len(to_refine)
+        else:
+            # "scaled" / "ddtw" / "ensemble": every candidate is resampled onto
+            # the MATCH_DTW_RESAMPLE_N grid, so they stack into one (k, N) array
+            # and all bands are filled together by the batched kernel.
+            curr_resampled = _resample_to(curr_arr, MATCH_DTW_RESAMPLE_N)
+            samples = np.vstack(
+                [_resample_to(np.array(c["sample"]), MATCH_DTW_RESAMPLE_N) for c in to_refine]
+            )
+            scorer = _Stage3Scorer(
+                curr_resampled, dtw_mode, dtw_bandwidth, current_peak,
+                l1_scale, ddtw_scale, ensemble_w,
+            )
+            exact_k = 1 if config.get("dtw_early_abandon", False) else int(
+                config.get("dtw_exact_top_k", 0)
+            )
+            keep_shape = config.get("dtw_keep_shape_score")
+            early_abandon = (
+                exact_k > 0
+                and len(to_refine) > exact_k
+                and 0.0 <= blend < 1.0
+                and (shape_w > 0.0 or not stage4_on)
+            )
+            if early_abandon:
+                # Score the Stage-2 top-k exactly, then prune (LB_Kim ->
+                # LB_Keogh) or abandon any other candidate whose DTW lower
+                # bound already proves its final score cannot reach the lowest
+                # of them. Those candidates are dropped, so the top-k is
+                # unchanged but the tail of the ranking is incomplete.
+                lead_dtw = scorer.scores(samples[:exact_k])
+                kth_final = np.inf
+                for cand, dtw_score in zip(to_refine[:exact_k], lead_dtw):
+                    final = blend * cand["score"] + (1.0 - blend) * float(dtw_score)
+                    if stage4_on:
+                        d_ag, e_ag = _stage4_term(cand)
+                        final = shape_w * final + dur_w * d_ag + en_w * e_ag
+                    kth_final = min(kth_final, final)
+                min_dtw = np.empty(len(to_refine) - exact_k)
+                for idx, cand in enumerate(to_refine[exact_k:]):
+                    need = kth_final
+                    if stage4_on:
+                        d_ag, e_ag = _stage4_term(cand)
+                        need = (kth_final - dur_w * d_ag - en_w * e_ag) / shape_w
+                    if keep_shape is not None:
+                        # Keep candidates that may still reach the shape score.
+                        need = min(need, float(keep_shape))
+                    min_dtw[idx] = (need - blend * cand["score"]) / (1.0 - blend) - _ABANDON_SLACK
+                dtw_scores = np.concatenate(
+                    (lead_dtw, scorer.scores(samples[exact_k:], min_dtw_score=min_dtw))
                 )
-                norm_dist = 0.0
-
-            cand["original_score"] = float(cand["score"])
-            cand["score"] = float(blend * cand["score"] + (1.0 - blend) * dtw_score)
-            cand["dtw_dist"] = float(norm_dist)
+            else:
+                dtw_scores = scorer.scores(samples)
+
+            abandoned: set[int] = set()
+            for cand, dtw_score in zip(to_refine, dtw_scores):
+                if np.isnan(dtw_score):
+                    abandoned.add(id(cand))
+                    continue
+                cand["original_score"] = float(cand["score"])
+                cand["score"] = float(blend * cand["score"] + (1.0 - blend) * float(dtw_score))
+                # composite / resampled distances are not meaningful per candidate
+                cand["dtw_dist"] = 0.0
+            if abandoned:
+                candidates = [c for c in candidates if id(c) not in abandoned]
+            if stats is not None:
+                stats.update(scorer.stats)
 
         candidates.sort(key=lambda x: x["score"], reverse=True)
 
@@ -427,32 +884,12 @@ def compute_matches_worker(
     # cannot separate profiles that differ mainly in duration/energy (the main
     # multi-program washing-machine failure mode), so nudge the score toward
     # candidates whose expected duration/energy match the observed cycle.
-    # Sanitize the configured weights so the blended score stays a convex
-    # combination in [0, 1]: clamp negatives to 0 and, if duration+energy exceed
-    # 1.0, scale them down proportionally (shape then contributes 0) rather than
-    # letting shape_w go negative or the total exceed 1.
-    # Drop non-finite configured weights (NaN/inf) so de_sum, the normalized
-    # weights, and every candidate score stay finite.
-    dur_w = max(0.0, dur_weight) if np.isfinite(dur_weight) else 0.0
-    en_w = max(0.0, en_weight) if np.isfinite(en_weight) else 0.0
-    de_sum = dur_w + en_w
-    if de_sum > 1.0:
-        dur_w, en_w = dur_w / de_sum, en_w / de_sum
-    shape_w = max(0.0, 1.0 - dur_w - en_w)
-    if (dur_w > 0 or en_w > 0) and candidates and current_duration > 0:
+    if stage4_on and candidates:
         # energy_mode: "mean" (default) compares whole-cycle mean power (W);
         # "integrated" compares true integrated energy (mean x duration). Opt-in so
         # the historical default is byte-for-byte preserved. See register item 99.
-        integrated = config.get("energy_mode", "mean") == "integrated"
-        cur_mean = float(np.mean(curr_arr))
-        cur_energy = cur_mean * current_duration if integrated else cur_mean
         for cand in candidates:
-            prof_dur = float(cand.get("profile_duration") or 0.0)
-            dur_ag = _agreement(current_duration, prof_dur, dur_scale)
-            sample = cand.get("sample") or []
-            cand_mean = float(np.mean(sample)) if sample else 0.0
-            cand_energy = cand_mean * prof_dur if integrated else cand_mean
-            en_ag = _agreement(cur_energy, cand_energy, en_scale)
+            dur_ag, en_ag = _stage4_term(cand)
             cand["shape_score"] = float(cand["score"])
             cand["score"] = float(
                 shape_w * cand["score"]
@@ -487,6 +487,10 @@ DEFAULT_DTW_MODE = "ensemble"
 MATCH_DTW_RESAMPLE_N = 200         # common grid length for "scaled"/"ddtw" DTW
 MATCH_DDTW_DIST_SCALE = 30.0       # half-saturation for derivative-DTW distance
 MATCH_DTW_ENSEMBLE_W = 0.7         # weight on L1 vs DDTW in "ensemble" mode
+# Live-trace resampling before matching (resample_adaptive arguments): never
+# finer than 5 s, and only a >6 h hole splits the trace into separate segments.
+MATCH_RESAMPLE_MIN_DT = 5.0
+MATCH_RESAMPLE_GAP_S = 21600.0
 # Ambiguity: top1-top2 score gap below this flags the match as ambiguous.
 MATCH_AMBIGUITY_MARGIN = 0.05
 # Smart Termination landscape guard: when a non-winning candidate is at least this
@@ -872,8 +876,16 @@ GROUP_MIN_COHESION = 0.80
 # v11 is a marker-only bump: per-phase profiles (envelope["phase_profile"]) are
 # derived cache populated by async_rebuild_envelope, so no data migration is
 # needed - they self-populate on the next envelope rebuild.
-STORAGE_VERSION = 11
+# v12 is a marker-only bump: cycle traces may be stored as per-cycle binary
+# blobs (power_ref) beside the JSON; inline power_data is moved on next save.
+STORAGE_VERSION = 12
 STORAGE_KEY = "ha_washdata"
+# Coalescing window for ProfileStore.async_schedule_save (fire-and-forget and
+# bulk mutators); immediate async_save calls flush it early.
+STORAGE_SAVE_DELAY_S = 5.0
+# Memory budget for ProfileStore's resampled sample-segment LRU (bytes of numpy
+# payload, not entries: segment length depends on the cycle and the grid dt).
+SAMPLE_SEGMENT_CACHE_MAX_BYTES = 8 * 1024 * 1024
 
 # Notification events
 EVENT_CYCLE_STARTED = "ha_washdata_cycle_started"
@@ -1059,6 +1071,9 @@ PLAYGROUND_STRESS_MAX_SPARSE_STEPS: int = 15         # max sparse steps → max
 PLAYGROUND_STRESS_MAX_IDLE_W: float = 100000.0       # upper bound for a manual idle override
                                                      # (far beyond any appliance; guards against
                                                      # inf/absurd values corrupting synthesis)
+# Upper bound on worker processes for a parallel Playground sweep (the "workers"
+# option of start_playground_sweep; 0 = auto = CPU count - 1, capped here).
+PLAYGROUND_SWEEP_MAX_WORKERS: int = 4
 
 # ─── Playground setting presets (sandbox snapshots, per device) ────────────────
 # Named snapshots of the Playground control panel's values, stored under the
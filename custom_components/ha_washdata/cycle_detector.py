@@ -383,6 +383,120 @@ class CycleDetector:
         else:
             self._p95_dt = max(dt, 1.0)
 
+    def _advance_cadence(self, dts: np.ndarray) -> np.ndarray:
+        """Apply :meth:`_update_cadence` for every dt at once.
+
+        Returns the p95 cadence as it stood BEFORE each reading (what the
+        gap-free tally in :meth:`process_reading` compares against). The rolling
+        p95 over each 20-wide window is computed in one vectorized percentile
+        call; results are identical to the per-reading path.
+        """
+        n = len(dts)
+        prior = np.full(n, self._p95_dt, dtype=float)
+        valid = np.flatnonzero(dts > 0.1)
+        if valid.size == 0:
+            return prior
+        c = np.asarray(self._recent_dts + dts[valid].tolist(), dtype=float)
+        m0 = len(self._recent_dts)
+        after = np.empty(valid.size, dtype=float)
+        positions = m0 + np.arange(valid.size)
+        full = positions >= 19
+        if full.any():
+            windows = np.lib.stride_tricks.sliding_window_view(c, 20)
+            after[full] = np.percentile(windows[positions[full] - 19], 95, axis=1)
+        for k in np.flatnonzero(~full):
+            pos = int(positions[k])
+            window = c[max(0, pos - 19):pos + 1]
+            if len(window) >= 5:
+                after[k] = float(np.percentile(window.tolist(), 95))
+            else:
+                after[k] = max(float(c[pos]), 1.0)
+        seen = np.searchsorted(valid, np.arange(n), side="left")
+        has_prev = seen > 0
+        prior[has_prev] = after[seen[has_prev] - 1]
+        self._recent_dts = c[-20:].tolist()
+        self._p95_dt = float(after[-1])
+        return prior
+
+    def quiet_run_mode(self) -> str | None:
+        """Whether below-threshold readings can be bulk-applied right now.
+
+        ``"off"``: OFF, where a reading is quiet below start_threshold_w (below
+        stop_threshold_w while delayed-start band detection is active).
+        ``"terminal"``: Finished/Interrupted/Force-stopped, quiet below
+        stop_threshold_w. ``None``: every reading must go through
+        :meth:`process_reading` (active cycle, anti-wrinkle, stop lockout, or no
+        previous reading yet).
+        """
+        if self._ignore_power_until_idle or self._last_process_time is None:
+            return None
+        if self._state == STATE_OFF:
+            return "off"
+        if self._state in (STATE_FINISHED, STATE_INTERRUPTED, STATE_FORCE_STOPPED):
+            return "terminal"
+        return None
+
+    @property
+    def delay_band_active(self) -> bool:
+        """Delayed-start band detection applies (see the OFF branch)."""
+        return bool(
+            self._config.delay_detect_enabled
+            and self._config.stop_threshold_w < self._config.start_threshold_w
+        )
+
+    def absorb_quiet_run(
+        self, dts: np.ndarray, powers: np.ndarray, last_timestamp: datetime
+    ) -> None:
+        """Fast-forward a run of quiet readings (replay fast path).
+
+        Exactly what :meth:`process_reading` does for each reading of the run
+        when :meth:`quiet_run_mode` allows it - none of them can change state -
+        applied in bulk: cadence, smoothing buffer, below-threshold tallies
+        (summed sequentially, so bit-identical), time in state and the OFF-branch
+        candidate resets. ``dts`` are the per-reading dt values (the first one
+        relative to the last processed reading); all must be >= 0.
+        """
+        mode = self.quiet_run_mode()
+        if mode is None or len(dts) == 0:
+            return
+        prior_p95 = self._advance_cadence(dts)
+        self._last_process_time = last_timestamp
+
+        window = self._config.smoothing_window
+        if window >= 1:
+            self._ma_buffer = (self._ma_buffer + powers[-window:].tolist())[-window:]
+        else:
+            self._ma_buffer = []
+
+        self._time_below_threshold = float(
+            np.cumsum(np.concatenate(([self._time_below_threshold], dts)))[-1]
+        )
+        ceilings = np.minimum(3600.0, np.maximum(60.0, 10.0 * prior_p95))
+        gaps = np.flatnonzero(dts > ceilings)
+        if gaps.size:
+            tail = dts[gaps[-1] + 1:]
+            base = 0.0
+        else:
+            tail = dts
+            base = self._time_below_threshold_gapfree
+        self._time_below_threshold_gapfree = float(
+            np.cumsum(np.concatenate(([base], tail)))[-1]
+        )
+        self._time_above_threshold = 0.0
+        self._time_in_state = float(
+            np.cumsum(np.concatenate(([self._time_in_state], dts)))[-1]
+        )
+        self._last_power = float(powers[-1])
+
+        self._anti_wrinkle_candidate_start = None
+        self._anti_wrinkle_candidate_peak = 0.0
+        self._anti_wrinkle_candidate_start_power = 0.0
+        if mode == "off" and self.delay_band_active:
+            self._delay_band_start = None
+            self._delay_band_seconds = 0.0
+            self._delay_band_peak = 0.0
+            self._preserve_delay_band_on_off = False
+
     def _try_profile_match(self, timestamp: datetime, force: bool = False) -> None:
         """Attempt to invoke the profile matcher if conditions are met.
 
@@ -96,6 +96,8 @@ async def async_get_config_entry_diagnostics(
             ),
             "profile_sample_repair_stats": manager.profile_sample_repair_stats,
             "suggestions": manager.profile_store.get_suggestions(),
+            "segment_cache": manager.profile_store.get_segment_cache_stats(),
+            "perf_stats": manager.profile_store.perf_stats.snapshot(),
             "feature_flags": {
                 "auto_maintenance": bool(getattr(manager, "_auto_maintenance", False)),
                 "save_debug_traces": bool(getattr(manager, "_save_debug_traces", False)),
@@ -213,7 +213,7 @@ class LearningManager:
 
         if not filtered_suggestions:
             if any_deleted:
-                self.hass.async_create_task(self.profile_store.async_save())
+                self.profile_store.async_schedule_save()
             return
 
         self.suggestion_engine.apply_suggestions(filtered_suggestions)
@@ -637,7 +637,7 @@ class LearningManager:
         # Persist pending feedback request so it survives restart.
         # The pending review is surfaced in the panel's Cycles review queue;
         # WashData intentionally does not raise a persistent notification here.
-        self.hass.async_create_task(self.profile_store.async_save())
+        self.profile_store.async_schedule_save()
 
     def request_cycle_verification(
         self,
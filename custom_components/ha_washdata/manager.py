@@ -259,6 +259,7 @@ from .const import (
 from .cycle_detector import CycleDetector, CycleDetectorConfig
 from .learning import LearningManager
 from .profile_store import (
+    OnlineMatcher,
     ProfileStore,
     decompress_power_data,
     is_terminal_drop,
@@ -593,6 +594,8 @@ class WashDataManager:
         # Stage-4 energy discriminator: integrated energy for WM/washer-dryer,
         # mean power elsewhere (see analysis.stage4_energy_mode).
         self.profile_store.energy_mode = analysis.stage4_energy_mode(self.device_type)
+        # Live in-cycle matching consumes only newly appended readings per tick.
+        self._online_matcher = OnlineMatcher(self.profile_store)
         self.learning_manager = LearningManager(
             hass, self.entry_id, self.profile_store, self.device_type,
             device_name=config_entry.title,
@@ -1014,10 +1017,8 @@ class WashDataManager:
             current_duration = (end_time - start_time).total_seconds()
 
             # 1. RUN BETTER ASYNC MATCHING
-            result = await self.profile_store.async_match_profile(
-                 readings,
-                 current_duration
-            )
+            with self.profile_store.perf_stats.measure("match"):
+                result = await self._online_matcher.async_match(readings, current_duration)
 
             # 2. UPDATE MANAGER STATE (Estimates, Program Name, etc.)
             self._last_match_result = result
@@ -1960,6 +1961,8 @@ class WashDataManager:
         # Trigger migration/compression of old cycle format
         # This is safe to run repeatedly (it skips already compressed cycles)
         await self.profile_store.async_migrate_cycles_to_compressed()
+        # Then move inline traces (pre-v12 stores) into binary trace blobs.
+        await self.profile_store.async_migrate_traces_to_binary()
 
         # Backfill match_confidence for labeled cycles that predate the field
         self.hass.async_create_task(
@@ -2520,6 +2523,8 @@ class WashDataManager:
         if self.detector.state in {STATE_RUNNING, STATE_PAUSED, STATE_STARTING, STATE_ENDING}:
             snapshot = self._augment_active_snapshot(self.detector.get_state_snapshot())
             await self.profile_store.async_save_active_cycle(snapshot)
+        # Write any coalesced (delayed) store changes before the store is dropped.
+        await self.profile_store.async_flush()
 
         self._last_reading_time = None
 
@@ -3223,7 +3228,8 @@ class WashDataManager:
         self._last_reading_time = now
         self._last_real_reading_time = now # Track real update
         self._current_power = power
-        self.detector.process_reading(power, now)
+        with self.profile_store.perf_stats.measure("process_reading"):
+            self.detector.process_reading(power, now)
 
         if self._cycle_start_time is None and self.detector.current_cycle_start is not None:
             self._cycle_start_time = self.detector.current_cycle_start
@@ -4317,15 +4323,16 @@ class WashDataManager:
         once training has promoted a regressor; otherwise returns ``None`` so the
         caller keeps the proven phase-aware estimate untouched. Never raises.
         """
-        return progress_mod.ml_progress_percent(
-            self.profile_store,
-            self.config_entry.options,
-            float(self._matched_profile_duration or 0.0),
-            trace,
-            profile_name,
-            self._profile_end_expectation,
-            self._logger,
-        )
+        with self.profile_store.perf_stats.measure("ml_progress"):
+            return progress_mod.ml_progress_percent(
+                self.profile_store,
+                self.config_entry.options,
+                float(self._matched_profile_duration or 0.0),
+                trace,
+                profile_name,
+                self._profile_end_expectation,
+                self._logger,
+            )
 
     def _ml_energy_total(
         self,
@@ -5043,6 +5050,7 @@ class WashDataManager:
         self._matched_profile_duration = None
         self._last_estimate_time = None
         self._last_match_result = None  # Clear so phase sensor resets to "Off" (issue #192)
+        self._online_matcher.reset()
         self._cycle_progress = 100.0  # 100% = cycle complete
         self._cycle_completed_time = dt_util.now()
         self._cycle_start_time = None
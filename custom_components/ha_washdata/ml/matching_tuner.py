@@ -121,7 +121,9 @@ def _top1(by_profile: dict[str, list[dict]], targets: list[tuple[str, int]], cfg
     return correct / total if total else 0.0
 
 
-_BASE_CFG = {"min_duration_ratio": 0.10, "max_duration_ratio": 1.5}
+# Only the top-1 name is consumed here, so Stage 3 may abandon candidates that
+# provably cannot overtake the leader (see analysis.compute_matches_worker).
+_BASE_CFG = {"min_duration_ratio": 0.10, "max_duration_ratio": 1.5, "dtw_early_abandon": True}
 
 #: Bounded scoring weights the tuner may promote. All live in [0, 1], so a tuned
 #: config can only shift emphasis (shape vs level vs energy, and how much the DTW
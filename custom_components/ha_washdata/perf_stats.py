@@ -0,0 +1,164 @@
+# WashData - Home Assistant integration for appliance cycle monitoring via smart plugs.
+# Copyright (C) 2026 Lukas Bandura
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Always-on hot-path timing for WashData.
+
+Each ProfileStore owns one :class:`PerfStats` (the manager shares it) that
+records wall time per named stage - ``process_reading``, ``match``,
+``match.compute``, ``envelope_rebuild``, ``ml_progress`` - plus the executor
+queue wait of offloaded jobs (``<stage>.queue_wait``).
+
+Recording is O(1) and allocation-free: a call count, a running sum/max and a
+fixed log-spaced histogram per stage, so it stays on permanently. p50/p95 are
+estimated from the histogram (geometric bucket midpoint, ~12% resolution),
+which is plenty to tell a 2 ms match from a 200 ms one. Executor jobs record
+from worker threads, so updates hold a plain lock.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+
+_T = TypeVar("_T")
+
+# Histogram: bucket 0 is < 10 µs, then 8 buckets per decade up to ~100 s,
+# the last bucket is open-ended.
+_MIN_S = 1e-5
+_BUCKETS_PER_DECADE = 8
+_DECADES = 7
+_N_BUCKETS = _BUCKETS_PER_DECADE * _DECADES + 2
+
+
+def _bucket(seconds: float) -> int:
+    if seconds < _MIN_S:
+        return 0
+    idx = 1 + int(math.log10(seconds / _MIN_S) * _BUCKETS_PER_DECADE)
+    return min(idx, _N_BUCKETS - 1)
+
+
+def _bucket_mid_s(idx: int) -> float:
+    if idx == 0:
+        return _MIN_S / 2
+    lo = _MIN_S * 10 ** ((idx - 1) / _BUCKETS_PER_DECADE)
+    return lo * 10 ** (0.5 / _BUCKETS_PER_DECADE)
+
+
+class _Stage:
+    __slots__ = ("count", "total", "max", "last", "hist")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+        self.hist = [0] * _N_BUCKETS
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for idx, n in enumerate(self.hist):
+            seen += n
+            if seen >= rank and n:
+                # Never report more than the observed max.
+                return min(_bucket_mid_s(idx), self.max)
+        return self.max
+
+
+class PerfStats:
+    """Per-device stage timers (count, mean, p50, p95, max, last)."""
+
+    def __init__(self) -> None:
+        self._stages: dict[str, _Stage] = {}
+        self._lock = threading.Lock()
+        self._since = time.time()
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record one call of ``stage`` that took ``seconds``."""
+        with self._lock:
+            st = self._stages.get(stage)
+            if st is None:
+                st = self._stages[stage] = _Stage()
+            st.count += 1
+            st.total += seconds
+            st.last = seconds
+            if seconds > st.max:
+                st.max = seconds
+            st.hist[_bucket(seconds)] += 1
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Time the ``with`` body as one call of ``stage``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    async def async_run_in_executor(
+        self, hass: HomeAssistant, stage: str, func: Callable[..., _T], *args: Any
+    ) -> _T:
+        """``hass.async_add_executor_job`` that also records queue wait and run time.
+
+        ``<stage>.queue_wait`` is the time between submission and a worker
+        picking the job up (executor saturation); ``stage`` is the run time.
+        """
+        submitted = time.perf_counter()
+
+        def _job() -> _T:
+            started = time.perf_counter()
+            self.record(f"{stage}.queue_wait", started - submitted)
+            try:
+                return func(*args)
+            finally:
+                self.record(stage, time.perf_counter() - started)
+
+        return await hass.async_add_executor_job(_job)
+
+    def reset(self) -> None:
+        """Forget every stage (e.g. before a measurement session)."""
+        with self._lock:
+            self._stages.clear()
+            self._since = time.time()
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-safe summary; times in milliseconds.
+
+        ``{"since": unix_ts, "stages": {name: {count, mean_ms, p50_ms, p95_ms,
+        max_ms, last_ms, total_ms}}}``
+        """
+        with self._lock:
+            stages = {
+                name: {
+                    "count": st.count,
+                    "mean_ms": round(st.total / st.count * 1000.0, 3) if st.count else 0.0,
+                    "p50_ms": round(st.quantile(0.50) * 1000.0, 3),
+                    "p95_ms": round(st.quantile(0.95) * 1000.0, 3),
+                    "max_ms": round(st.max * 1000.0, 3),
+                    "last_ms": round(st.last * 1000.0, 3),
+                    "total_ms": round(st.total * 1000.0, 1),
+                }
+                for name, st in sorted(self._stages.items())
+            }
+            return {"since": round(self._since, 3), "stages": stages}
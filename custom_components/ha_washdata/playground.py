@@ -26,6 +26,8 @@ Main entry points:
   progress/remaining-time/phase/energy series and typed event log.
 - :func:`run_playground_history` - per-cycle rows + optional before/after diff.
 - :func:`run_playground_sweep` - objective 1D/2D grid sweep.
+- :func:`create_sweep_pool` / :func:`submit_sweep_pairs` - the same sweep fanned
+  out as (grid point x cycle) jobs across worker processes.
 - :func:`dtw_debug_payload` - the score breakdown (Stage 2 / DTW / Stage 4),
   the two resampled traces on a shared grid, and the DTW warping path for one
   cycle vs one profile (the DTW visualizer).
@@ -37,6 +39,9 @@ from __future__ import annotations
 
 import logging
 import math
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable
@@ -104,6 +109,7 @@ from .const import (
     PLAYGROUND_STRESS_MAX_SPARSE_STEPS,
     PLAYGROUND_STRESS_SPARSE_STEP_S,
     PLAYGROUND_STRESS_TRAILING_WINDOW_S,
+    PLAYGROUND_SWEEP_MAX_WORKERS,
     STATE_ENDING,
     STATE_FINISHED,
     STATE_IDLE,
@@ -115,7 +121,12 @@ from .const import (
     TerminationReason,
 )
 from .cycle_detector import CycleDetector, CycleDetectorConfig
-from .profile_store import _ambiguity_from_candidates, decompress_power_data
+from .profile_store import (
+    _ambiguity_from_candidates,
+    decompress_power_data,
+    stage5_pick_member,
+)
+from .replay import MIN_QUIET_RUN, ReplayIndex, replay_span
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -774,6 +785,7 @@ class _DetailSim:
 
         self.last_sample_t = -1e9
         self._aborted = False
+        self._replay_index: ReplayIndex | None = None
 
         if self.ready:
             self.detector = CycleDetector(
@@ -995,11 +1007,25 @@ class _DetailSim:
                     )
         self.series.append(pt)
 
+    def _get_replay_index(self) -> ReplayIndex:
+        if self._replay_index is None:
+            self._replay_index = ReplayIndex(
+                [ts for ts, _ in self.readings], [p for _, p in self.readings], self.config
+            )
+        return self._replay_index
+
+    def _set_cursor(self, i: int) -> None:
+        self.cursor["t"] = (self.readings[i][0] - self.base).total_seconds()
+
     def step(self, i0: int, i1: int) -> None:
         """Replay readings[i0:i1] through the detector (a chunk of the cycle)."""
         if self._aborted or not self.ready:
             return
         try:
+            if not self.compute_series:
+                # No per-step series wanted: quiet stretches can be bulk-applied.
+                replay_span(self.detector, self._get_replay_index(), i0, i1, self._set_cursor)
+                return
             for ts, power in self.readings[i0:i1]:
                 self.cursor["t"] = (ts - self.base).total_seconds()
                 self.detector.process_reading(power, ts)
@@ -1049,8 +1075,23 @@ class _DetailSim:
             ) * 1.5 + 300.0
             step = 30.0
             n_steps = min(int(tail_span / step) + 1, 400)
-            for i in range(1, n_steps + 1):
-                ts = last_ts + timedelta(seconds=step * i)
+            tail_ts = [last_ts + timedelta(seconds=step * i) for i in range(1, n_steps + 1)]
+            for i, ts in enumerate(tail_ts):
+                if (
+                    not self.compute_series
+                    and n_steps - i >= MIN_QUIET_RUN
+                    and self.detector.quiet_run_mode() is not None
+                    and not (self.detector.state in (STATE_OFF, STATE_FINISHED) and self.captured)
+                ):
+                    # Idle/terminal on an all-zero tail and the break below cannot
+                    # fire: nothing can change any more, so fast-forward the rest.
+                    self.cursor["t"] = (tail_ts[-1] - self.base).total_seconds()
+                    replay_span(
+                        self.detector,
+                        ReplayIndex(tail_ts, [0.0] * n_steps, self.config),
+                        i, n_steps,
+                    )
+                    break
                 self.cursor["t"] = (ts - self.base).total_seconds()
                 self.detector.process_reading(0.0, ts)
                 self._sample(ts)
@@ -1736,6 +1777,154 @@ def run_playground_sweep(
     }
 
 
+# ─── Parallel sweep (process pool) ──────────────────────────────────────────────
+#
+# A sweep replays every selected cycle once per grid point; the points are
+# independent, so the (point, cycle) pairs fan out across worker processes (the
+# replay is pure Python and GIL-bound, so threads would not help). Workers get the
+# heavy shared state once via the pool initializer and return one compact row per
+# pair; the WS task aggregates rows per point with the serial path's helpers.
+
+
+class SweepStoreView:
+    """Picklable stand-in for the ProfileStore inside sweep worker processes.
+
+    Batch/sweep sims run with ``compute_series=False`` and prebuilt snapshots, so
+    the only store calls left are the Stage-5 group member pick (stateless) and
+    the lifetime cycle count used by the milestone marker.
+    """
+
+    def __init__(self, lifetime_cycle_count: int = 0) -> None:
+        self._lifetime_cycle_count = int(lifetime_cycle_count)
+
+    def get_lifetime_cycle_count(self) -> int:
+        return self._lifetime_cycle_count
+
+    def _stage5_pick_member(
+        self, current_power: list[float], current_duration: float,
+        members: list[str], member_snaps: dict[str, dict[str, Any]],
+    ) -> tuple[str, float | None, float | None]:
+        return stage5_pick_member(current_power, current_duration, members, member_snaps)
+
+
+def resolve_sweep_workers(requested: Any) -> int:
+    """Worker process count for a parallel sweep; ``0``/invalid = auto.
+
+    Auto leaves one core to Home Assistant. A result of 1 means "run serially".
+    """
+    cpus = os.cpu_count() or 1
+    try:
+        n = int(requested)
+    except (TypeError, ValueError):
+        n = 0
+    if n <= 0:
+        n = cpus - 1
+    return max(1, min(n, PLAYGROUND_SWEEP_MAX_WORKERS, cpus))
+
+
+def sweep_grid(
+    base_config: CycleDetectorConfig,
+    param: str,
+    values: list[float],
+    param_y: str | None = None,
+    values_y: list[float] | None = None,
+) -> list[tuple[tuple[int, int], dict[str, Any]]]:
+    """``((j, i), override)`` for every grid point (``j`` is 0 for a 1D sweep)."""
+    if param_y and values_y:
+        return [
+            (
+                (j, i),
+                {
+                    param: _coerce_param(base_config, param, vx),
+                    param_y: _coerce_param(base_config, param_y, vy),
+                },
+            )
+            for j, vy in enumerate(values_y)
+            for i, vx in enumerate(values)
+        ]
+    return [((0, i), {param: _coerce_param(base_config, param, vx)}) for i, vx in enumerate(values)]
+
+
+def sweep_point_result(
+    rows: list[dict[str, Any]], objective: str
+) -> tuple[float | None, dict[str, Any]]:
+    """Objective metric (rounded like the serial sweep) + summary for one point."""
+    metric = objective_metric(rows, objective)
+    return (round(metric, 4) if metric is not None else None), _rows_summary(rows)
+
+
+# Per-process shared state, installed once by the pool initializer.
+_SWEEP_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_sweep_worker(state: dict[str, Any]) -> None:
+    _SWEEP_WORKER_STATE.clear()
+    _SWEEP_WORKER_STATE.update(state)
+
+
+def _sweep_pair_worker(override: dict[str, Any], cycle_index: int) -> dict[str, Any] | None:
+    """Replay one cycle under one grid point's override (in a worker process)."""
+    st = _SWEEP_WORKER_STATE
+    detail = simulate_cycle_detail(
+        st["cycles"][cycle_index], st["base_config"], override, st["store"],
+        st["options"], st["price"], compute_series=False, prebuilt=st["prebuilt"],
+    )
+    if "error" in detail:
+        return None
+    return _detail_to_row(detail)
+
+
+def create_sweep_pool(
+    store: Any,
+    cycles: list[dict[str, Any]],
+    base_config: CycleDetectorConfig,
+    options: dict[str, Any] | None,
+    price: float | None,
+    prebuilt: tuple[Any, Any, Any, Any],
+    workers: int,
+) -> ProcessPoolExecutor:
+    """Start a worker pool primed with the sweep's shared state (blocking: run in
+    the executor). Uses the ``spawn`` start method - forking the multi-threaded
+    Home Assistant process is unsafe."""
+    try:
+        lifetime = int(store.get_lifetime_cycle_count())
+    except Exception:  # pylint: disable=broad-exception-caught
+        lifetime = 0
+    state = {
+        "cycles": cycles,
+        "base_config": base_config,
+        "store": SweepStoreView(lifetime),
+        "options": options or {},
+        "price": price,
+        "prebuilt": prebuilt,
+    }
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_sweep_worker,
+        initargs=(state,),
+    )
+
+
+def submit_sweep_pairs(
+    pool: ProcessPoolExecutor,
+    grid: list[tuple[tuple[int, int], dict[str, Any]]],
+    n_cycles: int,
+) -> list[tuple[Future, tuple[int, int], int]]:
+    """Queue every (grid point, cycle) pair, point-major so points complete in
+    order (blocking: spawning workers happens on submit - run in the executor)."""
+    return [
+        (pool.submit(_sweep_pair_worker, override, ci), key, ci)
+        for key, override in grid
+        for ci in range(n_cycles)
+    ]
+
+
+def shutdown_sweep_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop queued pairs and stop the workers (blocking: run in the executor)."""
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
 # ─── DTW debug ────────────────────────────────────────────────────────────────
 
 
@@ -18,6 +18,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import dataclasses
 import hashlib
@@ -28,12 +29,15 @@ import os
 import re
 import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, TypeAlias, cast
 
 import numpy as np
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
@@ -44,6 +48,8 @@ from .const import (
     MAINTENANCE_EVENT_TYPES,
     MAINTENANCE_RECENT_SUPPRESS_DAYS,
     MATCH_AMBIGUITY_MARGIN,
+    MATCH_RESAMPLE_GAP_S,
+    MATCH_RESAMPLE_MIN_DT,
     PHASE_CONSISTENCY_MIN_CYCLES,
     PHASE_PROFILE_MIN_CYCLES,
     PHASE_HEAT_CV_WARN,
@@ -59,6 +65,8 @@ from .const import (
     SMART_TERM_LANDSCAPE_RATIO,
     SMART_TERM_LANDSCAPE_MIN_SHAPE,
     STORAGE_KEY,
+    SAMPLE_SEGMENT_CACHE_MAX_BYTES,
+    STORAGE_SAVE_DELAY_S,
     STORAGE_VERSION,
     DEFAULT_MAX_PAST_CYCLES,
     DEFAULT_MAX_FULL_TRACES_PER_PROFILE,
@@ -66,7 +74,14 @@ from .const import (
     DEFAULT_DTW_BANDWIDTH,
 )
 from .features import compute_signature
-from .signal_processing import resample_uniform, resample_adaptive, Segment, integrate_wh, energy_gap_threshold_s
+from .signal_processing import (
+    IncrementalResampler,
+    resample_uniform,
+    resample_adaptive,
+    Segment,
+    integrate_wh,
+    energy_gap_threshold_s,
+)
 from . import analysis
 from .time_utils import (
     migrate_power_data_to_offsets,
@@ -88,6 +103,9 @@ from .phase_match import (
     phase_profile_to_dict,
 )
 from .log_utils import DeviceLoggerAdapter
+from .perf_stats import PerfStats
+from .segment_cache import SegmentCache
+from .trace_store import TraceStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -377,6 +395,42 @@ class MatchResult:
         return text_type_safe_asdict(self)
 
 
+# Resampling grids (rounded used_dt) whose grouped snapshots a MatchIndex keeps.
+_MATCH_INDEX_MAX_GRIDS = 4
+
+
+@dataclasses.dataclass
+class MatchIndex:
+    """Per-profile matching templates, built once per store generation.
+
+    ``entries`` keeps profile order: ``(name, snapshot, sample_cycle, avg_duration)``
+    where an envelope-backed profile carries its dt-independent ``snapshot`` and
+    a sample-backed one carries the cycle to resample (plus its preferred
+    avg_duration, before the segment-span fallback). ``grids`` memoizes the
+    finished Stage-5 ``(snapshots, group_members, member_snaps)`` per grid.
+    """
+
+    generation: tuple[int, int]
+    entries: list[tuple[str, dict[str, Any] | None, CycleDict | None, float]]
+    skipped: list[str]
+    grids: OrderedDict[float, tuple[list[dict[str, Any]], dict[str, list[str]], dict[str, dict[str, Any]]]] = (
+        dataclasses.field(default_factory=OrderedDict)
+    )
+
+
+# Cycle lists whose power_data is persisted via TraceStore blobs.
+_TRACE_LIST_KEYS = ("past_cycles", "reference_cycles")
+# Store sections. "active" (the in-flight cycle snapshot, rewritten every ~60 s
+# while a cycle runs) lives in its own small store so those periodic writes no
+# longer rewrite the main file; everything else belongs to "main".
+_SECTION_MAIN = "main"
+_SECTION_ACTIVE = "active"
+_ACTIVE_SECTION_KEYS = ("active_cycle", "last_active_save")
+_ACTIVE_STORE_VERSION = 1
+# Candidates a live match reports (ranking, debug panel, training snapshots);
+# Stage-3 pruning keeps this part of the ranking exact.
+_MATCH_RANKING_SIZE = 5
+
 
 def _safe_file_size_kb(path: str) -> float:
     """Return the size of ``path`` in KiB, or 0.0 if it cannot be read.
@@ -836,8 +890,77 @@ class WashDataStore(Store[JSONDict]):
             _LOGGER.info("Migrating storage from v%s to v11 (phase-profile cache marker)",
                          old_major_version)
 
+        if old_major_version < 12:
+            # Marker-only bump. From v12 cycle traces may live in per-cycle binary
+            # blobs (cycle["power_ref"] instead of power_data, see trace_store.py).
+            # Inline power_data stays fully readable; ProfileStore moves it into
+            # blobs on the next save (async_migrate_traces_to_binary). Nothing is
+            # rewritten here so the JSON stays valid for a v11 downgrade until then.
+            _LOGGER.info("Migrating storage from v%s to v12 (binary trace marker)",
+                         old_major_version)
+
         return old_data
 
+
+def stage5_pick_member(
+    current_power: list[float], current_duration: float,
+    members: list[str], member_snaps: dict[str, dict[str, Any]],
+) -> tuple[str, float | None, float | None]:
+    """Within a winning group, pick the member whose integrated ENERGY best
+    matches the cycle.
+
+    Group members already share shape and duration (that is what the cohesion
+    gate collapses them for), so the within-group discriminator is temperature
+    / spin, and the clean signal for that is integrated energy (Sum P*dt) --
+    NOT whole-cycle mean power (diluted, because hotter cycles also run longer)
+    nor peak (dominated by the ~constant heating-element draw, so it is flat
+    across variants). Validated on real store data (leave-one-cycle-out member
+    pick, 196 cycles): energy-only 73.3% vs the old duration*mean*peak product
+    63.3%; adding any duration term back regressed it (grouped members are
+    duration-cohesive, so duration only adds noise). Duration is still returned
+    (for ETA and the overrun guard) but is intentionally not part of selection.
+
+    Returns (member_name, individual_fit_score, member_avg_duration). The fit
+    score is the chosen member's own alignment score, used as a sanity check."""
+    cur = np.asarray(current_power, dtype=float)
+    if cur.size == 0 or not members:
+        return (members[0] if members else ""), None, None
+    # Energy proxy = mean power * duration; the 1/3600 Wh factor cancels in the
+    # log-ratio, so this is exact up to that constant.  This proxy equals the
+    # true integral only because `current_power` is already resampled onto a
+    # uniform grid by the matcher; raw or irregular traces must use
+    # signal_processing.integrate_wh instead.
+    cur_energy = float(cur.mean()) * float(current_duration)
+
+    def agree(a: float, b: float, scale: float) -> float:
+        if a <= 0 or b <= 0:
+            return 0.0
+        return 1.0 / (1.0 + abs(math.log(a / b)) / scale)
+
+    best_m, best_sc, best_dur = members[0], -1.0, None
+    for m in members:
+        snap = member_snaps.get(m)
+        if not snap:
+            continue
+        sp = np.asarray(snap.get("sample_power") or [], dtype=float)
+        if sp.size == 0:
+            continue
+        md = float(snap.get("avg_duration") or 0.0)
+        mem_energy = float(sp.mean()) * md
+        # Scale 0.30 is validated as insensitive over 0.25-0.40 on real data.
+        sc = agree(cur_energy, mem_energy, 0.30)
+        if sc > best_sc:
+            best_sc, best_m, best_dur = sc, m, md
+    fit = None
+    snap = member_snaps.get(best_m)
+    if snap and snap.get("sample_power"):
+        try:
+            fit = float(analysis.find_best_alignment(current_power, snap["sample_power"], 1.0)[0])
+        except Exception:  # pylint: disable=broad-exception-caught
+            fit = None
+    return best_m, fit, best_dur
+
+
 def _ambiguity_from_candidates(candidates: list[dict]) -> tuple[float, bool]:
     """Top1-vs-top2 score margin and whether the match is ambiguous.
 
@@ -1230,8 +1353,13 @@ class ProfileStore:
         self.energy_mode: str = "mean"
         self._save_debug_traces = save_debug_traces
 
-        # Cache for resampled sample segments: key=(cycle_id, dt)
-        self._cached_sample_segments: dict[tuple[str, float], Segment] = {}
+        # Byte-bounded LRU of resampled sample segments: key=(cycle_id, dt)
+        self._cached_sample_segments = SegmentCache(SAMPLE_SEGMENT_CACHE_MAX_BYTES)
+        # Prebuilt per-profile matching templates (see _get_match_index).
+        self._match_index: MatchIndex | None = None
+        # Hot-path timings (matching, envelope rebuilds; the manager adds the
+        # detector and ML stages). Exposed via ws get_perf_stats + diagnostics.
+        self.perf_stats = PerfStats()
         # Cache for group cohesion scores to avoid re-running DTW on the event loop
         # every 5 minutes.  Keyed by sorted-members tuple; invalidated when profile_groups
         # content changes (tracked by a simple generation counter).
@@ -1254,6 +1382,25 @@ class ProfileStore:
         self._store: Store[JSONDict] = WashDataStore(
             hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}"
         )
+        # Cycle traces are kept as binary blobs beside the JSON store; in memory
+        # every cycle still carries its plain power_data list.
+        self._trace_store = TraceStore(
+            hass.config.path(".storage", f"{STORAGE_KEY}.{entry_id}.traces")
+        )
+        self._active_store: Store[JSONDict] = Store(
+            hass, _ACTIVE_STORE_VERSION, f"{STORAGE_KEY}.{entry_id}.active"
+        )
+        self._write_lock = asyncio.Lock()
+        # Sections changed since the last write, plus the pending delayed-save
+        # timer / final-write listener of async_schedule_save.
+        self._dirty: set[str] = set()
+        self._save_unsub: CALLBACK_TYPE | None = None
+        self._final_write_unsub: CALLBACK_TYPE | None = None
+        # Pre-split stores still carry the active snapshot inside the main file;
+        # the main file must be rewritten once so a cleared snapshot can't revive.
+        self._active_in_main = False
+        # Cycles loaded with an inline trace (pre-v12 store) awaiting migration.
+        self._inline_traces_on_load = 0
         self._data: JSONDict = {
             "profiles": {},
             "past_cycles": [],
@@ -2048,59 +2195,8 @@ class ProfileStore:
         self, current_power: list[float], current_duration: float,
         members: list[str], member_snaps: dict[str, dict[str, Any]],
     ) -> tuple[str, float | None, float | None]:
-        """Within a winning group, pick the member whose integrated ENERGY best
-        matches the cycle.
-
-        Group members already share shape and duration (that is what the cohesion
-        gate collapses them for), so the within-group discriminator is temperature
-        / spin, and the clean signal for that is integrated energy (Sum P*dt) --
-        NOT whole-cycle mean power (diluted, because hotter cycles also run longer)
-        nor peak (dominated by the ~constant heating-element draw, so it is flat
-        across variants). Validated on real store data (leave-one-cycle-out member
-        pick, 196 cycles): energy-only 73.3% vs the old duration*mean*peak product
-        63.3%; adding any duration term back regressed it (grouped members are
-        duration-cohesive, so duration only adds noise). Duration is still returned
-        (for ETA and the overrun guard) but is intentionally not part of selection.
-
-        Returns (member_name, individual_fit_score, member_avg_duration). The fit
-        score is the chosen member's own alignment score, used as a sanity check."""
-        cur = np.asarray(current_power, dtype=float)
-        if cur.size == 0 or not members:
-            return (members[0] if members else ""), None, None
-        # Energy proxy = mean power * duration; the 1/3600 Wh factor cancels in the
-        # log-ratio, so this is exact up to that constant.  This proxy equals the
-        # true integral only because `current_power` is already resampled onto a
-        # uniform grid by the matcher; raw or irregular traces must use
-        # signal_processing.integrate_wh instead.
-        cur_energy = float(cur.mean()) * float(current_duration)
-
-        def agree(a: float, b: float, scale: float) -> float:
-            if a <= 0 or b <= 0:
-                return 0.0
-            return 1.0 / (1.0 + abs(math.log(a / b)) / scale)
-
-        best_m, best_sc, best_dur = members[0], -1.0, None
-        for m in members:
-            snap = member_snaps.get(m)
-            if not snap:
-                continue
-            sp = np.asarray(snap.get("sample_power") or [], dtype=float)
-            if sp.size == 0:
-                continue
-            md = float(snap.get("avg_duration") or 0.0)
-            mem_energy = float(sp.mean()) * md
-            # Scale 0.30 is validated as insensitive over 0.25-0.40 on real data.
-            sc = agree(cur_energy, mem_energy, 0.30)
-            if sc > best_sc:
-                best_sc, best_m, best_dur = sc, m, md
-        fit = None
-        snap = member_snaps.get(best_m)
-        if snap and snap.get("sample_power"):
-            try:
-                fit = float(analysis.find_best_alignment(current_power, snap["sample_power"], 1.0)[0])
-            except Exception:  # pylint: disable=broad-exception-caught
-                fit = None
-        return best_m, fit, best_dur
+        """Within a winning group, pick the member (see :func:`stage5_pick_member`)."""
+        return stage5_pick_member(current_power, current_duration, members, member_snaps)
 
     def suggest_profile_groups(self, dur_tol: float = 0.60, sim_min: float = 0.85) -> list[dict[str, Any]]:
         """Detect clusters of near-duplicate profiles not already fully grouped.
@@ -2253,7 +2349,7 @@ class ProfileStore:
             return
         base = self.get_lifetime_energy_wh()
         self._data["lifetime_energy_wh"] = round(base + add, 3)
-        await self.async_save()
+        self.async_schedule_save()
 
     def get_lifetime_cycle_count(self) -> int:
         """Persisted monotonic lifetime completed-cycle count.
@@ -3417,21 +3513,44 @@ class ProfileStore:
         # WashDataStore handles migration internally via _async_migrate_func
         data = await self._store.async_load()
         if data:
+            restored, missing = await self.hass.async_add_executor_job(
+                self._trace_store.restore, data, _TRACE_LIST_KEYS
+            )
+            if missing:
+                self._logger.warning(
+                    "%d cycle trace blob(s) missing or unreadable; those cycles "
+                    "are kept as summary-only",
+                    missing,
+                )
+            self._inline_traces_on_load = sum(
+                1
+                for key in _TRACE_LIST_KEYS
+                for c in data.get(key) or []
+                if isinstance(c, dict) and c.get("power_data")
+            ) - restored
+            self._active_in_main = any(k in data for k in _ACTIVE_SECTION_KEYS)
             self._data = data
+        active = await self._active_store.async_load()
+        if isinstance(active, dict):
+            for key in _ACTIVE_SECTION_KEYS:
+                self._data.pop(key, None)
+                if key in active:
+                    self._data[key] = active[key]
         # Ensure legacy custom phase formats are normalized in-memory.
         self._get_shared_custom_phases()
+        # Load-time repairs only mark the store dirty; one write at the end.
         # Assign ids to any custom phase missing one.
         if self._migrate_phase_ids():
-            await self.async_save()
+            self._dirty.add(_SECTION_MAIN)
         # Repair cycles whose power_data was corrupted by the double-subtract bug.
         if self.repair_corrupted_power_data():
-            await self.async_save()
             await self.async_rebuild_all_envelopes()
-            await self.async_save()
+            self._dirty.add(_SECTION_MAIN)
         # Prune pending feedback whose cycle no longer exists, so the device's
         # "needs review" count can't disagree with the Cycles review filter.
         if self.prune_orphaned_feedback():
-            await self.async_save()
+            self._dirty.add(_SECTION_MAIN)
+        await self.async_flush()
 
     # _migrate_v1_to_v2 and _decompress_power_from_raw removed; logic moved to WashDataStore
 
@@ -3523,14 +3642,98 @@ class ProfileStore:
         return stats
 
     async def async_save(self) -> None:
-        """Save data to storage."""
-        await self._store.async_save(self._data)
+        """Save data to storage now (also flushes any pending delayed save)."""
+        self._dirty.add(_SECTION_MAIN)
+        self._invalidate_match_index()
+        await self.async_flush()
+
+    def async_schedule_save(self, delay: float = STORAGE_SAVE_DELAY_S) -> None:
+        """Mark the main store dirty and save it after ``delay`` seconds.
+
+        For fire-and-forget and bulk mutators: every call inside the window is
+        coalesced into one write, and any immediate async_save in the meantime
+        takes the pending changes with it. A pending save is flushed on HA's
+        final-write event and by async_flush on unload.
+        """
+        self._dirty.add(_SECTION_MAIN)
+        self._invalidate_match_index()
+        if self._final_write_unsub is None:
+            self._final_write_unsub = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+            )
+        if self._save_unsub is None:
+            self._save_unsub = async_call_later(self.hass, delay, self._async_save_timer)
+
+    async def _async_save_timer(self, _now: datetime) -> None:
+        self._save_unsub = None
+        await self.async_flush()
+
+    async def _async_final_write(self, _event: Event) -> None:
+        self._final_write_unsub = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write every dirty section now and cancel a pending delayed save."""
+        if self._save_unsub is not None:
+            self._save_unsub()
+            self._save_unsub = None
+        if self._final_write_unsub is not None:
+            self._final_write_unsub()
+            self._final_write_unsub = None
+        if self._dirty:
+            await self._async_write_store()
+
+    async def _async_write_store(self) -> None:
+        """Write the dirty sections.
+
+        main: trace blobs, then the JSON store, then drop orphaned blobs. Blobs
+        go first so the JSON on disk never references a trace that is not there
+        yet; only blobs whose encoded content changed are rewritten.
+        active: the small active-cycle store only.
+
+        While a pre-split main store still holds the active-cycle keys, both
+        sections are written together and active goes first, so the snapshot
+        is never only in memory once main drops it.
+        """
+        async with self._write_lock:
+            sections, self._dirty = self._dirty, set()
+            if self._active_in_main and sections & {_SECTION_MAIN, _SECTION_ACTIVE}:
+                sections |= {_SECTION_MAIN, _SECTION_ACTIVE}
+            try:
+                if _SECTION_ACTIVE in sections:
+                    active = {
+                        k: self._data[k] for k in _ACTIVE_SECTION_KEYS if k in self._data
+                    }
+                    if active:
+                        await self._active_store.async_save(active)
+                    else:
+                        await self._active_store.async_remove()
+                if _SECTION_MAIN in sections:
+                    await self._async_write_main()
+            except Exception:
+                self._dirty |= sections
+                raise
+
+    async def _async_write_main(self) -> None:
+        payload, traces = self._trace_store.externalize(self._data, _TRACE_LIST_KEYS)
+        for key in _ACTIVE_SECTION_KEYS:
+            payload.pop(key, None)
+        failed = await self.hass.async_add_executor_job(
+            self._trace_store.write_changed, traces
+        )
+        TraceStore.inline_failed(payload, self._data, _TRACE_LIST_KEYS, failed)
+        await self._store.async_save(payload)
+        self._active_in_main = False
+        await self.hass.async_add_executor_job(
+            self._trace_store.prune, set(traces) - failed
+        )
 
     async def async_save_active_cycle(self, detector_snapshot: JSONDict) -> None:
         """Save the active cycle state to storage (throttled by Manager)."""
         self._data["active_cycle"] = detector_snapshot
         self._data["last_active_save"] = dt_util.now().isoformat()
-        await self._store.async_save(self._data)
+        self._dirty.add(_SECTION_ACTIVE)
+        await self._async_write_store()
 
     def get_active_cycle(self) -> JSONDict | None:
         """Get the saved active cycle."""
@@ -3553,7 +3756,8 @@ class ProfileStore:
         """Clear the active cycle snapshot from storage."""
         if "active_cycle" in self._data:
             del self._data["active_cycle"]
-            await self._store.async_save(self._data)
+            self._dirty.add(_SECTION_ACTIVE)
+            await self._async_write_store()
 
     def add_cycle(self, cycle_data: CycleDict) -> None:
         """Add a completed cycle to history (sync wrapper, schedules async tasks)."""
@@ -4079,6 +4283,9 @@ class ProfileStore:
         processed_count = await self.hass.async_add_executor_job(
             self._reprocess_all_data_sync
         )
+        # Every cycle's power_data/start_time may have been rewritten; cached
+        # resampled segments (including any built while the job ran) are stale.
+        self._cached_sample_segments.clear()
 
         # 2. Rebuild Envelopes (Using new async infrastructure)
         await self.async_rebuild_all_envelopes()
@@ -4106,14 +4313,21 @@ class ProfileStore:
             file_size_kb = await self.hass.async_add_executor_job(
                 _safe_file_size_kb, path
             )
+        trace_stats = await self.hass.async_add_executor_job(self._trace_store.stats)
 
         return {
             "file_size_kb": round(file_size_kb, 1),
             "total_cycles": len(cycles),
             "total_profiles": len(profiles),
             "debug_traces_count": debug_traces_count,
+            **trace_stats,
+            "segment_cache": self.get_segment_cache_stats(),
         }
 
+    def get_segment_cache_stats(self) -> dict[str, int]:
+        """Hit/miss/eviction counters and size of the sample-segment LRU."""
+        return self._cached_sample_segments.stats()
+
     async def async_clear_debug_data(self) -> int:
         """Clear debug data from all cycles."""
         cycles = self._data.get("past_cycles", [])
@@ -4367,7 +4581,9 @@ class ProfileStore:
         labeled_cycles = shape_cycles
 
         # 2. Run Heavy Computation in Executor (Parsing + DTW)
-        result_pkg = await self.hass.async_add_executor_job(
+        result_pkg = await self.perf_stats.async_run_in_executor(
+            self.hass,
+            "envelope_rebuild",
             self._rebuild_envelope_sync,
             shape_cycles
         )
@@ -4473,7 +4689,8 @@ class ProfileStore:
         )
         # Offload the per-cycle segmentation to the executor (it can be tens of ms
         # for very long traces; keep it off the event loop, like the envelope DTW).
-        phase_profile = await self.hass.async_add_executor_job(
+        phase_profile = await self.perf_stats.async_run_in_executor(
+            self.hass, "phase_profile",
             self._compute_phase_profile, profile_name, shape_cycles, device_type
         )
         if phase_profile is not None:
@@ -4482,6 +4699,7 @@ class ProfileStore:
         if "envelopes" not in self._data:
             self._data["envelopes"] = {}
         self._data["envelopes"][profile_name] = envelope_data
+        self._invalidate_match_index()
 
         return True
 
@@ -5103,8 +5321,9 @@ class ProfileStore:
         dt_key = float(round(dt, 2))
         key = (cycle_id, dt_key)
 
-        if key in self._cached_sample_segments:
-            return self._cached_sample_segments[key]
+        cached = self._cached_sample_segments.get(key)
+        if cached is not None:
+            return cached
 
         # Miss: Compute
         sample_data = sample_cycle.get("power_data")
@@ -5125,7 +5344,7 @@ class ProfileStore:
             sample_seg = max(s_segments, key=lambda s: len(s.power))
 
             # Store
-            self._cached_sample_segments[key] = sample_seg
+            self._cached_sample_segments.put(key, sample_seg)
             return sample_seg
         except Exception as e: # pylint: disable=broad-exception-caught
             self._logger.warning("Error caching sample segment %s: %s", cycle_id, e)
@@ -5138,9 +5357,6 @@ class ProfileStore:
     ) -> MatchResult:
         """Run profile matching asynchronously in executor."""
         # 1. Prepare data in main thread (Access ProfileStore state safely)
-        group_members: dict[str, list[str]] = {}
-        member_snaps: dict[str, dict[str, Any]] = {}
-
         # Convert to list of floats for current power (uniform resampling)
         if not current_power_data:
             return MatchResult(None, 0.0, 0.0, None, [], False, 0.0)
@@ -5169,157 +5385,230 @@ class ProfileStore:
             p_arr = np.array([float(x[1]) for x in current_power_data])
 
             # Resample current
-            segments, used_dt = resample_adaptive(ts_arr, p_arr, min_dt=5.0, gap_s=21600.0)
+            segments, used_dt = resample_adaptive(
+                ts_arr, p_arr, min_dt=MATCH_RESAMPLE_MIN_DT, gap_s=MATCH_RESAMPLE_GAP_S
+            )
             if not segments:
                 return MatchResult(None, 0.0, 0.0, None, [], False, 0.0)
             current_seg = max(segments, key=lambda s: len(s.power))
-            if len(current_seg.power) < 12:
-                return MatchResult(None, 0.0, 0.0, None, [], False, 0.0)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._logger.error("Preparation for async match failed: %s", e)
+            return MatchResult(None, 0.0, 0.0, None, [], False, 0.0)
 
-            current_power_list = current_seg.power.tolist()
+        return await self.async_match_segment(current_seg, used_dt, current_duration)
 
-            # Prepare Snapshots. Imported reference cycles are eligible as matching
-            # templates alongside real cycles (so an import-only profile can match).
-            all_cycles = list(self._data["past_cycles"]) + list(self._data.get("reference_cycles", []))
-            # Precompute per-profile lookups ONCE so the loop below is O(profiles),
-            # not O(profiles x cycles). Rescanning all_cycles with next()/any() for
-            # every profile made matching quadratic and stalled low-power hosts on
-            # auto-label (many matches x many cycles) - issue #311. Selections are
-            # byte-identical: cycles_by_id keeps the FIRST occurrence (== next()),
-            # labeled_by_profile keeps the first eligible cycle in all_cycles order,
-            # and golden_profiles mirrors the any(...) golden test.
-            cycles_by_id: dict[str, CycleDict] = {}
-            labeled_by_profile: dict[str, CycleDict] = {}
-            golden_profiles: set[str] = set()
-            for c in all_cycles:
-                cid = c.get("id")
-                if cid is not None and cid not in cycles_by_id:
-                    cycles_by_id[cid] = c
-                pname = c.get("profile_name")
-                if not pname or not c.get("power_data"):
-                    continue
-                if (
-                    pname not in labeled_by_profile
-                    and c.get("status") in ("completed", "force_stopped")
-                ):
-                    labeled_by_profile[pname] = c
-                rev = c.get("ml_review")
-                if isinstance(rev, dict) and rev.get("golden"):
-                    golden_profiles.add(pname)
-
-            snapshots: list[dict[str, Any]] = []
-            skipped_profiles: list[str] = []
-            for name, profile in self._data["profiles"].items():
-                # Try sample_cycle_id first, fall back to any labeled cycle
-                sample_id = profile.get("sample_cycle_id")
-                sample_cycle = cycles_by_id.get(sample_id) if sample_id else None
-                # Fallback: find ANY completed cycle labeled with this profile
-                if not sample_cycle:
-                    sample_cycle = labeled_by_profile.get(name)
-                # Boost user-pinned "golden" cycles: when a profile has one, use
-                # its sharp single-cycle trace as the matching template instead
-                # of the envelope average. The envelope average smears the
-                # wash-phase peaks (each cycle's spikes land at slightly
-                # different times), which hurts correlation for sharply-shaped
-                # programs; a trusted golden cycle preserves that shape.
-                has_golden = name in golden_profiles
-
-                # Prefer envelope avg curve when ≥2 labeled cycles have been
-                # confirmed - it gives a more representative reference signal
-                # than the original sample alone, so confidence improves over
-                # time as the user keeps confirming correct detections. Skipped
-                # when a golden cycle is pinned (see above).
-                envelope = self._data.get("envelopes", {}).get(name)
-                _env_avg = envelope.get("avg") if envelope else None
-                if (
-                    not has_golden
-                    and envelope
-                    and envelope.get("cycle_count", 0) >= 2
-                    and _env_avg
-                    and isinstance(_env_avg[0], (list, tuple))
-                    and len(_env_avg[0]) >= 2
-                ):
-                    avg_y = [float(p[1]) for p in _env_avg]
-                    _env_ts_duration = (
-                        float(_env_avg[-1][0]) - float(_env_avg[0][0])
-                        if len(_env_avg) > 1 else 0.0
-                    )
-                    avg_duration = (
-                        envelope.get("target_duration") or
-                        profile.get("avg_duration") or
-                        _env_ts_duration or
-                        None
-                    )
-                    if not avg_duration:
-                        skipped_profiles.append(
-                            f"{name}: no valid duration (envelope has no target_duration, avg_duration, or timestamp span)"
-                        )
-                        continue
-                    snapshots.append({
-                        "name": name,
-                        "avg_duration": float(avg_duration),
-                        "sample_power": avg_y,
-                    })
-                    continue
+    def _invalidate_match_index(self) -> None:
+        """Drop the matching index; the next match rebuilds it from ``_data``."""
+        self._match_index = None
 
-                if not sample_cycle:
-                    skipped_profiles.append(
-                        f"{name}: no sample cycle (sample_id={sample_id})"
-                    )
-                    continue
+    def _get_match_index(self) -> MatchIndex:
+        """Return the matching index, rebuilding it if the store changed.
 
-                # Prepare sample segment (using cache)
-                sample_seg = self._get_cached_sample_segment(sample_cycle, used_dt)
-                if not sample_seg:
-                    skipped_profiles.append(
-                        f"{name}: failed to resample cycle {sample_cycle.get('id')}"
-                    )
-                    continue
-                # avg_duration preference order:
-                #   1. profile["avg_duration"] (rolling average, most accurate)
-                #   2. sample_cycle["duration"] (raw cycle field)
-                #   3. timestamp span of sample_seg (estimate from the resampled data)
-                # Profiles created before avg_duration tracking was added may have
-                # 0 or a missing value; falling back to the segment estimate prevents
-                # update_match() from always seeing expected_duration=0, which
-                # silences time-remaining estimates and logs a misleading warning.
-                _seg_ts_duration = (
-                    float(sample_seg.timestamps[-1]) - float(sample_seg.timestamps[0])
-                    if len(sample_seg.timestamps) > 1 else 0.0
+        Every persisted mutation (async_save / async_schedule_save / envelope
+        rebuild) invalidates it; group cohesion changes are picked up through
+        the cohesion cache generation, so live ticks reuse one index.
+        """
+        # id(_data) also catches a wholesale replacement (import/clear).
+        generation = (id(self._data), self._cohesion_cache_generation)
+        index = self._match_index
+        if index is not None and index.generation == generation:
+            return index
+
+        # Imported reference cycles are eligible as matching templates alongside
+        # real cycles (so an import-only profile can match).
+        all_cycles = list(self._data["past_cycles"]) + list(self._data.get("reference_cycles", []))
+        # Precompute per-profile lookups ONCE so the loop below is O(profiles),
+        # not O(profiles x cycles). Rescanning all_cycles with next()/any() for
+        # every profile made matching quadratic and stalled low-power hosts on
+        # auto-label (many matches x many cycles) - issue #311. Selections are
+        # byte-identical: cycles_by_id keeps the FIRST occurrence (== next()),
+        # labeled_by_profile keeps the first eligible cycle in all_cycles order,
+        # and golden_profiles mirrors the any(...) golden test.
+        cycles_by_id: dict[str, CycleDict] = {}
+        labeled_by_profile: dict[str, CycleDict] = {}
+        golden_profiles: set[str] = set()
+        for c in all_cycles:
+            cid = c.get("id")
+            if cid is not None and cid not in cycles_by_id:
+                cycles_by_id[cid] = c
+            pname = c.get("profile_name")
+            if not pname or not c.get("power_data"):
+                continue
+            if (
+                pname not in labeled_by_profile
+                and c.get("status") in ("completed", "force_stopped")
+            ):
+                labeled_by_profile[pname] = c
+            rev = c.get("ml_review")
+            if isinstance(rev, dict) and rev.get("golden"):
+                golden_profiles.add(pname)
+
+        entries: list[tuple[str, dict[str, Any] | None, CycleDict | None, float]] = []
+        skipped_profiles: list[str] = []
+        for name, profile in self._data["profiles"].items():
+            # Try sample_cycle_id first, fall back to any labeled cycle
+            sample_id = profile.get("sample_cycle_id")
+            sample_cycle = cycles_by_id.get(sample_id) if sample_id else None
+            # Fallback: find ANY completed cycle labeled with this profile
+            if not sample_cycle:
+                sample_cycle = labeled_by_profile.get(name)
+            # Boost user-pinned "golden" cycles: when a profile has one, use
+            # its sharp single-cycle trace as the matching template instead
+            # of the envelope average. The envelope average smears the
+            # wash-phase peaks (each cycle's spikes land at slightly
+            # different times), which hurts correlation for sharply-shaped
+            # programs; a trusted golden cycle preserves that shape.
+            has_golden = name in golden_profiles
+
+            # Prefer envelope avg curve when ≥2 labeled cycles have been
+            # confirmed - it gives a more representative reference signal
+            # than the original sample alone, so confidence improves over
+            # time as the user keeps confirming correct detections. Skipped
+            # when a golden cycle is pinned (see above).
+            envelope = self._data.get("envelopes", {}).get(name)
+            _env_avg = envelope.get("avg") if envelope else None
+            if (
+                not has_golden
+                and envelope
+                and envelope.get("cycle_count", 0) >= 2
+                and _env_avg
+                and isinstance(_env_avg[0], (list, tuple))
+                and len(_env_avg[0]) >= 2
+            ):
+                avg_y = [float(p[1]) for p in _env_avg]
+                _env_ts_duration = (
+                    float(_env_avg[-1][0]) - float(_env_avg[0][0])
+                    if len(_env_avg) > 1 else 0.0
                 )
-                avg_dur = (
+                avg_duration = (
+                    envelope.get("target_duration") or
                     profile.get("avg_duration") or
-                    sample_cycle.get("duration") or
-                    _seg_ts_duration
+                    _env_ts_duration or
+                    None
                 )
-                if not avg_dur:
+                if not avg_duration:
                     skipped_profiles.append(
-                        f"{name}: no valid duration (avg_duration, cycle duration, and timestamp span all zero/missing)"
+                        f"{name}: no valid duration (envelope has no target_duration, avg_duration, or timestamp span)"
                     )
                     continue
-                snapshots.append({
+                entries.append((name, {
                     "name": name,
-                    "avg_duration": float(avg_dur),
-                    "sample_power": sample_seg.power.tolist(),
-                    "sample_dt": used_dt
-                })
+                    "avg_duration": float(avg_duration),
+                    "sample_power": avg_y,
+                }, None, 0.0))
+                continue
 
-            if skipped_profiles:
-                self._logger.debug(
-                    "Profile matching skipped %d profiles: %s",
-                    len(skipped_profiles),
-                    "; ".join(skipped_profiles)
+            if not sample_cycle:
+                skipped_profiles.append(
+                    f"{name}: no sample cycle (sample_id={sample_id})"
                 )
+                continue
+            # avg_duration preference order:
+            #   1. profile["avg_duration"] (rolling average, most accurate)
+            #   2. sample_cycle["duration"] (raw cycle field)
+            #   3. timestamp span of the resampled segment (per grid, see
+            #      _match_snapshots_for)
+            preferred = profile.get("avg_duration") or sample_cycle.get("duration") or 0.0
+            entries.append((name, None, sample_cycle, float(preferred)))
+
+        index = MatchIndex(generation, entries, skipped_profiles)
+        self._match_index = index
+        return index
+
+    def _match_snapshots_for(
+        self, used_dt: float
+    ) -> tuple[list[dict[str, Any]], dict[str, list[str]], dict[str, dict[str, Any]]]:
+        """Grouped matcher snapshots for one resampling grid, memoized per index."""
+        index = self._get_match_index()
+        dt_key = float(round(used_dt, 2))
+        cached = index.grids.get(dt_key)
+        if cached is not None:
+            index.grids.move_to_end(dt_key)
+            return cached
+
+        snapshots: list[dict[str, Any]] = []
+        skipped_profiles = list(index.skipped)
+        for name, snapshot, sample_cycle, preferred_dur in index.entries:
+            if snapshot is not None:
+                snapshots.append(snapshot)
+                continue
+            assert sample_cycle is not None
+            # Prepare sample segment (using cache)
+            sample_seg = self._get_cached_sample_segment(sample_cycle, used_dt)
+            if not sample_seg:
+                skipped_profiles.append(
+                    f"{name}: failed to resample cycle {sample_cycle.get('id')}"
+                )
+                continue
+            # Profiles created before avg_duration tracking was added may have
+            # 0 or a missing value; falling back to the segment estimate prevents
+            # update_match() from always seeing expected_duration=0, which
+            # silences time-remaining estimates and logs a misleading warning.
+            _seg_ts_duration = (
+                float(sample_seg.timestamps[-1]) - float(sample_seg.timestamps[0])
+                if len(sample_seg.timestamps) > 1 else 0.0
+            )
+            avg_dur = preferred_dur or _seg_ts_duration
+            if not avg_dur:
+                skipped_profiles.append(
+                    f"{name}: no valid duration (avg_duration, cycle duration, and timestamp span all zero/missing)"
+                )
+                continue
+            snapshots.append({
+                "name": name,
+                "avg_duration": float(avg_dur),
+                "sample_power": sample_seg.power.tolist(),
+                "sample_dt": used_dt
+            })
+
+        if skipped_profiles:
+            self._logger.debug(
+                "Profile matching skipped %d profiles: %s",
+                len(skipped_profiles),
+                "; ".join(skipped_profiles)
+            )
+
+        # Stage 5: collapse cohesive near-duplicate groups into one aggregate
+        # candidate each (loose groups stay individual). No-op without groups.
+        grouped = self._grouped_snapshots(snapshots)
+        index.grids[dt_key] = grouped
+        while len(index.grids) > _MATCH_INDEX_MAX_GRIDS:
+            index.grids.popitem(last=False)
+        return grouped
+
+    async def async_match_segment(
+        self,
+        current_seg: Segment | None,
+        used_dt: float,
+        current_duration: float,
+    ) -> MatchResult:
+        """Match an already-resampled current trace (see ``async_match_profile``).
+
+        Entry point for callers that keep the resampled segment themselves, e.g.
+        :class:`OnlineMatcher`, which grows it incrementally during a cycle.
+        """
+        group_members: dict[str, list[str]] = {}
+        member_snaps: dict[str, dict[str, Any]] = {}
+        try:
+            if current_seg is None or len(current_seg.power) < 12:
+                return MatchResult(None, 0.0, 0.0, None, [], False, 0.0)
 
-            # Stage 5: collapse cohesive near-duplicate groups into one aggregate
-            # candidate each (loose groups stay individual). No-op without groups.
-            snapshots, group_members, member_snaps = self._grouped_snapshots(snapshots)
+            current_power_list = current_seg.power.tolist()
+
+            # Prepare Snapshots from the matching index (rebuilt only when the
+            # persisted store changed) for this resampling grid.
+            with self.perf_stats.measure("match.prepare"):
+                snapshots, group_members, member_snaps = self._match_snapshots_for(used_dt)
 
             config = {
                 "min_duration_ratio": self._min_duration_ratio,
                 "max_duration_ratio": self._max_duration_ratio,
                 "dtw_bandwidth": self.dtw_bandwidth,
                 "energy_mode": self.energy_mode,
+                # Stage-3 may only drop candidates that can neither enter the
+                # reported ranking nor qualify for prefix ambiguity below.
+                "dtw_exact_top_k": _MATCH_RANKING_SIZE,
+                "dtw_keep_shape_score": SMART_TERM_LANDSCAPE_MIN_SHAPE,
                 # On-device tuned scoring weights (opt-in); empty = shipped defaults.
                 **self._matching_overrides(),
             }
@@ -5329,12 +5618,17 @@ class ProfileStore:
             return MatchResult(None, 0.0, 0.0, None, [], False, 0.0)
 
         # 2. Run Heavy Logic in Executor
-        candidates = await self.hass.async_add_executor_job(
+        # Stage-3 work accounting (refined / pruned / abandoned) for the debug panel.
+        dtw_stats: dict[str, int] = {}
+        candidates = await self.perf_stats.async_run_in_executor(
+            self.hass,
+            "match.compute",
             analysis.compute_matches_worker,
             current_power_list,
             current_duration,
             cast(Any, snapshots),
-            config
+            config,
+            dtw_stats,
         )
 
         # 3. Process Result (Main Thread)
@@ -5408,10 +5702,12 @@ class ProfileStore:
             best["score"],
             best_duration,
             matched_phase,
-            candidates[:5],
+            candidates[:_MATCH_RANKING_SIZE],
             is_ambiguous,
             margin,
-            ranking=candidates[:5],  # populate ranking (consumed for training snapshots)
+            # populate ranking (consumed for training snapshots)
+            ranking=candidates[:_MATCH_RANKING_SIZE],
+            debug_details={"dtw_pruning": dtw_stats},
             is_prefix_ambiguous=is_prefix_ambiguous,
         )
 
@@ -5820,8 +6116,11 @@ class ProfileStore:
         self._data["feedback_history"] = {}
         self._data["pending_feedback"] = {}
         self._data["auto_adjustments"] = []
-        self._data["active_cycle"] = None
-        self._data["last_active_save"] = None
+        # The active snapshot lives in its own store; removing it there keeps
+        # a restart from reading a stale active cycle back over the wipe.
+        self._data.pop("active_cycle", None)
+        self._data.pop("last_active_save", None)
+        self._dirty.add(_SECTION_ACTIVE)
         # Newer persisted state must also be wiped, else a "wipe all" leaves trained
         # models, groups, matcher tuning, histories, and counters behind.
         self._data["custom_phases"] = []
@@ -5837,7 +6136,7 @@ class ProfileStore:
         self._data["lifetime_cycle_count"] = 0
         self._data["settings_changelog"] = []
         self._data["suggestion_apply_cycle_count"] = 0
-        self._cached_sample_segments = {}
+        self._cached_sample_segments.clear()
         self._cohesion_cache = {}
         self._cohesion_cache_generation += 1
         await self.async_save()
@@ -6023,7 +6322,8 @@ class ProfileStore:
                 stats["skipped"] += 1
 
         if stats["labeled"] > 0 or stats["relabeled"] > 0:
-            await self.async_save()
+            # Persisted by the save at the end of smart processing.
+            self.async_schedule_save()
             # Trigger smart processing after bulk labeling
             await self.async_smart_process_history()
 
@@ -6107,6 +6407,21 @@ class ProfileStore:
 
         return migrated
 
+    async def async_migrate_traces_to_binary(self) -> int:
+        """
+        Move traces still stored inline in the JSON into binary blobs.
+        Runs after async_migrate_cycles_to_compressed (ISO rows are not
+        externalized). Safe to call repeatedly; a no-op once migrated.
+        Returns number of cycles that were inline on load.
+        """
+        inline = self._inline_traces_on_load
+        if inline <= 0:
+            return 0
+        await self.async_save()
+        self._inline_traces_on_load = 0
+        self._logger.info("Moved %s cycle traces to binary trace storage", inline)
+        return inline
+
 
 
     async def async_smart_process_history(
@@ -6269,7 +6584,7 @@ class ProfileStore:
                 "Import payload contains no profiles or cycles — aborting to prevent data loss"
             )
         self._data = data_dict
-        self._cached_sample_segments = {}
+        self._cached_sample_segments.clear()
         await self.async_save()
 
         return {
@@ -6624,7 +6939,7 @@ class ProfileStore:
         for p in sorted(touched):
             await self.async_rebuild_envelope(p)
 
-        self._cached_sample_segments = {}
+        self._cached_sample_segments.clear()
         await self.async_save()
 
         settings_out: dict[str, Any] = {}
@@ -6654,6 +6969,7 @@ class ProfileStore:
 
         profile_name = cycle_to_delete.get("profile_name")
         self._data["past_cycles"] = [c for c in cycles if c.get("id") != cycle_id]
+        self._cached_sample_segments.invalidate(cycle_id)
 
         if len(self._data["past_cycles"]) < initial_len:
             # Check profile references
@@ -6686,6 +7002,7 @@ class ProfileStore:
             return False
         profile_name = cycle.get("profile_name")
         self._data["reference_cycles"] = [c for c in refs if c.get("id") != cycle_id]
+        self._cached_sample_segments.invalidate(cycle_id)
         # Clear any profile that sampled this now-deleted reference cycle, mirroring
         # the real-cycle path in delete_cycle, so no sample id is left dangling.
         for _p_name, p_data in self.get_profiles().items():
@@ -6872,9 +7189,7 @@ class ProfileStore:
 
         # Invalidate cached sample segments for this cycle so future lookups
         # are recomputed from the trimmed data
-        stale_keys = [k for k in self._cached_sample_segments if k[0] == cycle_id]
-        for k in stale_keys:
-            del self._cached_sample_segments[k]
+        self._cached_sample_segments.invalidate(cycle_id)
 
         # Rebuild envelope for the associated profile
         profile_name = cycle.get("profile_name")
@@ -7041,6 +7356,7 @@ class ProfileStore:
             return []
 
         cycles.pop(idx)  # Remove original — all segments validated, safe to mutate
+        self._cached_sample_segments.invalidate(cycle_id)
 
         new_ids: list[str] = []
         original_profile = cycle.get("profile_name")
@@ -7302,6 +7618,8 @@ class ProfileStore:
             if p_data.get("sample_cycle_id") in all_removed_ids:
                 p_data["sample_cycle_id"] = new_id
 
+        self._cached_sample_segments.invalidate(*all_removed_ids)
+
         # Remove consumed cycles
         self._data["past_cycles"] = [
             c for c in cycles if c.get("id") not in ids_to_remove
@@ -7330,3 +7648,88 @@ class ProfileStore:
 
         return new_id
 
+
+class OnlineMatcher:
+    """Incremental front end to :meth:`ProfileStore.async_match_profile` for one cycle.
+
+    The detector hands the matcher its whole, ever-growing ``_power_readings``
+    list on every match tick. Re-parsing every timestamp and re-resampling the
+    full trace each time is O(cycle length) of Python work per tick; this
+    object remembers how many readings it has already consumed, converts only
+    the newly appended ones and grows the resampled segment through an
+    :class:`IncrementalResampler`. The resampled segment is identical to what
+    ``async_match_profile`` would build, so match results are unchanged.
+
+    The later stages (Stage-2 alignment, Stage-3 DTW) run against the
+    current trace resampled onto a length-normalised grid, which shifts every
+    point as the cycle grows, so they are re-run per tick from the cached
+    segment rather than resumed from partial state.
+
+    A reading list that no longer extends the consumed prefix (a new cycle, or
+    the detector trimming its tail) resets the state automatically.
+    """
+
+    def __init__(self, store: ProfileStore) -> None:
+        self._store = store
+        self._resampler = IncrementalResampler(
+            min_dt=MATCH_RESAMPLE_MIN_DT, gap_s=MATCH_RESAMPLE_GAP_S
+        )
+        self._t_start: float | None = None
+        self._first: tuple[datetime, float] | None = None
+        self._last: tuple[datetime, float] | None = None
+        self._consumed = 0
+
+    def reset(self) -> None:
+        """Forget the current cycle."""
+        self._resampler.reset()
+        self._t_start = None
+        self._first = None
+        self._last = None
+        self._consumed = 0
+
+    @property
+    def consumed(self) -> int:
+        """Number of readings folded into the resampled segment so far."""
+        return self._consumed
+
+    def _extends_prefix(self, readings: list[tuple[datetime, float]]) -> bool:
+        n = self._consumed
+        return (
+            n > 0
+            and len(readings) >= n
+            and readings[0] == self._first
+            and readings[n - 1] == self._last
+        )
+
+    def consume(self, readings: list[tuple[datetime, float]]) -> None:
+        """Fold any readings appended since the last call into the segment."""
+        if not readings:
+            self.reset()
+            return
+        if not self._extends_prefix(readings):
+            self.reset()
+            self._first = readings[0]
+            self._t_start = readings[0][0].timestamp()
+        new = readings[self._consumed:]
+        if not new:
+            return
+        t_start = cast(float, self._t_start)
+        self._resampler.extend(
+            np.array([ts.timestamp() - t_start for ts, _ in new]),
+            np.array([float(p) for _, p in new]),
+        )
+        self._consumed = len(readings)
+        self._last = readings[-1]
+
+    async def async_match(
+        self, readings: list[tuple[datetime, float]], current_duration: float
+    ) -> MatchResult:
+        """Match the cycle so far, consuming only readings not yet seen."""
+        try:
+            self.consume(readings)
+            current_seg, used_dt = self._resampler.longest_segment()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.reset()
+            self._store._logger.error("Preparation for async match failed: %s", e)  # pylint: disable=protected-access
+            return MatchResult(None, 0.0, 0.0, None, [], False, 0.0)
+        return await self._store.async_match_segment(current_seg, used_dt, current_duration)
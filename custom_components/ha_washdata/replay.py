@@ -0,0 +1,148 @@
+# WashData - Home Assistant integration for appliance cycle monitoring via smart plugs.
+# Copyright (C) 2026 Lukas Bandura
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Fast-path replay of historical readings through a :class:`CycleDetector`.
+
+Offline replays (Playground history/sweep rows) feed every stored sample to
+``CycleDetector.process_reading``. Most of a replayed trace's idle stretches
+cannot change detector state, yet each sample pays for datetime arithmetic, a
+percentile over the cadence window and the full state-machine dispatch.
+
+:class:`ReplayIndex` precomputes, in vectorized form, the per-sample dt (from
+integer microseconds, so it equals ``timedelta.total_seconds()`` exactly) and
+the threshold-crossing masks, and from them the end of every quiet run.
+:func:`replay_span` then bulk-applies a whole quiet run via
+``CycleDetector.absorb_quiet_run`` whenever the detector is idle or terminal,
+and drops into the full state machine for every other sample - i.e. around
+every possible transition. Detection output is identical to the per-sample
+path (see tests/test_replay.py).
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Callable, Sequence
+
+import numpy as np
+
+from .cycle_detector import CycleDetector, CycleDetectorConfig
+
+_ONE_US = timedelta(microseconds=1)
+# Shorter quiet runs are cheaper through process_reading than the bulk setup.
+MIN_QUIET_RUN = 4
+
+
+def _next_false(mask: np.ndarray) -> np.ndarray:
+    """For each index, the first index >= it where ``mask`` is False (or n)."""
+    n = len(mask)
+    idx = np.where(mask, n, np.arange(n))
+    return np.minimum.accumulate(idx[::-1])[::-1]
+
+
+class ReplayIndex:
+    """Vectorized per-sample features of one reading sequence for one config."""
+
+    def __init__(
+        self,
+        timestamps: Sequence[datetime],
+        powers: Sequence[float],
+        config: CycleDetectorConfig,
+    ) -> None:
+        self.timestamps = timestamps
+        self.powers = np.asarray(powers, dtype=float)
+        n = len(timestamps)
+        if n:
+            t0 = timestamps[0]
+            us = np.fromiter(
+                ((t - t0) // _ONE_US for t in timestamps), dtype=np.int64, count=n
+            )
+        else:
+            us = np.zeros(0, dtype=np.int64)
+        # dt[i] = seconds from reading i-1 to i; a run may only continue across
+        # non-negative steps (process_reading drops out-of-order readings).
+        self.dt = np.zeros(n, dtype=float)
+        if n > 1:
+            self.dt[1:] = np.diff(us) / 1e6
+        ordered = np.ones(n, dtype=bool)
+        ordered[1:] = self.dt[1:] >= 0
+
+        below_start = self.powers < float(config.start_threshold_w)
+        below_stop = self.powers < float(config.stop_threshold_w)
+        band_active = bool(
+            config.delay_detect_enabled
+            and config.stop_threshold_w < config.start_threshold_w
+        )
+        # With the delayed-start band active, readings in [stop, start) feed the
+        # band tracker in OFF, so only sub-stop readings are quiet there.
+        quiet_off = below_stop if band_active else below_start
+        # The run continues at i only if reading i is quiet AND ordered; the first
+        # reading of a run is checked separately against the detector's last time.
+        self._next_break = {
+            "off": _next_false(quiet_off & ordered),
+            "terminal": _next_false(below_stop & ordered),
+        }
+        self._quiet = {"off": quiet_off, "terminal": below_stop}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def quiet_run_end(self, mode: str, i: int, i1: int) -> int:
+        """End (exclusive) of the quiet run starting at ``i``, capped at ``i1``."""
+        if not self._quiet[mode][i]:
+            return i
+        if i + 1 >= len(self):
+            return min(i + 1, i1)
+        return min(int(self._next_break[mode][i + 1]), i1)
+
+
+def replay_span(
+    detector: CycleDetector,
+    index: ReplayIndex,
+    i0: int,
+    i1: int,
+    on_reading: Callable[[int], None] | None = None,
+) -> None:
+    """Replay readings ``[i0, i1)`` of ``index`` through ``detector``.
+
+    Quiet runs are absorbed in bulk; ``on_reading`` (if given) is called before
+    every sample that goes through ``process_reading`` (so callbacks fired by
+    the detector see the right cursor) and once with the last index of every
+    absorbed run. Callers that need a per-sample view of the detector (e.g. a
+    progress series) must not use this fast path.
+    """
+    i1 = min(i1, len(index))
+    timestamps = index.timestamps
+    powers = index.powers
+    i = i0
+    while i < i1:
+        mode = detector.quiet_run_mode()
+        if mode is not None:
+            j = index.quiet_run_end(mode, i, i1)
+            if j - i >= MIN_QUIET_RUN:
+                last = detector._last_process_time  # pylint: disable=protected-access
+                first_dt = (timestamps[i] - last).total_seconds() if last else 0.0
+                if first_dt >= 0:
+                    dts = index.dt[i:j].copy()
+                    dts[0] = first_dt
+                    if on_reading is not None:
+                        on_reading(j - 1)
+                    detector.absorb_quiet_run(dts, powers[i:j], timestamps[j - 1])
+                    i = j
+                    continue
+        if on_reading is not None:
+            on_reading(i)
+        detector.process_reading(float(powers[i]), timestamps[i])
+        i += 1
+
@@ -0,0 +1,112 @@
+# WashData - Home Assistant integration for appliance cycle monitoring via smart plugs.
+# Copyright (C) 2026 Lukas Bandura
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Byte-bounded LRU cache for resampled profile sample segments.
+
+The matcher resamples each profile's sample cycle onto the live cycle's grid
+(``used_dt``). The grid varies between cycles and devices, so an unbounded
+``(cycle_id, dt)`` dict grew for the lifetime of the process. This cache is
+bounded by the numpy payload size of the cached segments, evicts least
+recently used entries first and keeps hit/miss/eviction counters for the
+storage stats. Lookups run from executor threads, so every operation holds a
+plain lock (never across I/O).
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from .signal_processing import Segment
+
+
+def segment_nbytes(segment: Segment) -> int:
+    """Payload size of a segment's arrays in bytes."""
+    return int(segment.timestamps.nbytes + segment.power.nbytes + segment.mask.nbytes)
+
+
+class SegmentCache:
+    """LRU of ``(cycle_id, dt) -> Segment`` bounded by total array bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max(0, int(max_bytes))
+        self._entries: OrderedDict[tuple[str, float], tuple[Segment, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[str, float]) -> Segment | None:
+        """Return the cached segment (marking it most recently used) or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: tuple[str, float], segment: Segment) -> None:
+        """Insert ``segment``, evicting LRU entries until it fits.
+
+        A segment larger than the whole budget is not cached at all.
+        """
+        size = segment_nbytes(segment)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self._max_bytes:
+                return
+            while self._entries and self._bytes + size > self._max_bytes:
+                _key, (_seg, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self._evictions += 1
+            self._entries[key] = (segment, size)
+            self._bytes += size
+
+    def invalidate(self, *cycle_ids: str) -> int:
+        """Drop every cached grid of the given cycles; returns entries removed."""
+        ids = set(cycle_ids)
+        if not ids:
+            return 0
+        with self._lock:
+            stale = [k for k in self._entries if k[0] in ids]
+            for k in stale:
+                self._bytes -= self._entries.pop(k)[1]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept for the process lifetime)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Counters and current size for storage stats / diagnostics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
@@ -249,3 +249,103 @@ def resample_adaptive(
     return segments, target_dt
 
 
+
+
+class IncrementalResampler:
+    """Append-only equivalent of ``resample_adaptive`` for a growing trace.
+
+    Holds the raw offsets/power of an in-progress cycle in growable NumPy
+    buffers plus the last resampled result. :meth:`longest_segment` returns the
+    same segment as ``max(resample_adaptive(ts, p, ...)[0], key=len)`` over all
+    appended samples, but when the chosen step and the segmentation are
+    unchanged it only re-interpolates the grid points past the previous end
+    (every earlier grid point is bracketed by the same samples, so its value
+    cannot change). Any change in cadence or a new gap falls back to a full
+    ``resample_uniform`` over the buffered arrays.
+    """
+
+    def __init__(self, min_dt: float = 5.0, gap_s: float = 300.0) -> None:
+        self._min_dt = min_dt
+        self._gap_s = gap_s
+        self._ts = np.empty(256, dtype=float)
+        self._p = np.empty(256, dtype=float)
+        self._n = 0
+        self._cached: Segment | None = None
+        self._cached_dt = min_dt
+        self._cached_n = 0
+        self._cached_single_chunk = False
+
+    def __len__(self) -> int:
+        return self._n
+
+    def reset(self) -> None:
+        """Drop all samples (new cycle)."""
+        self._n = 0
+        self._cached = None
+        self._cached_n = 0
+        self._cached_single_chunk = False
+
+    def extend(self, timestamps: np.ndarray, power: np.ndarray) -> None:
+        """Append new samples (offsets in seconds, same origin as earlier ones)."""
+        add = len(timestamps)
+        if add == 0:
+            return
+        need = self._n + add
+        if need > len(self._ts):
+            cap = max(need, 2 * len(self._ts))
+            self._ts = np.resize(self._ts, cap)
+            self._p = np.resize(self._p, cap)
+        self._ts[self._n:need] = timestamps
+        self._p[self._n:need] = power
+        self._n = need
+
+    def longest_segment(self) -> Tuple[Segment | None, float]:
+        """Return ``(segment, used_dt)`` for all samples appended so far."""
+        n = self._n
+        if n < 2:
+            return None, self._min_dt
+        if self._cached_n == n:
+            return self._cached, self._cached_dt
+        ts = self._ts[:n]
+        p = self._p[:n]
+
+        # Same cadence / gap rules as resample_adaptive.
+        diffs = np.diff(ts)
+        valid_diffs = diffs[diffs > 0.001]
+        median_dt = float(np.median(valid_diffs)) if len(valid_diffs) else self._min_dt
+        min_dt = max(self._min_dt, 1e-3)
+        target_dt = max(min_dt, median_dt)
+        gap_s = max(self._gap_s, target_dt * 1.5, 1e-3)
+        single_chunk = not bool(np.any(diffs > gap_s))
+
+        prev = self._cached
+        if (
+            single_chunk
+            and self._cached_single_chunk
+            and prev is not None
+            and target_dt == self._cached_dt
+        ):
+            seg = self._extend_tail(prev, ts, p, target_dt)
+        else:
+            segments = resample_uniform(ts, p, dt_s=target_dt, gap_s=gap_s)
+            seg = max(segments, key=lambda s: len(s.power)) if segments else None
+
+        self._cached = seg
+        self._cached_dt = target_dt
+        self._cached_n = n
+        self._cached_single_chunk = single_chunk
+        return seg, target_dt
+
+    @staticmethod
+    def _extend_tail(prev: Segment, ts: np.ndarray, p: np.ndarray, dt: float) -> Segment:
+        """Grow ``prev`` to cover ``ts`` on the same grid, re-interpolating only
+        from the previous last grid point onward."""
+        grid = np.arange(ts[0], ts[-1] + 0.001, dt)
+        keep = len(prev.timestamps) - 1
+        if keep < 0 or len(grid) <= keep or grid[keep] != prev.timestamps[keep]:
+            return Segment(timestamps=grid, power=np.interp(grid, ts, p), mask=np.ones_like(grid, dtype=bool))
+        # Samples bracketing the tail start; interp only needs those onward.
+        first = max(0, int(np.searchsorted(ts, grid[keep], side="right")) - 1)
+        tail = np.interp(grid[keep:], ts[first:], p[first:])
+        power = np.concatenate((prev.power[:keep], tail))
+        return Segment(timestamps=grid, power=power, mask=np.ones_like(grid, dtype=bool))
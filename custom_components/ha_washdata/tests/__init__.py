@@ -0,0 +1,3 @@
+"""
+Test package for the ha_washdata integration
+"""
@@ -0,0 +1,192 @@
+import unittest
+
+import numpy as np
+
+try:
+    from custom_components.ha_washdata.analysis import (
+        _dtw_lite_scalar,
+        compute_dtw_lite,
+        compute_dtw_lite_batch,
+        compute_dtw_lite_many,
+        compute_matches_worker,
+    )
+except ImportError as err:  # Home Assistant is imported at package level
+    raise unittest.SkipTest(f"requires Home Assistant: {err}")
+
+
+def _scalar(x, y, band_width_ratio, derivative=False):
+    """Per-pair reference distance exactly as compute_dtw_lite bands it."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if derivative:
+        x = np.gradient(x) if len(x) > 1 else x
+        y = np.gradient(y) if len(y) > 1 else y
+    n, m = len(x), len(y)
+    if n == 0 or m == 0:
+        return float("inf")
+    w = max(1, int(min(n, m) * band_width_ratio))
+    return _dtw_lite_scalar(x, y, n, m, w)
+
+
+class TestDtwLiteParity(unittest.TestCase):
+    """The batched and per-row DTW kernels must match the scalar reference exactly."""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(1234)
+
+    def _curves(self, k, length):
+        # Power-like curves: non-negative, with plateaus and steps.
+        base = np.abs(self.rng.normal(0.0, 50.0, size=(k, length)))
+        steps = self.rng.integers(0, 4, size=(k, 1)) * 300.0
+        return base + steps
+
+    def test_per_pair_matches_scalar(self):
+        for n, m in ((200, 200), (50, 80), (80, 50), (1, 7), (7, 1), (2, 2)):
+            for ratio in (0.0, 0.05, 0.1, 0.25, 1.0):
+                x = self._curves(1, n)[0]
+                y = self._curves(1, m)[0]
+                with self.subTest(n=n, m=m, ratio=ratio):
+                    self.assertEqual(
+                        compute_dtw_lite(x, y, band_width_ratio=ratio),
+                        _scalar(x, y, ratio),
+                    )
+
+    def test_batch_shared_query_matches_scalar(self):
+        for n, m in ((200, 200), (120, 200), (200, 120), (3, 11), (1, 1)):
+            for ratio in (0.0, 0.1, 0.3, 1.0):
+                x = self._curves(1, n)[0]
+                ys = self._curves(9, m)
+                expected = np.array([_scalar(x, y, ratio) for y in ys])
+                with self.subTest(n=n, m=m, ratio=ratio):
+                    np.testing.assert_array_equal(
+                        compute_dtw_lite_batch(x, ys, band_width_ratio=ratio), expected
+                    )
+
+    def test_batch_per_row_query_matches_scalar(self):
+        for n, m in ((200, 200), (64, 100), (100, 64)):
+            xs = self._curves(6, n)
+            ys = self._curves(6, m)
+            expected = np.array([_scalar(x, y, 0.1) for x, y in zip(xs, ys)])
+            with self.subTest(n=n, m=m):
+                np.testing.assert_array_equal(
+                    compute_dtw_lite_batch(xs, ys, band_width_ratio=0.1), expected
+                )
+
+    def test_batch_derivative_matches_scalar(self):
+        x = self._curves(1, 150)[0]
+        ys = self._curves(5, 200)
+        expected = np.array([_scalar(x, y, 0.1, derivative=True) for y in ys])
+        np.testing.assert_array_equal(
+            compute_dtw_lite_batch(x, ys, band_width_ratio=0.1, derivative=True), expected
+        )
+        np.testing.assert_array_equal(
+            [compute_dtw_lite(x, y, band_width_ratio=0.1, derivative=True) for y in ys],
+            expected,
+        )
+
+    def test_empty_inputs_are_inf(self):
+        self.assertEqual(compute_dtw_lite(np.array([]), np.ones(5)), float("inf"))
+        self.assertEqual(compute_dtw_lite(np.ones(5), np.array([])), float("inf"))
+        np.testing.assert_array_equal(
+            compute_dtw_lite_batch(np.array([]), np.ones((3, 5))), np.full(3, np.inf)
+        )
+        np.testing.assert_array_equal(
+            compute_dtw_lite_batch(np.ones(5), np.ones((3, 0))), np.full(3, np.inf)
+        )
+        self.assertEqual(compute_dtw_lite_batch(np.ones(5), np.empty((0, 5))).shape, (0,))
+
+    def test_batch_rejects_row_mismatch(self):
+        with self.assertRaises(ValueError):
+            compute_dtw_lite_batch(np.ones((2, 5)), np.ones((3, 5)))
+
+    def test_loose_abandon_threshold_changes_nothing(self):
+        x = self._curves(1, 200)[0]
+        ys = self._curves(12, 200)
+        exact = compute_dtw_lite_batch(x, ys)
+        np.testing.assert_array_equal(
+            compute_dtw_lite_batch(x, ys, abandon_above=np.full(12, 1e300)), exact
+        )
+
+    def test_abandoned_rows_exceed_threshold(self):
+        x = self._curves(1, 200)[0]
+        ys = self._curves(12, 200)
+        exact = compute_dtw_lite_batch(x, ys)
+        thresholds = np.full(12, np.median(exact))
+        got = compute_dtw_lite_batch(x, ys, abandon_above=thresholds)
+        kept = np.isfinite(got)
+        np.testing.assert_array_equal(got[kept], exact[kept])
+        # Only rows that really end above their threshold may be abandoned.
+        self.assertTrue(np.all(exact[~kept] > thresholds[~kept]))
+        self.assertTrue(np.all(kept[exact <= thresholds]))
+
+    def test_many_matches_batch(self):
+        x = self._curves(1, 200)[0]
+        ys = self._curves(7, 200)
+        np.testing.assert_array_equal(
+            compute_dtw_lite_many(x, ys, band_width_ratio=0.1),
+            compute_dtw_lite_batch(x, ys, band_width_ratio=0.1),
+        )
+
+
+class TestMatchPruning(unittest.TestCase):
+    """LB pruning / early abandon is opt-in and never changes the winner."""
+
+    def setUp(self):
+        rng = np.random.default_rng(99)
+        t = np.linspace(0.0, 1.0, 240)
+        self.current = (1800.0 * (t < 0.3) + 400.0 + 50.0 * np.sin(40 * t)).tolist()
+        self.snapshots = []
+        for idx in range(8):
+            cut = 0.2 + 0.05 * idx
+            sample = 1800.0 * (t < cut) + 400.0 + rng.normal(0.0, 30.0 + 20.0 * idx, t.size)
+            self.snapshots.append(
+                {"name": f"p{idx}", "avg_duration": 3600.0, "sample_power": sample.tolist()}
+            )
+
+    def _run(self, **extra):
+        config = {"dtw_bandwidth": 0.1, "dtw_refine_top_n": 8, **extra}
+        stats = {}
+        cands = compute_matches_worker(self.current, 3600.0, self.snapshots, config, stats)
+        return cands, stats
+
+    def test_default_config_scores_every_candidate(self):
+        cands, stats = self._run()
+        self.assertEqual(stats["evaluated"], stats["candidates"])
+        self.assertEqual(stats["pruned_lb_kim"] + stats["pruned_lb_keogh"] + stats["abandoned"], 0)
+        self.assertEqual(len(cands), len(self.snapshots))
+
+    def test_early_abandon_keeps_winner(self):
+        full, _ = self._run()
+        pruned, stats = self._run(dtw_early_abandon=True)
+        self.assertEqual(pruned[0]["name"], full[0]["name"])
+        self.assertEqual(pruned[0]["score"], full[0]["score"])
+        self.assertEqual(
+            stats["evaluated"] + stats["pruned_lb_kim"] + stats["pruned_lb_keogh"]
+            + stats["abandoned"],
+            stats["candidates"],
+        )
+        self.assertEqual(len(pruned), stats["evaluated"])
+
+    def test_exact_top_k_keeps_ranking(self):
+        full, _ = self._run()
+        pruned, stats = self._run(dtw_exact_top_k=3)
+        self.assertGreater(stats["evaluated"], 3)
+        self.assertLess(stats["evaluated"], stats["candidates"])
+        self.assertEqual(
+            [(c["name"], c["score"]) for c in pruned[:3]],
+            [(c["name"], c["score"]) for c in full[:3]],
+        )
+        self.assertEqual(len(pruned), stats["evaluated"])
+
+    def test_exact_top_k_keeps_shape_candidates(self):
+        full, _ = self._run()
+        keep = sorted(c.get("shape_score", c["score"]) for c in full)[2]
+        pruned, _ = self._run(dtw_exact_top_k=1, dtw_keep_shape_score=keep)
+        kept = {c["name"] for c in pruned}
+        for cand in full:
+            if cand.get("shape_score", cand["score"]) >= keep:
+                self.assertIn(cand["name"], kept)
+
+
+if __name__ == "__main__":
+    unittest.main()
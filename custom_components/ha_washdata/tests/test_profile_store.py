@@ -0,0 +1,78 @@
+"""Persistence tests for ProfileStore's split main/active stores."""
+
+import copy
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+try:
+    from custom_components.ha_washdata.profile_store import ProfileStore
+except ImportError as err:  # Home Assistant is imported at package level
+    raise unittest.SkipTest(f"requires Home Assistant: {err}")
+
+
+class _MemoryStore:
+    """In-memory stand-in for a Home Assistant Store file."""
+
+    def __init__(self):
+        self.data = None
+
+    async def async_load(self):
+        return copy.deepcopy(self.data)
+
+    async def async_save(self, data):
+        self.data = copy.deepcopy(data)
+
+    async def async_remove(self):
+        self.data = None
+
+
+class TestProfileStorePersistence(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.main = _MemoryStore()
+        self.active = _MemoryStore()
+
+    def _hass(self):
+        hass = MagicMock()
+        hass.config.path = lambda *parts: "/".join((self._tmp.name, *parts))
+
+        async def _executor(func, *args):
+            return func(*args)
+
+        hass.async_add_executor_job = _executor
+        return hass
+
+    def _store(self):
+        """A ProfileStore as built after a (re)start, sharing the fake files."""
+        store = ProfileStore(self._hass(), "entry")
+        store._store = self.main
+        store._active_store = self.active
+        return store
+
+    async def test_active_cycle_survives_restart(self):
+        store = self._store()
+        await store.async_load()
+        await store.async_save_active_cycle({"state": "running"})
+
+        reloaded = self._store()
+        await reloaded.async_load()
+        self.assertEqual(reloaded.get_active_cycle(), {"state": "running"})
+
+    async def test_clear_all_data_drops_active_cycle_after_restart(self):
+        store = self._store()
+        await store.async_load()
+        await store.async_save_active_cycle({"state": "running"})
+
+        await store.clear_all_data()
+        self.assertIsNone(self.active.data)
+
+        reloaded = self._store()
+        await reloaded.async_load()
+        self.assertIsNone(reloaded.get_active_cycle())
+        self.assertIsNone(reloaded.get_last_active_save())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import json
+import os
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+try:
+    from custom_components.ha_washdata.cycle_detector import (
+        CycleDetector,
+        CycleDetectorConfig,
+    )
+    from custom_components.ha_washdata.replay import (
+        MIN_QUIET_RUN,
+        ReplayIndex,
+        replay_span,
+    )
+except ImportError as err:  # Home Assistant is imported at package level
+    raise unittest.SkipTest(f"requires Home Assistant: {err}")
+
+TRACES = os.path.join(os.path.dirname(__file__), "replay_traces.json")
+
+# Snapshot fields taken from the wall clock (CycleDetector.reset() stamps
+# state_enter_time with dt_util.now()), so they differ between any two runs.
+WALL_CLOCK_FIELDS = frozenset({"state_enter_time"})
+
+
+def _cycle_boundaries(cycles):
+    return [
+        (
+            str(c.get("start_time")),
+            str(c.get("end_time")),
+            c.get("status"),
+            str(c.get("termination_reason")),
+        )
+        for c in cycles
+    ]
+
+
+def _replay_both(config, timestamps, powers):
+    """Run the per-sample reference and the fast path over the same readings."""
+    ref_cycles, fast_cycles = [], []
+    ref_states, fast_states = [], []
+    ref = CycleDetector(config, lambda _o, n: ref_states.append(n), ref_cycles.append)
+    fast = CycleDetector(config, lambda _o, n: fast_states.append(n), fast_cycles.append)
+    for ts, p in zip(timestamps, powers):
+        ref.process_reading(float(p), ts)
+    replay_span(fast, ReplayIndex(timestamps, powers, config), 0, len(timestamps))
+    return (ref, ref_cycles, ref_states), (fast, fast_cycles, fast_states)
+
+
+class ReplayParityMixin:
+    def assertReplayParity(self, config, timestamps, powers):
+        (ref, ref_cycles, ref_states), (fast, fast_cycles, fast_states) = _replay_both(
+            config, timestamps, powers
+        )
+        self.assertEqual(_cycle_boundaries(fast_cycles), _cycle_boundaries(ref_cycles))
+        self.assertEqual(fast_states, ref_states)
+        ref_snap, fast_snap = ref.get_state_snapshot(), fast.get_state_snapshot()
+        for key in sorted((set(ref_snap) | set(fast_snap)) - WALL_CLOCK_FIELDS):
+            self.assertEqual(fast_snap.get(key), ref_snap.get(key), key)
+        return ref_cycles
+
+
+class TestReplayRecordedTraces(ReplayParityMixin, unittest.TestCase):
+    """The fast path detects the same cycles as process_reading on stored traces."""
+
+    @classmethod
+    def setUpClass(cls):
+        with open(TRACES, encoding="utf-8") as f:
+            cls.doc = json.load(f)
+        cls.start = datetime.fromisoformat(cls.doc["start"])
+
+    def test_traces(self):
+        for trace in self.doc["traces"]:
+            timestamps = [self.start + timedelta(seconds=t) for t, _ in trace["readings"]]
+            powers = [p for _, p in trace["readings"]]
+            with self.subTest(trace=trace["name"]):
+                cycles = self.assertReplayParity(
+                    CycleDetectorConfig(**trace["config"]), timestamps, powers
+                )
+                self.assertTrue(cycles, "trace should contain at least one cycle")
+
+
+class TestReplaySyntheticTraces(ReplayParityMixin, unittest.TestCase):
+    """Fuzzed traces: random cadence, gaps, out-of-order readings and configs."""
+
+    def _trace(self, rng):
+        start = datetime(2026, 1, 5, 8, 0, tzinfo=datetime.now().astimezone().tzinfo)
+        t = 0.0
+        timestamps, powers = [], []
+        for _ in range(int(rng.integers(3, 9))):
+            quiet = bool(rng.random() < 0.5)
+            for _ in range(int(rng.integers(MIN_QUIET_RUN, 120))):
+                t += float(rng.choice([1.0, 5.0, 10.0, 30.0, 60.0]) * rng.uniform(0.5, 1.5))
+                if rng.random() < 0.01:
+                    t += float(rng.uniform(600.0, 7200.0))  # sensor outage
+                step = t - float(rng.uniform(1.0, 30.0)) if rng.random() < 0.01 else t
+                timestamps.append(start + timedelta(seconds=round(step, 3)))
+                if quiet:
+                    powers.append(float(abs(rng.normal(0.5, 1.0))))
+                else:
+                    powers.append(float(abs(rng.normal(rng.choice([5.0, 200.0, 1500.0]), 50.0))))
+        return timestamps, powers
+
+    def _config(self, rng):
+        stop = float(rng.choice([1.0, 2.0, 5.0]))
+        return CycleDetectorConfig(
+            min_power=stop,
+            off_delay=int(rng.choice([60, 120, 300])),
+            device_type=str(rng.choice(["washing_machine", "dryer", "dishwasher"])),
+            smoothing_window=int(rng.integers(1, 8)),
+            start_threshold_w=stop + float(rng.choice([0.0, 3.0, 10.0])),
+            stop_threshold_w=stop,
+            anti_wrinkle_enabled=bool(rng.random() < 0.3),
+            delay_detect_enabled=bool(rng.random() < 0.3),
+        )
+
+    def test_fuzzed_traces(self):
+        rng = np.random.default_rng(7)
+        for case in range(120):
+            timestamps, powers = self._trace(rng)
+            config = self._config(rng)
+            with self.subTest(case=case):
+                self.assertReplayParity(config, timestamps, powers)
+
+    def test_spans_resume_mid_trace(self):
+        rng = np.random.default_rng(11)
+        timestamps, powers = self._trace(rng)
+        config = self._config(rng)
+        index = ReplayIndex(timestamps, powers, config)
+        whole, chunked = [], []
+        a = CycleDetector(config, lambda _o, _n: None, whole.append)
+        b = CycleDetector(config, lambda _o, _n: None, chunked.append)
+        replay_span(a, index, 0, len(index))
+        for i0 in range(0, len(index), 37):
+            replay_span(b, index, i0, i0 + 37)
+        self.assertEqual(_cycle_boundaries(chunked), _cycle_boundaries(whole))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,320 @@
+# WashData - Home Assistant integration for appliance cycle monitoring via smart plugs.
+# Copyright (C) 2026 Lukas Bandura
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""Columnar binary storage for cycle power traces.
+
+Every past/reference cycle carries a ``power_data`` list of ``[offset_s, watts]``
+pairs. Kept inline in the main JSON store they dominate its size, every load
+re-parses hundreds of thousands of floats, and every save re-serialises all of
+them. This module keeps each trace in its own small binary blob next to the
+JSON store, referenced from the cycle by ``power_ref``:
+
+    <config>/.storage/ha_washdata.<entry_id>.traces/<cycle_id>.wdt
+
+Blob layout (little endian)::
+
+    magic   4s   b"WDT1"
+    flags   u8   bit0: offsets are u16 decisecond deltas (else f64 absolute)
+                 bit1: power is f32 (else f64)
+    pad     3x
+    count   u32
+    base    f64  first offset (only meaningful with delta offsets)
+    offsets      u16[count-1] deltas | f64[count]
+    power        f32[count] | f64[count]
+
+The compact encodings are only chosen when they round-trip *exactly* (stored
+offsets are rounded to 0.1 s and most powers to 0.1 W), otherwise the blob
+falls back to float64 - encoding is always lossless. Blobs are decoded with
+``np.frombuffer`` and can be memory-mapped.
+
+In memory nothing changes: ``power_data`` is restored on load, so the rest of
+the integration keeps working on plain lists. :class:`TraceStore` only swaps
+the lists for references in the payload handed to the JSON store and rewrites
+a blob only when its encoded content changed.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import struct
+from typing import Any
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+TRACE_MAGIC = b"WDT1"
+TRACE_SUFFIX = ".wdt"
+_HEADER = struct.Struct("<4sB3xId")
+_FLAG_DELTA_OFFSETS = 0x01
+_FLAG_F32_POWER = 0x02
+_MAX_U16 = 0xFFFF
+# Cycle ids become file names; anything outside this set is hashed instead.
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_.-]{1,128}$")
+
+
+def encode_trace(power_data: list[Any]) -> bytes | None:
+    """Encode ``[[offset, power], ...]`` into a blob, or ``None`` if not numeric."""
+    try:
+        arr = np.asarray(power_data, dtype=float)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim != 2 or arr.shape[0] == 0 or arr.shape[1] != 2:
+        return None
+    offsets = np.ascontiguousarray(arr[:, 0])
+    power = np.ascontiguousarray(arr[:, 1])
+    count = len(offsets)
+    flags = 0
+    base = float(offsets[0])
+
+    off_bytes = offsets.astype("<f8").tobytes()
+    ds = np.rint(offsets * 10.0)
+    deltas = np.diff(ds)
+    if (
+        np.all(np.isfinite(ds))
+        and np.array_equal(ds / 10.0, offsets)
+        and (deltas.size == 0 or (deltas.min() >= 0 and deltas.max() <= _MAX_U16))
+    ):
+        flags |= _FLAG_DELTA_OFFSETS
+        off_bytes = deltas.astype("<u2").tobytes()
+
+    p_bytes = power.astype("<f8").tobytes()
+    p32 = power.astype("<f4")
+    if np.array_equal(_restore_f32_power(p32), power, equal_nan=True):
+        flags |= _FLAG_F32_POWER
+        p_bytes = p32.tobytes()
+
+    return _HEADER.pack(TRACE_MAGIC, flags, count, base) + off_bytes + p_bytes
+
+
+def _restore_f32_power(p32: np.ndarray) -> np.ndarray:
+    """float32 power back to the float64 it was rounded from (0.1 W grid)."""
+    return np.round(p32.astype(float), 1)
+
+
+def decode_trace_arrays(blob: bytes | memoryview) -> tuple[np.ndarray, np.ndarray]:
+    """Decode a blob into ``(offsets, power)`` float64 arrays."""
+    magic, flags, count, base = _HEADER.unpack_from(blob, 0)
+    if magic != TRACE_MAGIC:
+        raise ValueError("not a WashData trace blob")
+    pos = _HEADER.size
+    if flags & _FLAG_DELTA_OFFSETS:
+        deltas = np.frombuffer(blob, dtype="<u2", count=max(0, count - 1), offset=pos)
+        pos += deltas.nbytes
+        ds = np.empty(count, dtype=float)
+        ds[0] = np.rint(base * 10.0)
+        if count > 1:
+            np.cumsum(deltas, out=ds[1:])
+            ds[1:] += ds[0]
+        offsets = ds / 10.0
+    else:
+        offsets = np.frombuffer(blob, dtype="<f8", count=count, offset=pos).astype(float)
+        pos += offsets.nbytes
+    if flags & _FLAG_F32_POWER:
+        power = _restore_f32_power(np.frombuffer(blob, dtype="<f4", count=count, offset=pos))
+    else:
+        power = np.frombuffer(blob, dtype="<f8", count=count, offset=pos).astype(float)
+    return offsets, power
+
+
+def decode_trace(blob: bytes | memoryview) -> list[list[float]]:
+    """Decode a blob into the in-memory ``[[offset, power], ...]`` form."""
+    offsets, power = decode_trace_arrays(blob)
+    return np.column_stack((offsets, power)).tolist()
+
+
+class TraceStore:
+    """Per-cycle binary trace blobs referenced from the JSON store."""
+
+    def __init__(self, directory: str) -> None:
+        self._dir = directory
+        # cycle id -> digest of the blob last written/read, so unchanged traces
+        # are never rewritten.
+        self._digests: dict[str, bytes] = {}
+
+    @property
+    def directory(self) -> str:
+        return self._dir
+
+    def _path(self, cycle_id: str) -> str:
+        if _SAFE_ID.match(cycle_id):
+            name = cycle_id
+        else:
+            name = "h" + hashlib.sha1(cycle_id.encode("utf-8")).hexdigest()
+        return os.path.join(self._dir, name + TRACE_SUFFIX)
+
+    # ── save side (event loop: split, executor: write) ───────────────────────
+
+    def externalize(
+        self, data: dict[str, Any], list_keys: tuple[str, ...]
+    ) -> tuple[dict[str, Any], dict[str, list[Any]]]:
+        """Return ``(payload, traces)`` for a save.
+
+        ``payload`` is a shallow copy of ``data`` whose cycles in ``list_keys``
+        carry ``power_ref`` instead of ``power_data``; ``traces`` maps cycle id
+        to the trace that must be on disk before the payload is written.
+        Cycles without an id or with non-numeric (legacy ISO) rows stay inline.
+        """
+        payload = dict(data)
+        traces: dict[str, list[Any]] = {}
+        for key in list_keys:
+            cycles = data.get(key)
+            if not isinstance(cycles, list):
+                continue
+            out: list[Any] = []
+            for cycle in cycles:
+                if not isinstance(cycle, dict):
+                    out.append(cycle)
+                    continue
+                trace = cycle.get("power_data")
+                cid = cycle.get("id")
+                if (
+                    not isinstance(cid, str)
+                    or not isinstance(trace, list)
+                    or not trace
+                    or not isinstance(trace[0], (list, tuple))
+                    or not isinstance(trace[0][0], (int, float))
+                ):
+                    out.append(cycle)
+                    continue
+                traces[cid] = trace
+                ref = {k: v for k, v in cycle.items() if k != "power_data"}
+                ref["power_ref"] = {"n": len(trace)}
+                out.append(ref)
+            payload[key] = out
+        return payload, traces
+
+    def write_changed(self, traces: dict[str, list[Any]]) -> set[str]:
+        """Write blobs whose content changed (executor).
+
+        Returns the ids that could not be written; the caller keeps those
+        inline for this save so nothing is ever lost.
+        """
+        failed: set[str] = set()
+        if not traces:
+            return failed
+        os.makedirs(self._dir, exist_ok=True)
+        for cid, trace in traces.items():
+            blob = encode_trace(trace)
+            if blob is None:
+                failed.add(cid)
+                continue
+            digest = hashlib.blake2b(blob, digest_size=16).digest()
+            if self._digests.get(cid) == digest:
+                continue
+            path = self._path(cid)
+            tmp = path + ".tmp"
+            try:
+                with open(tmp, "wb") as fh:
+                    fh.write(blob)
+                os.replace(tmp, path)
+            except OSError as err:
+                _LOGGER.warning("Failed to write trace blob for cycle %s: %s", cid, err)
+                failed.add(cid)
+                continue
+            self._digests[cid] = digest
+        return failed
+
+    @staticmethod
+    def inline_failed(
+        payload: dict[str, Any],
+        data: dict[str, Any],
+        list_keys: tuple[str, ...],
+        failed: set[str],
+    ) -> None:
+        """Put the original cycle back into ``payload`` for ids in ``failed``."""
+        if not failed:
+            return
+        for key in list_keys:
+            originals = data.get(key)
+            refs = payload.get(key)
+            if not isinstance(originals, list) or not isinstance(refs, list):
+                continue
+            payload[key] = [
+                orig
+                if isinstance(orig, dict) and orig.get("id") in failed
+                else ref
+                for orig, ref in zip(originals, refs)
+            ]
+
+    def prune(self, live_ids: set[str]) -> int:
+        """Delete blobs whose cycle no longer exists (executor)."""
+        removed = 0
+        try:
+            names = os.listdir(self._dir)
+        except OSError:
+            return 0
+        live_names = {os.path.basename(self._path(cid)) for cid in live_ids}
+        for name in names:
+            if not name.endswith(TRACE_SUFFIX) or name in live_names:
+                continue
+            try:
+                os.remove(os.path.join(self._dir, name))
+                removed += 1
+            except OSError:
+                continue
+        self._digests = {cid: d for cid, d in self._digests.items() if cid in live_ids}
+        return removed
+
+    # ── load side (executor) ─────────────────────────────────────────────────
+
+    def restore(self, data: dict[str, Any], list_keys: tuple[str, ...]) -> tuple[int, int]:
+        """Replace ``power_ref`` with the decoded ``power_data`` in place.
+
+        Returns ``(restored, missing)``. A missing/corrupt blob leaves the cycle
+        without ``power_data`` (the same state as a retention-trimmed cycle).
+        """
+        restored = missing = 0
+        for key in list_keys:
+            cycles = data.get(key)
+            if not isinstance(cycles, list):
+                continue
+            for cycle in cycles:
+                if not isinstance(cycle, dict) or "power_ref" not in cycle:
+                    continue
+                cycle.pop("power_ref", None)
+                cid = cycle.get("id")
+                if not isinstance(cid, str):
+                    missing += 1
+                    continue
+                try:
+                    with open(self._path(cid), "rb") as fh:
+                        blob = fh.read()
+                    trace = decode_trace(blob)
+                except (OSError, ValueError, struct.error) as err:
+                    _LOGGER.warning("Trace blob for cycle %s unreadable: %s", cid, err)
+                    missing += 1
+                    continue
+                cycle["power_data"] = trace
+                self._digests[cid] = hashlib.blake2b(blob, digest_size=16).digest()
+                restored += 1
+        return restored, missing
+
+    def stats(self) -> dict[str, float]:
+        """Blob count and total size in KiB (executor)."""
+        count = 0
+        size = 0
+        try:
+            with os.scandir(self._dir) as it:
+                for entry in it:
+                    if entry.name.endswith(TRACE_SUFFIX):
+                        count += 1
+                        size += entry.stat().st_size
+        except OSError:
+            pass
+        return {"trace_blobs": count, "trace_blobs_kb": round(size / 1024, 1)}
@@ -1081,7 +1081,8 @@ def async_register_commands(hass: HomeAssistant) -> None:
         # Feedbacks
         ws_get_feedbacks, ws_resolve_feedback, ws_dismiss_all_feedbacks,
         # Diagnostics
-        ws_get_diagnostics, ws_reprocess_history, ws_clear_debug_data,
+        ws_get_diagnostics, ws_get_perf_stats, ws_reset_perf_stats, ws_reprocess_history,
+        ws_clear_debug_data,
         ws_wipe_history, ws_export_config, ws_import_config,
         # Selective export/import wizard (inventory + analyze + selective export/import)
         ws_get_export_inventory, ws_analyze_import,
@@ -2742,6 +2743,49 @@ async def ws_get_diagnostics(
         connection.send_error(msg["id"], "unknown_error", str(exc))
 
 
+@websocket_api.websocket_command({
+    vol.Required("type"): "ha_washdata/get_perf_stats",
+    vol.Required("entry_id"): str,
+})
+@callback
+def ws_get_perf_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return hot-path stage timings."""
+    entry_id: str = msg["entry_id"]
+    manager = _get_manager(hass, entry_id)
+    if manager is None:
+        _err_not_found(connection, msg["id"], entry_id)
+        return
+
+    _send_result(
+        connection, msg["id"], "get_perf_stats", manager.profile_store.perf_stats.snapshot()
+    )
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "ha_washdata/reset_perf_stats",
+    vol.Required("entry_id"): str,
+})
+@callback
+def ws_reset_perf_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Clear the hot-path stage timings and restart their window."""
+    entry_id: str = msg["entry_id"]
+    manager = _get_manager(hass, entry_id)
+    if manager is None:
+        _err_not_found(connection, msg["id"], entry_id)
+        return
+
+    manager.profile_store.perf_stats.reset()
+    _send_result(connection, msg["id"], "reset_perf_stats", {"success": True})
+
+
 async def _reprocess_task(hass: HomeAssistant, task: Any, entry_id: str) -> None:
     """Detached runner for the full "Process history" pass, reporting phase-level
     progress to the task registry and storing the summary as the result. Survives
@@ -4168,8 +4212,9 @@ def ws_get_match_debug(
 ) -> None:
     """Return the latest live match result for the Status debug panel.
 
-    Confidence, ambiguity flag, and the ranked candidate list (from the last
-    in-cycle match attempt). Empty until the first match runs.
+    Confidence, ambiguity flag, the ranked candidate list and the Stage-3 DTW
+    work accounting (refined / evaluated / LB-pruned / abandoned candidates)
+    from the last in-cycle match attempt. Empty until the first match runs.
     """
     entry_id: str = msg["entry_id"]
     manager = _get_manager(hass, entry_id)
@@ -4177,7 +4222,7 @@ def ws_get_match_debug(
         _err_not_found(connection, msg["id"], entry_id)
         return
 
-    out: dict[str, Any] = {"confidence": None, "ambiguous": False, "candidates": []}
+    out: dict[str, Any] = {"confidence": None, "ambiguous": False, "candidates": [], "pruning": {}}
     try:
         mr = getattr(manager, "_last_match_result", None)
         conf = getattr(manager, "_last_match_confidence", None)
@@ -4185,6 +4230,8 @@ def ws_get_match_debug(
         out["ambiguous"] = bool(getattr(manager, "_last_match_ambiguous", False))
         if mr is not None:
             out["candidates"] = manager.profile_store.get_match_candidates_summary(mr, 5)
+            details = getattr(mr, "debug_details", None) or {}
+            out["pruning"] = dict(details.get("dtw_pruning") or {})
     except Exception as exc:  # pylint: disable=broad-exception-caught
         _LOGGER.debug("Error building match debug for %s: %s", entry_id, exc)
 
@@ -5821,10 +5868,88 @@ async def _pg_history_task(
         reg.finish(task, state=task_registry.STATE_ERROR, error=str(exc))
 
 
+async def _pg_sweep_parallel(
+    hass: HomeAssistant, task: Any, store: Any, base_config: Any,
+    options: dict[str, Any], price: float | None, prebuilt: Any, workers: int,
+    past: list[dict[str, Any]], param: str, values: list[float], objective: str,
+    param_y: str | None, values_y: list[float] | None,
+) -> dict[str, Any]:
+    """Process-pool variant of the sweep loop: every (grid point, cycle) pair is
+    one worker job. Progress advances per pair; cancellation drops the queued
+    pairs and returns the points that completed. A pair whose worker raised
+    counts as done without a row, so one bad cycle can't abort the sweep."""
+    reg = task_registry.get_registry(hass)
+    cycles = [c for c in past[-playground.DEFAULT_RECENT_CYCLES:] if isinstance(c, dict) and c.get("id")]
+    cycles = cycles[:playground.MAX_BATCH_CYCLES]
+    grid_points = playground.sweep_grid(base_config, param, values, param_y, values_y)
+    n_cycles = len(cycles)
+    reg.update(task, total=len(grid_points) * n_cycles)
+    rows: dict[tuple[int, int], list[dict[str, Any] | None]] = {
+        key: [None] * n_cycles for key, _ in grid_points
+    }
+    remaining = {key: n_cycles for key, _ in grid_points}
+    pool = await hass.async_add_executor_job(
+        playground.create_sweep_pool, store, cycles, base_config, options, price, prebuilt, workers,
+    )
+    try:
+        submitted = await hass.async_add_executor_job(
+            playground.submit_sweep_pairs, pool, grid_points, n_cycles
+        )
+        pending = {asyncio.wrap_future(f): (key, ci) for f, key, ci in submitted}
+        done = 0
+        while pending and not task.cancel_requested:
+            finished, _ = await asyncio.wait(
+                pending, timeout=_PG_SWEEP_POLL_S, return_when=asyncio.FIRST_COMPLETED,
+            )
+            for fut in finished:
+                key, ci = pending.pop(fut)
+                try:
+                    rows[key][ci] = fut.result()
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    _LOGGER.warning(
+                        "Playground sweep pair %s/cycle %d failed: %s", key, ci, exc
+                    )
+                remaining[key] -= 1
+                done += 1
+            if finished:
+                reg.update(task, done=done)
+    finally:
+        await hass.async_add_executor_job(playground.shutdown_sweep_pool, pool)
+
+    def _point(key: tuple[int, int]) -> tuple[float | None, dict[str, Any] | None]:
+        if remaining[key]:
+            return None, None  # cancelled before every cycle of this point ran
+        return playground.sweep_point_result([r for r in rows[key] if r], objective)
+
+    current = playground._sim_config_summary(base_config)  # pylint: disable=protected-access
+    if param_y and values_y:
+        grid: list[list[float | None]] = [
+            [_point((j, i))[0] for i in range(len(values))] for j in range(len(values_y))
+        ]
+        return playground.finalize_sweep_2d(
+            param, param_y, objective, values, values_y, grid,
+            {
+                "x": current.get(playground._OVERRIDE_FIELD_MAP.get(param, (param,))[0]),  # pylint: disable=protected-access
+                "y": current.get(playground._OVERRIDE_FIELD_MAP.get(param_y, (param_y,))[0]),  # pylint: disable=protected-access
+            },
+        )
+    points: list[dict[str, Any]] = []
+    for i, vx in enumerate(values):
+        metric, summary = _point((0, i))
+        if summary is None:
+            continue
+        points.append({"value": vx, "metric": metric, "summary": summary})
+    return playground.finalize_sweep_1d(
+        param, objective, points,
+        current.get(playground._OVERRIDE_FIELD_MAP.get(param, (param,))[0]),  # pylint: disable=protected-access
+    )
+
+
 async def _pg_sweep_task(
     hass: HomeAssistant, task: Any, entry_id: str,
     param: str, values: list[float], objective: str,
     param_y: str | None, values_y: list[float] | None,
+    workers: int = 1,
 ) -> None:
     reg = task_registry.get_registry(hass)
     ctx = _playground_context(hass, entry_id)
@@ -5839,7 +5964,15 @@ async def _pg_sweep_task(
         n = max(1, len(ids))
         # Build match snapshots once — identical for every sweep value/cell.
         prebuilt = await hass.async_add_executor_job(playground._build_match_snapshots, store)
-        if param_y and values_y:
+        if objective not in playground._SWEEP_OBJECTIVES:  # pylint: disable=protected-access
+            objective = "match_accuracy"
+        n_points = len(values) * (len(values_y) if param_y and values_y else 1)
+        if workers > 1 and n_points > 1 and ids:
+            payload = await _pg_sweep_parallel(
+                hass, task, store, base_config, options, price, prebuilt, workers,
+                past, param, values, objective, param_y, values_y,
+            )
+        elif param_y and values_y:
             reg.update(task, total=len(values) * len(values_y))
             grid: list[list[float | None]] = [[None] * len(values) for _ in values_y]
             current: dict[str, Any] = {}
@@ -5934,6 +6067,10 @@ def ws_start_playground_history(
         vol.Required("objective"): str,
         vol.Optional("param_y"): vol.Any(str, None),
         vol.Optional("values_y"): vol.Any([vol.Coerce(float)], None),
+        # Worker processes for the sweep; 1 (default) = the serial in-executor
+        # loop, 0 = auto (CPU count - 1, capped). The process pool is opt-in
+        # because spawning it is heavy on small hosts.
+        vol.Optional("workers", default=1): vol.All(vol.Coerce(int), vol.Range(min=0)),
     }
 )
 @callback
@@ -5942,7 +6079,8 @@ def ws_start_playground_sweep(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Kick off a detached, registry-tracked Optimize sweep; returns the task id."""
+    """Kick off a detached, registry-tracked Optimize sweep; returns the task id.
+    With more than one worker the grid is evaluated across a process pool."""
     entry_id = msg["entry_id"]
     if _playground_context(hass, entry_id) is None:
         _err_not_found(connection, msg["id"], entry_id)
@@ -5960,12 +6098,18 @@ def ws_start_playground_sweep(
     _raw = hass.async_create_task(_pg_sweep_task(
         hass, task, entry_id, msg["param"], list(msg.get("values") or []),
         msg["objective"], param_y, list(values_y) if values_y else None,
+        playground.resolve_sweep_workers(msg.get("workers", 1)),
     ))
     if _raw is not None:
         reg.link_asyncio_task(task.id, _raw)
     _send_result(connection, msg["id"], "start_playground_sweep", {"task_id": task.id})
 
 
+# How often the parallel sweep wakes to check cancel_requested while no
+# (point, cycle) pair has finished.
+_PG_SWEEP_POLL_S = 0.5
+
+
 # Readings replayed per executor job for the single-cycle detail sim. The event
 # loop breathes between chunks; a ~233min/5s dishwasher cycle (~2800 readings)
 # becomes ~11 short jobs instead of one multi-minute GIL-holding call (issue #311).
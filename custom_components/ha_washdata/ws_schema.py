@@ -191,6 +191,21 @@ class GetDiagnosticsResponse(TypedDict):
     stats: dict[str, Any]
 
 
+class PerfStageStats(TypedDict):
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    last_ms: float
+    total_ms: float
+
+
+class GetPerfStatsResponse(TypedDict):
+    since: float
+    stages: dict[str, PerfStageStats]
+
+
 class ClearDebugDataResponse(TypedDict):
     success: bool
     count: int
@@ -322,6 +337,7 @@ class GetMatchDebugResponse(TypedDict):
     confidence: float | None
     ambiguous: bool
     candidates: list[dict[str, Any]]
+    pruning: dict[str, int]
 
 
 # ─── Live power history ────────────────────────────────────────────────────────
@@ -685,6 +701,8 @@ WS_RESPONSE_TYPES: dict[str, type] = {
     "resolve_feedback": SuccessResponse,
     "dismiss_all_feedbacks": DismissAllFeedbacksResponse,
     "get_diagnostics": GetDiagnosticsResponse,
+    "get_perf_stats": GetPerfStatsResponse,
+    "reset_perf_stats": SuccessResponse,
     "reprocess_history": StartTaskResponse,
     "clear_debug_data": ClearDebugDataResponse,
     "wipe_history": SuccessResponse,
@@ -898,6 +916,8 @@ WS_COMMANDS: dict[str, dict] = {
     ]},
     "dismiss_all_feedbacks": {"params": [_entry()]},
     "get_diagnostics": {"params": [_entry()]},
+    "get_perf_stats": {"params": [_entry()]},
+    "reset_perf_stats": {"params": [_entry()]},
     "reprocess_history": {"params": [_entry()]},
     "clear_debug_data": {"params": [_entry()]},
     "wipe_history": {"params": [_entry()]},
@@ -1029,6 +1049,7 @@ WS_COMMANDS: dict[str, dict] = {
         _p("objective", "str"),
         _p("param_y", "str|null", False),
         _p("values_y", "list[float]", False),
+        _p("workers", "int", False),
     ]},
     "start_playground_cycle_detail": {"params": [
         _entry(),
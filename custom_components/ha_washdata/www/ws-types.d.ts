@@ -137,6 +137,21 @@ export interface GetDiagnosticsResponse {
   stats: Record<string, unknown>;
 }
 
+export interface PerfStageStats {
+  count: number;
+  mean_ms: number;
+  p50_ms: number;
+  p95_ms: number;
+  max_ms: number;
+  last_ms: number;
+  total_ms: number;
+}
+
+export interface GetPerfStatsResponse {
+  since: number;
+  stages: Record<string, PerfStageStats>;
+}
+
 export interface GetDtwDebugResponse {
   cycle_id: unknown;
   profile_name: string;
@@ -174,6 +189,7 @@ export interface GetMatchDebugResponse {
   confidence: number | null;
   ambiguous: boolean;
   candidates: Record<string, unknown>[];
+  pruning: Record<string, number>;
 }
 
 export interface GetMlComparisonResponse {
@@ -697,6 +713,14 @@ export interface GetDiagnosticsRequest {
   entry_id: string;
 }
 
+export interface GetPerfStatsRequest {
+  entry_id: string;
+}
+
+export interface ResetPerfStatsRequest {
+  entry_id: string;
+}
+
 export interface ReprocessHistoryRequest {
   entry_id: string;
 }
@@ -957,6 +981,7 @@ export interface StartPlaygroundSweepRequest {
   objective: string;
   param_y?: string | null;
   values_y?: number[];
+  workers?: number;
 }
 
 export interface StartPlaygroundCycleDetailRequest {
@@ -1109,6 +1134,8 @@ export interface WashDataWsRequests {
   "ha_washdata/resolve_feedback": ResolveFeedbackRequest;
   "ha_washdata/dismiss_all_feedbacks": DismissAllFeedbacksRequest;
   "ha_washdata/get_diagnostics": GetDiagnosticsRequest;
+  "ha_washdata/get_perf_stats": GetPerfStatsRequest;
+  "ha_washdata/reset_perf_stats": ResetPerfStatsRequest;
   "ha_washdata/reprocess_history": ReprocessHistoryRequest;
   "ha_washdata/clear_debug_data": ClearDebugDataRequest;
   "ha_washdata/wipe_history": WipeHistoryRequest;
@@ -1218,6 +1245,8 @@ export interface WashDataWsResponses {
   "ha_washdata/resolve_feedback": SuccessResponse;
   "ha_washdata/dismiss_all_feedbacks": DismissAllFeedbacksResponse;
   "ha_washdata/get_diagnostics": GetDiagnosticsResponse;
+  "ha_washdata/get_perf_stats": GetPerfStatsResponse;
+  "ha_washdata/reset_perf_stats": SuccessResponse;
   "ha_washdata/reprocess_history": StartTaskResponse;
   "ha_washdata/clear_debug_data": ClearDebugDataResponse;
   "ha_washdata/wipe_history": SuccessResponse;
@@ -18,11 +18,15 @@ Copyright (C) 2025 Zara-Toorox
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
+
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_time_change
 
 from .const import (
@@ -36,21 +40,34 @@ from .const import (
     DAILY_AGGREGATION_HOUR,
     DAILY_AGGREGATION_MINUTE,
     DAILY_AGGREGATION_SECOND,
+    HOURLY_AGGREGATION_MINUTE,
+    HOURLY_AGGREGATION_SECOND,
+    SERVICE_REBUILD_BILLING_HISTORY,
+    ATTR_START_DATE,
+    ATTR_END_DATE,
     FORECAST_MORNING_HOUR,
     FORECAST_MORNING_MINUTE,
     FORECAST_EVENING_HOUR,
     FORECAST_EVENING_MINUTE,
 )
-from .storage import DataValidator
+from .storage import DataValidator, TimeSeriesStore
 from .api import async_setup_views, async_setup_websocket
 from .services.daily_aggregator import DailyEnergyAggregator
 from .services.billing_calculator import BillingCalculator
+from .services.hourly_aggregator import HourlyBillingAggregator
 from .services.forecast_comparison_collector import ForecastComparisonCollector
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = []
 
+REBUILD_BILLING_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+    }
+)
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the SFML Stats component."""
@@ -62,6 +79,27 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     await async_setup_websocket(hass)
     _LOGGER.info("SFML Stats Lite Dashboard available at: /api/sfml_stats_lite/dashboard")
 
+    async def _rebuild_billing_history(call: ServiceCall) -> None:
+        """Recompute the hourly billing history of a date range."""
+        start_date: date = call.data[ATTR_START_DATE]
+        end_date: date = call.data.get(ATTR_END_DATE, date.today())
+        for entry_data in hass.data.get(DOMAIN, {}).values():
+            if isinstance(entry_data, dict) and entry_data.get("hourly_aggregator"):
+                hours = await entry_data["hourly_aggregator"].async_rebuild_range(
+                    start_date, end_date
+                )
+                _LOGGER.info(
+                    "Billing history rebuilt for %s to %s (%d hours)",
+                    start_date, end_date, hours
+                )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REBUILD_BILLING_HISTORY,
+        _rebuild_billing_history,
+        schema=REBUILD_BILLING_HISTORY_SCHEMA,
+    )
+
     return True
 
 
@@ -126,10 +164,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     aggregator = DailyEnergyAggregator(hass, config_path)
     billing_calculator = BillingCalculator(hass, config_path, entry_data=entry_config)
 
+    # Open the time-series store (migrates the legacy JSON histories once)
+    power_sources_path = config_path / "sfml_stats_lite" / "data"
+    timeseries_store = TimeSeriesStore(hass, power_sources_path)
+    try:
+        await timeseries_store.async_open()
+    except Exception as err:
+        _LOGGER.error("Failed to open time-series store: %s", err)
+        return False
+
+    hourly_aggregator = HourlyBillingAggregator(hass, config_path, timeseries_store)
+
     # Initialize Power Sources Collector with error handling
     from .power_sources_collector import PowerSourcesCollector
-    power_sources_path = config_path / "sfml_stats_lite" / "data"
-    power_sources_collector = PowerSourcesCollector(hass, entry_config, power_sources_path)
+    power_sources_collector = PowerSourcesCollector(
+        hass, entry_config, power_sources_path, timeseries_store
+    )
     try:
         await power_sources_collector.start()
     except Exception as err:
@@ -155,7 +205,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     forecast_entity_2 = entry_config.get(CONF_FORECAST_ENTITY_2)
     if forecast_entity_1 or forecast_entity_2:
         try:
-            forecast_comparison_collector = ForecastComparisonCollector(hass, config_path)
+            forecast_comparison_collector = ForecastComparisonCollector(
+                hass, config_path, timeseries_store
+            )
             _LOGGER.info("Forecast comparison collector initialized")
         except Exception as err:
             _LOGGER.error("Failed to initialize forecast comparison collector: %s", err)
@@ -163,7 +215,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = {
         "validator": validator,
         "config": entry_config,
+        "timeseries_store": timeseries_store,
         "aggregator": aggregator,
+        "hourly_aggregator": hourly_aggregator,
         "billing_calculator": billing_calculator,
         "power_sources_collector": power_sources_collector,
         "weather_collector": weather_collector,
@@ -195,6 +249,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         DAILY_AGGREGATION_MINUTE,
     )
 
+    async def _hourly_aggregation_job(now: datetime) -> None:
+        """Run hourly billing aggregation job."""
+        _LOGGER.debug("Starting scheduled hourly billing aggregation")
+        try:
+            await hourly_aggregator.async_aggregate_hourly()
+        except Exception as err:
+            _LOGGER.error("Hourly billing aggregation failed: %s", err)
+
+    cancel_hourly_job = async_track_time_change(
+        hass,
+        _hourly_aggregation_job,
+        minute=HOURLY_AGGREGATION_MINUTE,
+        second=HOURLY_AGGREGATION_SECOND,
+    )
+    hass.data[DOMAIN][entry.entry_id]["cancel_hourly_job"] = cancel_hourly_job
+
     # Schedule Forecast Comparison Jobs if collector is initialized
     if forecast_comparison_collector:
         async def _forecast_morning_job(now: datetime) -> None:
@@ -260,6 +330,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             await aggregator.async_aggregate_daily()
         except Exception as err:
             _LOGGER.error("Initial aggregation failed: %s", err)
+        # Backfills the billing hours missed while Home Assistant was down
+        try:
+            await hourly_aggregator.async_aggregate_hourly()
+        except Exception as err:
+            _LOGGER.error("Initial billing aggregation failed: %s", err)
 
     hass.async_create_background_task(
         _initial_aggregation(),
@@ -293,6 +368,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         except Exception as err:
             _LOGGER.warning("Error cancelling daily job: %s", err)
 
+    if "cancel_hourly_job" in entry_data:
+        try:
+            entry_data["cancel_hourly_job"]()
+            _LOGGER.debug("Hourly billing job cancelled")
+        except Exception as err:
+            _LOGGER.warning("Error cancelling hourly billing job: %s", err)
+
     # Cancel forecast comparison jobs
     if "cancel_morning_forecast" in entry_data:
         try:
@@ -316,6 +398,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         except Exception as err:
             _LOGGER.warning("Error stopping power sources collector: %s", err)
 
+    # Close the time-series store after its writers are stopped
+    if entry_data.get("timeseries_store"):
+        try:
+            await entry_data["timeseries_store"].async_close()
+            _LOGGER.debug("Time-series store closed")
+        except Exception as err:
+            _LOGGER.warning("Error closing time-series store: %s", err)
+
     # Weather collector doesn't need stopping (passive loader)
     if "weather_collector" in entry_data and entry_data["weather_collector"]:
         _LOGGER.debug("Weather collector cleaned up")
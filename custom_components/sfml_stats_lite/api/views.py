@@ -23,7 +23,7 @@ import json
 import logging
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 from aiohttp import web
 from homeassistant.components.http import HomeAssistantView
@@ -129,10 +129,13 @@ from ..const import (
     DEFAULT_FEED_IN_TARIFF,
     CONF_PANEL_GROUP_NAMES,
 )
+from ..utils.cache import get_file_json_cache
 
 if TYPE_CHECKING:
     from aiohttp.web import Request, Response
 
+    from ..storage import TimeSeriesStore
+
 _LOGGER = logging.getLogger(__name__)
 
 SOLAR_PATH: Path | None = None
@@ -148,6 +151,7 @@ async def async_setup_views(hass: HomeAssistant) -> None:
     config_path = Path(hass.config.path())
     SOLAR_PATH = config_path / "solar_forecast_ml"
     GRID_PATH = config_path / "grid_price_monitor"
+    get_file_json_cache().clear()
 
     _LOGGER.debug("SFML Stats paths: Solar=%s, Grid=%s", SOLAR_PATH, GRID_PATH)
 
@@ -174,23 +178,68 @@ async def async_setup_views(hass: HomeAssistant) -> None:
 
 
 async def _read_json_file(path: Path | None) -> dict | None:
-    """Read a JSON file asynchronously."""
+    """Read a JSON file through the shared mtime-invalidated cache.
+
+    The returned document is shared with other requests - do not modify it.
+    """
     if path is None:
         _LOGGER.warning("Path is None - was async_setup_views called?")
         return None
-    if not path.exists():
-        _LOGGER.debug("File not found: %s", path)
-        return None
-    try:
-        import aiofiles
-        async with aiofiles.open(path, "r", encoding="utf-8") as f:
-            content = await f.read()
-            data = json.loads(content)
-            _LOGGER.debug("Successfully loaded: %s (%d bytes)", path, len(content))
-            return data
-    except Exception as e:
-        _LOGGER.error("Error reading %s: %s", path, e)
-        return None
+    data = await get_file_json_cache().read(HASS, path)
+    if data is None:
+        _LOGGER.debug("File not found or unreadable: %s", path)
+    return data
+
+
+def _if_none_match(request: Request, etag: str) -> bool:
+    """Check whether the client already holds the representation ``etag``."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in header.split(",")
+    )
+
+
+async def _conditional_json_response(
+    request: Request,
+    key: str,
+    paths: list[Path],
+    build: Callable[[], Awaitable[dict[str, Any]]],
+    *parts: Any,
+) -> Response:
+    """Serve a file-backed view with ETag/304 support.
+
+    The ETag covers the request query, today's date (date cutoffs), any
+    extra ``parts`` and the signatures of the source ``paths``. If the
+    client's copy is current a 304 is returned without building anything;
+    otherwise a previously serialized body with the same ETag is reused
+    and ``build`` only runs when a source file actually changed. The
+    payload's ``timestamp`` is added per response, so reused bodies do not
+    carry the time they were built.
+    """
+    cache = get_file_json_cache()
+    etag = await cache.async_etag(
+        HASS, key, request.query_string, date.today().isoformat(), *parts, paths=paths
+    )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if _if_none_match(request, etag):
+        return web.Response(status=304, headers=headers)
+
+    cache_key = f"{key}?{request.query_string}"
+    body = cache.get_response(cache_key, etag)
+    if body is None:
+        body = json.dumps(await build()).encode("utf-8")
+        cache.set_response(cache_key, etag, body)
+
+    # Splice the response time into the stored object body.
+    stamp = json.dumps({"timestamp": datetime.now().isoformat()}).encode("utf-8")
+    body = stamp[:-1] + b", " + body[1:] if body != b"{}" else stamp
+
+    return web.Response(body=body, content_type="application/json", headers=headers)
 
 
 class DashboardView(HomeAssistantView):
@@ -406,12 +455,29 @@ class SolarDataView(HomeAssistantView):
     @local_only
     async def get(self, request: Request) -> Response:
         """Return solar data."""
+        return await _conditional_json_response(
+            request,
+            self.name,
+            [
+                SOLAR_PATH / "stats" / "daily_forecasts.json",
+                SOLAR_PATH / "stats" / "daily_summaries.json",
+                SOLAR_PATH / "stats" / "hourly_predictions.json",
+                SOLAR_PATH / "stats" / "hourly_weather_actual.json",
+                SOLAR_PATH / "stats" / "weather_forecast_corrected.json",
+                SOLAR_PATH / "ai" / "learned_weights.json",
+                SOLAR_PATH / "stats" / "astronomy_cache.json",
+                SOLAR_PATH / "stats" / "multi_day_hourly_forecast.json",
+            ],
+            lambda: self._build(request),
+        )
+
+    async def _build(self, request: Request) -> dict[str, Any]:
+        """Build the solar data payload."""
         days = int(request.query.get("days", 7))
         include_hourly = request.query.get("hourly", "true").lower() == "true"
 
         result = {
             "success": True,
-            "timestamp": datetime.now().isoformat(),
             "data": {},
         }
 
@@ -523,7 +589,7 @@ class SolarDataView(HomeAssistantView):
         if multi_day and "days" in multi_day:
             result["data"]["multi_day_hourly"] = multi_day["days"]
 
-        return web.json_response(result)
+        return result
 
 
 class PriceDataView(HomeAssistantView):
@@ -591,9 +657,23 @@ class SummaryDataView(HomeAssistantView):
     @local_only
     async def get(self, request: Request) -> Response:
         """Return a summary for the dashboard."""
+        return await _conditional_json_response(
+            request,
+            self.name,
+            [
+                SOLAR_PATH / "stats" / "daily_summaries.json",
+                GRID_PATH / "data" / "price_history.json",
+                SOLAR_PATH / "ai" / "learned_weights.json",
+                SOLAR_PATH / "stats" / "astronomy_cache.json",
+                SOLAR_PATH / "stats" / "daily_forecasts.json",
+            ],
+            self._build,
+        )
+
+    async def _build(self) -> dict[str, Any]:
+        """Build the dashboard summary payload."""
         result = {
             "success": True,
-            "timestamp": datetime.now().isoformat(),
             "kpis": {},
             "today": {},
             "week": {},
@@ -690,7 +770,7 @@ class SummaryDataView(HomeAssistantView):
                 "sunset": extract_time(today_astronomy.get("sunset_local")),
             }
 
-        return web.json_response(result)
+        return result
 
 
 class RealtimeDataView(HomeAssistantView):
@@ -776,6 +856,17 @@ def _get_config() -> dict[str, Any]:
     return {}
 
 
+def _get_timeseries_store() -> TimeSeriesStore | None:
+    """Get the time-series store of the first loaded config entry."""
+    if HASS is None:
+        return None
+
+    for entry_data in HASS.data.get(DOMAIN, {}).values():
+        if isinstance(entry_data, dict) and entry_data.get("timeseries_store"):
+            return entry_data["timeseries_store"]
+    return None
+
+
 def _get_sensor_value(entity_id: str | None) -> float | None:
     """Read current value from a sensor."""
     if not entity_id or not HASS:
@@ -1015,10 +1106,22 @@ class StatisticsView(HomeAssistantView):
     @local_only
     async def get(self, request: Request) -> Response:
         """Return statistics data from Solar Forecast ML JSON files."""
+        return await _conditional_json_response(
+            request,
+            self.name,
+            [
+                SOLAR_PATH / "stats" / "daily_forecasts.json",
+                SOLAR_PATH / "stats" / "hourly_predictions.json",
+            ],
+            self._build,
+            sorted((_get_config().get(CONF_PANEL_GROUP_NAMES) or {}).items()),
+        )
+
+    async def _build(self) -> dict[str, Any]:
+        """Build the statistics payload."""
         # Normal statistics response
         result = {
             "success": True,
-            "timestamp": datetime.now().isoformat(),
             "peaks": {},
             "production": {},
             "statistics": {},
@@ -1081,7 +1184,7 @@ class StatisticsView(HomeAssistantView):
 
         result["panel_groups"] = await self._get_panel_group_data()
 
-        return web.json_response(result)
+        return result
 
     async def _get_panel_group_data(self) -> dict[str, Any]:
         """Extract panel group predictions and actuals for today."""
@@ -1215,6 +1318,25 @@ class BillingDataView(HomeAssistantView):
                 "error": str(err),
             })
 
+        # Optional hourly rows for a date range (?start=YYYY-MM-DD&end=YYYY-MM-DD)
+        start = request.query.get("start")
+        if start:
+            store = _get_timeseries_store()
+            try:
+                start_day = date.fromisoformat(start)
+                end_day = date.fromisoformat(request.query.get("end", start))
+            except ValueError:
+                return web.json_response({
+                    "success": False,
+                    "error": "Invalid start/end date",
+                }, status=400)
+            hourly = {}
+            if store is not None:
+                hourly = await store.async_get_billing_hours(
+                    start_day.isoformat(), (end_day + timedelta(days=1)).isoformat()
+                )
+            billing_data = {**billing_data, "hourly": hourly}
+
         return web.json_response(billing_data)
 
 
@@ -1315,7 +1437,7 @@ class PowerSourcesHistoryView(HomeAssistantView):
                     _LOGGER.info("Got %d entries from power sources collector", len(collector_data))
                 else:
                     # Last resort: try hourly file fallback
-                    file_data = await self._get_hourly_history_from_file()
+                    file_data = await self._get_hourly_billing_history(hours)
                     if file_data:
                         processed_data = file_data
                         data_source = "hourly_file"
@@ -1404,76 +1526,48 @@ class PowerSourcesHistoryView(HomeAssistantView):
 
         return result
 
-    async def _get_hourly_history_from_file(self) -> list[dict]:
-        """Get hourly history from our own data file as alternative."""
+    async def _get_hourly_billing_history(self, hours: int) -> list[dict]:
+        """Get hourly billing history from the time-series store as alternative."""
         try:
-            hourly_path = Path(HASS.config.path()) / "sfml_stats_lite" / "data" / "hourly_billing_history.json"
-
-            if not hourly_path.exists():
+            store = _get_timeseries_store()
+            if store is None:
                 return []
 
-            import aiofiles
-            import json
-
-            async with aiofiles.open(hourly_path, 'r') as f:
-                content = await f.read()
-                data = json.loads(content)
-
-            hours_data = data.get("hours", {})
+            start = (datetime.now() - timedelta(hours=hours)).strftime("%Y-%m-%dT%H:00")
+            hours_data = await store.async_get_billing_hours(start)
             result = []
 
-            for hour_key, hour_data in sorted(hours_data.items()):
+            for hour_key, hour_data in hours_data.items():
                 result.append({
                     "timestamp": hour_key + ":00",
-                    "solar_to_house": hour_data.get("solar_to_house_kwh", 0) * 1000,  # Convert to W (avg)
-                    "battery_to_house": hour_data.get("battery_to_house_kwh", 0) * 1000,
-                    "grid_to_house": hour_data.get("grid_to_house_kwh", 0) * 1000,
-                    "home_consumption": hour_data.get("home_consumption_kwh", 0) * 1000,
+                    "solar_to_house": (hour_data.get("solar_to_house_kwh") or 0) * 1000,  # Convert to W (avg)
+                    "battery_to_house": (hour_data.get("battery_to_house_kwh") or 0) * 1000,
+                    "grid_to_house": (hour_data.get("grid_to_house_kwh") or 0) * 1000,
+                    "home_consumption": (hour_data.get("home_consumption_kwh") or 0) * 1000,
                     "battery_soc": None,
                 })
 
             return result
         except Exception as e:
-            _LOGGER.error("Error reading hourly history file: %s", e)
+            _LOGGER.error("Error reading hourly billing history: %s", e)
             return []
 
     async def _get_power_sources_collector_data(self, hours: int) -> list[dict]:
-        """Get data from power sources collector file."""
+        """Get power sources collector samples from the time-series store."""
         try:
-            collector_path = Path(HASS.config.path()) / "sfml_stats_lite" / "data" / "power_sources_history.json"
-
-            if not collector_path.exists():
-                _LOGGER.debug("Power sources collector file not found")
-                return []
-
-            import aiofiles
-            import json
-
-            async with aiofiles.open(collector_path, 'r') as f:
-                content = await f.read()
-                data = json.loads(content)
-
-            data_points = data.get("data_points", [])
-            if not data_points:
+            store = _get_timeseries_store()
+            if store is None:
+                _LOGGER.debug("Time-series store not available")
                 return []
 
-            # Filter by time
             cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-            filtered = []
-
-            for dp in data_points:
-                try:
-                    ts = datetime.fromisoformat(dp["timestamp"].replace('Z', '+00:00'))
-                    if ts > cutoff:
-                        filtered.append(dp)
-                except (ValueError, KeyError):
-                    continue
+            samples = await store.async_get_power_samples(cutoff)
 
-            _LOGGER.debug("Power sources collector: %d points after filtering", len(filtered))
-            return sorted(filtered, key=lambda x: x["timestamp"])
+            _LOGGER.debug("Power sources collector: %d points in range", len(samples))
+            return samples
 
         except Exception as e:
-            _LOGGER.error("Error reading power sources collector file: %s", e)
+            _LOGGER.error("Error reading power sources collector data: %s", e)
             return []
 
     def _process_history(
@@ -1574,53 +1668,50 @@ class EnergySourcesDailyStatsView(HomeAssistantView):
             if collector is None:
                 # Fallback: read directly from file
                 data_path = Path(HASS.config.path()) / "sfml_stats_lite" / "data" / "energy_sources_daily_stats.json"
-                if data_path.exists():
-                    import aiofiles
-                    async with aiofiles.open(data_path, 'r') as f:
-                        content = await f.read()
-                        daily_stats = json.loads(content)
-                else:
-                    daily_stats = {"days": {}}
+                daily_stats = await _read_json_file(data_path) or {"days": {}}
             else:
                 daily_stats = await collector.get_daily_stats(days)
 
+            # Cached documents are shared - merge into a copy of the day map
+            stats_days = dict(daily_stats.get("days", {}))
+
             # Merge with daily_energy_history.json for more complete data
             history_path = Path(HASS.config.path()) / "sfml_stats_lite" / "data" / "daily_energy_history.json"
-            if history_path.exists():
-                import aiofiles
-                async with aiofiles.open(history_path, 'r') as f:
-                    content = await f.read()
-                    history_data = json.loads(content)
-                    history_days = history_data.get("days", {})
-
-                    # Merge history data into daily_stats (add missing days)
-                    for date_str, day_data in history_days.items():
-                        if date_str not in daily_stats.get("days", {}):
-                            # Convert history format to daily_stats format
-                            daily_stats.setdefault("days", {})[date_str] = {
-                                "date": date_str,
-                                "solar_to_house_kwh": day_data.get("solar_to_house_kwh", 0),
-                                "solar_to_battery_kwh": day_data.get("battery_charge_solar_kwh", 0),
-                                "battery_to_house_kwh": day_data.get("battery_to_house_kwh", 0),
-                                "battery_charge_grid_kwh": day_data.get("battery_charge_grid_kwh", 0),
-                                "grid_to_house_kwh": day_data.get("grid_import_kwh", 0),
-                                "grid_export_kwh": day_data.get("grid_export_kwh", 0),
-                                "home_consumption_kwh": day_data.get("home_consumption_kwh", 0),
-                                "solar_yield_kwh": day_data.get("solar_yield_kwh", 0),
-                                "price_ct_kwh": day_data.get("price_ct_kwh", 0),
-                                "autarky_percent": day_data.get("autarky_percent", 0),
-                                "self_consumption_percent": day_data.get("self_consumption_percent", 0),
-                                "avg_soc": day_data.get("avg_soc", 0),
-                                "min_soc": day_data.get("min_soc", 0),
-                                "max_soc": day_data.get("max_soc", 0),
+            history_data = await _read_json_file(history_path)
+            if history_data:
+                history_days = history_data.get("days", {})
+
+                # Merge history data into daily_stats (add missing days)
+                for date_str, day_data in history_days.items():
+                    if date_str not in stats_days:
+                        # Convert history format to daily_stats format
+                        stats_days[date_str] = {
+                            "date": date_str,
+                            "solar_to_house_kwh": day_data.get("solar_to_house_kwh", 0),
+                            "solar_to_battery_kwh": day_data.get("battery_charge_solar_kwh", 0),
+                            "battery_to_house_kwh": day_data.get("battery_to_house_kwh", 0),
+                            "battery_charge_grid_kwh": day_data.get("battery_charge_grid_kwh", 0),
+                            "grid_to_house_kwh": day_data.get("grid_import_kwh", 0),
+                            "grid_export_kwh": day_data.get("grid_export_kwh", 0),
+                            "home_consumption_kwh": day_data.get("home_consumption_kwh", 0),
+                            "solar_yield_kwh": day_data.get("solar_yield_kwh", 0),
+                            "price_ct_kwh": day_data.get("price_ct_kwh", 0),
+                            "autarky_percent": day_data.get("autarky_percent", 0),
+                            "self_consumption_percent": day_data.get("self_consumption_percent", 0),
+                            "avg_soc": day_data.get("avg_soc", 0),
+                            "min_soc": day_data.get("min_soc", 0),
+                            "max_soc": day_data.get("max_soc", 0),
+                            "peak_battery_power_w": day_data.get("peak_battery_power_w", 0),
+                            "peak_consumption_w": 0,
+                        }
+                    else:
+                        # Merge additional fields from history into existing day data
+                        existing = stats_days[date_str]
+                        if existing.get("peak_battery_power_w") is None or existing.get("peak_battery_power_w") == 0:
+                            stats_days[date_str] = {
+                                **existing,
                                 "peak_battery_power_w": day_data.get("peak_battery_power_w", 0),
-                                "peak_consumption_w": 0,
                             }
-                        else:
-                            # Merge additional fields from history into existing day data
-                            existing = daily_stats["days"][date_str]
-                            if existing.get("peak_battery_power_w") is None or existing.get("peak_battery_power_w") == 0:
-                                existing["peak_battery_power_w"] = day_data.get("peak_battery_power_w", 0)
 
             # Also get current sensor values for real-time display
             config = _get_config()
@@ -1644,7 +1735,7 @@ class EnergySourcesDailyStatsView(HomeAssistantView):
                 "success": True,
                 "timestamp": datetime.now().isoformat(),
                 "days_requested": days,
-                "daily_stats": daily_stats.get("days", {}),
+                "daily_stats": stats_days,
                 "current_values": current_values,
             })
 
@@ -1825,7 +1916,7 @@ class ForecastComparisonView(HomeAssistantView):
                     "error": "HASS not initialized",
                 }, status=500)
 
-            reader = ForecastComparisonReader(config_path)
+            reader = ForecastComparisonReader(config_path, _get_timeseries_store())
 
             if not reader.is_available:
                 return web.json_response({
@@ -20,19 +20,34 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
+
+import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_interval,
+)
+
+from ..const import (
+    DOMAIN,
+    ENERGY_FLOW_SENSORS,
+    WS_DEFAULT_INTERVAL_SECONDS,
+    WS_STATE_DEBOUNCE_SECONDS,
+)
+from ..utils.cache import get_file_json_cache
 
 if TYPE_CHECKING:
     from homeassistant.components.websocket_api import ActiveConnection
 
 _LOGGER = logging.getLogger(__name__)
 
-_subscriptions: dict[str, set] = {}
+_publisher: RealtimePublisher | None = None
 
 
 def _get_config_paths(hass: HomeAssistant) -> tuple[Path, Path]:
@@ -43,8 +58,218 @@ def _get_config_paths(hass: HomeAssistant) -> tuple[Path, Path]:
     return solar_path, grid_path
 
 
+def _get_config(hass: HomeAssistant) -> dict[str, Any]:
+    """Get current configuration from the first config entry."""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if isinstance(entry_data, dict) and "config" in entry_data:
+            return entry_data["config"]
+
+    config_entries = hass.config_entries.async_entries(DOMAIN)
+    if config_entries:
+        return dict(config_entries[0].data)
+    return {}
+
+
+def _pointer_token(key: Any) -> str:
+    """Escape a key for use in a JSON pointer."""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _json_patch(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """Build JSON-patch style operations that turn ``old`` into ``new``.
+
+    Dicts are compared key by key; any other changed value (including
+    lists) is replaced as a whole.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = [
+            {"op": "remove", "path": f"{path}/{_pointer_token(key)}"}
+            for key in old
+            if key not in new
+        ]
+        for key, value in new.items():
+            child = f"{path}/{_pointer_token(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(_json_patch(old[key], value, child))
+        return ops
+
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+class _Subscriber:
+    """State of one ``sfml_stats_lite/subscribe`` subscription."""
+
+    __slots__ = ("connection", "msg_id", "interval", "delta", "last_data")
+
+    def __init__(
+        self, connection: ActiveConnection, msg_id: int, interval: int, delta: bool
+    ) -> None:
+        self.connection = connection
+        self.msg_id = msg_id
+        self.interval = interval
+        self.delta = delta
+        self.last_data: dict[str, Any] | None = None
+
+
+class RealtimePublisher:
+    """Shared realtime publisher for all WebSocket subscribers.
+
+    The realtime payload is computed once per tick and fanned out to every
+    subscriber. Ticks are triggered by state changes of the configured
+    energy flow sensors (debounced) and by a fallback timer at the shortest
+    subscriber interval, which picks up file and clock driven fields.
+    Subscribers only receive a message when their view of the payload
+    changed: the full payload (``update``) by default, or ``delta``
+    messages with JSON-patch style operations after an initial
+    ``snapshot`` when they subscribed with ``delta: true``.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the publisher."""
+        self._hass = hass
+        self._subscribers: dict[tuple[int, int], _Subscriber] = {}
+        self._tracked_entities: list[str] = []
+        self._timer_interval: int | None = None
+        self._unsub_state: Callable[[], None] | None = None
+        self._unsub_timer: Callable[[], None] | None = None
+        self._unsub_debounce: Callable[[], None] | None = None
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Return the number of active subscribers."""
+        return len(self._subscribers)
+
+    @callback
+    def subscribe(
+        self,
+        connection: ActiveConnection,
+        msg_id: int,
+        interval: int,
+        delta: bool,
+    ) -> Callable[[], None]:
+        """Add a subscriber and return its unsubscribe callback.
+
+        The subscriber receives its initial payload with the next refresh.
+        """
+        key = (id(connection), msg_id)
+        self._subscribers[key] = _Subscriber(connection, msg_id, interval, delta)
+        self._update_listeners()
+
+        @callback
+        def unsubscribe() -> None:
+            self._subscribers.pop(key, None)
+            self._update_listeners()
+
+        return unsubscribe
+
+    @callback
+    def _update_listeners(self) -> None:
+        """Start, stop or retarget the state and timer listeners."""
+        if not self._subscribers:
+            self._stop_listeners()
+            return
+
+        config = _get_config(self._hass)
+        entities = sorted({config[key] for key in ENERGY_FLOW_SENSORS if config.get(key)})
+        if entities != self._tracked_entities:
+            if self._unsub_state is not None:
+                self._unsub_state()
+                self._unsub_state = None
+            if entities:
+                self._unsub_state = async_track_state_change_event(
+                    self._hass, entities, self._handle_state_change
+                )
+            self._tracked_entities = entities
+
+        interval = min(sub.interval for sub in self._subscribers.values())
+        if interval != self._timer_interval:
+            if self._unsub_timer is not None:
+                self._unsub_timer()
+            self._unsub_timer = async_track_time_interval(
+                self._hass, self._handle_timer, timedelta(seconds=interval)
+            )
+            self._timer_interval = interval
+
+    @callback
+    def _stop_listeners(self) -> None:
+        """Cancel all listeners."""
+        for unsub in (self._unsub_state, self._unsub_timer, self._unsub_debounce):
+            if unsub is not None:
+                unsub()
+        self._unsub_state = None
+        self._unsub_timer = None
+        self._unsub_debounce = None
+        self._tracked_entities = []
+        self._timer_interval = None
+
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        """Schedule a debounced refresh on a sensor state change."""
+        if self._unsub_debounce is None:
+            self._unsub_debounce = async_call_later(
+                self._hass, WS_STATE_DEBOUNCE_SECONDS, self._handle_debounced
+            )
+
+    async def _handle_debounced(self, now: datetime) -> None:
+        """Refresh after the debounce delay."""
+        self._unsub_debounce = None
+        await self.async_refresh()
+
+    async def _handle_timer(self, now: datetime) -> None:
+        """Fallback refresh for file and clock driven fields."""
+        await self.async_refresh()
+
+    async def async_refresh(self) -> None:
+        """Compute the realtime payload once and push it to all subscribers."""
+        async with self._refresh_lock:
+            if not self._subscribers:
+                return
+            self._update_listeners()
+
+            data = await _get_realtime_data(self._hass)
+            timestamp = datetime.now().isoformat()
+
+            for key, sub in list(self._subscribers.items()):
+                try:
+                    self._send(sub, data, timestamp)
+                except Exception as e:
+                    _LOGGER.error("Error sending WebSocket update: %s", e)
+                    self._subscribers.pop(key, None)
+
+            if not self._subscribers:
+                self._stop_listeners()
+
+    @staticmethod
+    def _send(sub: _Subscriber, data: dict[str, Any], timestamp: str) -> None:
+        """Send ``data`` to one subscriber if its last payload differs."""
+        if sub.delta and sub.last_data is not None:
+            ops = _json_patch(sub.last_data, data)
+            if not ops:
+                return
+            payload = {"type": "delta", "timestamp": timestamp, "ops": ops}
+        else:
+            if sub.last_data is not None and not _json_patch(sub.last_data, data):
+                return
+            payload = {
+                "type": "snapshot" if sub.delta else "update",
+                "timestamp": timestamp,
+                "data": data,
+            }
+
+        sub.connection.send_message(websocket_api.event_message(sub.msg_id, payload))
+        sub.last_data = data
+
+
 async def async_setup_websocket(hass: HomeAssistant) -> None:
     """Register WebSocket commands."""
+    global _publisher
+
+    _publisher = RealtimePublisher(hass)
     websocket_api.async_register_command(hass, websocket_subscribe_updates)
     websocket_api.async_register_command(hass, websocket_get_dashboard_data)
     _LOGGER.info("SFML Stats WebSocket commands registered")
@@ -52,8 +277,11 @@ async def async_setup_websocket(hass: HomeAssistant) -> None:
 
 @websocket_api.websocket_command(
     {
-        "type": "sfml_stats_lite/subscribe",
-        "interval": int,
+        vol.Required("type"): "sfml_stats_lite/subscribe",
+        vol.Optional("interval", default=WS_DEFAULT_INTERVAL_SECONDS): vol.All(
+            int, vol.Range(min=1)
+        ),
+        vol.Optional("delta", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -64,41 +292,21 @@ async def websocket_subscribe_updates(
 ) -> None:
     """Subscribe to realtime updates."""
     msg_id = msg["id"]
-    interval = msg.get("interval", 30)
+    interval = msg["interval"]
+    delta = msg["delta"]
 
-    _LOGGER.debug("WebSocket Subscribe: msg_id=%s, interval=%s", msg_id, interval)
+    _LOGGER.debug(
+        "WebSocket Subscribe: msg_id=%s, interval=%s, delta=%s", msg_id, interval, delta
+    )
 
-    connection.send_result(msg_id, {"subscribed": True, "interval": interval})
+    connection.send_result(
+        msg_id, {"subscribed": True, "interval": interval, "delta": delta}
+    )
 
-    async def send_updates():
-        """Send periodic updates."""
-        while True:
-            try:
-                data = await _get_realtime_data(hass)
-                connection.send_message(
-                    websocket_api.event_message(
-                        msg_id,
-                        {
-                            "type": "update",
-                            "timestamp": datetime.now().isoformat(),
-                            "data": data,
-                        }
-                    )
-                )
-                await asyncio.sleep(interval)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                _LOGGER.error("Error sending WebSocket update: %s", e)
-                break
-
-    task = asyncio.create_task(send_updates())
-
-    @callback
-    def on_disconnect():
-        task.cancel()
-
-    connection.subscriptions[msg_id] = on_disconnect
+    connection.subscriptions[msg_id] = _publisher.subscribe(
+        connection, msg_id, interval, delta
+    )
+    await _publisher.async_refresh()
 
 
 @websocket_api.websocket_command(
@@ -169,6 +377,7 @@ async def websocket_get_dashboard_data(
 async def _get_realtime_data(hass: HomeAssistant) -> dict:
     """Collect realtime data for WebSocket updates."""
     solar_path, grid_path = _get_config_paths(hass)
+    file_cache = get_file_json_cache()
 
     data = {
         "hour": datetime.now().hour,
@@ -176,46 +385,53 @@ async def _get_realtime_data(hass: HomeAssistant) -> dict:
     }
 
     try:
-        import aiofiles
-
-        predictions_path = solar_path / "stats" / "hourly_predictions.json"
-        if predictions_path.exists():
-            async with aiofiles.open(predictions_path, "r") as f:
-                predictions = json.loads(await f.read())
-                now = datetime.now()
-                current = next(
-                    (p for p in predictions.get("predictions", [])
-                     if p.get("target_date") == now.date().isoformat()
-                     and p.get("target_hour") == now.hour),
-                    None
-                )
-                if current:
-                    data["solar"] = {
-                        "prediction": current.get("prediction_kwh", 0),
-                        "actual": current.get("actual_kwh"),
-                        "clouds": current.get("weather_forecast", {}).get("clouds", 0),
-                        "radiation": current.get("weather_forecast", {}).get("solar_radiation_wm2", 0),
-                    }
-
-        prices_path = grid_path / "data" / "price_history.json"
-        if prices_path.exists():
-            async with aiofiles.open(prices_path, "r") as f:
-                prices = json.loads(await f.read())
-                if prices.get("prices"):
-                    latest = prices["prices"][-1]
-                    data["price"] = {
-                        "current": latest.get("price_net", 0),
-                        "hour": latest.get("hour"),
-                    }
-
-        weather_path = solar_path / "stats" / "hourly_weather_actual.json"
-        if weather_path.exists():
-            async with aiofiles.open(weather_path, "r") as f:
-                weather = json.loads(await f.read())
-                today = datetime.now().date().isoformat()
-                hour = str(datetime.now().hour)
-                if today in weather.get("hourly_data", {}) and hour in weather["hourly_data"][today]:
-                    data["weather"] = weather["hourly_data"][today][hour]
+        predictions = await file_cache.read(hass, solar_path / "stats" / "hourly_predictions.json")
+        if predictions:
+            now = datetime.now()
+            current = next(
+                (p for p in predictions.get("predictions", [])
+                 if p.get("target_date") == now.date().isoformat()
+                 and p.get("target_hour") == now.hour),
+                None
+            )
+            if current:
+                data["solar"] = {
+                    "prediction": current.get("prediction_kwh", 0),
+                    "actual": current.get("actual_kwh"),
+                    "clouds": current.get("weather_forecast", {}).get("clouds", 0),
+                    "radiation": current.get("weather_forecast", {}).get("solar_radiation_wm2", 0),
+                }
+
+        prices = await file_cache.read(hass, grid_path / "data" / "price_history.json")
+        if prices and prices.get("prices"):
+            latest = prices["prices"][-1]
+            data["price"] = {
+                "current": latest.get("price_net", 0),
+                "hour": latest.get("hour"),
+            }
+
+        weather = await file_cache.read(hass, solar_path / "stats" / "hourly_weather_actual.json")
+        if weather:
+            today = datetime.now().date().isoformat()
+            hour = str(datetime.now().hour)
+            if today in weather.get("hourly_data", {}) and hour in weather["hourly_data"][today]:
+                data["weather"] = weather["hourly_data"][today][hour]
+
+        # Current values of the configured energy flow sensors
+        config = _get_config(hass)
+        sensors = {}
+        for conf_key in ENERGY_FLOW_SENSORS:
+            entity_id = config.get(conf_key)
+            if not entity_id:
+                continue
+            state = hass.states.get(entity_id)
+            try:
+                value = float(state.state) if state is not None else None
+            except (ValueError, TypeError):
+                value = None
+            sensors[conf_key.removeprefix("sensor_")] = value
+        if sensors:
+            data["sensors"] = sensors
 
     except Exception as e:
         _LOGGER.error("Error getting realtime data: %s", e)
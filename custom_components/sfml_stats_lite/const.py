@@ -57,6 +57,12 @@ SFML_STATS_DATA: Final = SFML_STATS_BASE / "data"
 
 DAILY_ENERGY_HISTORY: Final = "daily_energy_history.json"
 HOURLY_BILLING_HISTORY: Final = "hourly_billing_history.json"
+POWER_SOURCES_HISTORY: Final = "power_sources_history.json"
+TIMESERIES_DB: Final = "timeseries.db"
+
+# Longest gap of missed billing hours backfilled by one hourly aggregation
+# (the recorder keeps 10 days of states by default)
+BILLING_BACKFILL_MAX_HOURS: Final = 240
 
 EXPORT_DIRECTORIES: Final = [
     SFML_STATS_BASE,
@@ -232,8 +238,13 @@ POWER_DATA_RETENTION_DAYS: Final = 7
 
 # API Caching
 API_CACHE_TTL_SECONDS: Final = 30
+API_RESPONSE_CACHE_SIZE: Final = 32  # Serialized view responses kept for ETag hits
 MAX_HISTORY_HOURS: Final = 168  # 7 days
 
+# WebSocket realtime updates
+WS_DEFAULT_INTERVAL_SECONDS: Final = 30  # Fallback refresh without state changes
+WS_STATE_DEBOUNCE_SECONDS: Final = 1.0  # Coalesce bursts of sensor state changes
+
 # Weather
 WEATHER_HISTORY_DAYS: Final = 365
 SUN_HOURS_RADIATION_THRESHOLD: Final = 100  # W/m²
@@ -246,6 +257,13 @@ FILE_RETRY_DELAY_SECONDS: Final = 0.1
 DAILY_AGGREGATION_HOUR: Final = 23
 DAILY_AGGREGATION_MINUTE: Final = 55
 DAILY_AGGREGATION_SECOND: Final = 0
+HOURLY_AGGREGATION_MINUTE: Final = 1
+HOURLY_AGGREGATION_SECOND: Final = 0
+
+# Services
+SERVICE_REBUILD_BILLING_HISTORY: Final = "rebuild_billing_history"
+ATTR_START_DATE: Final = "start_date"
+ATTR_END_DATE: Final = "end_date"
 
 # =============================================================================
 # Forecast Comparison Constants
@@ -23,6 +23,8 @@ import aiofiles
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
+    from .storage import TimeSeriesStore
+
 from .const import (
     CONF_SENSOR_SOLAR_POWER,
     CONF_SENSOR_SOLAR_TO_HOUSE,
@@ -46,12 +48,18 @@ MAX_DATA_AGE_DAYS = 7
 class PowerSourcesCollector:
     """Collects power sources data periodically."""
 
-    def __init__(self, hass: HomeAssistant, config: dict[str, Any], data_path: Path) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: dict[str, Any],
+        data_path: Path,
+        store: TimeSeriesStore,
+    ) -> None:
         """Initialize the collector."""
         self.hass = hass
         self.config = config
         self.data_path = data_path
-        self.data_file = data_path / "power_sources_history.json"
+        self.store = store
         self.daily_stats_file = data_path / "energy_sources_daily_stats.json"
         self._task: asyncio.Task | None = None
         self._running = False
@@ -72,18 +80,6 @@ class PowerSourcesCollector:
         """Ensure data directory and files exist on first installation."""
         self.data_path.mkdir(parents=True, exist_ok=True)
 
-        # Initialize power_sources_history.json if not exists
-        if not self.data_file.exists():
-            initial_data = {
-                "version": 2,
-                "created": datetime.now(timezone.utc).isoformat(),
-                "last_updated": None,
-                "points_count": 0,
-                "data_points": []
-            }
-            await self._save_json(self.data_file, initial_data)
-            _LOGGER.info("Created power_sources_history.json")
-
         # Initialize energy_sources_daily_stats.json if not exists
         if not self.daily_stats_file.exists():
             initial_stats = {
@@ -158,25 +154,9 @@ class PowerSourcesCollector:
             "battery_soc": battery_soc,
         }
 
-        # Load existing data
-        data = await self._load_data()
-
-        # Add new data point
-        data["data_points"].append(data_point)
-
-        # Clean old data
-        cutoff = now - timedelta(days=MAX_DATA_AGE_DAYS)
-        data["data_points"] = [
-            dp for dp in data["data_points"]
-            if datetime.fromisoformat(dp["timestamp"].replace('Z', '+00:00')) > cutoff
-        ]
-
-        # Update metadata
-        data["last_updated"] = now.isoformat()
-        data["points_count"] = len(data["data_points"])
-
-        # Save data
-        await self._save_data(data)
+        # Append the sample and drop samples past the retention window
+        await self.store.async_append_power_sample(now, data_point)
+        await self.store.async_purge_power_samples(now - timedelta(days=MAX_DATA_AGE_DAYS))
 
         _LOGGER.debug(
             "Collected power data: solar_power=%.1f, solar_to_house=%.1f, solar_to_battery=%.1f, battery=%.1f, grid=%.1f, consumption=%.1f, soc=%s",
@@ -202,53 +182,10 @@ class PowerSourcesCollector:
         except (ValueError, TypeError):
             return None
 
-    async def _load_data(self) -> dict[str, Any]:
-        """Load existing data from file."""
-        if not self.data_file.exists():
-            return {
-                "version": 1,
-                "created": datetime.now(timezone.utc).isoformat(),
-                "last_updated": None,
-                "points_count": 0,
-                "data_points": []
-            }
-
-        try:
-            async with aiofiles.open(self.data_file, 'r') as f:
-                content = await f.read()
-                return json.loads(content)
-        except Exception as e:
-            _LOGGER.error("Error loading power sources data: %s", e)
-            return {
-                "version": 1,
-                "created": datetime.now(timezone.utc).isoformat(),
-                "last_updated": None,
-                "points_count": 0,
-                "data_points": []
-            }
-
-    async def _save_data(self, data: dict[str, Any]) -> None:
-        """Save data to file."""
-        self.data_path.mkdir(parents=True, exist_ok=True)
-
-        try:
-            async with aiofiles.open(self.data_file, 'w') as f:
-                await f.write(json.dumps(data, indent=2))
-        except Exception as e:
-            _LOGGER.error("Error saving power sources data: %s", e)
-
     async def get_history(self, hours: int = 24) -> list[dict[str, Any]]:
         """Get historical data for the specified number of hours."""
-        data = await self._load_data()
-
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-
-        filtered = [
-            dp for dp in data.get("data_points", [])
-            if datetime.fromisoformat(dp["timestamp"].replace('Z', '+00:00')) > cutoff
-        ]
-
-        return sorted(filtered, key=lambda x: x["timestamp"])
+        return await self.store.async_get_power_samples(cutoff)
 
     async def _update_daily_stats(self, now: datetime, data_point: dict[str, Any]) -> None:
         """Update daily statistics with current data point."""
@@ -14,7 +14,7 @@ import logging
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiofiles
 
@@ -24,6 +24,9 @@ from ..const import (
     FORECAST_COMPARISON_CHART_DAYS,
 )
 
+if TYPE_CHECKING:
+    from ..storage import TimeSeriesStore
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -81,16 +84,21 @@ class ForecastComparisonStats:
 class ForecastComparisonReader:
     """Reads forecast comparison data for charts and analysis."""
 
-    def __init__(self, config_path: Path) -> None:
-        """Initialize the forecast comparison reader."""
+    def __init__(self, config_path: Path, store: TimeSeriesStore | None = None) -> None:
+        """Initialize the forecast comparison reader.
+
+        With a ``store`` the history is read from the time-series store,
+        otherwise from the legacy JSON file.
+        """
         self._config_path = config_path
         self._data_path = config_path / SFML_STATS_DATA
         self._history_file = self._data_path / EXTERNAL_FORECASTS_HISTORY
+        self._store = store
 
     @property
     def is_available(self) -> bool:
         """Check if forecast comparison data is available."""
-        return self._history_file.exists()
+        return self._store is not None or self._history_file.exists()
 
     async def _read_json_file(self, file_path: Path) -> dict | None:
         """Read a JSON file asynchronously."""
@@ -116,17 +124,24 @@ class ForecastComparisonReader:
         end_date: date | None = None,
     ) -> list[ForecastComparisonDay]:
         """Get forecast comparison data for a date range."""
-        data = await self._read_json_file(self._history_file)
-
-        if not data or "days" not in data:
-            return []
-
         # Determine date range
         if end_date is None:
             end_date = date.today()
         if start_date is None:
             start_date = end_date - timedelta(days=days - 1)
 
+        if self._store is not None:
+            data = {
+                "days": await self._store.async_get_forecast_days(
+                    start_date.isoformat(), end_date.isoformat()
+                )
+            }
+        else:
+            data = await self._read_json_file(self._history_file)
+
+        if not data or "days" not in data:
+            return []
+
         result: list[ForecastComparisonDay] = []
 
         current = start_date
@@ -36,10 +36,8 @@ from homeassistant.core import HomeAssistant
 
 from ..const import (
     DOMAIN,
-    SFML_STATS_DATA,
     SOLAR_FORECAST_ML_STATS,
     SOLAR_DAILY_SUMMARIES,
-    EXTERNAL_FORECASTS_HISTORY,
     FORECAST_COMPARISON_RETENTION_DAYS,
     CONF_SENSOR_SOLAR_YIELD_DAILY,
     CONF_FORECAST_ENTITY_1,
@@ -49,6 +47,7 @@ from ..const import (
     DEFAULT_FORECAST_ENTITY_1_NAME,
     DEFAULT_FORECAST_ENTITY_2_NAME,
 )
+from ..storage import TimeSeriesStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,12 +55,13 @@ _LOGGER = logging.getLogger(__name__)
 class ForecastComparisonCollector:
     """Collect and store forecast comparison data."""
 
-    def __init__(self, hass: HomeAssistant, config_path: Path) -> None:
+    def __init__(
+        self, hass: HomeAssistant, config_path: Path, store: TimeSeriesStore
+    ) -> None:
         """Initialize the collector."""
         self._hass = hass
         self._config_path = config_path
-        self._data_path = config_path / SFML_STATS_DATA
-        self._history_file = self._data_path / EXTERNAL_FORECASTS_HISTORY
+        self._store = store
         self._sfml_summaries_file = config_path / SOLAR_FORECAST_ML_STATS / SOLAR_DAILY_SUMMARIES
 
     def _get_config(self) -> dict[str, Any]:
@@ -90,38 +90,10 @@ class ForecastComparisonCollector:
         except (ValueError, TypeError):
             return None
 
-    async def _load_history(self) -> dict[str, Any]:
-        """Load existing history file."""
-        if not self._history_file.exists():
-            return {
-                "days": {},
-                "metadata": {
-                    "last_updated": None,
-                    "retention_days": FORECAST_COMPARISON_RETENTION_DAYS,
-                }
-            }
-
-        try:
-            async with aiofiles.open(self._history_file, "r", encoding="utf-8") as f:
-                content = await f.read()
-                return json.loads(content)
-        except Exception as err:
-            _LOGGER.error("Error loading forecast history: %s", err)
-            return {
-                "days": {},
-                "metadata": {
-                    "last_updated": None,
-                    "retention_days": FORECAST_COMPARISON_RETENTION_DAYS,
-                }
-            }
-
-    async def _save_history(self, history: dict[str, Any]) -> bool:
-        """Save history file."""
-        self._data_path.mkdir(parents=True, exist_ok=True)
-
+    async def _save_days(self, days: dict[str, dict[str, Any]]) -> bool:
+        """Write day entries to the time-series store."""
         try:
-            async with aiofiles.open(self._history_file, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(history, indent=2, ensure_ascii=False))
+            await self._store.async_put_forecast_days(days)
             return True
         except Exception as err:
             _LOGGER.error("Error saving forecast history: %s", err)
@@ -187,22 +159,13 @@ class ForecastComparisonCollector:
             _LOGGER.warning("Error reading SFML summaries: %s", err)
             return None
 
-    async def _cleanup_old_entries(self, history: dict[str, Any]) -> None:
+    async def _cleanup_old_entries(self) -> None:
         """Remove entries older than retention period."""
-        retention_days = history.get("metadata", {}).get(
-            "retention_days", FORECAST_COMPARISON_RETENTION_DAYS
-        )
-        cutoff_date = date.today() - timedelta(days=retention_days)
-        cutoff_str = cutoff_date.isoformat()
-
-        days_to_remove = [
-            day_str for day_str in history.get("days", {})
-            if day_str < cutoff_str
-        ]
+        cutoff_date = date.today() - timedelta(days=FORECAST_COMPARISON_RETENTION_DAYS)
 
-        for day_str in days_to_remove:
-            del history["days"][day_str]
-            _LOGGER.debug("Removed old forecast entry: %s", day_str)
+        removed = await self._store.async_purge_forecast_days(cutoff_date.isoformat())
+        if removed:
+            _LOGGER.debug("Removed %d old forecast entries", removed)
 
     async def async_collect_morning_forecasts(self) -> bool:
         """Collect forecast values for TODAY at 08:00.
@@ -229,11 +192,8 @@ class ForecastComparisonCollector:
         # Get SFML forecast for today
         sfml_forecast_kwh = await self._get_sfml_forecast(today_str)
 
-        # Load history
-        history = await self._load_history()
-
         # Create or update entry for today (only forecasts, no actual yet)
-        daily_entry: dict[str, Any] = history.get("days", {}).get(today_str, {})
+        daily_entry: dict[str, Any] = await self._store.async_get_forecast_day(today_str) or {}
 
         # Only update if we don't have forecast values yet
         if "sfml_forecast_kwh" not in daily_entry or daily_entry.get("sfml_forecast_kwh") is None:
@@ -267,10 +227,7 @@ class ForecastComparisonCollector:
             daily_entry["actual_kwh"] = None
 
         # Save to history
-        history["days"][today_str] = daily_entry
-        history["metadata"]["last_updated"] = datetime.now().isoformat()
-
-        success = await self._save_history(history)
+        success = await self._save_days({today_str: daily_entry})
 
         if success:
             _LOGGER.info(
@@ -298,11 +255,8 @@ class ForecastComparisonCollector:
         actual_entity = config.get(CONF_SENSOR_SOLAR_YIELD_DAILY)
         actual_kwh = self._get_sensor_value(actual_entity)
 
-        # Load history
-        history = await self._load_history()
-
         # Get or create entry for today
-        daily_entry = history.get("days", {}).get(today_str, {})
+        daily_entry = await self._store.async_get_forecast_day(today_str) or {}
 
         if not daily_entry:
             _LOGGER.warning("No morning forecast data for %s, creating new entry", today_str)
@@ -348,13 +302,10 @@ class ForecastComparisonCollector:
                     )
 
         # Save to history
-        history["days"][today_str] = daily_entry
-        history["metadata"]["last_updated"] = datetime.now().isoformat()
+        success = await self._save_days({today_str: daily_entry})
 
         # Cleanup old entries
-        await self._cleanup_old_entries(history)
-
-        success = await self._save_history(history)
+        await self._cleanup_old_entries()
 
         if success:
             sfml_forecast = daily_entry.get("sfml_forecast_kwh")
@@ -373,23 +324,15 @@ class ForecastComparisonCollector:
 
     async def async_get_comparison_data(self, days: int = 7) -> list[dict[str, Any]]:
         """Get forecast comparison data for the last N days."""
-        history = await self._load_history()
-
         cutoff_date = date.today() - timedelta(days=days - 1)
-        result = []
-
-        current = cutoff_date
-        while current <= date.today():
-            day_str = current.isoformat()
-            if day_str in history.get("days", {}):
-                day_data = history["days"][day_str]
-                result.append({
-                    "date": day_str,
-                    **day_data
-                })
-            current = current + timedelta(days=1)
+        history_days = await self._store.async_get_forecast_days(
+            cutoff_date.isoformat(), date.today().isoformat()
+        )
 
-        return result
+        return [
+            {"date": day_str, **day_data}
+            for day_str, day_data in history_days.items()
+        ]
 
     async def _get_all_sfml_summaries(self) -> dict[str, dict[str, Any]]:
         """Load all SFML summaries from daily_summaries.json."""
@@ -513,13 +456,16 @@ class ForecastComparisonCollector:
         external_1_history = await self._get_sensor_history_from_recorder(external_1_entity, days)
         external_2_history = await self._get_sensor_history_from_recorder(external_2_entity, days)
 
-        # Load existing history
-        history = await self._load_history()
-
         # Build entries for each day
         end_date = date.today()
         start_date = end_date - timedelta(days=days - 1)
 
+        # Load existing entries of the range
+        existing_days = await self._store.async_get_forecast_days(
+            start_date.isoformat(), end_date.isoformat()
+        )
+        new_days: dict[str, dict[str, Any]] = {}
+
         current = start_date
         days_added = 0
 
@@ -527,7 +473,7 @@ class ForecastComparisonCollector:
             day_str = current.isoformat()
 
             # Skip if we already have data for this day
-            if day_str in history.get("days", {}):
+            if day_str in existing_days:
                 current = current + timedelta(days=1)
                 continue
 
@@ -584,16 +530,13 @@ class ForecastComparisonCollector:
                             max(0, 100 - (error / actual_kwh * 100)), 1
                         )
 
-                history["days"][day_str] = daily_entry
+                new_days[day_str] = daily_entry
                 days_added += 1
 
             current = current + timedelta(days=1)
 
-        # Update metadata
-        history["metadata"]["last_updated"] = datetime.now().isoformat()
-
         # Save history
-        success = await self._save_history(history)
+        success = await self._save_days(new_days)
 
         if success:
             _LOGGER.info(
@@ -616,19 +559,22 @@ class ForecastComparisonCollector:
         # Load all SFML summaries
         sfml_data = await self._get_all_sfml_summaries()
 
-        # Load history
-        history = await self._load_history()
-
         repaired_count = 0
         end_date = date.today()
         start_date = end_date - timedelta(days=days - 1)
 
+        # Load existing entries of the range
+        history_days = await self._store.async_get_forecast_days(
+            start_date.isoformat(), end_date.isoformat()
+        )
+        repaired_days: dict[str, dict[str, Any]] = {}
+
         current = start_date
         while current <= end_date:
             day_str = current.isoformat()
 
-            if day_str in history.get("days", {}):
-                daily_entry = history["days"][day_str]
+            if day_str in history_days:
+                daily_entry = history_days[day_str]
 
                 # Check if SFML forecast is missing
                 if daily_entry.get("sfml_forecast_kwh") is None:
@@ -649,14 +595,13 @@ class ForecastComparisonCollector:
                                 max(0, 100 - (error / actual_kwh * 100)), 1
                             )
 
-                        history["days"][day_str] = daily_entry
+                        repaired_days[day_str] = daily_entry
                         repaired_count += 1
 
             current = current + timedelta(days=1)
 
         if repaired_count > 0:
-            history["metadata"]["last_updated"] = datetime.now().isoformat()
-            await self._save_history(history)
+            await self._save_days(repaired_days)
             _LOGGER.info("Repaired %d missing SFML forecasts", repaired_count)
 
         return repaired_count
@@ -10,20 +10,17 @@
 """Hourly billing aggregator for SFML Stats."""
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-import aiofiles
+import numpy as np
 
 from homeassistant.core import HomeAssistant
 
 from ..const import (
     DOMAIN,
-    SFML_STATS_DATA,
-    HOURLY_BILLING_HISTORY,
     CONF_SENSOR_SMARTMETER_IMPORT,
     CONF_SENSOR_SMARTMETER_EXPORT,
     CONF_SENSOR_SMARTMETER_IMPORT_KWH,
@@ -42,20 +39,113 @@ from ..const import (
     CONF_BILLING_START_MONTH,
     PRICE_MODE_FIXED,
     DEFAULT_BILLING_FIXED_PRICE,
+    BILLING_BACKFILL_MAX_HOURS,
 )
+from ..storage import TimeSeriesStore
 
 _LOGGER = logging.getLogger(__name__)
 
+# Billing columns integrated from watt sensors
+_FLOW_SENSORS: dict[str, str] = {
+    "grid_to_house_kwh": CONF_SENSOR_GRID_TO_HOUSE,
+    "grid_to_battery_kwh": CONF_SENSOR_GRID_TO_BATTERY,
+    "solar_yield_kwh": CONF_SENSOR_SOLAR_POWER,
+    "solar_to_house_kwh": CONF_SENSOR_SOLAR_TO_HOUSE,
+    "solar_to_battery_kwh": CONF_SENSOR_SOLAR_TO_BATTERY,
+    "battery_to_house_kwh": CONF_SENSOR_BATTERY_TO_HOUSE,
+    "home_consumption_kwh": CONF_SENSOR_HOME_CONSUMPTION,
+}
+
+_EMPTY_SERIES: tuple[np.ndarray, np.ndarray] = (np.empty(0), np.empty(0))
+
+
+def _to_float(value: Any) -> float:
+    """Convert a state value to float, NaN if it is not numeric."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+def _state_series(states: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """Return epoch timestamps and values of recorder states, sorted by time."""
+    count = len(states)
+    times = np.fromiter(
+        (state.last_changed.timestamp() for state in states), dtype=float, count=count
+    )
+    values = np.fromiter((_to_float(state.state) for state in states), dtype=float, count=count)
+    order = np.argsort(times, kind="stable")
+    return times[order], values[order]
+
+
+def _hourly_energy_kwh(
+    times: np.ndarray, watts: np.ndarray, boundaries: np.ndarray
+) -> np.ndarray:
+    """Integrate a watt series into kWh per ``[boundaries[i], boundaries[i + 1])``.
+
+    Trapezoidal rule between samples, negative watts clipped to 0, the last
+    sample held until the final boundary. Segments touching a non-numeric
+    sample contribute nothing.
+    """
+    buckets = len(boundaries) - 1
+    watts = np.maximum(watts, 0.0)
+    if len(times) and times[-1] < boundaries[-1]:
+        times = np.append(times, boundaries[-1])
+        watts = np.append(watts, watts[-1])
+    if len(times) < 2:
+        return np.zeros(buckets)
+
+    # Cumulative energy (Ws) at every sample
+    segments = np.nan_to_num(np.diff(times) * (watts[:-1] + watts[1:]) / 2)
+    cumulative = np.concatenate(([0.0], np.cumsum(segments)))
+
+    # Cumulative energy at every boundary, interpolating inside its segment
+    k = np.searchsorted(times, boundaries, side="right") - 1
+    seg = np.clip(k, 0, len(times) - 2)
+    t0, t1 = times[seg], times[seg + 1]
+    w0, w1 = watts[seg], watts[seg + 1]
+    frac = np.divide(boundaries - t0, t1 - t0, out=np.zeros(len(boundaries)), where=t1 > t0)
+    w_at = w0 + (w1 - w0) * frac
+    partial_ws = np.nan_to_num((boundaries - t0) * (w0 + w_at) / 2)
+    at_boundary = np.where(
+        k < 0,
+        0.0,
+        np.where(k >= len(times) - 1, cumulative[-1], cumulative[seg] + partial_ws),
+    )
+    return np.diff(at_boundary) / 3_600_000
+
+
+def _step_values(times: np.ndarray, values: np.ndarray, at: np.ndarray) -> np.ndarray:
+    """Value in effect at each instant of ``at`` (last numeric state), NaN before any."""
+    valid = ~np.isnan(values)
+    times, values = times[valid], values[valid]
+    idx = np.searchsorted(times, at, side="right") - 1
+    return np.where(idx >= 0, values[np.maximum(idx, 0)] if len(values) else np.nan, np.nan)
+
+
+def _hourly_meter_diff(
+    times: np.ndarray, values: np.ndarray, boundaries: np.ndarray
+) -> np.ndarray:
+    """kWh consumed per hour from a total_increasing meter; NaN when unknown.
+
+    A drop of more than 1 Wh (meter reset) is treated as unknown.
+    """
+    readings = _step_values(times, values, boundaries)
+    diff = np.diff(readings)
+    diff = np.where(diff < -0.001, np.nan, diff)
+    return np.maximum(diff, 0.0)
+
 
 class HourlyBillingAggregator:
     """Aggregates hourly energy values and calculates costs."""
 
-    def __init__(self, hass: HomeAssistant, config_path: Path) -> None:
+    def __init__(
+        self, hass: HomeAssistant, config_path: Path, store: TimeSeriesStore
+    ) -> None:
         """Initialize the aggregator."""
         self._hass = hass
         self._config_path = config_path
-        self._data_path = config_path / SFML_STATS_DATA
-        self._history_file = self._data_path / HOURLY_BILLING_HISTORY
+        self._store = store
 
     def _get_config(self) -> dict[str, Any]:
         """Get the current configuration."""
@@ -83,221 +173,118 @@ class HourlyBillingAggregator:
         except (ValueError, TypeError):
             return None
 
-    async def _calculate_kwh_from_recorder(
+    async def _async_fetch_states(
         self,
-        entity_id: str,
+        entity_ids: list[str],
         start_time: datetime,
         end_time: datetime,
-    ) -> float:
-        """Calculate kWh from watt values in recorder."""
-        if not entity_id:
-            return 0.0
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """Load the numeric series of all entities with one recorder query.
 
-        hours = (end_time - start_time).total_seconds() / 3600
+        The state in effect at ``start_time`` is included so integration and
+        meter readings start exactly at the range boundary.
+        """
+        if not entity_ids:
+            return {}
 
         try:
             from homeassistant.components.recorder import get_instance
-            from homeassistant.components.recorder.history import state_changes_during_period
-
-            instance = get_instance(self._hass)
-
-            states = await instance.async_add_executor_job(
-                state_changes_during_period,
-                self._hass,
-                start_time,
-                end_time,
-                [entity_id],
-                True,
-                False,
-                None,
-            )
-
-            entity_states = states.get(entity_id, [])
-
-            _LOGGER.debug(
-                "Recorder for %s: %d states from %s to %s",
-                entity_id, len(entity_states), start_time, end_time
-            )
-
-            if len(entity_states) >= 1:
-                total_wh = 0.0
-
-                if len(entity_states) == 1:
-                    try:
-                        watts = float(entity_states[0].state)
-                        if watts > 0:
-                            kwh = (watts * hours) / 1000
-                            _LOGGER.debug(
-                                "%s: 1 state with %.1f W -> %.4f kWh",
-                                entity_id, watts, kwh
-                            )
-                            return kwh
-                    except (ValueError, TypeError):
-                        pass
-                else:
-                    for i in range(1, len(entity_states)):
-                        prev_state = entity_states[i - 1]
-                        curr_state = entity_states[i]
-
-                        delta_seconds = (
-                            curr_state.last_changed - prev_state.last_changed
-                        ).total_seconds()
-                        delta_hours = delta_seconds / 3600
-
-                        try:
-                            prev_watts = float(prev_state.state)
-                            curr_watts = float(curr_state.state)
-
-                            prev_watts = max(0, prev_watts)
-                            curr_watts = max(0, curr_watts)
-
-                            avg_watts = (prev_watts + curr_watts) / 2
-                            total_wh += avg_watts * delta_hours
-
-                        except (ValueError, TypeError):
-                            continue
-
-                    if total_wh > 0:
-                        kwh = total_wh / 1000
-                        _LOGGER.debug(
-                            "%s: Calculated %.4f kWh from %d states",
-                            entity_id, kwh, len(entity_states)
-                        )
-                        return kwh
-
+            from homeassistant.components.recorder.history import get_significant_states
         except ImportError as err:
             _LOGGER.debug("Recorder not available: %s", err)
-        except Exception as err:
-            _LOGGER.debug(
-                "Recorder query for %s failed: %s",
-                entity_id, err
-            )
-
-        current = self._get_sensor_value(entity_id)
-        if current is not None and current > 0:
-            kwh = (current * hours) / 1000
-            _LOGGER.info(
-                "%s: Fallback to current value %.1f W x %.2fh = %.4f kWh",
-                entity_id, current, hours, kwh
-            )
-            return kwh
-
-        _LOGGER.debug("%s: No value available, returning 0", entity_id)
-        return 0.0
-
-    async def _calculate_kwh_diff_from_total(
-        self,
-        entity_id: str,
-        start_time: datetime,
-        end_time: datetime,
-    ) -> float | None:
-        """Calculate kWh difference from a total_increasing kWh sensor."""
-        if not entity_id:
-            return None
-
-        try:
-            from homeassistant.components.recorder import get_instance
-            from homeassistant.components.recorder.history import state_changes_during_period
-
-            instance = get_instance(self._hass)
+            return {}
 
-            states = await instance.async_add_executor_job(
-                state_changes_during_period,
+        def _load() -> dict[str, tuple[np.ndarray, np.ndarray]]:
+            states = get_significant_states(
                 self._hass,
-                start_time,
-                end_time,
-                [entity_id],
-                True,
-                False,
-                None,
+                start_time.astimezone(),
+                end_time.astimezone(),
+                entity_ids,
+                significant_changes_only=False,
+                include_start_time_state=True,
+                no_attributes=True,
             )
+            series = {}
+            for entity_id in entity_ids:
+                entity_states = states.get(entity_id, [])
+                series[entity_id] = _state_series(entity_states)
+                _LOGGER.debug(
+                    "Recorder for %s: %d states from %s to %s",
+                    entity_id, len(entity_states), start_time, end_time
+                )
+            return series
 
-            entity_states = states.get(entity_id, [])
-
-            if len(entity_states) >= 2:
-                try:
-                    start_kwh = float(entity_states[0].state)
-                    end_kwh = float(entity_states[-1].state)
-
-                    diff = end_kwh - start_kwh
+        try:
+            return await get_instance(self._hass).async_add_executor_job(_load)
+        except Exception as err:
+            _LOGGER.debug("Recorder query for %s failed: %s", entity_ids, err)
+            return {}
 
-                    if diff >= -0.001:
-                        diff = max(0, diff)
-                        _LOGGER.debug(
-                            "%s: kWh difference %.4f (%.4f -> %.4f)",
-                            entity_id, diff, start_kwh, end_kwh
-                        )
-                        return diff
+    async def async_aggregate_hourly(self) -> bool:
+        """Aggregate the last hour and calculate costs.
 
-                except (ValueError, TypeError):
-                    pass
+        Hours missed since the last stored row (e.g. while Home Assistant was
+        down) are backfilled in the same recorder query.
+        """
+        end_time = datetime.now().replace(minute=0, second=0, microsecond=0)
+        start_time = end_time - timedelta(hours=1)
 
-            elif len(entity_states) == 1:
-                _LOGGER.debug(
-                    "%s: Only 1 state in period, cannot calculate difference",
-                    entity_id
+        last_hour = await self._store.async_get_last_billing_hour()
+        if last_hour:
+            try:
+                resume = datetime.fromisoformat(last_hour) + timedelta(hours=1)
+            except ValueError:
+                resume = start_time
+            if resume < start_time:
+                start_time = max(
+                    resume, end_time - timedelta(hours=BILLING_BACKFILL_MAX_HOURS)
                 )
 
-        except ImportError:
-            _LOGGER.debug("Recorder not available for kWh diff")
-        except Exception as err:
-            _LOGGER.debug("Error in kWh diff for %s: %s", entity_id, err)
-
-        return None
-
-    async def _load_history(self) -> dict[str, Any]:
-        """Load the existing history file."""
-        if not self._history_file.exists():
-            return {
-                "billing_period": {},
-                "hours": {},
-                "totals": {
-                    "grid_import_kwh": 0,
-                    "grid_import_cost_eur": 0,
-                    "grid_export_kwh": 0,
-                    "solar_yield_kwh": 0,
-                    "self_consumption_kwh": 0,
-                },
-                "last_updated": None,
-            }
+        return await self._async_aggregate_range(start_time, end_time, True) > 0
 
-        try:
-            async with aiofiles.open(self._history_file, "r", encoding="utf-8") as f:
-                content = await f.read()
-                return json.loads(content)
-        except Exception as err:
-            _LOGGER.error("Error loading billing history: %s", err)
-            return {
-                "billing_period": {},
-                "hours": {},
-                "totals": {},
-                "last_updated": None,
-            }
+    async def async_rebuild_range(self, start_date: date, end_date: date) -> int:
+        """Recompute the billing history of ``start_date`` to ``end_date`` (inclusive).
 
-    async def _save_history(self, history: dict[str, Any]) -> bool:
-        """Save the history file."""
-        self._data_path.mkdir(parents=True, exist_ok=True)
-
-        try:
-            async with aiofiles.open(self._history_file, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(history, indent=2, ensure_ascii=False))
-            return True
-        except Exception as err:
-            _LOGGER.error("Error saving billing history: %s", err)
-            return False
+        Returns the number of hours written. Hours outside the recorder's
+        retention are written with whatever states are still available.
+        """
+        start_time = datetime.combine(start_date, datetime.min.time())
+        end_time = min(
+            datetime.combine(end_date + timedelta(days=1), datetime.min.time()),
+            datetime.now().replace(minute=0, second=0, microsecond=0),
+        )
+        return await self._async_aggregate_range(start_time, end_time, False)
 
-    async def async_aggregate_hourly(self) -> bool:
-        """Aggregate the last hour and calculate costs."""
+    async def _async_aggregate_range(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        use_current_fallback: bool,
+    ) -> int:
+        """Aggregate every full hour in ``[start_time, end_time)`` in one pass.
+
+        All configured sensors are loaded with a single recorder query and
+        integrated per hour bucket. With ``use_current_fallback`` a watt sensor
+        without any recorded state falls back to its current value for the
+        last hour. Returns the number of hours written.
+        """
         config = self._get_config()
-
         now = datetime.now()
-        end_time = now.replace(minute=0, second=0, microsecond=0)
-        start_time = end_time - timedelta(hours=1)
-        hour_key = start_time.strftime("%Y-%m-%dT%H:00")
+
+        # Epoch boundaries keep hours exact across DST changes
+        first = start_time.timestamp()
+        hours = int((end_time.timestamp() - first) // 3600)
+        if hours <= 0:
+            return 0
+        boundaries = first + 3600.0 * np.arange(hours + 1)
+        hour_keys = [
+            datetime.fromtimestamp(ts).strftime("%Y-%m-%dT%H:00")
+            for ts in boundaries[:-1]
+        ]
 
         _LOGGER.info(
-            "Starting hourly billing aggregation for %s",
-            hour_key
+            "Starting billing aggregation for %s to %s (%d hours)",
+            hour_keys[0], hour_keys[-1], hours
         )
 
         smartmeter_import_w = config.get(CONF_SENSOR_SMARTMETER_IMPORT)
@@ -316,145 +303,123 @@ class HourlyBillingAggregator:
             _LOGGER.warning(
                 "No smartmeter import sensor configured - billing aggregation skipped"
             )
-            return False
-
-        grid_import_kwh = 0.0
-        data_source = "none"
+            return 0
 
-        if smartmeter_import_kwh:
-            diff = await self._calculate_kwh_diff_from_total(
-                smartmeter_import_kwh, start_time, end_time
-            )
-            if diff is not None:
-                grid_import_kwh = diff
-                data_source = "kwh_sensor"
-                _LOGGER.info(
-                    "Grid import from kWh sensor: %.4f kWh",
-                    grid_import_kwh
-                )
-
-        if grid_import_kwh == 0.0 and smartmeter_import_w:
-            grid_import_kwh = await self._calculate_kwh_from_recorder(
-                smartmeter_import_w, start_time, end_time
+        price_mode = config.get(CONF_BILLING_PRICE_MODE, "dynamic")
+        price_sensor = (
+            config.get(CONF_SENSOR_PRICE_TOTAL) if price_mode != PRICE_MODE_FIXED else None
+        )
+        watt_export = None if smartmeter_export_kwh else smartmeter_export_w
+        flow_sensors = {column: config.get(conf) for column, conf in _FLOW_SENSORS.items()}
+
+        entity_ids = list(dict.fromkeys(
+            entity_id
+            for entity_id in (
+                smartmeter_import_w,
+                smartmeter_import_kwh,
+                smartmeter_export_kwh,
+                watt_export,
+                price_sensor,
+                *flow_sensors.values(),
             )
-            if grid_import_kwh > 0:
-                data_source = "watt_recorder"
-                _LOGGER.info(
-                    "Grid import from watt recorder: %.4f kWh",
-                    grid_import_kwh
-                )
-            else:
-                current_w = self._get_sensor_value(smartmeter_import_w)
-                _LOGGER.debug(
-                    "Smartmeter import '%s' current: %s W",
-                    smartmeter_import_w, current_w
-                )
-
-        grid_export_kwh = 0.0
+            if entity_id
+        ))
+        series = await self._async_fetch_states(entity_ids, start_time, end_time)
+
+        def energy(entity_id: str | None) -> np.ndarray:
+            if not entity_id:
+                return np.zeros(hours)
+            times, values = series.get(entity_id, _EMPTY_SERIES)
+            if len(times) == 0:
+                kwh = np.zeros(hours)
+                current = self._get_sensor_value(entity_id) if use_current_fallback else None
+                if current is not None and current > 0:
+                    kwh[-1] = current / 1000
+                    _LOGGER.info(
+                        "%s: Fallback to current value %.1f W x 1h = %.4f kWh",
+                        entity_id, current, kwh[-1]
+                    )
+                return kwh
+            return _hourly_energy_kwh(times, values, boundaries)
+
+        def meter_diff(entity_id: str | None) -> np.ndarray:
+            if not entity_id:
+                return np.full(hours, np.nan)
+            times, values = series.get(entity_id, _EMPTY_SERIES)
+            return _hourly_meter_diff(times, values, boundaries)
+
+        # Import prefers the kWh meter and falls back to integrated watts
+        import_diff = meter_diff(smartmeter_import_kwh)
+        has_diff = ~np.isnan(import_diff)
+        grid_import = np.where(has_diff, import_diff, 0.0)
+        data_source = np.where(has_diff, "kwh_sensor", "none")
+        if smartmeter_import_w:
+            import_watts = energy(smartmeter_import_w)
+            use_watts = (grid_import == 0.0) & (import_watts > 0)
+            grid_import = np.where(use_watts, import_watts, grid_import)
+            data_source = np.where(use_watts, "watt_recorder", data_source)
 
         if smartmeter_export_kwh:
-            diff = await self._calculate_kwh_diff_from_total(
-                smartmeter_export_kwh, start_time, end_time
-            )
-            if diff is not None:
-                grid_export_kwh = diff
-        elif smartmeter_export_w:
-            grid_export_kwh = await self._calculate_kwh_from_recorder(
-                smartmeter_export_w, start_time, end_time
-            )
-
-        grid_to_house_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_GRID_TO_HOUSE), start_time, end_time
-        )
-        grid_to_battery_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_GRID_TO_BATTERY), start_time, end_time
-        )
-        solar_power_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_SOLAR_POWER), start_time, end_time
-        )
-        solar_to_house_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_SOLAR_TO_HOUSE), start_time, end_time
-        )
-        solar_to_battery_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_SOLAR_TO_BATTERY), start_time, end_time
-        )
-        battery_to_house_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_BATTERY_TO_HOUSE), start_time, end_time
-        )
-        home_consumption_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_HOME_CONSUMPTION), start_time, end_time
-        )
+            grid_export = np.nan_to_num(meter_diff(smartmeter_export_kwh))
+        else:
+            grid_export = energy(watt_export)
 
-        price_mode = config.get(CONF_BILLING_PRICE_MODE, "dynamic")
         if price_mode == PRICE_MODE_FIXED:
-            current_price = config.get(
-                CONF_BILLING_FIXED_PRICE, DEFAULT_BILLING_FIXED_PRICE
+            prices = np.full(
+                hours, float(config.get(CONF_BILLING_FIXED_PRICE, DEFAULT_BILLING_FIXED_PRICE))
             )
         else:
-            current_price = self._get_sensor_value(
-                config.get(CONF_SENSOR_PRICE_TOTAL)
-            )
-            if current_price is None:
-                current_price = DEFAULT_BILLING_FIXED_PRICE
-                _LOGGER.warning(
-                    "No electricity price available, using default: %.2f ct/kWh",
-                    current_price
-                )
-
-        grid_import_cost_eur = (grid_import_kwh * current_price) / 100
-
-        hourly_data = {
-            "grid_import_kwh": round(grid_import_kwh, 4),
-            "grid_import_cost_ct": round(grid_import_kwh * current_price, 2),
-            "grid_export_kwh": round(grid_export_kwh, 4),
-            "price_ct_kwh": round(current_price, 2),
-            "grid_to_house_kwh": round(grid_to_house_kwh, 4),
-            "grid_to_battery_kwh": round(grid_to_battery_kwh, 4),
-            "solar_yield_kwh": round(solar_power_kwh, 4),
-            "solar_to_house_kwh": round(solar_to_house_kwh, 4),
-            "solar_to_battery_kwh": round(solar_to_battery_kwh, 4),
-            "battery_to_house_kwh": round(battery_to_house_kwh, 4),
-            "home_consumption_kwh": round(home_consumption_kwh, 4),
-            "timestamp": now.isoformat(),
-            "data_source": data_source,
-        }
-
-        history = await self._load_history()
-
-        billing_start_day = config.get(CONF_BILLING_START_DAY, 1)
-        billing_start_month = config.get(CONF_BILLING_START_MONTH, 1)
-        history["billing_period"] = {
-            "start_day": billing_start_day,
-            "start_month": billing_start_month,
-        }
-
-        history["hours"][hour_key] = hourly_data
-        history["last_updated"] = now.isoformat()
-
-        await self._recalculate_totals(history, config)
+            prices = np.full(hours, np.nan)
+            if price_sensor:
+                times, values = series.get(price_sensor, _EMPTY_SERIES)
+                prices = _step_values(times, values, boundaries[:-1])
+            if np.isnan(prices).any():
+                current_price = self._get_sensor_value(price_sensor)
+                if current_price is None:
+                    current_price = DEFAULT_BILLING_FIXED_PRICE
+                    _LOGGER.warning(
+                        "No electricity price available, using default: %.2f ct/kWh",
+                        current_price
+                    )
+                prices = np.where(np.isnan(prices), current_price, prices)
+
+        flows = {column: energy(entity_id) for column, entity_id in flow_sensors.items()}
+
+        timestamp = now.isoformat()
+        rows: dict[str, dict[str, Any]] = {}
+        for i, hour_key in enumerate(hour_keys):
+            rows[hour_key] = {
+                "grid_import_kwh": round(float(grid_import[i]), 4),
+                "grid_import_cost_ct": round(float(grid_import[i] * prices[i]), 2),
+                "grid_export_kwh": round(float(grid_export[i]), 4),
+                "price_ct_kwh": round(float(prices[i]), 2),
+                **{column: round(float(kwh[i]), 4) for column, kwh in flows.items()},
+                "timestamp": timestamp,
+                "data_source": str(data_source[i]),
+            }
 
-        success = await self._save_history(history)
+        try:
+            await self._store.async_upsert_billing_hours(rows)
+            await self._recalculate_totals(config)
+        except Exception as err:
+            _LOGGER.error("Error saving billing history: %s", err)
+            return 0
 
-        if success:
-            _LOGGER.info(
-                "Billing aggregation saved: Import=%.3f kWh (%.2f ct), "
-                "Export=%.3f kWh, Price=%.2f ct/kWh",
-                grid_import_kwh,
-                grid_import_kwh * current_price,
-                grid_export_kwh,
-                current_price,
-            )
+        last = rows[hour_keys[-1]]
+        _LOGGER.info(
+            "Billing aggregation saved %d hours, last: Import=%.3f kWh (%.2f ct), "
+            "Export=%.3f kWh, Price=%.2f ct/kWh",
+            hours,
+            last["grid_import_kwh"],
+            last["grid_import_cost_ct"],
+            last["grid_export_kwh"],
+            last["price_ct_kwh"],
+        )
 
-        return success
+        return hours
 
-    async def _recalculate_totals(
-        self,
-        history: dict[str, Any],
-        config: dict[str, Any],
-    ) -> None:
+    async def _recalculate_totals(self, config: dict[str, Any]) -> dict[str, Any]:
         """Recalculate totals for the billing period."""
-        from datetime import date
-
         billing_start_day = config.get(CONF_BILLING_START_DAY, 1)
         billing_start_month = config.get(CONF_BILLING_START_MONTH, 1)
 
@@ -474,49 +439,25 @@ class HourlyBillingAggregator:
 
         billing_start_str = billing_start.isoformat()
 
+        # Sums over the billing period are a single range query on the store
+        sums = await self._store.async_get_billing_sums(billing_start_str)
+        price_sum = sums["price_sum"]
+
         totals = {
-            "grid_import_kwh": 0,
-            "grid_import_cost_eur": 0,
-            "grid_export_kwh": 0,
-            "solar_yield_kwh": 0,
-            "solar_to_house_kwh": 0,
-            "solar_to_battery_kwh": 0,
-            "battery_to_house_kwh": 0,
-            "grid_to_house_kwh": 0,
-            "grid_to_battery_kwh": 0,
-            "home_consumption_kwh": 0,
-            "hours_count": 0,
+            "grid_import_kwh": sums["grid_import_kwh"],
+            "grid_import_cost_eur": sums["grid_import_cost_ct"] / 100,
+            "grid_export_kwh": sums["grid_export_kwh"],
+            "solar_yield_kwh": sums["solar_yield_kwh"],
+            "solar_to_house_kwh": sums["solar_to_house_kwh"],
+            "solar_to_battery_kwh": sums["solar_to_battery_kwh"],
+            "battery_to_house_kwh": sums["battery_to_house_kwh"],
+            "grid_to_house_kwh": sums["grid_to_house_kwh"],
+            "grid_to_battery_kwh": sums["grid_to_battery_kwh"],
+            "home_consumption_kwh": sums["home_consumption_kwh"],
+            "hours_count": sums["hours_count"],
             "avg_price_ct": 0,
         }
 
-        price_sum = 0
-
-        for hour_key, hour_data in history.get("hours", {}).items():
-            hour_date = hour_key[:10]
-            if hour_date >= billing_start_str:
-                totals["grid_import_kwh"] += hour_data.get("grid_import_kwh", 0)
-                totals["grid_import_cost_eur"] += (
-                    hour_data.get("grid_import_cost_ct", 0) / 100
-                )
-                totals["grid_export_kwh"] += hour_data.get("grid_export_kwh", 0)
-                totals["solar_yield_kwh"] += hour_data.get("solar_yield_kwh", 0)
-                totals["solar_to_house_kwh"] += hour_data.get("solar_to_house_kwh", 0)
-                totals["solar_to_battery_kwh"] += hour_data.get(
-                    "solar_to_battery_kwh", 0
-                )
-                totals["battery_to_house_kwh"] += hour_data.get(
-                    "battery_to_house_kwh", 0
-                )
-                totals["grid_to_house_kwh"] += hour_data.get("grid_to_house_kwh", 0)
-                totals["grid_to_battery_kwh"] += hour_data.get(
-                    "grid_to_battery_kwh", 0
-                )
-                totals["home_consumption_kwh"] += hour_data.get(
-                    "home_consumption_kwh", 0
-                )
-                totals["hours_count"] += 1
-                price_sum += hour_data.get("price_ct_kwh", 0)
-
         if totals["hours_count"] > 0:
             totals["avg_price_ct"] = round(price_sum / totals["hours_count"], 2)
 
@@ -545,27 +486,25 @@ class HourlyBillingAggregator:
         else:
             totals["savings_eur"] = 0
 
-        history["totals"] = totals
-        history["billing_period"]["start"] = billing_start_str
+        await self._store.async_set_meta(
+            "billing_period",
+            {
+                "start_day": billing_start_day,
+                "start_month": billing_start_month,
+                "start": billing_start_str,
+            },
+        )
+        await self._store.async_set_meta("billing_totals", totals)
+
+        return totals
 
     async def async_cleanup_old_data(self, keep_days: int = 400) -> int:
         """Remove old hourly data older than keep_days."""
-        history = await self._load_history()
         cutoff = (datetime.now() - timedelta(days=keep_days)).isoformat()[:10]
 
-        deleted = 0
-        hours_to_keep = {}
-
-        for hour_key, hour_data in history.get("hours", {}).items():
-            hour_date = hour_key[:10]
-            if hour_date >= cutoff:
-                hours_to_keep[hour_key] = hour_data
-            else:
-                deleted += 1
+        deleted = await self._store.async_purge_billing_hours(cutoff)
 
         if deleted > 0:
-            history["hours"] = hours_to_keep
-            await self._save_history(history)
             _LOGGER.info("Billing history: %d old entries deleted", deleted)
 
         return deleted
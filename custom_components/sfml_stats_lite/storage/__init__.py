@@ -18,5 +18,6 @@ Copyright (C) 2025 Zara-Toorox
 from __future__ import annotations
 
 from .data_validator import DataValidator
+from .timeseries_store import TimeSeriesStore
 
-__all__ = ["DataValidator"]
+__all__ = ["DataValidator", "TimeSeriesStore"]
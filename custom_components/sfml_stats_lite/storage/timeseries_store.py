@@ -0,0 +1,432 @@
+"""Append-only time-series store for SFML Stats Lite.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Copyright (C) 2025 Zara-Toorox
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from ..const import (
+    EXTERNAL_FORECASTS_HISTORY,
+    HOURLY_BILLING_HISTORY,
+    POWER_SOURCES_HISTORY,
+    TIMESERIES_DB,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# One column per power flow of a 5-minute sample
+POWER_COLUMNS: tuple[str, ...] = (
+    "solar_power",
+    "solar_to_house",
+    "solar_to_battery",
+    "battery_to_house",
+    "grid_to_house",
+    "home_consumption",
+    "battery_soc",
+)
+
+# Numeric columns of an hourly billing row
+BILLING_COLUMNS: tuple[str, ...] = (
+    "grid_import_kwh",
+    "grid_import_cost_ct",
+    "grid_export_kwh",
+    "price_ct_kwh",
+    "grid_to_house_kwh",
+    "grid_to_battery_kwh",
+    "solar_yield_kwh",
+    "solar_to_house_kwh",
+    "solar_to_battery_kwh",
+    "battery_to_house_kwh",
+    "home_consumption_kwh",
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS power_samples (
+    ts_us INTEGER PRIMARY KEY,
+    {", ".join(f"{col} REAL" for col in POWER_COLUMNS)}
+);
+CREATE TABLE IF NOT EXISTS billing_hours (
+    hour TEXT PRIMARY KEY,
+    {", ".join(f"{col} REAL" for col in BILLING_COLUMNS)},
+    timestamp TEXT,
+    data_source TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS forecast_days (
+    day TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+"""
+
+
+def _to_us(timestamp: datetime) -> int:
+    """Convert an aware datetime to integer microseconds since the epoch."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    delta = timestamp - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_us(ts_us: int) -> str:
+    """Convert integer microseconds since the epoch to a UTC ISO string."""
+    return datetime.fromtimestamp(ts_us / 1_000_000, tz=timezone.utc).isoformat()
+
+
+class TimeSeriesStore:
+    """SQLite (WAL) backed store for the growing time-series histories.
+
+    Replaces the JSON files that were rewritten in full on every update:
+
+    - ``power_samples``: 5-minute power flow samples of the power sources
+      collector, keyed by timestamp (microseconds).
+    - ``billing_hours``: hourly billing rows keyed by ``YYYY-MM-DDTHH:00``.
+    - ``forecast_days``: forecast comparison entries keyed by day.
+
+    Appends and upserts touch a single row, range queries use the primary
+    key and retention is a ranged ``DELETE``. All blocking work runs in the
+    executor; the connection is shared and guarded by a lock.
+    """
+
+    def __init__(self, hass: HomeAssistant, data_path: Path) -> None:
+        """Initialize the store."""
+        self._hass = hass
+        self._data_path = data_path
+        self._db_file = data_path / TIMESERIES_DB
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def db_file(self) -> Path:
+        """Return the database file path."""
+        return self._db_file
+
+    async def async_open(self) -> None:
+        """Open the database and migrate the legacy JSON histories once."""
+        await self._hass.async_add_executor_job(self._open)
+
+    async def async_close(self) -> None:
+        """Close the database."""
+        await self._hass.async_add_executor_job(self._close)
+
+    def _open(self) -> None:
+        """Open the connection, create the schema and run migrations."""
+        with self._lock:
+            if self._conn is not None:
+                return
+            self._data_path.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._db_file, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+
+        self._migrate_json(self._data_path / POWER_SOURCES_HISTORY, self._import_power_json)
+        self._migrate_json(self._data_path / HOURLY_BILLING_HISTORY, self._import_billing_json)
+        self._migrate_json(self._data_path / EXTERNAL_FORECASTS_HISTORY, self._import_forecast_json)
+
+    def _close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _execute(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run ``func`` with the connection inside one transaction."""
+        with self._lock:
+            if self._conn is None:
+                raise RuntimeError("TimeSeriesStore is not open")
+            with self._conn:
+                return func(self._conn)
+
+    async def _async_execute(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run ``func`` in the executor."""
+        return await self._hass.async_add_executor_job(self._execute, func)
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def _migrate_json(
+        self, path: Path, importer: Callable[[sqlite3.Connection, dict[str, Any]], int]
+    ) -> None:
+        """Import a legacy JSON history and rename it to ``*.migrated``."""
+        if not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            count = self._execute(lambda conn: importer(conn, data))
+            path.replace(path.with_suffix(path.suffix + ".migrated"))
+            _LOGGER.info("Migrated %d rows from %s to %s", count, path.name, TIMESERIES_DB)
+        except Exception as err:
+            _LOGGER.error("Failed to migrate %s: %s", path, err)
+
+    @staticmethod
+    def _import_power_json(conn: sqlite3.Connection, data: dict[str, Any]) -> int:
+        """Import ``power_sources_history.json`` data points."""
+        rows = []
+        for dp in data.get("data_points", []):
+            try:
+                ts = datetime.fromisoformat(dp["timestamp"].replace("Z", "+00:00"))
+            except (ValueError, KeyError, AttributeError):
+                continue
+            rows.append((_to_us(ts), *(dp.get(col) for col in POWER_COLUMNS)))
+        conn.executemany(
+            f"INSERT OR IGNORE INTO power_samples VALUES ({', '.join('?' * (len(POWER_COLUMNS) + 1))})",
+            rows,
+        )
+        return len(rows)
+
+    @staticmethod
+    def _import_billing_json(conn: sqlite3.Connection, data: dict[str, Any]) -> int:
+        """Import ``hourly_billing_history.json`` hours."""
+        rows = [
+            (
+                hour_key,
+                *(hour_data.get(col) for col in BILLING_COLUMNS),
+                hour_data.get("timestamp"),
+                hour_data.get("data_source"),
+            )
+            for hour_key, hour_data in data.get("hours", {}).items()
+        ]
+        conn.executemany(
+            f"INSERT OR IGNORE INTO billing_hours VALUES ({', '.join('?' * (len(BILLING_COLUMNS) + 3))})",
+            rows,
+        )
+        return len(rows)
+
+    @staticmethod
+    def _import_forecast_json(conn: sqlite3.Connection, data: dict[str, Any]) -> int:
+        """Import ``external_forecasts_history.json`` days."""
+        rows = [
+            (day_str, json.dumps(entry, ensure_ascii=False))
+            for day_str, entry in data.get("days", {}).items()
+        ]
+        conn.executemany("INSERT OR IGNORE INTO forecast_days VALUES (?, ?)", rows)
+        last_updated = data.get("metadata", {}).get("last_updated")
+        if last_updated:
+            conn.execute(
+                "INSERT OR IGNORE INTO meta VALUES ('forecast_last_updated', ?)",
+                (json.dumps(last_updated),),
+            )
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # Meta
+    # ------------------------------------------------------------------
+
+    async def async_get_meta(self, key: str) -> Any | None:
+        """Return a JSON value stored under ``key``."""
+        def _get(conn: sqlite3.Connection) -> Any | None:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+            return json.loads(row[0]) if row else None
+
+        return await self._async_execute(_get)
+
+    async def async_set_meta(self, key: str, value: Any) -> None:
+        """Store a JSON value under ``key``."""
+        await self._async_execute(
+            lambda conn: conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                (key, json.dumps(value, ensure_ascii=False)),
+            )
+        )
+
+    # ------------------------------------------------------------------
+    # Power samples
+    # ------------------------------------------------------------------
+
+    async def async_append_power_sample(
+        self, timestamp: datetime, sample: dict[str, Any]
+    ) -> None:
+        """Append one power flow sample."""
+        row = (_to_us(timestamp), *(sample.get(col) for col in POWER_COLUMNS))
+        await self._async_execute(
+            lambda conn: conn.execute(
+                f"INSERT OR REPLACE INTO power_samples VALUES ({', '.join('?' * len(row))})",
+                row,
+            )
+        )
+
+    async def async_get_power_samples(
+        self, start: datetime, end: datetime | None = None
+    ) -> list[dict[str, Any]]:
+        """Return samples with ``start < timestamp <= end``, oldest first."""
+        params: tuple[int, ...] = (_to_us(start),)
+        query = f"SELECT ts_us, {', '.join(POWER_COLUMNS)} FROM power_samples WHERE ts_us > ?"
+        if end is not None:
+            query += " AND ts_us <= ?"
+            params += (_to_us(end),)
+        query += " ORDER BY ts_us"
+
+        rows = await self._async_execute(lambda conn: conn.execute(query, params).fetchall())
+        return [
+            {"timestamp": _from_us(row[0]), **dict(zip(POWER_COLUMNS, row[1:]))}
+            for row in rows
+        ]
+
+    async def async_purge_power_samples(self, before: datetime) -> int:
+        """Delete samples at or before ``before``; returns rows removed."""
+        cursor = await self._async_execute(
+            lambda conn: conn.execute(
+                "DELETE FROM power_samples WHERE ts_us <= ?", (_to_us(before),)
+            )
+        )
+        return cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # Hourly billing
+    # ------------------------------------------------------------------
+
+    async def async_upsert_billing_hour(self, hour_key: str, data: dict[str, Any]) -> None:
+        """Insert or replace the billing row of one hour."""
+        await self.async_upsert_billing_hours({hour_key: data})
+
+    async def async_upsert_billing_hours(self, hours: dict[str, dict[str, Any]]) -> None:
+        """Insert or replace the billing rows of several hours in one transaction."""
+        rows = [
+            (
+                hour_key,
+                *(data.get(col) for col in BILLING_COLUMNS),
+                data.get("timestamp"),
+                data.get("data_source"),
+            )
+            for hour_key, data in hours.items()
+        ]
+        if not rows:
+            return
+        await self._async_execute(
+            lambda conn: conn.executemany(
+                f"INSERT OR REPLACE INTO billing_hours VALUES ({', '.join('?' * (len(BILLING_COLUMNS) + 3))})",
+                rows,
+            )
+        )
+
+    async def async_get_last_billing_hour(self) -> str | None:
+        """Return the key of the most recent stored billing hour."""
+        row = await self._async_execute(
+            lambda conn: conn.execute("SELECT MAX(hour) FROM billing_hours").fetchone()
+        )
+        return row[0] if row else None
+
+    async def async_get_billing_hours(
+        self, start: str | None = None, end: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Return billing rows keyed by hour for ``start <= hour < end``.
+
+        ``start`` and ``end`` are hour keys or date prefixes
+        (``YYYY-MM-DD``), compared as strings.
+        """
+        query = f"SELECT hour, {', '.join(BILLING_COLUMNS)}, timestamp, data_source FROM billing_hours"
+        clauses = []
+        params: list[str] = []
+        if start is not None:
+            clauses.append("hour >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("hour < ?")
+            params.append(end)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY hour"
+
+        rows = await self._async_execute(lambda conn: conn.execute(query, params).fetchall())
+        columns = (*BILLING_COLUMNS, "timestamp", "data_source")
+        return {row[0]: dict(zip(columns, row[1:])) for row in rows}
+
+    async def async_get_billing_sums(self, start: str) -> dict[str, float]:
+        """Return per-column sums, ``hours_count`` and ``price_sum`` from ``start``."""
+        sums = ", ".join(f"TOTAL({col})" for col in BILLING_COLUMNS)
+        row = await self._async_execute(
+            lambda conn: conn.execute(
+                f"SELECT COUNT(*), {sums} FROM billing_hours WHERE hour >= ?", (start,)
+            ).fetchone()
+        )
+        result = dict(zip(BILLING_COLUMNS, row[1:]))
+        result["hours_count"] = row[0]
+        result["price_sum"] = result["price_ct_kwh"]
+        return result
+
+    async def async_purge_billing_hours(self, before: str) -> int:
+        """Delete rows of hours before ``before``; returns rows removed."""
+        cursor = await self._async_execute(
+            lambda conn: conn.execute("DELETE FROM billing_hours WHERE hour < ?", (before,))
+        )
+        return cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # Forecast comparison
+    # ------------------------------------------------------------------
+
+    async def async_get_forecast_days(
+        self, start: str | None = None, end: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Return forecast entries keyed by day for ``start <= day <= end``."""
+        query = "SELECT day, data FROM forecast_days"
+        clauses = []
+        params: list[str] = []
+        if start is not None:
+            clauses.append("day >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("day <= ?")
+            params.append(end)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY day"
+
+        rows = await self._async_execute(lambda conn: conn.execute(query, params).fetchall())
+        return {day: json.loads(data) for day, data in rows}
+
+    async def async_get_forecast_day(self, day: str) -> dict[str, Any] | None:
+        """Return the forecast entry of one day."""
+        return (await self.async_get_forecast_days(day, day)).get(day)
+
+    async def async_put_forecast_days(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Insert or replace forecast entries and bump ``last_updated``."""
+        rows = [
+            (day, json.dumps(entry, ensure_ascii=False)) for day, entry in entries.items()
+        ]
+        last_updated = json.dumps(datetime.now().isoformat())
+
+        def _put(conn: sqlite3.Connection) -> None:
+            conn.executemany("INSERT OR REPLACE INTO forecast_days VALUES (?, ?)", rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('forecast_last_updated', ?)",
+                (last_updated,),
+            )
+
+        await self._async_execute(_put)
+
+    async def async_purge_forecast_days(self, before: str) -> int:
+        """Delete entries of days before ``before``; returns rows removed."""
+        cursor = await self._async_execute(
+            lambda conn: conn.execute("DELETE FROM forecast_days WHERE day < ?", (before,))
+        )
+        return cursor.rowcount
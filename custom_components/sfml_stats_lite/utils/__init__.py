@@ -17,7 +17,7 @@ Copyright (C) 2025 Zara-Toorox
 """
 from __future__ import annotations
 
-from .cache import TTLCache, get_json_cache
+from .cache import FileJSONCache, TTLCache, get_file_json_cache, get_json_cache
 from .file_ops import (
     read_json_safe,
     write_json_safe,
@@ -27,7 +27,9 @@ from .file_ops import (
 
 __all__ = [
     "TTLCache",
+    "FileJSONCache",
     "get_json_cache",
+    "get_file_json_cache",
     "read_json_safe",
     "write_json_safe",
     "append_to_file_safe",
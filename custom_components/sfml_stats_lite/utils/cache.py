@@ -19,11 +19,21 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import hashlib
+import json
 import logging
+import os
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Callable, TypeVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
-from ..const import API_CACHE_TTL_SECONDS
+import aiofiles
+
+from ..const import API_CACHE_TTL_SECONDS, API_RESPONSE_CACHE_SIZE
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -126,10 +136,126 @@ class TTLCache:
         return int(self._ttl.total_seconds())
 
 
+class FileJSONCache:
+    """Parsed JSON documents keyed by path, invalidated on mtime/size change.
+
+    Every lookup stats the file in the executor; the parsed document is only
+    re-read when ``(mtime_ns, size)`` differs from the cached signature, so
+    unchanged files cost one ``stat`` instead of a read and ``json.loads``.
+    Cached documents are shared between callers and must be treated as
+    read-only.
+
+    The same signatures back the ETags of the dashboard views:
+    ``async_etag()`` hashes the signatures of a view's source files together
+    with the request parameters, and the serialized response body is kept
+    per key so unchanged payloads are neither rebuilt nor reserialized.
+    """
+
+    def __init__(self, max_responses: int = API_RESPONSE_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self._documents: dict[Path, tuple[tuple[int, int], Any]] = {}
+        self._responses: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._max_responses = max_responses
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def signature(path: Path) -> tuple[int, int] | None:
+        """Return ``(mtime_ns, size)`` of a file or None if it is missing."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def _signatures(cls, paths: list[Path]) -> list[tuple[int, int] | None]:
+        """Return the signatures of several files (blocking)."""
+        return [cls.signature(path) for path in paths]
+
+    async def read(self, hass: HomeAssistant, path: Path) -> Any | None:
+        """Return the parsed JSON document at ``path`` or None."""
+        signature = await hass.async_add_executor_job(self.signature, path)
+        if signature is None:
+            self._documents.pop(path, None)
+            return None
+
+        cached = self._documents.get(path)
+        if cached is not None and cached[0] == signature:
+            self._hits += 1
+            return cached[1]
+
+        self._misses += 1
+        try:
+            async with aiofiles.open(path, "r", encoding="utf-8") as f:
+                content = await f.read()
+            data = json.loads(content)
+        except Exception as err:
+            self._documents.pop(path, None)
+            _LOGGER.error("Error reading %s: %s", path, err)
+            return None
+
+        self._documents[path] = (signature, data)
+        _LOGGER.debug("Loaded %s (%d bytes)", path, len(content))
+        return data
+
+    async def async_etag(
+        self, hass: HomeAssistant, *parts: Any, paths: list[Path]
+    ) -> str:
+        """Build an ETag from request parameters and source file signatures."""
+        signatures = await hass.async_add_executor_job(self._signatures, paths)
+        digest = hashlib.sha1()
+        for part in parts:
+            digest.update(repr(part).encode("utf-8"))
+            digest.update(b"\0")
+        for path, signature in zip(paths, signatures):
+            digest.update(f"{path}:{signature}".encode("utf-8"))
+            digest.update(b"\0")
+        return f'"{digest.hexdigest()[:20]}"'
+
+    def get_response(self, key: str, etag: str) -> bytes | None:
+        """Return the serialized body stored for ``key`` if its ETag matches."""
+        cached = self._responses.get(key)
+        if cached is None or cached[0] != etag:
+            return None
+        self._responses.move_to_end(key)
+        return cached[1]
+
+    def set_response(self, key: str, etag: str, body: bytes) -> None:
+        """Store a serialized body, evicting the least recently used ones."""
+        self._responses[key] = (etag, body)
+        self._responses.move_to_end(key)
+        while len(self._responses) > self._max_responses:
+            self._responses.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached documents and responses."""
+        self._documents.clear()
+        self._responses.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return cache counters."""
+        return {
+            "documents": len(self._documents),
+            "responses": len(self._responses),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
 # Global cache instance for JSON file reads
 _json_file_cache = TTLCache(ttl_seconds=API_CACHE_TTL_SECONDS)
 
+# Global parsed-document cache shared by the dashboard views
+_file_json_cache = FileJSONCache()
+
 
 def get_json_cache() -> TTLCache:
     """Get the global JSON file cache instance."""
     return _json_file_cache
+
+
+def get_file_json_cache() -> FileJSONCache:
+    """Get the global mtime-invalidated JSON document cache."""
+    return _file_json_cache
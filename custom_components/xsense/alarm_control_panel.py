@@ -16,7 +16,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, MANUFACTURER
-from .coordinator import XSenseDataUpdateCoordinator
+from .coordinator import XSenseDataUpdateCoordinator, listener_context
 from .entity import coordinator_stations
 from .errors import xsense_error
 
@@ -96,7 +96,7 @@ class XSenseAlarmControlPanel(
         station,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=listener_context(station))
         self._station_id = station.entity_id
         self._attr_unique_id = f"{station.sn}_alarm"
         self._attr_device_info = {
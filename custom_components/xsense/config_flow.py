@@ -18,12 +18,14 @@ from .python_xsense import AsyncXSense
 from .python_xsense.async_xsense import is_camera_entity
 from .python_xsense.exceptions import APIFailure, AuthFailed
 from .const import (
+    CONF_RECORDING_MEDIA_CACHE_SIZE_MB,
     CONF_RECORDING_MEDIA_CLIPS_ORDER,
     CONF_RECORDING_MEDIA_DAYS_ORDER,
     CONF_RECORDING_MEDIA_STORAGE_PATH,
     CONF_RECORDING_MEDIA_SYNC_ENABLED,
     CONF_RECORDING_MEDIA_SYNC_HOURS,
     CONF_RECORDING_NOTIFICATION_QUALITY,
+    DEFAULT_RECORDING_MEDIA_CACHE_SIZE_MB,
     DEFAULT_RECORDING_MEDIA_CLIPS_ORDER,
     DEFAULT_RECORDING_MEDIA_DAYS_ORDER,
     DEFAULT_RECORDING_MEDIA_STORAGE_PATH,
@@ -86,6 +88,13 @@ def options_schema(
                     DEFAULT_RECORDING_MEDIA_STORAGE_PATH,
                 ),
             ): str,
+            vol.Optional(
+                CONF_RECORDING_MEDIA_CACHE_SIZE_MB,
+                default=options.get(
+                    CONF_RECORDING_MEDIA_CACHE_SIZE_MB,
+                    DEFAULT_RECORDING_MEDIA_CACHE_SIZE_MB,
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=100, max=1_000_000)),
             vol.Optional(
                 CONF_RECORDING_NOTIFICATION_QUALITY,
                 default=options.get(
@@ -162,6 +171,9 @@ def _normalized_options(options: dict[str, Any]) -> dict[str, Any]:
     normalized[CONF_RECORDING_MEDIA_STORAGE_PATH] = _safe_media_path(
         normalized.get(CONF_RECORDING_MEDIA_STORAGE_PATH)
     )
+    normalized[CONF_RECORDING_MEDIA_CACHE_SIZE_MB] = _safe_cache_size_mb(
+        normalized.get(CONF_RECORDING_MEDIA_CACHE_SIZE_MB)
+    )
     normalized[CONF_RECORDING_NOTIFICATION_QUALITY] = _safe_recording_quality(
         normalized.get(CONF_RECORDING_NOTIFICATION_QUALITY)
     )
@@ -186,6 +198,16 @@ def _safe_sync_hours(value: Any) -> int:
     return DEFAULT_RECORDING_MEDIA_SYNC_HOURS
 
 
+def _safe_cache_size_mb(value: Any) -> int:
+    try:
+        size_mb = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RECORDING_MEDIA_CACHE_SIZE_MB
+    if 100 <= size_mb <= 1_000_000:
+        return size_mb
+    return DEFAULT_RECORDING_MEDIA_CACHE_SIZE_MB
+
+
 def _safe_media_path(value: Any) -> str:
     path = str(value or DEFAULT_RECORDING_MEDIA_STORAGE_PATH).strip()
     if _recording_media_path_allowed(path):
@@ -11,16 +11,20 @@ CAMERA_SCAN_INTERVAL = 1800
 CAMERA_AI_HISTORY_SCAN_INTERVAL = 60
 CAMERA_AI_SERVICE_AVAILABLE = "cameraAiServiceAvailable"
 POLL_INTERVAL_MIN = 5
+# Seconds MQTT shadow updates of a station are collected before being applied
+MQTT_COALESCE_WINDOW = 0.25
 
 CONF_RECORDING_MEDIA_SYNC_ENABLED = "recording_media_sync_enabled"
 CONF_RECORDING_MEDIA_SYNC_HOURS = "recording_media_sync_hours"
 CONF_RECORDING_MEDIA_STORAGE_PATH = "recording_media_storage_path"
+CONF_RECORDING_MEDIA_CACHE_SIZE_MB = "recording_media_cache_size_mb"
 CONF_RECORDING_MEDIA_DAYS_ORDER = "recording_media_days_order"
 CONF_RECORDING_MEDIA_CLIPS_ORDER = "recording_media_clips_order"
 CONF_RECORDING_NOTIFICATION_QUALITY = "recording_notification_quality"
 DEFAULT_RECORDING_MEDIA_SYNC_ENABLED = False
 DEFAULT_RECORDING_MEDIA_SYNC_HOURS = 24
 DEFAULT_RECORDING_MEDIA_STORAGE_PATH = "/media/xsense_recordings"
+DEFAULT_RECORDING_MEDIA_CACHE_SIZE_MB = 4096
 DEFAULT_RECORDING_MEDIA_DAYS_ORDER = "descending"
 DEFAULT_RECORDING_MEDIA_CLIPS_ORDER = "descending"
 DEFAULT_RECORDING_NOTIFICATION_QUALITY = "hd"
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from contextlib import suppress
 from datetime import datetime, timedelta, timezone
+from functools import partial
 import hashlib
 import json
 from typing import Any
@@ -41,12 +43,15 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     LOGGER,
+    MQTT_COALESCE_WINDOW,
     POLL_INTERVAL_MIN,
 )
 from .mqtt import DEFAULT_ENCODING, DEFAULT_SUBSCRIBE_QOS, XSenseMQTT
 
 _IGNORED_TOPIC_SUFFIXES = ("/update/accepted", "/update/documents", "/update/rejected")
 
+_MISSING = object()
+
 KEYPAD_CODE_EVENT_TYPE = "xsense_keypad_code"
 SELF_TEST_EVENT_TYPE = "xsense_self_test"
 
@@ -69,11 +74,16 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._camera_initialized: bool = False
         self._last_camera_update_attempt: datetime | None = None
         self._camera_station_cache: dict[str, Any] = {}
+        self._stations_by_sn: dict[Any, Any] | None = None
+        self._stations_by_device_sn: dict[str, Any] = {}
+        self._stations_by_shadow_name: dict[Any, Any] = {}
         self._camera_ai_history_seen: set[str] = set()
         self._camera_ai_history_unsub = None
         self._camera_ai_history_lock = asyncio.Lock()
         self._startup_refresh_complete = False
         self._deferred_refresh_unsub = None
+        self._pending_station_updates: dict[str, tuple[Any, list[Callable[[], None]]]] = {}
+        self._station_flush_unsub = None
         self._shutting_down = False
         super().__init__(
             hass,
@@ -112,6 +122,11 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._camera_ai_history_unsub()
             self._camera_ai_history_unsub = None
 
+        if self._station_flush_unsub is not None:
+            self._station_flush_unsub()
+            self._station_flush_unsub = None
+        self._pending_station_updates.clear()
+
         mqtt_servers = list(self.mqtt_servers.values())
         self.mqtt_servers.clear()
 
@@ -213,6 +228,7 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._camera_initialized = False
         self._last_camera_update_attempt = None
         self._camera_station_cache = {}
+        self._stations_by_sn = None
 
     async def _async_update_data(self) -> dict[str, Any]:
         if self.xsense is None:
@@ -252,6 +268,7 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 for s in h.stations.values():
                     await self.xsense.get_state(s)
                     devices.update(s.devices.items())
+            self._rebuild_station_index()
         except (SessionExpired, AuthFailed) as ex:
             if not retry:
                 await self._connect()
@@ -264,33 +281,52 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         else:
             return devices
 
-    def _get_station_by_id(self, identifier: str):
+    def _rebuild_station_index(self) -> None:
+        """Index stations by serial, child device serial and shadow name.
+
+        MQTT routing resolves several identifiers per message, so lookups go
+        through these dicts instead of scanning every house, station and
+        device. The first station wins, as with a scan in house order.
+        """
+        by_sn: dict[Any, Any] = {}
+        by_device_sn: dict[str, Any] = {}
+        by_shadow_name: dict[Any, Any] = {}
+        if self.xsense:
+            for h in self.xsense.houses.values():
+                for s in h.stations.values():
+                    by_sn.setdefault(s.sn, s)
+                    by_shadow_name.setdefault(s.shadow_name, s)
+                    by_device_sn.setdefault(str(s.sn), s)
+                    for device_sn in s.device_by_sn:
+                        by_device_sn.setdefault(device_sn, s)
+        self._stations_by_sn = by_sn
+        self._stations_by_device_sn = by_device_sn
+        self._stations_by_shadow_name = by_shadow_name
+
+    def _station_index(self) -> dict[Any, Any] | None:
+        """Return the station serial index, building it on first use."""
         if not self.xsense:
             return None
-        for h in self.xsense.houses.values():
-            if s := h.get_station_by_sn(identifier):
-                return s
-        return None
+        if self._stations_by_sn is None:
+            self._rebuild_station_index()
+        return self._stations_by_sn
+
+    def _get_station_by_id(self, identifier: str):
+        if (by_sn := self._station_index()) is None:
+            return None
+        return by_sn.get(identifier)
 
     def _get_station_by_shadow_name(self, shadow_name: str):
         """Return the station matching an AWS IoT shadow thing name."""
-        if not self.xsense:
+        if self._station_index() is None:
             return None
-        for h in self.xsense.houses.values():
-            for s in h.stations.values():
-                if s.shadow_name == shadow_name:
-                    return s
-        return None
+        return self._stations_by_shadow_name.get(shadow_name)
 
     def _get_station_by_device_sn(self, device_sn: str | None):
         """Return the station containing the device serial number."""
-        if not self.xsense or not device_sn:
+        if not device_sn or self._station_index() is None:
             return None
-        for h in self.xsense.houses.values():
-            for s in h.stations.values():
-                if s.sn == device_sn or s.get_device_by_sn(device_sn):
-                    return s
-        return None
+        return self._stations_by_device_sn.get(str(device_sn))
 
     async def get_stations(self, retry=False):
         """Retrieve all stations."""
@@ -302,6 +338,7 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     await self.xsense.get_station_state(s)
                     await self.xsense.get_state(s)
                     stations.append(s)
+            self._rebuild_station_index()
         except (SessionExpired, AuthFailed) as ex:
             if not retry:
                 await self._connect()
@@ -364,6 +401,7 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 LOGGER.debug("X-Sense device state polling skipped during startup refresh")
 
             self._merge_cached_camera_stations(stations)
+            self._rebuild_station_index()
             LOGGER.debug(
                 "X-Sense coordinator refresh summary: stations=%s devices=%s camera_initialized=%s camera_cache=%s mqtt_servers=%s mqtt_connected=%s",
                 len(stations),
@@ -761,19 +799,23 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         if _is_presence_topic(topic):
             if event_type := data.get("eventType"):
-                station._set_online(event_type == "connected")
-                self.async_update_listeners()
+                self._async_queue_station_update(
+                    station, partial(station._set_online, event_type == "connected")
+                )
             return
 
         if isinstance(station_data, list):
-            self.xsense.parse_get_state(station, station_data)
-            self.async_update_listeners()
+            self._async_queue_station_update(
+                station, partial(self.xsense.parse_get_state, station, station_data)
+            )
             return
 
         is_safemode_topic = "/shadow/name/2nd_safemode/update" in topic
         if is_safemode_topic and "safeMode" in station_data:
             safe_mode = station_data["safeMode"]
-            _apply_safe_mode(station, safe_mode)
+            self._async_queue_station_update(
+                station, partial(_apply_safe_mode, station, safe_mode)
+            )
             LOGGER.debug(
                 "MQTT: station %s safeMode -> %s (topic: %s)",
                 station.sn,
@@ -809,6 +851,12 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if _is_keypad_notice_topic(topic):
             _fire_keypad_code_events(self.hass, station_data)
 
+        self._async_queue_station_update(
+            station, partial(self._apply_station_data, station, station_data)
+        )
+
+    def _apply_station_data(self, station, station_data: dict[str, Any]) -> None:
+        """Merge a reported shadow payload into the station or its target device."""
         children = station_data.pop("devs", {}) or {}
         target_device_sn = _mqtt_target_device_sn(station_data)
         if (
@@ -829,7 +877,69 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 station_data["devs"] = children
             self.xsense.parse_get_state(station, station_data)
 
-        self.async_update_listeners()
+    @callback
+    def _async_queue_station_update(self, station, apply: Callable[[], None]) -> None:
+        """Queue a state change of a station and schedule the coalesced flush.
+
+        Shadow traffic arrives in bursts (e.g. one update per shadow page on
+        reconnect); applying it in one pass per window means entities are
+        refreshed once, and only when their data actually changed.
+        """
+        if self._shutting_down:
+            return
+        _station, updates = self._pending_station_updates.setdefault(
+            station.entity_id, (station, [])
+        )
+        updates.append(apply)
+        if self._station_flush_unsub is None:
+            self._station_flush_unsub = async_call_later(
+                self.hass, MQTT_COALESCE_WINDOW, self._async_flush_station_updates
+            )
+
+    @callback
+    def _async_flush_station_updates(self, _now=None) -> None:
+        """Apply queued station changes and notify the entities that changed."""
+        self._station_flush_unsub = None
+        pending, self._pending_station_updates = self._pending_station_updates, {}
+        if self.xsense is None:
+            return
+
+        changed: set[str] = set()
+        for station, updates in pending.values():
+            before = _station_snapshot(station)
+            for apply in updates:
+                try:
+                    apply()
+                except Exception:  # noqa: BLE001
+                    LOGGER.exception(
+                        "Could not apply X-Sense MQTT update for station %s", station.sn
+                    )
+            after = _station_snapshot(station)
+            changes = _snapshot_changes(before, after)
+            LOGGER.debug(
+                "X-Sense MQTT updates applied: station=%s updates=%s changed=%s",
+                station.sn,
+                len(updates),
+                {context: sorted(keys) for context, keys in changes.items()},
+            )
+            changed.update(changes)
+            if "online" in changes.get(listener_context(station), ()):
+                # Child device availability follows the station.
+                changed.update(after)
+
+        if changed:
+            self.async_update_entity_listeners(changed)
+
+    @callback
+    def async_update_entity_listeners(self, contexts: set[str]) -> None:
+        """Notify listeners bound to one of ``contexts``.
+
+        Entities register with ``listener_context()`` of their X-Sense entity;
+        listeners without a context are always notified.
+        """
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in contexts:
+                update_callback()
 
     async def assure_subscriptions(self, h: House) -> None:
         """Assure there are subscriptions for all relevant topics.
@@ -922,6 +1032,60 @@ def _apply_safe_mode(station, safe_mode: str) -> None:
     station._data["safeMode"] = safe_mode
 
 
+def listener_context(entity) -> str:
+    """Return the coordinator listener context of an X-Sense entity.
+
+    The serial survives re-discovery under a new X-Sense entity ID; entities
+    without one fall back to their entity ID.
+    """
+    serial = getattr(entity, "sn", None)
+    if serial in (None, ""):
+        return entity.entity_id
+    return str(serial)
+
+
+def _station_snapshot(station) -> dict[str, tuple[Any, Any, dict[str, Any]]]:
+    """Return online flag, safe mode and data of a station and its devices.
+
+    Keyed by ``listener_context()``.
+    """
+    snapshot = {
+        listener_context(station): (
+            station.online,
+            getattr(station, "safe_mode", None),
+            dict(station.data),
+        )
+    }
+    for device in station.devices.values():
+        snapshot[listener_context(device)] = (device.online, None, dict(device.data))
+    return snapshot
+
+
+def _snapshot_changes(
+    before: dict[str, tuple[Any, Any, dict[str, Any]]],
+    after: dict[str, tuple[Any, Any, dict[str, Any]]],
+) -> dict[str, set[str]]:
+    """Return the changed attribute names per listener context."""
+    changes: dict[str, set[str]] = {}
+    for context, (online, safe_mode, data) in after.items():
+        if context not in before:
+            changes[context] = {"online", *data}
+            continue
+        old_online, old_safe_mode, old_data = before[context]
+        keys = {
+            key
+            for key in old_data.keys() | data.keys()
+            if old_data.get(key, _MISSING) != data.get(key, _MISSING)
+        }
+        if online != old_online:
+            keys.add("online")
+        if safe_mode != old_safe_mode:
+            keys.add("safe_mode")
+        if keys:
+            changes[context] = keys
+    return changes
+
+
 def _mqtt_target_device_sn(data: dict[str, Any]) -> str | None:
     """Return the child device serial from APK MQTT payload variants."""
     for key in (
@@ -12,6 +12,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, MANUFACTURER
+from .coordinator import listener_context
 
 if TYPE_CHECKING:
     from .coordinator import XSenseDataUpdateCoordinator
@@ -53,7 +54,7 @@ class XSenseEntity(CoordinatorEntity):
         station_id: str | None = None,
     ) -> None:
         """Initialise the gateway."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=listener_context(entity))
         self._dev_id = entity.entity_id
         self._station_id = station_id
         self._entity_serial = _entity_serial(entity)
@@ -63,6 +63,71 @@ def _subscription_accepts_id() -> bool:
         return False
 
 
+class _SubscriptionTrie:
+    """Topic-level trie of wildcard subscriptions.
+
+    Matching walks one branch per topic level (plus the ``+``/``#`` branches)
+    instead of testing every wildcard subscription's matcher. Follows the
+    MQTT rule that wildcards at the first level never match ``$`` topics.
+    """
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _SubscriptionTrie] = {}
+        self.subscriptions: set[Subscription] = set()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription under its topic filter."""
+        node = self
+        for level in subscription.topic.split("/"):
+            node = node.children.setdefault(level, _SubscriptionTrie())
+        node.subscriptions.add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription and prune empty branches; KeyError if unknown."""
+        levels = subscription.topic.split("/")
+        path = [self]
+        for level in levels:
+            path.append(path[-1].children[level])
+        path[-1].subscriptions.remove(subscription)
+        for depth in range(len(levels), 0, -1):
+            node = path[depth]
+            if node.subscriptions or node.children:
+                break
+            del path[depth - 1].children[levels[depth - 1]]
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return if a subscription with exactly this topic filter exists."""
+        node: _SubscriptionTrie | None = self
+        for level in topic_filter.split("/"):
+            node = node.children.get(level)
+            if node is None:
+                return False
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions whose topic filter matches ``topic``."""
+        levels = topic.split("/")
+        wildcard_root = not topic.startswith("$")
+        matches: list[Subscription] = []
+        stack: list[tuple[_SubscriptionTrie, int]] = [(self, 0)]
+        while stack:
+            node, depth = stack.pop()
+            wildcards = depth > 0 or wildcard_root
+            # "a/#" also matches "a" itself
+            if wildcards and (multi := node.children.get("#")) is not None:
+                matches.extend(multi.subscriptions)
+            if depth == len(levels):
+                matches.extend(node.subscriptions)
+                continue
+            if (child := node.children.get(levels[depth])) is not None:
+                stack.append((child, depth + 1))
+            if wildcards and (single := node.children.get("+")) is not None:
+                stack.append((single, depth + 1))
+        return matches
+
+
 class XSenseMQTT:
     """XSenseMQTT is a MQTT client for xsense, copied from the Home Assistant MQTT client."""
 
@@ -83,6 +148,7 @@ class XSenseMQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_trie = _SubscriptionTrie()
         self._retained_topics: defaultdict[Subscription, set[str]] = defaultdict(set)
 
         self._subscribe_debouncer = EnsureJobAfterCooldown(
@@ -266,11 +332,11 @@ class XSenseMQTT:
         if fileno > -1:
             self.loop.remove_writer(sock)
 
-    # unchanged
+    # wildcard filters looked up in the trie
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or self._wildcard_trie.has_filter(
+            topic
         )
 
     # unchanged
@@ -405,7 +471,7 @@ class XSenseMQTT:
             self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
-    # unchanged
+    # also tracks wildcards in the trie
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
@@ -418,8 +484,9 @@ class XSenseMQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_trie.add(subscription)
 
-    # unchanged
+    # also untracks wildcards from the trie
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
@@ -437,6 +504,7 @@ class XSenseMQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise xsense_error("subscription_remove_twice") from exc
 
@@ -650,18 +718,13 @@ class XSenseMQTT:
         self._async_connection_result(True)
 
     # def _async_queue_resubscribe
+    # wildcards matched through the trie
     @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_trie.match(topic))
         return subscriptions
 
     @callback
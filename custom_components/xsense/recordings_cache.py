@@ -0,0 +1,435 @@
+"""Byte-bounded X-Sense recording cache with prioritized downloads.
+
+Cached recordings live under each configured media root as
+``videos/<clip>.mp4``, ``hls/<clip>/`` and ``thumbs/<clip>.jpg``, where
+``<clip>`` is ``<serial>_<start>_<end>``. :class:`RecordingCacheManager`
+accounts those files per clip, keeps the clips of each root in LRU order
+(seeded from file modification times on first use) and evicts the least
+recently used clips once a root exceeds its configured byte budget.
+
+All recording downloads go through a bounded pool of download slots.
+Interactive playback is served before background sync whenever both are
+waiting, and file downloads stream into a ``.part`` file that is resumed
+with an HTTP range request after an interrupted transfer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+import heapq
+import itertools
+from pathlib import Path
+import shutil
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    CONF_RECORDING_MEDIA_CACHE_SIZE_MB,
+    DEFAULT_RECORDING_MEDIA_CACHE_SIZE_MB,
+    DOMAIN,
+    LOGGER,
+)
+
+DOWNLOAD_PRIORITY_INTERACTIVE = 0
+DOWNLOAD_PRIORITY_BACKGROUND = 1
+RECORDING_DOWNLOAD_SLOTS = 3
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+_PART_SUFFIX = ".part"
+
+
+class _PrioritySlots:
+    """Counting semaphore that hands free slots out by priority, then FIFO."""
+
+    def __init__(self, slots: int) -> None:
+        self._free = slots
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: int) -> None:
+        if self._free > 0 and not self.waiting:
+            self._free -= 1
+            self._active += 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the cancellation.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self._active -= 1
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                self._active += 1
+                return
+        self._free += 1
+
+
+class RecordingCacheManager:
+    """LRU byte budget, download slots and statistics for recording caches."""
+
+    def __init__(self, hass: HomeAssistant, slots: int = RECORDING_DOWNLOAD_SLOTS) -> None:
+        self.hass = hass
+        self._slots = _PrioritySlots(slots)
+        self._budgets: dict[str, int] = {}
+        # root -> clip key -> bytes, least recently used first
+        self._clips: dict[str, OrderedDict[str, int]] = {}
+        self._bytes: dict[str, int] = {}
+        self._scan_locks: dict[str, asyncio.Lock] = {}
+        self._counters: dict[str, dict[str, int]] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    # Configuration -------------------------------------------------------
+
+    def set_budget(self, root: Path, max_bytes: int) -> None:
+        """Set the byte budget of one media root."""
+        self._budgets[str(root)] = max(0, int(max_bytes))
+
+    def budget(self, root: Path) -> int:
+        """Return the byte budget of one media root."""
+        return self._budgets.get(
+            str(root), DEFAULT_RECORDING_MEDIA_CACHE_SIZE_MB * 1024 * 1024
+        )
+
+    # Downloads -----------------------------------------------------------
+
+    @asynccontextmanager
+    async def download_slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold one of the bounded download slots for the ``with`` body."""
+        self._count(None, "downloads")
+        await self._slots.acquire(priority)
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    async def async_download_file(
+        self, url: str, output_path: Path, *, priority: int
+    ) -> dict[str, Any]:
+        """Stream ``url`` into ``output_path``, resuming an interrupted transfer.
+
+        Data is written to ``<output>.part``; a leftover part file is
+        continued with a ``Range`` request and restarted when the server
+        answers with the full body instead.
+        """
+        part_path = output_path.with_name(f"{output_path.name}{_PART_SUFFIX}")
+        session = async_get_clientsession(self.hass)
+        async with self.download_slot(priority):
+            for _attempt in range(2):
+                offset = await self.hass.async_add_executor_job(_file_size, part_path)
+                headers = {"Range": f"bytes={offset}-"} if offset else None
+                async with session.get(url, headers=headers) as response:
+                    if (
+                        offset
+                        and response.status
+                        == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+                    ):
+                        await self.hass.async_add_executor_job(
+                            _unlink_missing_ok, part_path
+                        )
+                        continue
+                    response.raise_for_status()
+                    if response.status != HTTPStatus.PARTIAL_CONTENT:
+                        offset = 0
+                    elif offset:
+                        self._count(None, "resumed_downloads")
+                    content_type = response.headers.get("content-type", "")
+                    handle = await self.hass.async_add_executor_job(
+                        _open_part_file, part_path, offset
+                    )
+                    received = 0
+                    try:
+                        async for chunk in response.content.iter_chunked(
+                            DOWNLOAD_CHUNK_SIZE
+                        ):
+                            await self.hass.async_add_executor_job(handle.write, chunk)
+                            received += len(chunk)
+                    finally:
+                        await self.hass.async_add_executor_job(handle.close)
+                break
+            else:
+                raise OSError(f"Range request for {output_path.name} kept failing")
+
+        await self.hass.async_add_executor_job(_replace_file, part_path, output_path)
+        self._count(None, "downloaded_bytes", received)
+        return {
+            "content_type": content_type,
+            "bytes": offset + received,
+            "resumed_bytes": offset,
+        }
+
+    async def async_fetch(self, url: str, *, priority: int) -> bytes:
+        """Download a small file (HLS segment, key or map) into memory."""
+        session = async_get_clientsession(self.hass)
+        async with self.download_slot(priority):
+            async with session.get(url) as response:
+                response.raise_for_status()
+                payload = await response.read()
+        self._count(None, "downloaded_bytes", len(payload))
+        return payload
+
+    # Accounting ----------------------------------------------------------
+
+    @callback
+    def async_record_lookup(self, root: Path, key: str, hit: bool) -> None:
+        """Count a playback lookup and mark a hit clip as recently used."""
+        root_key = str(root)
+        self._count(root_key, "hits" if hit else "misses")
+        if hit and (clips := self._clips.get(root_key)) and key in clips:
+            clips.move_to_end(key)
+        self._async_notify()
+
+    async def async_track_clip(self, root: Path, key: str) -> None:
+        """Account the cached files of one clip and enforce the root budget."""
+        root_key = str(root)
+        clips = await self._async_clips(root)
+        size = await self.hass.async_add_executor_job(_clip_bytes, root, key)
+        previous = clips.pop(key, 0)
+        if size:
+            clips[key] = size
+        self._bytes[root_key] = self._bytes.get(root_key, 0) - previous + size
+        await self._async_evict(root, keep=key)
+        self._async_notify()
+
+    async def _async_evict(self, root: Path, *, keep: str | None = None) -> None:
+        root_key = str(root)
+        clips = self._clips.get(root_key)
+        if clips is None:
+            return
+        budget = self.budget(root)
+        evicted: list[str] = []
+        while self._bytes.get(root_key, 0) > budget:
+            key = next((key for key in clips if key != keep), None)
+            if key is None:
+                break
+            self._bytes[root_key] -= clips.pop(key)
+            evicted.append(key)
+        if not evicted:
+            return
+        await self.hass.async_add_executor_job(_remove_clips, root, evicted)
+        self._count(root_key, "evictions", len(evicted))
+        LOGGER.debug(
+            "X-Sense recording cache evicted clips: %s",
+            {
+                "root": root_key,
+                "clips": len(evicted),
+                "bytes": self._bytes.get(root_key, 0),
+                "budget": budget,
+            },
+        )
+
+    async def _async_clips(self, root: Path) -> OrderedDict[str, int]:
+        """Return the clip table of a root, scanning the disk on first use."""
+        root_key = str(root)
+        if (clips := self._clips.get(root_key)) is not None:
+            return clips
+        lock = self._scan_locks.setdefault(root_key, asyncio.Lock())
+        async with lock:
+            if (clips := self._clips.get(root_key)) is None:
+                scanned = await self.hass.async_add_executor_job(_scan_root, root)
+                clips = OrderedDict(scanned)
+                self._clips[root_key] = clips
+                self._bytes[root_key] = sum(clips.values())
+                await self._async_evict(root)
+        return clips
+
+    async def async_load(self, root: Path) -> None:
+        """Scan a root's existing cache so its size is known before new downloads."""
+        await self._async_clips(root)
+        self._async_notify()
+
+    @callback
+    def async_forget(self, roots: list[Path]) -> None:
+        """Drop the accounting of cleared roots (counters are kept)."""
+        for root in roots:
+            self._clips.pop(str(root), None)
+            self._bytes.pop(str(root), None)
+        self._async_notify()
+
+    # Statistics ----------------------------------------------------------
+
+    def stats(self, root: Path) -> dict[str, Any]:
+        """Return cache size, budget and counters of one media root."""
+        root_key = str(root)
+        counters = self._counters.get(root_key, {})
+        shared = self._counters.get("", {})
+        clips = self._clips.get(root_key)
+        return {
+            "bytes": self._bytes.get(root_key, 0),
+            "max_bytes": self.budget(root),
+            "clips": len(clips) if clips is not None else None,
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "evictions": counters.get("evictions", 0),
+            "active_downloads": self._slots.active,
+            "queued_downloads": self._slots.waiting,
+            "total_downloads": shared.get("downloads", 0),
+            "resumed_downloads": shared.get("resumed_downloads", 0),
+            "downloaded_bytes": shared.get("downloaded_bytes", 0),
+        }
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Listen for cache changes; returns a function that removes the listener."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return _remove
+
+    def _count(self, root_key: str | None, counter: str, amount: int = 1) -> None:
+        counters = self._counters.setdefault(root_key or "", {})
+        counters[counter] = counters.get(counter, 0) + amount
+
+    @callback
+    def _async_notify(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+def async_get_recording_cache(hass: HomeAssistant) -> RecordingCacheManager:
+    """Return the shared recording cache manager with current entry budgets."""
+    from .recordings_media import _recording_media_root
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    manager = domain_data.get("_recording_cache")
+    if not isinstance(manager, RecordingCacheManager):
+        manager = domain_data["_recording_cache"] = RecordingCacheManager(hass)
+
+    # Entries sharing a media root share its budget; the largest one wins.
+    budgets: dict[Path, int] = {}
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        root = _recording_media_root(hass, entry.entry_id)
+        budgets[root] = max(budgets.get(root, 0), recording_cache_budget(entry.options))
+    for root, max_bytes in budgets.items():
+        manager.set_budget(root, max_bytes)
+    return manager
+
+
+def recording_cache_budget(options: dict[str, Any]) -> int:
+    """Return the configured cache budget in bytes."""
+    try:
+        size_mb = int(
+            options.get(
+                CONF_RECORDING_MEDIA_CACHE_SIZE_MB, DEFAULT_RECORDING_MEDIA_CACHE_SIZE_MB
+            )
+        )
+    except (TypeError, ValueError):
+        size_mb = DEFAULT_RECORDING_MEDIA_CACHE_SIZE_MB
+    return max(0, size_mb) * 1024 * 1024
+
+
+def clip_cache_key(path: Path) -> str:
+    """Return the clip key of a cached video, thumbnail or HLS playlist path."""
+    if path.name == "index.m3u8":
+        return path.parent.name
+    return path.name.split(".", 1)[0]
+
+
+def _scan_root(root: Path) -> list[tuple[str, int]]:
+    """Return ``(clip key, bytes)`` of a root, oldest modification first."""
+    clips: dict[str, list[float]] = {}
+
+    def _add(key: str, size: int, mtime: float) -> None:
+        entry = clips.setdefault(key, [0, 0.0])
+        entry[0] += size
+        entry[1] = max(entry[1], mtime)
+
+    for folder in (root / "videos", root / "thumbs"):
+        if not folder.is_dir():
+            continue
+        for path in folder.iterdir():
+            if path.is_file():
+                stat = path.stat()
+                _add(clip_cache_key(path), stat.st_size, stat.st_mtime)
+    hls_root = root / "hls"
+    if hls_root.is_dir():
+        for clip_dir in hls_root.iterdir():
+            if not clip_dir.is_dir():
+                continue
+            for path in clip_dir.rglob("*"):
+                if path.is_file():
+                    stat = path.stat()
+                    _add(clip_dir.name, stat.st_size, stat.st_mtime)
+    ordered = sorted(clips.items(), key=lambda item: item[1][1])
+    return [(key, int(size)) for key, (size, _mtime) in ordered]
+
+
+def _clip_bytes(root: Path, key: str) -> int:
+    """Return the bytes cached for one clip across videos, thumbs and HLS."""
+    total = 0
+    for folder in (root / "videos", root / "thumbs"):
+        if folder.is_dir():
+            total += sum(
+                path.stat().st_size
+                for path in folder.glob(f"{key}.*")
+                if path.is_file()
+            )
+    hls_dir = root / "hls" / key
+    if hls_dir.is_dir():
+        total += sum(
+            path.stat().st_size for path in hls_dir.rglob("*") if path.is_file()
+        )
+    return total
+
+
+def _remove_clips(root: Path, keys: list[str]) -> None:
+    """Delete every cached file of the given clips."""
+    for key in keys:
+        for folder in (root / "videos", root / "thumbs"):
+            if folder.is_dir():
+                for path in folder.glob(f"{key}.*"):
+                    path.unlink(missing_ok=True)
+        shutil.rmtree(root / "hls" / key, ignore_errors=True)
+
+
+def _open_part_file(path: Path, offset: int):
+    """Open a part file for writing at ``offset`` (0 truncates it)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not offset:
+        return path.open("wb")
+    handle = path.open("r+b")
+    handle.seek(offset)
+    handle.truncate()
+    return handle
+
+
+def _replace_file(source: Path, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    source.replace(target)
+
+
+def _unlink_missing_ok(path: Path) -> None:
+    path.unlink(missing_ok=True)
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
@@ -27,6 +27,12 @@ from homeassistant.helpers.event import async_call_later, async_track_time_inter
 from homeassistant.helpers.storage import Store
 
 from .python_xsense.async_xsense import is_camera_entity
+from .recordings_cache import (
+    DOWNLOAD_PRIORITY_BACKGROUND,
+    DOWNLOAD_PRIORITY_INTERACTIVE,
+    async_get_recording_cache,
+    clip_cache_key,
+)
 from .recordings_gate import has_any_camera_entities
 from .const import (
     CONF_RECORDING_MEDIA_CLIPS_ORDER,
@@ -204,7 +210,9 @@ async def async_cache_recording_media(
 ) -> dict[str, int]:
     """Pre-cache X-Sense recording media for configured entries."""
     summary = {"downloaded": 0, "thumbnails": 0, "skipped": 0, "failed": 0}
-    media_source = XSenseRecordingsMediaSource(hass)
+    media_source = XSenseRecordingsMediaSource(
+        hass, priority=DOWNLOAD_PRIORITY_BACKGROUND
+    )
     recent_cutoff = _recent_recording_cutoff() if recent_only else None
     indexes = await async_refresh_recording_indexes(
         hass,
@@ -220,7 +228,9 @@ async def async_cache_recording_media(
             "force_refresh": force_refresh,
         },
     )
-    media_source = XSenseRecordingsMediaSource(hass)
+    media_source = XSenseRecordingsMediaSource(
+        hass, priority=DOWNLOAD_PRIORITY_BACKGROUND
+    )
     for index in indexes:
         clips = _recording_cache_candidates(index)
         for clip in clips:
@@ -307,6 +317,7 @@ async def async_cache_recording_playback(
 
     media_source = XSenseRecordingsMediaSource(hass)
     cached_url = await media_source._async_cached_media_url(clip)
+    media_source._record_lookup(clip, bool(cached_url))
     if cached_url:
         LOGGER.debug(
             "X-Sense motion recording cache already ready: %s",
@@ -385,6 +396,7 @@ async def async_clear_recording_caches(
     )
     _clear_recording_capture_locks(hass, roots)
     await hass.async_add_executor_job(_clear_media_cache, roots)
+    async_get_recording_cache(hass).async_forget(roots)
 
 
 def async_remove_recording_index(hass: HomeAssistant, entry_id: str) -> None:
@@ -508,10 +520,17 @@ class XSenseRecordingsMediaSource(MediaSource):
 
     name = "X-Sense Recordings"
 
-    def __init__(self, hass: HomeAssistant) -> None:
-        """Initialize the media source."""
+    def __init__(
+        self, hass: HomeAssistant, *, priority: int = DOWNLOAD_PRIORITY_INTERACTIVE
+    ) -> None:
+        """Initialize the media source.
+
+        ``priority`` orders this source's downloads against other recording
+        downloads; background sync uses ``DOWNLOAD_PRIORITY_BACKGROUND``.
+        """
         super().__init__(DOMAIN)
         self.hass = hass
+        self._priority = priority
 
     async def async_browse_media(
         self, item: MediaSourceItem
@@ -676,9 +695,9 @@ class XSenseRecordingsMediaSource(MediaSource):
         clip = self._find_clip(camera, start)
         if clip is None:
             raise Unresolvable("Unknown X-Sense recording")
-        if _recording_media_sync_enabled(
-            self.hass, entry_id
-        ) and not await self._async_cached_media_ready(clip):
+        cached = await self._async_cached_media_ready(clip)
+        self._record_lookup(clip, cached)
+        if _recording_media_sync_enabled(self.hass, entry_id) and not cached:
             raise Unresolvable("X-Sense recording is waiting for background sync")
         resolved_url = await self._async_cached_playback_url(clip)
         hls_ready = await self._async_hls_ready(clip)
@@ -697,7 +716,24 @@ class XSenseRecordingsMediaSource(MediaSource):
         if clip.get("source") != "video_url" or not direct_url:
             raise Unresolvable("X-Sense recording did not include a direct media URL")
 
-        return await self._async_cached_direct_playback_url(clip, direct_url)
+        url = await self._async_cached_direct_playback_url(clip, direct_url)
+        await self._async_track_clip(clip)
+        return url
+
+    def _record_lookup(self, clip: dict[str, Any], hit: bool) -> None:
+        """Count a playback cache hit or miss for the cache statistics."""
+        async_get_recording_cache(self.hass).async_record_lookup(
+            _recording_media_root_from_value(clip.get("media_root")),
+            clip_cache_key(_clip_cache_path(clip)),
+            hit,
+        )
+
+    async def _async_track_clip(self, clip: dict[str, Any]) -> None:
+        """Account a clip's cached files against the cache budget."""
+        await async_get_recording_cache(self.hass).async_track_clip(
+            _recording_media_root_from_value(clip.get("media_root")),
+            clip_cache_key(_clip_cache_path(clip)),
+        )
 
     async def _async_cached_direct_playback_url(
         self, clip: dict[str, Any], direct_url: str
@@ -882,10 +918,11 @@ class XSenseRecordingsMediaSource(MediaSource):
     ) -> dict[str, Any]:
         """Download and rewrite one HLS playlist for local cached playback."""
         session = async_get_clientsession(self.hass)
-        async with session.get(url) as response:
-            response.raise_for_status()
-            content_type = response.headers.get("content-type", "")
-            playlist_text = await response.text()
+        async with async_get_recording_cache(self.hass).download_slot(self._priority):
+            async with session.get(url) as response:
+                response.raise_for_status()
+                content_type = response.headers.get("content-type", "")
+                playlist_text = await response.text()
         if "#EXTM3U" not in playlist_text[:256]:
             raise Unresolvable("X-Sense direct recording was not an HLS playlist")
 
@@ -1022,6 +1059,7 @@ class XSenseRecordingsMediaSource(MediaSource):
                     continue
                 cached += 1
                 bytes_written += len(payload)
+            await self._async_track_clip(clip)
             LOGGER.debug(
                 "X-Sense HLS recording background cache finished: %s",
                 {
@@ -1057,10 +1095,9 @@ class XSenseRecordingsMediaSource(MediaSource):
 
     async def _async_download_hls_part(self, url: str) -> bytes:
         """Download one HLS segment, map, or key file."""
-        session = async_get_clientsession(self.hass)
-        async with session.get(url) as response:
-            response.raise_for_status()
-            return await response.read()
+        return await async_get_recording_cache(self.hass).async_fetch(
+            url, priority=self._priority
+        )
 
     async def _async_cache_thumbnail(self, clip: dict[str, Any]) -> bool:
         """Cache one recording thumbnail when X-Sense provides a direct image URL."""
@@ -1075,17 +1112,20 @@ class XSenseRecordingsMediaSource(MediaSource):
         except Exception as exc:  # noqa: BLE001
             LOGGER.debug("Could not cache X-Sense recording thumbnail: %s", exc)
             return False
-        return await self._async_path_ready(output_path)
+        if not await self._async_path_ready(output_path):
+            return False
+        await self._async_track_clip(clip)
+        return True
 
     async def _async_download_url(self, url: str, output_path: Path) -> dict[str, Any]:
-        """Download one URL into the recording media cache."""
-        session = async_get_clientsession(self.hass)
-        async with session.get(url) as response:
-            response.raise_for_status()
-            content_type = response.headers.get("content-type", "")
-            payload = await response.read()
-        await self.hass.async_add_executor_job(_write_cache_file, output_path, payload)
-        return {"content_type": content_type, "bytes": len(payload)}
+        """Download one URL into the recording media cache.
+
+        The download streams to disk and resumes a previously interrupted
+        transfer of the same file.
+        """
+        return await async_get_recording_cache(self.hass).async_download_file(
+            url, output_path, priority=self._priority
+        )
 
     async def _async_path_ready(self, path: Path) -> bool:
         """Return whether a cached path is present without blocking the loop."""
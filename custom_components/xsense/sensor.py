@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .python_xsense.async_xsense import is_camera_entity
 from .python_xsense.device import Device
@@ -24,9 +24,10 @@ from homeassistant.const import (
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     EntityCategory,
+    UnitOfInformation,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
@@ -37,6 +38,9 @@ from .entity import (
     coordinator_stations,
     device_station_id,
 )
+from .recordings_cache import async_get_recording_cache
+from .recordings_gate import has_camera_entities
+from .recordings_media import _recording_media_root
 
 UNIT_PARTS_PER_MILLION = getattr(
     getattr(ha_const, "UnitOfRatio", None), "PARTS_PER_MILLION", "ppm"
@@ -771,9 +775,60 @@ async def async_setup_entry(
             if description.exists_fn(dev)
         )
 
+    if has_camera_entities(coordinator.data):
+        devices.append(XSenseRecordingCacheSensor(entry))
+
     async_add_entities(devices)
 
 
+class XSenseRecordingCacheSensor(SensorEntity):
+    """Size and hit statistics of the camera recording media cache."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "recording_cache"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    _attr_suggested_unit_of_measurement = UnitOfInformation.MEBIBYTES
+    _attr_should_poll = False
+
+    def __init__(self, entry: config_entries.ConfigEntry) -> None:
+        """Set up the instance."""
+        self._entry_id = entry.entry_id
+        self._attr_unique_id = f"{entry.entry_id}-recording-cache"
+
+    async def async_added_to_hass(self) -> None:
+        """Follow cache changes and load the size of the existing cache."""
+        cache = async_get_recording_cache(self.hass)
+        self.async_on_remove(cache.async_add_listener(self._async_cache_changed))
+        self.hass.async_create_task(
+            cache.async_load(_recording_media_root(self.hass, self._entry_id))
+        )
+
+    @callback
+    def _async_cache_changed(self) -> None:
+        """Write the new cache statistics."""
+        self.async_write_ha_state()
+
+    def _stats(self) -> dict[str, Any]:
+        return async_get_recording_cache(self.hass).stats(
+            _recording_media_root(self.hass, self._entry_id)
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return the cached bytes of this entry's media root."""
+        return self._stats()["bytes"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the cache budget and download counters."""
+        stats = self._stats()
+        stats.pop("bytes")
+        return stats
+
+
 class XSenseSensorEntity(XSenseEntity, SensorEntity):
     """Representation of a xsense device."""
 